@@ -7,11 +7,35 @@ Provides backtesting and simulation capabilities.
 from .backtest_runner import BacktestRunner
 from .latency_simulator import LatencySimulator
 from .market_microstructure import MarketMicrostructure
+from .monte_carlo import MonteCarloAnalyzer, MonteCarloResult
+from .parameter_sweep import ParameterRange, ParameterSweep, SweepResult
+from .pipeline_replay import PipelineReplay
+from .portfolio_backtest import PortfolioBacktester, PricePanel
 from .realistic_simulator import RealisticSimulator
+from .result_cache import ResultCache
+from .results_store import ResultsWriter, StoredResults, list_results, load_results
+from .vectorized_backtest import VectorizedBacktester
+from .walk_forward import WalkForwardOptimizer, WalkForwardWindow
 
 __all__ = [
     'BacktestRunner',
     'LatencySimulator',
     'MarketMicrostructure',
+    'MonteCarloAnalyzer',
+    'MonteCarloResult',
+    'ParameterRange',
+    'ParameterSweep',
+    'PipelineReplay',
+    'PortfolioBacktester',
+    'PricePanel',
     'RealisticSimulator',
+    'ResultCache',
+    'ResultsWriter',
+    'StoredResults',
+    'SweepResult',
+    'VectorizedBacktester',
+    'WalkForwardOptimizer',
+    'WalkForwardWindow',
+    'list_results',
+    'load_results',
 ]
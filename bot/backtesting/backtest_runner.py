@@ -9,9 +9,13 @@ import numpy as np
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 import asyncio
+import time
+from pathlib import Path
 
+from .date_range import date_bounds, filter_date_range
 from .realistic_simulator import RealisticSimulator
 from .market_microstructure import MarketMicrostructure
+from .results_store import ResultsWriter, to_epoch
 
 logger = logging.getLogger(__name__)
 
@@ -34,9 +38,18 @@ class BacktestRunner:
         
         # Backtest configuration
         bt_config = config.get('backtesting', {})
-        self.start_date = bt_config.get('start_date', '2023-01-01')
-        self.end_date = bt_config.get('end_date', '2025-12-31')
+        self.start_date, self.end_date = date_bounds(bt_config)
         self.initial_capital = bt_config.get('initial_capital', 3000)
+        self.warmup_bars = bt_config.get('warmup_bars', 50)
+        self.lookback = bt_config.get('lookback', 200)
+        self.position_fraction = bt_config.get('position_fraction', 0.1)
+        
+        # Output
+        output_config = bt_config.get('output', {})
+        self.results_dir = Path(output_config.get('results_dir', 'data/backtest_results'))
+        self.chunk_rows = output_config.get('chunk_rows', 4096)
+        self.save_trades = output_config.get('save_trades', True)
+        self.save_equity_curve = output_config.get('save_equity_curve', True)
         
         # Components
         self.simulator = RealisticSimulator(config)
@@ -50,7 +63,14 @@ class BacktestRunner:
         }
         self.trades: List[Dict] = []
         self.equity_curve: List[float] = []
+        self.equity_timestamps: List[float] = []  # Epoch seconds per equity point
         self.daily_returns: List[float] = []
+        self.writer: Optional[ResultsWriter] = None
+        self.trade_count = 0
+        
+        # Throughput of the last run
+        self.bars_processed = 0
+        self.elapsed_seconds = 0.0
         
         logger.info(
             f"✓ Backtest Runner initialized "
@@ -59,14 +79,26 @@ class BacktestRunner:
     
     async def run_backtest(self,
                           historical_data: pd.DataFrame,
-                          strategy) -> Dict:
+                          strategy,
+                          writer: Optional[ResultsWriter] = None) -> Dict:
         """
         Run backtest on historical data
         
+        Event-driven: bars are fed one at a time. Strategies with
+        ``supports_incremental`` update their own state through
+        ``on_bar``; others receive a fixed window of the last
+        ``lookback`` bars, so each bar costs the same regardless of
+        how far into the history the run is.
+        
+        With a ``writer``, equity points and trades are streamed to the
+        results store instead of being kept in memory; the returned
+        dict then holds the scalar metrics and ``results_dir``.
+        
         Args:
             historical_data: DataFrame with OHLCV data
             strategy: Strategy instance to test
-            
+            writer: Results store receiving the run (see ``results_writer``)
+        
         Returns:
             Dict with backtest results
         """
@@ -74,7 +106,7 @@ class BacktestRunner:
         logger.info(f"Starting backtest for {strategy.name}...")
         
         # Filter data by date range
-        data = self._filter_date_range(historical_data)
+        data = filter_date_range(historical_data, self.start_date, self.end_date)
         
         if data.empty:
             logger.error("No data in specified date range")
@@ -89,108 +121,171 @@ class BacktestRunner:
         self.trades.clear()
         self.equity_curve = [self.initial_capital]
         self.daily_returns.clear()
-        
-        # Iterate through historical data
-        for i in range(len(data)):
+        self.trade_count = 0
+        
+        # Initial capital is stamped with the first bar
+        first_timestamp = to_epoch(data['timestamp'].iloc[0] if 'timestamp' in data.columns else data.index[0])
+        self.equity_timestamps = [first_timestamp]
+        self.writer = writer
+        if writer is not None:
+            writer.metadata.setdefault('strategy', strategy.name)
+            writer.append_equity(first_timestamp, self.initial_capital)
+        
+        incremental = getattr(strategy, 'supports_incremental', False)
+        lookback = max(getattr(strategy, 'history_bars', None) or self.lookback, self.warmup_bars)
+        if incremental:
+            strategy.reset_state()
+        
+        columns = list(data.columns)
+        index = data.index
+        has_timestamp = 'timestamp' in columns
+        
+        start = time.perf_counter()
+        
+        # Feed bars in order
+        for i, values in enumerate(data.itertuples(index=False, name=None)):
+            bar = dict(zip(columns, values))
+            if not has_timestamp:
+                bar['timestamp'] = index[i]
             
-            # Get data up to current point
-            current_data = data.iloc[:i+1]
+            # Incremental strategies see every bar, warm-up included
+            if incremental:
+                signal = await strategy.on_bar(bar)
             
-            if len(current_data) < 50:
+            if i + 1 < self.warmup_bars:
                 continue  # Need minimum data for indicators
             
             # Update microstructure
-            self.microstructure.update(current_data)
+            self.microstructure.update_bar(bar)
             
             # Generate signal
-            signal = await strategy.generate_signal(current_data)
+            if not incremental:
+                signal = await strategy.generate_signal(self._window(data, i, lookback))
             
-            if signal is None:
-                # Update equity (mark-to-market)
-                self._update_equity(current_data.iloc[-1])
-                continue
+            if signal is not None:
+                self._handle_signal(signal, data, i, lookback)
             
-            # Check if we can trade
-            if signal.action == 'BUY' and self.portfolio['cash'] < 100:
-                continue  # Insufficient cash
-            
-            # Calculate position size (simplified)
-            if signal.action == 'BUY':
-                position_size = min(self.portfolio['cash'] * 0.1, self.portfolio['cash'])
-            else:
-                # For demo, skip sells if no position
-                if not self.portfolio['positions']:
-                    continue
-                position_size = list(self.portfolio['positions'].values())[0].get('value', 0)
-            
-            # Simulate execution
-            execution = self.simulator.simulate_trade(
-                action=signal.action,
-                size=position_size,
-                price=signal.entry_price,
-                market_data=current_data
-            )
-            
-            if not execution['executed']:
-                continue
-            
-            # Update portfolio
-            self._process_execution(signal, execution)
-            
-            # Update equity
-            self._update_equity(current_data.iloc[-1])
+            # Update equity (mark-to-market)
+            self._update_equity(bar)
+        
+        self.bars_processed = len(data)
+        self.elapsed_seconds = time.perf_counter() - start
         
         # Calculate performance metrics
-        results = self._calculate_performance()
+        if writer is not None:
+            results = self._calculate_stored_performance(writer)
+        else:
+            results = self._calculate_performance()
+        if results:
+            results.update(self.get_statistics())
+        if writer is not None:
+            writer.close(results)
+            self.writer = None
         
-        logger.info(f"✓ Backtest complete: {results.get('total_return', 0):.2%} return")
+        logger.info(
+            f"✓ Backtest complete: {results.get('total_return', 0):.2%} return "
+            f"({self.bars_processed} bars, {self.get_statistics()['bars_per_second']:,.0f} bars/s)"
+        )
         
         return results
     
-    def _filter_date_range(self, data: pd.DataFrame) -> pd.DataFrame:
-        """Filter data by date range"""
+    def _window(self, data: pd.DataFrame, i: int, lookback: int) -> pd.DataFrame:
+        """Last ``lookback`` bars up to and including bar ``i``"""
+        return data.iloc[max(0, i + 1 - lookback):i + 1]
+    
+    def _handle_signal(self, signal, data: pd.DataFrame, i: int, lookback: int):
+        """Size and simulate the trade for a signal at bar ``i``"""
         
-        if 'timestamp' not in data.columns:
-            return data
+        position = self.portfolio['positions'].get(signal.symbol)
         
-        mask = (
-            (data['timestamp'] >= pd.to_datetime(self.start_date)) &
-            (data['timestamp'] <= pd.to_datetime(self.end_date))
+        # Long-only, one position per symbol: BUY opens, SELL closes
+        if signal.action == 'BUY':
+            if position is not None:
+                return  # Already long
+            if self.portfolio['cash'] < 100:
+                return  # Insufficient cash
+            position_size = self.portfolio['cash'] * self.position_fraction
+        else:
+            if position is None:
+                return  # Nothing to sell
+            position_size = position['units'] * signal.entry_price
+        
+        # Simulate execution
+        execution = self.simulator.simulate_trade(
+            action=signal.action,
+            size=position_size,
+            price=signal.entry_price,
+            market_data=self._window(data, i, lookback),
+            portfolio_value=self.portfolio['equity']
         )
         
-        return data[mask].copy()
+        if not execution['executed']:
+            return
+        
+        # Update portfolio
+        self._process_execution(signal, execution)
+    
+    def get_statistics(self) -> Dict:
+        """Throughput of the last run"""
+        return {
+            'bars_processed': self.bars_processed,
+            'elapsed_seconds': self.elapsed_seconds,
+            'bars_per_second': self.bars_processed / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+        }
     
     def _process_execution(self, signal, execution: Dict):
         """Process trade execution and update portfolio"""
         
+        outcome = {}
+        
         if signal.action == 'BUY':
             # Buy: reduce cash, add position
             self.portfolio['cash'] -= execution['total_cost']
             
             self.portfolio['positions'][signal.symbol] = {
+                'units': execution['size_filled'] / execution['execution_price'],
                 'size': execution['size_filled'],
                 'entry_price': execution['execution_price'],
                 'value': execution['size_filled'],
-                'entry_time': execution['timestamp']
+                'entry_time': execution['timestamp'],
+                'cost': execution['total_cost'],
+                'entry_equity': self.portfolio['equity']
             }
         
         else:  # SELL
-            # Sell: add cash, remove position
-            self.portfolio['cash'] += execution['size_filled']
+            # Sell: receive the slipped price for the filled units
+            position = self.portfolio['positions'][signal.symbol]
+            units = min(position['units'], execution['size_filled'] / execution['price'])
+            proceeds = units * execution['execution_price'] - execution['commission']
+            self.portfolio['cash'] += proceeds
+            
+            # Realized P&L against the sold share of the entry cost
+            cost = position['cost'] * units / position['units']
+            outcome = {
+                'pnl': proceeds - cost,
+                'trade_return': (proceeds - cost) / position['entry_equity']
+            }
             
-            if signal.symbol in self.portfolio['positions']:
+            position['cost'] -= cost
+            position['units'] -= units
+            if position['units'] <= 1e-12:
                 del self.portfolio['positions'][signal.symbol]
         
         # Record trade
         trade_record = {
             **execution,
+            **outcome,
             'symbol': signal.symbol,
             'strategy': signal.strategy,
             'portfolio_value': self.portfolio['equity']
         }
-        self.trades.append(trade_record)
+        self.trade_count += 1
+        if self.writer is not None:
+            self.writer.append_trade(trade_record)
+        else:
+            self.trades.append(trade_record)
     
-    def _update_equity(self, current_market: pd.Series):
+    def _update_equity(self, current_market: Dict):
         """Update portfolio equity based on current prices"""
         
         equity = self.portfolio['cash']
@@ -198,11 +293,16 @@ class BacktestRunner:
         # Mark positions to market
         current_price = current_market.get('close', 0)
         for symbol, position in self.portfolio['positions'].items():
-            position_value = position['size']
-            equity += position_value
+            position['value'] = position['units'] * current_price
+            equity += position['value']
         
         self.portfolio['equity'] = equity
+        if self.writer is not None:
+            self.writer.append_equity(current_market['timestamp'], equity)
+            return
+        
         self.equity_curve.append(equity)
+        self.equity_timestamps.append(to_epoch(current_market['timestamp']))
         
         # Calculate daily return
         if len(self.equity_curve) > 1:
@@ -215,29 +315,61 @@ class BacktestRunner:
         if not self.trades or not self.equity_curve:
             return {}
         
+        results = self._performance_metrics(
+            np.array(self.equity_curve),
+            np.array(self.daily_returns),
+            np.array([t.get('slippage', 0) for t in self.trades])
+        )
+        results.update({
+            'equity_curve': self.equity_curve,
+            'equity_timestamps': self.equity_timestamps,
+            'daily_returns': self.daily_returns,
+            'trades': self.trades
+        })
+        return results
+    
+    def _calculate_stored_performance(self, writer: ResultsWriter) -> Dict:
+        """Performance metrics over the tables of a streamed run"""
+        
+        writer.flush()
+        if not self.trade_count:
+            return {}
+        
+        stored = writer.results()
+        results = self._performance_metrics(
+            stored.equity['equity'],
+            stored.returns(),
+            stored.trades['slippage']
+        )
+        results['results_dir'] = str(writer.directory)
+        return results
+    
+    def _performance_metrics(self,
+                             equity_array: np.ndarray,
+                             daily_returns: np.ndarray,
+                             slippage: np.ndarray) -> Dict:
+        """Scalar metrics of an equity curve and its trades' slippage"""
+        
         # Total return
         total_return = (self.portfolio['equity'] - self.initial_capital) / self.initial_capital
         
         # Sharpe ratio
-        if len(self.daily_returns) > 1:
-            sharpe = np.mean(self.daily_returns) / (np.std(self.daily_returns) + 1e-8) * np.sqrt(252)
+        if len(daily_returns) > 1:
+            sharpe = np.mean(daily_returns) / (np.std(daily_returns) + 1e-8) * np.sqrt(252)
         else:
             sharpe = 0.0
         
         # Max drawdown
-        equity_array = np.array(self.equity_curve)
         running_max = np.maximum.accumulate(equity_array)
         drawdown = (equity_array - running_max) / running_max
         max_drawdown = np.min(drawdown)
         
         # Win rate
-        profitable_trades = sum(1 for t in self.trades if t.get('slippage', 0) < 0.01)
-        win_rate = profitable_trades / len(self.trades) if self.trades else 0
+        profitable_trades = int(np.sum(slippage < 0.01))
+        win_rate = profitable_trades / len(slippage) if len(slippage) else 0
         
         # Average trade
-        avg_trade_return = np.mean([
-            t.get('slippage', 0) for t in self.trades
-        ]) if self.trades else 0
+        avg_trade_return = np.mean(slippage) if len(slippage) else 0
         
         return {
             'initial_capital': self.initial_capital,
@@ -247,22 +379,41 @@ class BacktestRunner:
             'sharpe_ratio': sharpe,
             'max_drawdown': max_drawdown,
             'max_drawdown_pct': max_drawdown * 100,
-            'total_trades': len(self.trades),
+            'total_trades': self.trade_count,
             'win_rate': win_rate,
-            'avg_trade_return': avg_trade_return,
-            'equity_curve': self.equity_curve,
-            'daily_returns': self.daily_returns,
-            'trades': self.trades
+            'avg_trade_return': avg_trade_return
         }
     
-    def save_results(self, results: Dict, filename: str = 'backtest_results.csv'):
-        """Save backtest results to CSV"""
+    def results_writer(self, name: str, metadata: Optional[Dict] = None) -> ResultsWriter:
+        """Results store for a run under the configured results directory"""
+        return ResultsWriter(self.results_dir / name, chunk_rows=self.chunk_rows, metadata=metadata)
+    
+    def save_results(self, results: Dict, name: str = 'backtest_results') -> Optional[Path]:
+        """
+        Save in-memory backtest results to the columnar results store
         
-        if not results:
-            return
+        Args:
+            results: Dict returned by ``run_backtest``
+            name: Run directory under ``results_dir``
         
-        # Save trades
-        trades_df = pd.DataFrame(results['trades'])
-        trades_df.to_csv(f'logs/{filename}', index=False)
+        Returns:
+            Run directory (None when there is nothing to save)
+        """
         
-        logger.info(f"✓ Backtest results saved to logs/{filename}")
+        if not results:
+            return None
+        
+        with self.results_writer(name) as writer:
+            if self.save_equity_curve and 'equity_curve' in results:
+                equity = np.asarray(results['equity_curve'], dtype=np.float64)
+                timestamps = results.get('equity_timestamps')
+                if timestamps is None or len(timestamps) != len(equity):
+                    timestamps = np.full(len(equity), np.nan)
+                writer.extend_equity(np.asarray(timestamps, dtype=np.float64), equity)
+            if self.save_trades:
+                for trade in results.get('trades', []):
+                    writer.append_trade(trade)
+            writer.close(results)
+        
+        logger.info(f"✓ Backtest results saved to {writer.directory}")
+        return writer.directory
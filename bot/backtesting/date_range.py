@@ -0,0 +1,54 @@
+"""
+Backtest Date Range
+Shared start/end date handling for the backtesters
+
+Every backtester reads ``backtesting.start_date``/``end_date`` and
+trims its input to that window before running; None on either end
+leaves that side unbounded.
+"""
+
+import pandas as pd
+from typing import Dict, Optional, Tuple
+
+DEFAULT_START_DATE = '2023-01-01'
+DEFAULT_END_DATE = '2025-12-31'
+
+
+def date_bounds(bt_config: Dict) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Configured backtest window
+    
+    Args:
+        bt_config: ``backtesting`` config section
+    
+    Returns:
+        (start_date, end_date)
+    """
+    return (
+        bt_config.get('start_date', DEFAULT_START_DATE),
+        bt_config.get('end_date', DEFAULT_END_DATE)
+    )
+
+
+def filter_date_range(data: pd.DataFrame, start_date=None, end_date=None) -> pd.DataFrame:
+    """
+    Rows of ``data`` whose timestamp lies in [start_date, end_date]
+    
+    Args:
+        data: OHLCV frame (returned unchanged without a timestamp column)
+        start_date: First timestamp kept (None = unbounded)
+        end_date: Last timestamp kept (None = unbounded)
+    
+    Returns:
+        Filtered copy, or ``data`` itself when every row is in range
+    """
+    if 'timestamp' not in data.columns:
+        return data
+    
+    mask = pd.Series(True, index=data.index)
+    if start_date is not None:
+        mask &= data['timestamp'] >= pd.to_datetime(start_date)
+    if end_date is not None:
+        mask &= data['timestamp'] <= pd.to_datetime(end_date)
+    
+    return data if mask.all() else data[mask].copy()
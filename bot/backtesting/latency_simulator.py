@@ -3,14 +3,20 @@ Latency Simulator
 Realistic network latency simulation for backtesting and testing
 Models: Normal, Lognormal, Exponential distributions
 Features: Time-of-day effects, packet loss, retries
+
+Backtests draw from a pre-sampled stream: latency, packet-loss and
+retry outcomes are generated in vectorized blocks from a seeded
+generator (or replayed from recorded latencies), so millions of
+requests cost milliseconds and runs are reproducible.
 """
 
 import logging
 import numpy as np
 import asyncio
+from collections import deque
 from datetime import datetime, time
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Optional, List, Sequence, Tuple, Union
 from enum import Enum
 
 logger = logging.getLogger(__name__)
@@ -44,6 +50,68 @@ class LatencyStats:
     min_latency_ms: float
 
 
+class LatencyHistogram:
+    """
+    Bounded log-bucketed latency histogram
+    
+    Fixed memory regardless of sample count; percentiles are accurate
+    to the bucket width (``10 ** (1 / bins_per_decade)``, ~1.2% at 200).
+    """
+    
+    def __init__(self, min_ms: float = 0.01, max_ms: float = 1e6, bins_per_decade: int = 200):
+        """
+        Args:
+            min_ms: Lower bound of the first bucket
+            max_ms: Upper bound of the last bucket
+            bins_per_decade: Buckets per factor of 10
+        """
+        decades = np.log10(max_ms) - np.log10(min_ms)
+        self.edges = np.logspace(np.log10(min_ms), np.log10(max_ms), int(decades * bins_per_decade) + 1)
+        self.mids = np.sqrt(self.edges[:-1] * self.edges[1:])
+        self.counts = np.zeros(len(self.edges) - 1, dtype=np.int64)
+        self.reset()
+    
+    def reset(self):
+        self.counts[:] = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+    
+    def record(self, values: Union[float, np.ndarray]):
+        """Add one value or an array of values"""
+        values = np.atleast_1d(np.asarray(values, dtype=np.float64))
+        if len(values) == 0:
+            return
+        
+        idx = np.clip(np.searchsorted(self.edges, values, side='right') - 1, 0, len(self.counts) - 1)
+        self.counts += np.bincount(idx, minlength=len(self.counts))
+        self.count += len(values)
+        self.total += float(values.sum())
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+    
+    def merge(self, other: 'LatencyHistogram'):
+        """Add another histogram with the same buckets"""
+        self.counts += other.counts
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+    
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+    
+    def percentile(self, q: float) -> float:
+        """Value at percentile ``q`` (0-100)"""
+        if self.count == 0:
+            return 0.0
+        rank = max(1, int(np.ceil(q / 100 * self.count)))
+        bucket = int(np.searchsorted(np.cumsum(self.counts), rank))
+        return float(np.clip(self.mids[bucket], self.min, self.max))
+
+
 class LatencySimulator:
     """
     Simulates realistic network latency for backtesting
@@ -54,7 +122,8 @@ class LatencySimulator:
     - Packet loss simulation
     - Automatic retries with exponential backoff
     - Timeout handling
-    - Statistics tracking
+    - Statistics tracking (bounded histogram)
+    - Pre-sampled, seeded or replayed latency streams for backtests
     """
     
     def __init__(self, config):
@@ -92,8 +161,17 @@ class LatencySimulator:
         self.retry_attempts = lat_config.get('retry_attempts', 3)
         self.retry_delay_ms = lat_config.get('retry_delay_ms', 100)
         
-        # Statistics
-        self.latencies: List[float] = []
+        # Pre-sampled stream (seed = reproducible backtests)
+        self.seed = lat_config.get('seed')
+        self.block_size = lat_config.get('block_size', 65536)
+        self.rng = np.random.default_rng(self.seed)
+        self._stream: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = None
+        self._stream_pos = 0
+        self._replay: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        
+        # Statistics (histogram for percentiles; recent raw samples only)
+        self.histogram = LatencyHistogram()
+        self.latencies = deque(maxlen=lat_config.get('recent_samples', 1000))
         self.total_requests = 0
         self.successful_requests = 0
         self.failed_requests = 0
@@ -166,6 +244,7 @@ class LatencySimulator:
         
         # Record statistics
         self.latencies.append(actual_latency)
+        self.histogram.record(actual_latency)
         
         if success:
             self.successful_requests += 1
@@ -189,30 +268,36 @@ class LatencySimulator:
         Returns:
             Latency in milliseconds
         """
+        return float(self._sample_latencies(1)[0])
+    
+    def _sample_latencies(self, size) -> np.ndarray:
+        """
+        Draw latencies from the configured distribution
         
-        if self.distribution == 'normal':
-            # Normal distribution
-            latency = np.random.normal(self.mean_ms, self.std_ms)
-            
-        elif self.distribution == 'lognormal':
+        Args:
+            size: Output shape
+        
+        Returns:
+            Latencies in milliseconds, clipped to [min_ms, max_ms]
+        """
+        
+        if self.distribution == 'lognormal':
             # Lognormal distribution (most realistic for network latency)
             # Parameters for lognormal to match desired mean/std
             sigma = np.sqrt(np.log(1 + (self.std_ms / self.mean_ms) ** 2))
             mu = np.log(self.mean_ms) - sigma ** 2 / 2
-            latency = np.random.lognormal(mu, sigma)
+            latency = self.rng.lognormal(mu, sigma, size)
             
         elif self.distribution == 'exponential':
             # Exponential distribution
-            latency = np.random.exponential(self.mean_ms)
+            latency = self.rng.exponential(self.mean_ms, size)
             
         else:
-            # Default to normal
-            latency = np.random.normal(self.mean_ms, self.std_ms)
+            # Normal distribution (default)
+            latency = self.rng.normal(self.mean_ms, self.std_ms, size)
         
         # Clip to valid range
-        latency = np.clip(latency, self.min_ms, self.max_ms)
-        
-        return latency
+        return np.clip(latency, self.min_ms, self.max_ms)
     
     def _apply_time_effects(self, latency: float, timestamp: datetime) -> float:
         """
@@ -263,7 +348,7 @@ class LatencySimulator:
             total_latency += base_latency
             
             # Check for packet loss
-            if np.random.random() < self.packet_loss_rate:
+            if self.rng.random() < self.packet_loss_rate:
                 self.packet_losses += 1
                 
                 if attempt < self.retry_attempts - 1:
@@ -293,6 +378,155 @@ class LatencySimulator:
         
         return total_latency, False
     
+    # ==================== BULK / REPLAY STREAM ====================
+    
+    def _sample_block(self, n: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Pre-sample ``n`` complete request outcomes
+        
+        Mirrors ``_simulate_with_retries``: each attempt draws a latency
+        and a packet-loss flag; a lost attempt adds ``retry_delay_ms *
+        2**attempt`` backoff before the next one, except after the last.
+        
+        Returns:
+            (first attempt latency, remaining latency, success, losses)
+        """
+        attempts = max(1, self.retry_attempts)
+        latency = self._sample_latencies((n, attempts))
+        lost = self.rng.random((n, attempts)) < self.packet_loss_rate
+        
+        success = ~lost.all(axis=1)
+        final = np.where(success, np.argmin(lost, axis=1), attempts - 1)
+        
+        # Latency and backoff accumulated through the final attempt
+        cum_latency = np.cumsum(latency, axis=1)
+        backoff = np.concatenate([[0.0], np.cumsum(self.retry_delay_ms * 2.0 ** np.arange(attempts - 1))])
+        rows = np.arange(n)
+        total = cum_latency[rows, final] + backoff[final]
+        
+        losses = np.where(success, final, attempts)
+        return latency[:, 0], total - latency[:, 0], success, losses
+    
+    def _take(self, n: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Next ``n`` outcomes of the pre-sampled (or replayed) stream"""
+        parts = []
+        while n > 0:
+            if self._stream is None or self._stream_pos >= len(self._stream[0]):
+                self._refill()
+            take = min(n, len(self._stream[0]) - self._stream_pos)
+            parts.append(tuple(a[self._stream_pos:self._stream_pos + take] for a in self._stream))
+            self._stream_pos += take
+            n -= take
+        
+        if len(parts) == 1:
+            return parts[0]
+        return tuple(np.concatenate(columns) for columns in zip(*parts))
+    
+    def _refill(self):
+        """Load the next block of outcomes"""
+        if self._replay is not None:
+            latencies, success = self._replay
+            zeros = np.zeros(len(latencies))
+            self._stream = (latencies, zeros, success, (~success).astype(np.int64))
+        else:
+            self._stream = self._sample_block(self.block_size)
+        self._stream_pos = 0
+    
+    def _peak_mask(self, timestamps) -> np.ndarray:
+        """Boolean mask of timestamps falling in peak hours"""
+        hours = np.asarray(timestamps, dtype='datetime64[h]').astype(np.int64) % 24
+        return np.isin(hours, self.peak_hours)
+    
+    def simulate_batch(self,
+                       n: Optional[int] = None,
+                       timestamps: Optional[Sequence] = None,
+                       record: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Simulate many requests at once without sleeping
+        
+        Args:
+            n: Number of requests (defaults to len(timestamps))
+            timestamps: Request times for time-of-day effects (datetime64-compatible)
+            record: Add the outcomes to the statistics
+        
+        Returns:
+            (latencies in ms, success flags)
+        """
+        if n is None:
+            n = len(timestamps) if timestamps is not None else 1
+        
+        if not self.enabled:
+            return np.zeros(n), np.ones(n, dtype=bool)
+        
+        first, rest, success, losses = self._take(n)
+        
+        if self.time_effects_enabled and timestamps is not None and self._replay is None:
+            first = np.where(self._peak_mask(timestamps), first * self.peak_multiplier, first)
+        latencies = first + rest
+        
+        if record:
+            self.histogram.record(latencies)
+            self.latencies.extend(latencies[-self.latencies.maxlen:].tolist())
+            self.total_requests += n
+            n_success = int(success.sum())
+            self.successful_requests += n_success
+            self.failed_requests += n - n_success
+            self.timeouts += int((latencies > self.max_ms).sum())
+            self.packet_losses += int(losses.sum())
+            self.retries_count += int(np.minimum(losses, self.retry_attempts - 1).sum())
+        
+        return latencies, success
+    
+    def next_latency(self, timestamp: Optional[datetime] = None) -> float:
+        """
+        Latency of one simulated request from the pre-sampled stream
+        
+        Args:
+            timestamp: Request time for time-of-day effects
+        
+        Returns:
+            Latency in ms (no sleeping)
+        """
+        latencies, _ = self.simulate_batch(1, None if timestamp is None else [np.datetime64(timestamp)])
+        return float(latencies[0])
+    
+    def reseed(self, seed: Optional[int] = None):
+        """
+        Restart the pre-sampled stream from ``seed`` (default: configured seed)
+        
+        Same seed and block size reproduce the same request outcomes,
+        regardless of how requests are grouped into batches.
+        """
+        self.seed = self.seed if seed is None else seed
+        self.rng = np.random.default_rng(self.seed)
+        self._stream = None
+        self._stream_pos = 0
+    
+    def load_replay(self, latencies_ms: Sequence[float], success: Optional[Sequence[bool]] = None):
+        """
+        Replay recorded latencies (cycled) instead of sampling
+        
+        Args:
+            latencies_ms: Recorded request latencies
+            success: Recorded outcome per request (default: all succeeded)
+        """
+        latencies = np.asarray(latencies_ms, dtype=np.float64)
+        if len(latencies) == 0:
+            raise ValueError("Replay requires at least one latency")
+        flags = np.ones(len(latencies), dtype=bool) if success is None else np.asarray(success, dtype=bool)
+        
+        self._replay = (latencies, flags)
+        self._stream = None
+        self._stream_pos = 0
+    
+    def clear_replay(self):
+        """Return to sampling from the seeded generator"""
+        self._replay = None
+        self._stream = None
+        self._stream_pos = 0
+    
+    # ==================== STATISTICS ====================
+    
     def get_statistics(self) -> LatencyStats:
         """
         Get latency statistics
@@ -301,7 +535,9 @@ class LatencySimulator:
             LatencyStats object
         """
         
-        if len(self.latencies) == 0:
+        hist = self.histogram
+        
+        if hist.count == 0:
             return LatencyStats(
                 total_requests=self.total_requests,
                 successful_requests=self.successful_requests,
@@ -317,8 +553,6 @@ class LatencySimulator:
                 min_latency_ms=0
             )
         
-        latencies_array = np.array(self.latencies)
-        
         return LatencyStats(
             total_requests=self.total_requests,
             successful_requests=self.successful_requests,
@@ -326,12 +560,12 @@ class LatencySimulator:
             timeouts=self.timeouts,
             retries=self.retries_count,
             packet_losses=self.packet_losses,
-            mean_latency_ms=float(np.mean(latencies_array)),
-            median_latency_ms=float(np.median(latencies_array)),
-            p95_latency_ms=float(np.percentile(latencies_array, 95)),
-            p99_latency_ms=float(np.percentile(latencies_array, 99)),
-            max_latency_ms=float(np.max(latencies_array)),
-            min_latency_ms=float(np.min(latencies_array))
+            mean_latency_ms=hist.mean,
+            median_latency_ms=hist.percentile(50),
+            p95_latency_ms=hist.percentile(95),
+            p99_latency_ms=hist.percentile(99),
+            max_latency_ms=hist.max,
+            min_latency_ms=hist.min
         )
     
     def print_statistics(self):
@@ -360,6 +594,7 @@ class LatencySimulator:
     def reset_statistics(self):
         """Reset all statistics"""
         self.latencies.clear()
+        self.histogram.reset()
         self.total_requests = 0
         self.successful_requests = 0
         self.failed_requests = 0
@@ -6,17 +6,21 @@ Models order book dynamics and price formation
 import logging
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from collections import deque
+from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
 
 class OrderBook:
     """
-    Simulated order book
+    Simulated L2 order book
     
-    Maintains bid and ask sides with depth
+    Bid and ask ladders are NumPy arrays (bids descending, asks
+    ascending by price). Market orders sweep the ladder with a
+    cumulative-notional ``searchsorted``; L2 deltas and recorded depth
+    snapshots update the arrays in place.
     """
     
     def __init__(self, levels: int = 10):
@@ -26,14 +30,29 @@ class OrderBook:
         """
         self.levels = levels
         
-        # Order book structure
-        self.bids: deque = deque(maxlen=levels)  # [(price, size), ...]
-        self.asks: deque = deque(maxlen=levels)
+        # Ladders: best level first
+        self.bid_prices = np.zeros(0)
+        self.bid_sizes = np.zeros(0)
+        self.ask_prices = np.zeros(0)
+        self.ask_sizes = np.zeros(0)
+        
+        # Level spacing of the synthetic ladder
+        self.tick = 0.0
         
         # State
         self.last_trade_price = 0.0
         self.last_trade_size = 0.0
     
+    @property
+    def bids(self) -> List[Tuple[float, float]]:
+        """Bid levels as (price, size), best first"""
+        return list(zip(self.bid_prices.tolist(), self.bid_sizes.tolist()))
+    
+    @property
+    def asks(self) -> List[Tuple[float, float]]:
+        """Ask levels as (price, size), best first"""
+        return list(zip(self.ask_prices.tolist(), self.ask_sizes.tolist()))
+    
     def initialize(self, mid_price: float, spread_bps: float = 5):
         """
         Initialize order book around mid price
@@ -44,35 +63,127 @@ class OrderBook:
         """
         
         spread = mid_price * (spread_bps / 10000)
+        self.tick = spread / 10
+        offsets = spread / 2 + np.arange(self.levels) * self.tick
         
-        # Clear existing
-        self.bids.clear()
-        self.asks.clear()
+        self.bid_prices = mid_price - offsets
+        self.ask_prices = mid_price + offsets
+        self.bid_sizes = np.random.uniform(5000, 20000, self.levels)  # Random size
+        self.ask_sizes = np.random.uniform(5000, 20000, self.levels)
         
-        # Generate bid levels
-        for i in range(self.levels):
-            price = mid_price - spread / 2 - (i * spread / 10)
-            size = np.random.uniform(5000, 20000)  # Random size
-            self.bids.append((price, size))
+        self.last_trade_price = mid_price
+    
+    def recenter(self, mid_price: float, spread_bps: float = 5, replenish: float = 1.0):
+        """
+        Rebuild the synthetic ladder around a new mid price
         
-        # Generate ask levels
-        for i in range(self.levels):
-            price = mid_price + spread / 2 + (i * spread / 10)
-            size = np.random.uniform(5000, 20000)
-            self.asks.append((price, size))
+        Levels return to the ``initialize`` price grid and their sizes
+        recover toward fresh synthetic depth, so liquidity taken by
+        earlier sweeps does not leave the book permanently hollowed out.
         
-        self.last_trade_price = mid_price
+        Args:
+            mid_price: New middle price
+            spread_bps: Spread in basis points
+            replenish: Share of the gap to fresh depth restored (1.0 = full reset)
+        """
+        if len(self.bid_prices) == 0 or len(self.ask_prices) == 0 or replenish >= 1.0:
+            self.initialize(mid_price, spread_bps)
+            return
+        
+        bid_sizes, ask_sizes = self.bid_sizes, self.ask_sizes
+        self.initialize(mid_price, spread_bps)
+        self.bid_sizes = self._replenish(bid_sizes, self.bid_sizes, replenish)
+        self.ask_sizes = self._replenish(ask_sizes, self.ask_sizes, replenish)
+    
+    def _replenish(self, remaining: np.ndarray, fresh: np.ndarray, replenish: float) -> np.ndarray:
+        """Move remaining level sizes (best first, missing = 0) toward fresh depth"""
+        sizes = np.zeros(self.levels)
+        sizes[:min(len(remaining), self.levels)] = remaining[:self.levels]
+        return sizes + replenish * (fresh - sizes)
+    
+    def load_snapshot(self,
+                      bid_prices: np.ndarray,
+                      bid_sizes: np.ndarray,
+                      ask_prices: np.ndarray,
+                      ask_sizes: np.ndarray):
+        """
+        Replace the book with a recorded L2 snapshot
+        
+        Args:
+            bid_prices/bid_sizes: Bid levels (any order; zero sizes dropped)
+            ask_prices/ask_sizes: Ask levels (any order; zero sizes dropped)
+        """
+        self.bid_prices, self.bid_sizes = self._sorted_side(bid_prices, bid_sizes, descending=True)
+        self.ask_prices, self.ask_sizes = self._sorted_side(ask_prices, ask_sizes, descending=False)
+        
+        if len(self.bid_prices) and len(self.ask_prices):
+            self.last_trade_price = self.get_mid_price()
+    
+    def _sorted_side(self, prices, sizes, descending: bool):
+        """Sort a side best-first, drop empty levels and truncate"""
+        prices = np.asarray(prices, dtype=np.float64)
+        sizes = np.asarray(sizes, dtype=np.float64)
+        keep = sizes > 0
+        prices, sizes = prices[keep], sizes[keep]
+        
+        order = np.argsort(-prices if descending else prices, kind='stable')[:self.levels]
+        return prices[order], sizes[order]
+    
+    def apply_delta(self, side: str, price: float, size: float):
+        """
+        Apply an L2 delta (absolute size at a price level; 0 removes it)
+        
+        Args:
+            side: 'bid' or 'ask'
+            price: Level price
+            size: New total size at the level
+        """
+        self.apply_deltas(side, np.array([price]), np.array([size]))
+    
+    def apply_deltas(self, side: str, prices: np.ndarray, sizes: np.ndarray):
+        """
+        Apply a batch of L2 deltas to one side
+        
+        Later entries for the same price win, as in a feed.
+        
+        Args:
+            side: 'bid' or 'ask'
+            prices: Level prices
+            sizes: New total sizes (0 removes the level)
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        sizes = np.asarray(sizes, dtype=np.float64)
+        
+        if side == 'bid':
+            book_prices, book_sizes = self.bid_prices, self.bid_sizes
+        else:
+            book_prices, book_sizes = self.ask_prices, self.ask_sizes
+        
+        # Last update per price
+        unique, last = np.unique(prices[::-1], return_index=True)
+        delta_sizes = sizes[::-1][last]
+        
+        # Existing levels not touched by the deltas
+        untouched = ~np.isin(book_prices, unique)
+        merged_prices = np.concatenate([book_prices[untouched], unique])
+        merged_sizes = np.concatenate([book_sizes[untouched], delta_sizes])
+        
+        result = self._sorted_side(merged_prices, merged_sizes, descending=(side == 'bid'))
+        if side == 'bid':
+            self.bid_prices, self.bid_sizes = result
+        else:
+            self.ask_prices, self.ask_sizes = result
     
     def get_best_bid(self) -> Tuple[float, float]:
         """Get best bid (highest buy price)"""
-        if self.bids:
-            return self.bids[0]
+        if len(self.bid_prices):
+            return (float(self.bid_prices[0]), float(self.bid_sizes[0]))
         return (0.0, 0.0)
     
     def get_best_ask(self) -> Tuple[float, float]:
         """Get best ask (lowest sell price)"""
-        if self.asks:
-            return self.asks[0]
+        if len(self.ask_prices):
+            return (float(self.ask_prices[0]), float(self.ask_sizes[0]))
         return (0.0, 0.0)
     
     def get_spread(self) -> float:
@@ -102,77 +213,56 @@ class OrderBook:
         Args:
             action: BUY or SELL
             size: Order size in dollars
-            
+        
         Returns:
             Execution details
         """
         
-        filled_size = 0.0
-        total_cost = 0.0
-        fills = []
-        
         if action == 'BUY':
-            # Take from asks
-            book = list(self.asks)
-            
-            for i, (price, available) in enumerate(book):
-                if filled_size >= size:
-                    break
-                
-                # Calculate how much to take at this level
-                remaining = size - filled_size
-                take_size = min(remaining / price, available)
-                
-                # Execute fill
-                fill_cost = take_size * price
-                total_cost += fill_cost
-                filled_size += fill_cost
-                
-                fills.append({
-                    'price': price,
-                    'size': take_size,
-                    'cost': fill_cost
-                })
-                
-                # Update book
-                new_size = available - take_size
-                if new_size > 0:
-                    self.asks[i] = (price, new_size)
-                else:
-                    # Level exhausted, remove it
-                    if len(self.asks) > i:
-                        self.asks.pop(i)
-        
-        else:  # SELL
-            # Hit bids
-            book = list(self.bids)
+            prices, sizes = self.ask_prices, self.ask_sizes  # Take from asks
+        else:
+            prices, sizes = self.bid_prices, self.bid_sizes  # Hit bids
+        
+        # Last level touched: first where cumulative notional covers the order
+        notional = prices * sizes
+        cumulative = np.cumsum(notional)
+        last = int(np.searchsorted(cumulative, size, side='left'))
+        
+        if last >= len(prices):
+            # Sweep the whole side
+            take = sizes.copy()
+            consumed = len(prices)
+            remaining_sizes = np.zeros(0)
+        else:
+            before = cumulative[last - 1] if last > 0 else 0.0
+            take = sizes[:last + 1].copy()
+            take[last] = (size - before) / prices[last]
             
-            for i, (price, available) in enumerate(book):
-                if filled_size >= size:
-                    break
-                
-                remaining = size - filled_size
-                take_size = min(remaining / price, available)
-                
-                fill_cost = take_size * price
-                total_cost += fill_cost
-                filled_size += fill_cost
-                
-                fills.append({
-                    'price': price,
-                    'size': take_size,
-                    'cost': fill_cost
-                })
-                
-                new_size = available - take_size
-                if new_size > 0:
-                    self.bids[i] = (price, new_size)
-                else:
-                    if len(self.bids) > i:
-                        self.bids.pop(i)
-        
-        # Calculate average price
-        avg_price = total_cost / (filled_size / fills[0]['price']) if fills else 0.0
+            # Level exhausted exactly: remove it as well
+            leftover = sizes[last] - take[last]
+            consumed = last + 1 if leftover <= 0 else last
+            remaining_sizes = sizes[consumed:].copy()
+            if leftover > 0:
+                remaining_sizes[0] = leftover
+        
+        fill_prices = prices[:len(take)]
+        costs = take * fill_prices
+        filled_size = float(costs.sum())
+        filled_qty = float(take.sum())
+        
+        # Update book
+        if action == 'BUY':
+            self.ask_prices, self.ask_sizes = prices[consumed:], remaining_sizes
+        else:
+            self.bid_prices, self.bid_sizes = prices[consumed:], remaining_sizes
+        
+        fills = [
+            {'price': p, 'size': q, 'cost': c}
+            for p, q, c in zip(fill_prices.tolist(), take.tolist(), costs.tolist())
+        ]
+        
+        # Volume-weighted average price
+        avg_price = filled_size / filled_qty if filled_qty > 0 else 0.0
         
         # Update last trade
         if fills:
@@ -189,6 +279,71 @@ class OrderBook:
         }
 
 
+class DepthReplay:
+    """
+    Replay of recorded L2 depth snapshots
+    
+    Snapshots are stored as arrays of shape (snapshots, levels); the
+    snapshot in force at a timestamp is found with ``searchsorted``.
+    """
+    
+    def __init__(self,
+                 timestamps: np.ndarray,
+                 bid_prices: np.ndarray,
+                 bid_sizes: np.ndarray,
+                 ask_prices: np.ndarray,
+                 ask_sizes: np.ndarray):
+        """
+        Args:
+            timestamps: Snapshot times (epoch seconds), ascending
+            bid_prices/bid_sizes/ask_prices/ask_sizes: (snapshots, levels) arrays
+        """
+        self.timestamps = np.asarray(timestamps, dtype=np.float64)
+        self.bid_prices = np.asarray(bid_prices, dtype=np.float64)
+        self.bid_sizes = np.asarray(bid_sizes, dtype=np.float64)
+        self.ask_prices = np.asarray(ask_prices, dtype=np.float64)
+        self.ask_sizes = np.asarray(ask_sizes, dtype=np.float64)
+        self._current = -1
+    
+    @classmethod
+    def load(cls, path: str) -> 'DepthReplay':
+        """Load snapshots saved with ``save``"""
+        data = np.load(path)
+        return cls(data['timestamps'], data['bid_prices'], data['bid_sizes'],
+                   data['ask_prices'], data['ask_sizes'])
+    
+    def save(self, path: str):
+        """Save snapshots as a compressed ``.npz``"""
+        np.savez_compressed(
+            path, timestamps=self.timestamps,
+            bid_prices=self.bid_prices, bid_sizes=self.bid_sizes,
+            ask_prices=self.ask_prices, ask_sizes=self.ask_sizes
+        )
+    
+    def __len__(self) -> int:
+        return len(self.timestamps)
+    
+    def index_at(self, timestamp: float) -> int:
+        """Index of the latest snapshot at or before ``timestamp`` (-1 if none)"""
+        return int(np.searchsorted(self.timestamps, timestamp, side='right')) - 1
+    
+    def apply(self, book: OrderBook, timestamp: float) -> bool:
+        """
+        Load the snapshot in force at ``timestamp`` into ``book``
+        
+        Returns:
+            True if a new snapshot was loaded
+        """
+        index = self.index_at(timestamp)
+        if index < 0 or index == self._current:
+            return False
+        
+        book.load_snapshot(self.bid_prices[index], self.bid_sizes[index],
+                           self.ask_prices[index], self.ask_sizes[index])
+        self._current = index
+        return True
+
+
 class MarketMicrostructure:
     """
     Market microstructure model
@@ -199,10 +354,16 @@ class MarketMicrostructure:
     - Liquidity dynamics
     """
     
-    def __init__(self):
-        """Initialize microstructure model"""
+    def __init__(self, depth_replay: Optional[DepthReplay] = None):
+        """
+        Initialize microstructure model
+        
+        Args:
+            depth_replay: Recorded depth snapshots (None = synthetic book)
+        """
         
         self.order_book = OrderBook(levels=10)
+        self.depth_replay = depth_replay
         
         # Metrics
         self.order_flow_imbalance = 0.0
@@ -222,17 +383,33 @@ class MarketMicrostructure:
             return
         
         latest = market_data.iloc[-1]
-        price = latest.get('close', 0)
+        bar = latest.to_dict()
+        bar.setdefault('timestamp', latest.name)
+        self.update_bar(bar)
+    
+    def update_bar(self, bar: Dict):
+        """
+        Update microstructure from a single bar (event-driven backtests)
+        
+        Args:
+            bar: Mapping with close, open, volume and optionally timestamp
+        """
+        price = bar.get('close', 0)
         
         if price == 0:
             return
         
-        # Initialize/update order book
-        self.order_book.initialize(price)
+        # Update order book: recorded depth if available, else rebuild the synthetic ladder
+        timestamp = bar.get('timestamp')
+        if (self.depth_replay is not None and isinstance(timestamp, (pd.Timestamp, datetime)) and
+                self.depth_replay.index_at(pd.Timestamp(timestamp).timestamp()) >= 0):
+            self.depth_replay.apply(self.order_book, pd.Timestamp(timestamp).timestamp())
+        else:
+            self.order_book.recenter(price)
         
         # Calculate order flow imbalance
-        volume = latest.get('volume', 0)
-        price_change = latest.get('close', 0) - latest.get('open', 0)
+        volume = bar.get('volume', 0)
+        price_change = bar.get('close', 0) - bar.get('open', 0)
         
         # Positive imbalance = more buying pressure
         if price_change > 0:
@@ -251,7 +428,7 @@ class MarketMicrostructure:
             action: BUY or SELL
             size: Order size
             signal_price: Signal price
-            
+        
         Returns:
             Realistic execution price
         """
@@ -0,0 +1,292 @@
+"""
+Monte Carlo Robustness Analysis
+Distributions of backtest metrics over resampled equity paths
+
+A backtest yields one equity path; resampling its returns shows how
+much of the result depends on the particular ordering of events:
+
+- bootstrap: bar returns drawn independently with replacement
+- block_bootstrap: contiguous blocks of bar returns (keeps volatility
+  clustering and short-term autocorrelation)
+- trade_shuffle: round-trip returns in random order (same final
+  equity, different drawdowns)
+
+Paths are generated as one (paths x horizon) matrix per chunk, and
+max drawdown, Sharpe, total return and time to recovery are computed
+along the path axis. Chunking bounds memory to ``chunk_size x horizon``
+floats regardless of the number of paths.
+"""
+
+import logging
+import time
+import numpy as np
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+METHODS = ('bootstrap', 'block_bootstrap', 'trade_shuffle')
+METRICS = ('total_return', 'max_drawdown', 'sharpe_ratio', 'time_to_recovery')
+
+
+@dataclass
+class MonteCarloResult:
+    """Per-path metrics of one resampling method"""
+    method: str
+    paths: int
+    horizon: int
+    total_return: np.ndarray
+    max_drawdown: np.ndarray
+    sharpe_ratio: np.ndarray
+    time_to_recovery: np.ndarray     # Longest underwater stretch (bars; trades for trade_shuffle)
+    recovered: np.ndarray            # Path ends at a new high
+    observed: Dict[str, float]
+    
+    def percentiles(self, metric: str, q: Sequence[float] = (5, 25, 50, 75, 95)) -> Dict[str, float]:
+        """Percentiles of one metric's distribution"""
+        values = np.percentile(getattr(self, metric), q)
+        return {f'p{p:g}': float(v) for p, v in zip(q, values)}
+    
+    def rank(self, metric: str) -> Optional[float]:
+        """Share of paths at or below the observed value"""
+        if metric not in self.observed:
+            return None
+        return float(np.mean(getattr(self, metric) <= self.observed[metric]))
+    
+    def to_dict(self) -> Dict:
+        """Summary without the per-path arrays"""
+        return {
+            'method': self.method,
+            'paths': self.paths,
+            'horizon': self.horizon,
+            'probability_of_loss': float(np.mean(self.total_return < 0)),
+            'recovery_rate': float(np.mean(self.recovered)),
+            **{
+                metric: {
+                    'mean': float(np.mean(getattr(self, metric))),
+                    **self.percentiles(metric),
+                    'observed': self.observed.get(metric),
+                    'observed_rank': self.rank(metric)
+                }
+                for metric in METRICS
+            }
+        }
+
+
+class MonteCarloAnalyzer:
+    """
+    Resamples backtest returns into path matrices
+    
+    Usage:
+        analyzer = MonteCarloAnalyzer(config)
+        summary = analyzer.analyze(results)
+    """
+    
+    def __init__(self, config, paths: Optional[int] = None, seed: Optional[int] = None):
+        """
+        Args:
+            config: Configuration (backtesting.monte_carlo section)
+            paths: Paths per method (overrides config)
+            seed: Random seed (overrides config)
+        """
+        mc_config = config.get('backtesting', {}).get('monte_carlo', {})
+        
+        self.paths = paths or mc_config.get('paths', 10000)
+        self.block_size = mc_config.get('block_size', 20)
+        self.chunk_size = mc_config.get('chunk_size', 2500)
+        self.periods_per_year = mc_config.get('periods_per_year', 252)
+        self.seed = mc_config.get('seed') if seed is None else seed
+        self.seed_sequence = np.random.SeedSequence(self.seed)
+        self.rng = np.random.default_rng(self.seed_sequence)
+        
+        logger.info(
+            f"✓ Monte Carlo Analyzer initialized "
+            f"(paths={self.paths}, block={self.block_size}, chunk={self.chunk_size})"
+        )
+    
+    # ==================== ANALYSIS ====================
+    
+    def analyze(self, results: Dict, methods: Sequence[str] = METHODS) -> Dict[str, Dict]:
+        """
+        Robustness summary of a backtest result
+        
+        Args:
+            results: BacktestRunner / VectorizedBacktester results
+            methods: Resampling methods to run
+        
+        Returns:
+            Dict of method -> summary (see MonteCarloResult.to_dict)
+        """
+        start = time.perf_counter()
+        returns = np.asarray(results.get('daily_returns', []), dtype=np.float64)
+        trade_returns = self.trade_returns(results)
+        
+        summary = {}
+        for method in methods:
+            if method == 'trade_shuffle':
+                result = self.trade_shuffle(trade_returns)
+            elif method == 'block_bootstrap':
+                result = self.block_bootstrap(returns)
+            elif method == 'bootstrap':
+                result = self.bootstrap(returns)
+            else:
+                raise ValueError(f"Unknown Monte Carlo method: {method}")
+            
+            if result is not None:
+                summary[method] = result.to_dict()
+        
+        logger.info(
+            f"✓ Monte Carlo complete: {len(summary)} methods x {self.paths} paths "
+            f"in {time.perf_counter() - start:.2f}s"
+        )
+        return summary
+    
+    def task_rng(self, task: int) -> np.random.Generator:
+        """
+        Generator of one task of a parallel analysis
+        
+        The ``task``-th child of the analyzer's seed (as created by
+        ``SeedSequence.spawn``), so a task's paths do not depend on which
+        process runs it or on what ran there before.
+        """
+        return np.random.default_rng(np.random.SeedSequence(self.seed_sequence.entropy, spawn_key=(task,)))
+    
+    def robustness_metrics(self, results: Dict, task: Optional[int] = None) -> Dict[str, float]:
+        """
+        Scalar block-bootstrap figures for ranking sweep candidates
+        
+        Args:
+            results: Backtest results
+            task: Task number (draws from ``task_rng``; None = the shared generator)
+        """
+        rng = None if task is None else self.task_rng(task)
+        result = self.block_bootstrap(np.asarray(results.get('daily_returns', []), dtype=np.float64), rng=rng)
+        if result is None:
+            return {}
+        return {
+            'mc_total_return_p5': float(np.percentile(result.total_return, 5)),
+            'mc_max_drawdown_p5': float(np.percentile(result.max_drawdown, 5)),
+            'mc_sharpe_ratio_p5': float(np.percentile(result.sharpe_ratio, 5)),
+            'mc_probability_of_loss': float(np.mean(result.total_return < 0))
+        }
+    
+    @staticmethod
+    def trade_returns(results: Dict) -> np.ndarray:
+        """Round-trip returns (relative to equity at entry) from backtest results"""
+        if 'trade_returns' in results:
+            return np.asarray(results['trade_returns'], dtype=np.float64)
+        return np.array([
+            t['trade_return'] for t in results.get('trades', []) if 'trade_return' in t
+        ], dtype=np.float64)
+    
+    # ==================== RESAMPLING ====================
+    
+    def bootstrap(self,
+                  returns: np.ndarray,
+                  horizon: Optional[int] = None,
+                  rng: Optional[np.random.Generator] = None) -> Optional[MonteCarloResult]:
+        """Independent draws of bar returns"""
+        returns = np.asarray(returns, dtype=np.float64)
+        if len(returns) < 2:
+            return None
+        
+        horizon = horizon or len(returns)
+        rng = rng or self.rng
+        
+        def sample(n):
+            return returns[rng.integers(0, len(returns), (n, horizon))]
+        
+        return self._simulate('bootstrap', sample, horizon, returns)
+    
+    def block_bootstrap(self,
+                        returns: np.ndarray,
+                        horizon: Optional[int] = None,
+                        block_size: Optional[int] = None,
+                        rng: Optional[np.random.Generator] = None) -> Optional[MonteCarloResult]:
+        """Moving-block draws of bar returns"""
+        returns = np.asarray(returns, dtype=np.float64)
+        if len(returns) < 2:
+            return None
+        
+        horizon = horizon or len(returns)
+        block = max(1, min(block_size or self.block_size, len(returns)))
+        blocks = -(-horizon // block)
+        offsets = np.arange(block)
+        rng = rng or self.rng
+        
+        def sample(n):
+            starts = rng.integers(0, len(returns) - block + 1, (n, blocks))
+            index = (starts[:, :, None] + offsets).reshape(n, blocks * block)[:, :horizon]
+            return returns[index]
+        
+        return self._simulate('block_bootstrap', sample, horizon, returns)
+    
+    def trade_shuffle(self,
+                      trade_returns: np.ndarray,
+                      rng: Optional[np.random.Generator] = None) -> Optional[MonteCarloResult]:
+        """
+        Random orderings of round-trip returns
+        
+        Paths step per trade, so ``time_to_recovery`` counts trades.
+        """
+        trade_returns = np.asarray(trade_returns, dtype=np.float64)
+        if len(trade_returns) < 2:
+            return None
+        
+        rng = rng or self.rng
+        
+        def sample(n):
+            return rng.permuted(np.tile(trade_returns, (n, 1)), axis=1)
+        
+        return self._simulate('trade_shuffle', sample, len(trade_returns), trade_returns)
+    
+    # ==================== PATH METRICS ====================
+    
+    def _simulate(self, method: str, sample, horizon: int, observed_returns: np.ndarray) -> MonteCarloResult:
+        """Generate paths chunk by chunk and collect their metrics"""
+        metrics = {name: np.empty(self.paths) for name in METRICS}
+        recovered = np.empty(self.paths, dtype=bool)
+        
+        for start in range(0, self.paths, self.chunk_size):
+            stop = min(start + self.chunk_size, self.paths)
+            chunk = self._path_metrics(sample(stop - start))
+            for name in METRICS:
+                metrics[name][start:stop] = chunk[name]
+            recovered[start:stop] = chunk['recovered']
+        
+        observed = self._path_metrics(observed_returns[None, :])
+        
+        return MonteCarloResult(
+            method=method,
+            paths=self.paths,
+            horizon=horizon,
+            recovered=recovered,
+            observed={name: float(observed[name][0]) for name in METRICS},
+            **metrics
+        )
+    
+    def _path_metrics(self, returns: np.ndarray) -> Dict[str, np.ndarray]:
+        """Metrics of each row of a (paths x horizon) return matrix"""
+        n, horizon = returns.shape
+        
+        wealth = np.empty((n, horizon + 1))
+        wealth[:, 0] = 1.0
+        np.cumprod(1.0 + returns, axis=1, out=wealth[:, 1:])
+        
+        peak = np.maximum.accumulate(wealth, axis=1)
+        max_drawdown = np.min(wealth / peak, axis=1) - 1.0
+        
+        # Steps (bars or trades) since the last high; its maximum is the longest underwater stretch
+        steps = np.arange(horizon + 1)
+        last_high = np.maximum.accumulate(np.where(wealth >= peak, steps, 0), axis=1)
+        underwater = steps - last_high
+        
+        sharpe = returns.mean(axis=1) / (returns.std(axis=1) + 1e-8) * np.sqrt(self.periods_per_year)
+        
+        return {
+            'total_return': wealth[:, -1] - 1.0,
+            'max_drawdown': max_drawdown,
+            'sharpe_ratio': sharpe,
+            'time_to_recovery': underwater.max(axis=1).astype(np.float64),
+            'recovered': underwater[:, -1] == 0
+        }
@@ -0,0 +1,664 @@
+"""
+Parameter Sweep
+Parallel backtests over strategy parameter combinations
+
+- Combinations from a full grid, random samples or Bayesian
+  optimization (Gaussian process + expected improvement)
+- OHLCV columns are copied once into a shared-memory block; worker
+  processes map it instead of receiving the data with every task
+- Results are yielded as they complete, so callers can show progress
+  or stop early
+- Strategies with ``signals_vectorized`` run on the vectorized
+  backtester, others on the event-driven BacktestRunner
+- Optional Monte Carlo robustness figures per candidate
+  (``monte_carlo_paths``)
+- ``run_windows`` evaluates a combination on several bar ranges
+  (walk-forward); vectorized signals are computed once per combination
+  and sliced per window
+- Optional ``ResultCache``: finished combinations and vectorized
+  signal arrays are reused across sweeps and editor re-runs
+"""
+
+import asyncio
+import hashlib
+import logging
+import math
+import os
+import itertools
+import json
+import numpy as np
+import pandas as pd
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .backtest_runner import BacktestRunner
+from .monte_carlo import MonteCarloAnalyzer
+from .result_cache import ResultCache
+from .vectorized_backtest import VectorizedBacktester
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ParameterRange:
+    """Searchable range of one strategy attribute"""
+    name: str
+    kind: str = 'float'                  # int, float or choice
+    low: Optional[float] = None
+    high: Optional[float] = None
+    step: Optional[float] = None         # Grid spacing (None = 5 points)
+    choices: Optional[List[Any]] = None
+    
+    def grid(self) -> List[Any]:
+        """Values visited by a grid search"""
+        if self.kind == 'choice':
+            return list(self.choices)
+        
+        if self.step:
+            values = np.arange(self.low, self.high + self.step / 2, self.step)
+        else:
+            values = np.linspace(self.low, self.high, 5)
+        return self._cast(values)
+    
+    def from_unit(self, u: np.ndarray) -> List[Any]:
+        """Map points of [0, 1] onto the range (snapped to the grid step)"""
+        u = np.clip(np.asarray(u, dtype=np.float64), 0.0, 1.0)
+        if self.kind == 'choice':
+            index = np.minimum((u * len(self.choices)).astype(int), len(self.choices) - 1)
+            return [self.choices[i] for i in index]
+        
+        values = self.low + u * (self.high - self.low)
+        if self.step:
+            values = self.low + np.round((values - self.low) / self.step) * self.step
+        return self._cast(np.clip(values, self.low, self.high))
+    
+    def to_unit(self, value: Any) -> float:
+        """Position of a value within the range"""
+        if self.kind == 'choice':
+            return (self.choices.index(value) + 0.5) / len(self.choices)
+        if self.high == self.low:
+            return 0.5
+        return (float(value) - self.low) / (self.high - self.low)
+    
+    def _cast(self, values: np.ndarray) -> List[Any]:
+        if self.kind == 'int':
+            return [int(round(v)) for v in values]
+        return [round(float(v), 10) for v in values]
+
+
+@dataclass
+class SweepResult:
+    """Metrics of one parameter combination"""
+    params: Dict[str, Any]
+    metrics: Dict[str, float] = field(default_factory=dict)
+    error: Optional[str] = None
+    window: Optional[int] = None                 # Position in run_windows' window list
+    equity_curve: Optional[np.ndarray] = None    # Kept on request (run_windows)
+    
+    def score(self, metric: str) -> float:
+        """Metric value (-inf for failed or tradeless runs)"""
+        value = self.metrics.get(metric)
+        if self.error is not None or value is None or not np.isfinite(value):
+            return -np.inf
+        return float(value)
+
+
+# ==================== SHARED MARKET DATA ====================
+
+class SharedFrame:
+    """
+    Numeric OHLCV columns (plus timestamps) in one shared-memory block
+    
+    The owner copies the data in on construction; workers rebuild a
+    DataFrame over the same memory with ``attach(spec)``.
+    """
+    
+    def __init__(self, data: pd.DataFrame):
+        """
+        Args:
+            data: Market data (non-numeric columns other than timestamp are dropped)
+        """
+        numeric = data.select_dtypes(include=[np.number]).astype(np.float64)
+        self.columns = list(numeric.columns)
+        self.rows = len(numeric)
+        self.has_timestamp = 'timestamp' in data.columns
+        
+        values_size = max(numeric.size * 8, 8)
+        stamps_size = self.rows * 8 if self.has_timestamp else 0
+        self.shm = shared_memory.SharedMemory(create=True, size=values_size + stamps_size)
+        
+        values = np.ndarray(numeric.shape, dtype=np.float64, buffer=self.shm.buf)
+        values[:] = numeric.to_numpy()
+        if self.has_timestamp:
+            stamps = np.ndarray((self.rows,), dtype=np.int64, buffer=self.shm.buf, offset=values_size)
+            stamps[:] = pd.to_datetime(data['timestamp']).to_numpy(dtype='datetime64[ns]').view(np.int64)
+        
+        self.spec = {
+            'name': self.shm.name,
+            'rows': self.rows,
+            'columns': self.columns,
+            'timestamp_offset': values_size if self.has_timestamp else None
+        }
+    
+    @staticmethod
+    def attach(spec: Dict) -> Tuple[pd.DataFrame, shared_memory.SharedMemory]:
+        """DataFrame view of a published block (keep the handle alive while in use)"""
+        shm = shared_memory.SharedMemory(name=spec['name'])
+        values = np.ndarray((spec['rows'], len(spec['columns'])), dtype=np.float64, buffer=shm.buf)
+        frame = pd.DataFrame(values, columns=spec['columns'], copy=False)
+        
+        if spec['timestamp_offset'] is not None:
+            stamps = np.ndarray((spec['rows'],), dtype=np.int64, buffer=shm.buf, offset=spec['timestamp_offset'])
+            frame.insert(0, 'timestamp', pd.to_datetime(stamps))
+        
+        return frame, shm
+    
+    def close(self):
+        """Release and remove the block"""
+        self.shm.close()
+        try:
+            self.shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+# ==================== WORKER ====================
+
+# Per-process state set by _init_worker
+_worker_frame: Optional[pd.DataFrame] = None
+_worker_config = None
+_worker_shm = None
+_worker_monte_carlo: Optional[MonteCarloAnalyzer] = None
+_worker_cache: Optional[ResultCache] = None
+_worker_cache_scope: Optional[Dict[str, Any]] = None
+
+
+def _init_worker(spec: Dict,
+                 config,
+                 monte_carlo_paths: int = 0,
+                 cache: Optional[ResultCache] = None,
+                 cache_scope: Optional[Dict[str, Any]] = None,
+                 monte_carlo_seed: Optional[int] = None):
+    """Pool initializer: map the shared market data once per process"""
+    global _worker_frame, _worker_config, _worker_shm, _worker_monte_carlo, _worker_cache, _worker_cache_scope
+    
+    # Quiet per-backtest component logs in workers
+    logging.getLogger('bot').setLevel(logging.WARNING)
+    
+    _worker_frame, _worker_shm = SharedFrame.attach(spec)
+    _worker_config = config
+    _worker_monte_carlo = (
+        MonteCarloAnalyzer(config, paths=monte_carlo_paths, seed=monte_carlo_seed) if monte_carlo_paths else None
+    )
+    _worker_cache = cache
+    _worker_cache_scope = cache_scope
+
+
+def _configure(strategy_class, params: Dict[str, Any]):
+    """Strategy instance with the combination's attributes set"""
+    strategy = strategy_class(_worker_config)
+    for name, value in params.items():
+        if not hasattr(strategy, name):
+            raise ValueError(f"{strategy_class.__name__} has no parameter '{name}'")
+        setattr(strategy, name, value)
+    return strategy
+
+
+def _cache_key(kind: str, strategy_class, strategy, **settings) -> Optional[str]:
+    """
+    Cache key of a configured strategy on the worker's data (None without a cache)
+    
+    Signals depend on the data and strategy only; other entries also
+    on the sweep's simulator settings and ``settings``.
+    """
+    if _worker_cache is None:
+        return None
+    if kind != 'signals':
+        settings = {**_worker_cache_scope['settings'], **settings}
+    return _worker_cache.key(
+        kind, _worker_cache_scope['fingerprint'], strategy_class,
+        ResultCache.strategy_params(strategy), settings or None
+    )
+
+
+def _signals(strategy_class, strategy) -> np.ndarray:
+    """Vectorized actions over the worker's data (cached indicator output when available)"""
+    key = _cache_key('signals', strategy_class, strategy)
+    cached = _worker_cache.get(key) if key else None
+    if cached is not None:
+        return cached['action']
+    
+    action, confidence = strategy.signals_vectorized(_worker_frame)
+    if key:
+        _worker_cache.put(key, {'action': action, 'confidence': confidence})
+    return action
+
+
+def _task_number(strategy_class, params: Dict[str, Any]) -> int:
+    """Stable number of a combination (Monte Carlo seed child, independent of scheduling)"""
+    payload = json.dumps([strategy_class.__qualname__, params], sort_keys=True, default=str)
+    return int.from_bytes(hashlib.blake2b(payload.encode(), digest_size=8).digest(), 'little')
+
+
+def _scalar_metrics(results: Dict) -> Dict[str, float]:
+    return {
+        key: float(value) for key, value in results.items()
+        if isinstance(value, (int, float, np.integer, np.floating))
+    }
+
+
+def _run_combination(strategy_class, params: Dict[str, Any], engine: str) -> SweepResult:
+    """Backtest one combination on the worker's market data"""
+    try:
+        strategy = _configure(strategy_class, params)
+        key = _cache_key('results', strategy_class, strategy, engine=engine)
+        cached = _worker_cache.get(key) if key else None
+        if cached is not None:
+            return SweepResult(params=params, metrics=cached)
+        
+        if engine != 'event' and getattr(strategy, 'supports_vectorized', False):
+            backtester = VectorizedBacktester(_worker_config)
+            results = backtester.run_signals(_worker_frame, _signals(strategy_class, strategy))
+        else:
+            runner = BacktestRunner(_worker_config)
+            runner.start_date = runner.end_date = None  # Data is already the sweep window
+            results = asyncio.run(runner.run_backtest(_worker_frame, strategy))
+        
+        metrics = _scalar_metrics(results)
+        if _worker_monte_carlo is not None and results:
+            metrics.update(_worker_monte_carlo.robustness_metrics(results, task=_task_number(strategy_class, params)))
+        
+        if key:
+            _worker_cache.put(key, metrics)
+        return SweepResult(params=params, metrics=metrics)
+    
+    except Exception as e:
+        return SweepResult(params=params, error=str(e))
+
+
+def _run_windows(strategy_class,
+                 params: Dict[str, Any],
+                 engine: str,
+                 windows: Sequence[Tuple[int, int, int]],
+                 keep_curves: bool) -> List[SweepResult]:
+    """
+    Backtest one combination on several bar ranges of the worker's data
+    
+    Each window is ``(history_start, start, stop)``: bars from
+    ``history_start`` warm up the strategy, trading covers
+    ``[start, stop)``. Vectorized signals are causal, so they are
+    computed once over the full history and sliced per window.
+    """
+    try:
+        strategy = _configure(strategy_class, params)
+        key = _cache_key('windows', strategy_class, strategy,
+                         engine=engine, windows=[list(w) for w in windows], keep_curves=keep_curves)
+        cached = _worker_cache.get(key) if key else None
+        if cached is not None:
+            return [
+                SweepResult(params=params, metrics=entry['metrics'], error=entry['error'],
+                            window=k, equity_curve=entry['equity_curve'])
+                for k, entry in enumerate(cached)
+            ]
+        
+        vectorized = engine != 'event' and getattr(strategy, 'supports_vectorized', False)
+        if vectorized:
+            action = _signals(strategy_class, strategy)
+    except Exception as e:
+        return [SweepResult(params=params, error=str(e), window=k) for k in range(len(windows))]
+    
+    results = []
+    for k, (history_start, start, stop) in enumerate(windows):
+        try:
+            segment = _worker_frame.iloc[history_start:stop]
+            warmup = start - history_start + 1  # First traded bar is ``start``
+            
+            if vectorized:
+                backtester = VectorizedBacktester(_worker_config)
+                backtester.warmup_bars = warmup
+                output = backtester.run_signals(segment, action[history_start:stop])
+            else:
+                runner = BacktestRunner(_worker_config)
+                runner.start_date = runner.end_date = None
+                runner.warmup_bars = warmup
+                output = asyncio.run(runner.run_backtest(segment, _configure(strategy_class, params)))
+            
+            curve = np.asarray(output['equity_curve'], dtype=np.float64) if keep_curves and output else None
+            results.append(SweepResult(params=params, metrics=_scalar_metrics(output), window=k, equity_curve=curve))
+        
+        except Exception as e:
+            results.append(SweepResult(params=params, error=str(e), window=k))
+    
+    if key and not any(r.error for r in results):
+        _worker_cache.put(key, [
+            {'metrics': r.metrics, 'error': r.error, 'equity_curve': r.equity_curve} for r in results
+        ])
+    return results
+
+
+# ==================== SWEEP ====================
+
+class ParameterSweep:
+    """
+    Parallel backtests of one strategy over many parameter sets
+    
+    Usage:
+        with ParameterSweep(config, data) as sweep:
+            for result in sweep.run(MACDMomentumStrategy, sweep.grid(space)):
+                ...
+    """
+    
+    def __init__(self,
+                 config,
+                 data: pd.DataFrame,
+                 workers: Optional[int] = None,
+                 engine: str = 'auto',
+                 metric: str = 'sharpe_ratio',
+                 monte_carlo_paths: int = 0,
+                 cache: Optional[ResultCache] = None):
+        """
+        Args:
+            config: Configuration passed to strategies and backtesters (picklable)
+            data: OHLCV market data shared by every run
+            workers: Worker processes (default: CPU count; 1 = run in-process)
+            engine: auto (vectorized when supported) or event
+            metric: Result metric maximized by ``bayesian`` and ``best``
+            monte_carlo_paths: Block-bootstrap paths per candidate (0 = off); adds mc_* metrics
+            cache: Result cache shared with the workers (None = always recompute)
+        """
+        self.config = config
+        self.data = data
+        self.workers = workers or os.cpu_count() or 1
+        self.engine = engine
+        self.metric = metric
+        self.monte_carlo_paths = monte_carlo_paths
+        self.cache = cache
+        
+        self._cache_scope: Optional[Dict[str, Any]] = None
+        self._shared: Optional[SharedFrame] = None
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._monte_carlo: Optional[MonteCarloAnalyzer] = None
+        
+        # Statistics
+        self.completed = 0
+        self.failed = 0
+        
+        logger.info(f"✓ Parameter Sweep initialized ({len(data)} bars, workers={self.workers})")
+    
+    # ==================== SAMPLING ====================
+    
+    @staticmethod
+    def grid(space: Sequence[ParameterRange]) -> List[Dict[str, Any]]:
+        """Every combination of the ranges' grid values"""
+        names = [r.name for r in space]
+        return [dict(zip(names, values)) for values in itertools.product(*(r.grid() for r in space))]
+    
+    @staticmethod
+    def random(space: Sequence[ParameterRange], n: int, seed: Optional[int] = None) -> List[Dict[str, Any]]:
+        """``n`` uniform samples of the space"""
+        u = np.random.default_rng(seed).random((n, len(space)))
+        columns = [r.from_unit(u[:, j]) for j, r in enumerate(space)]
+        return [{r.name: columns[j][i] for j, r in enumerate(space)} for i in range(n)]
+    
+    # ==================== EXECUTION ====================
+    
+    def _scope(self) -> Optional[Dict[str, Any]]:
+        """Key parts shared by every cached entry of this sweep (data hashed once)"""
+        if self.cache is not None and self._cache_scope is None:
+            self._cache_scope = {
+                'fingerprint': ResultCache.fingerprint(self.data),
+                'settings': {
+                    'simulator': ResultCache.simulator_settings(self.config),
+                    'monte_carlo_paths': self.monte_carlo_paths
+                }
+            }
+        return self._cache_scope
+    
+    def _ensure_pool(self):
+        """Publish the data and start workers on first use"""
+        if self._pool is None:
+            self._shared = SharedFrame(self.data)
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self._shared.spec, self.config, self.monte_carlo_paths, self.cache, self._scope(),
+                          self._monte_carlo_seed())
+            )
+    
+    def _monte_carlo_seed(self) -> Optional[int]:
+        """Base Monte Carlo seed shared with the workers (drawn once when not configured)"""
+        if not self.monte_carlo_paths:
+            return None
+        if self._monte_carlo is None:
+            self._monte_carlo = MonteCarloAnalyzer(self.config, paths=self.monte_carlo_paths)
+        return self._monte_carlo.seed_sequence.entropy
+    
+    def _submit(self, fn, *args):
+        self._ensure_pool()
+        return self._pool.submit(fn, *args)
+    
+    def _run_inline(self, fn, *args):
+        """Single-process execution over the caller's DataFrame"""
+        global _worker_frame, _worker_config, _worker_monte_carlo, _worker_cache, _worker_cache_scope
+        _worker_frame, _worker_config = self.data, self.config
+        self._monte_carlo_seed()
+        _worker_monte_carlo = self._monte_carlo
+        _worker_cache, _worker_cache_scope = self.cache, self._scope()
+        return fn(*args)
+    
+    def _stream(self, fn, tasks: Iterable[Tuple]) -> Iterator:
+        """Results of ``fn(*args)`` for every task, in completion order"""
+        if self.workers == 1:
+            for args in tasks:
+                yield self._run_inline(fn, *args)
+            return
+        
+        pending = {self._submit(fn, *args) for args in tasks}
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+    
+    def _record(self, result: SweepResult) -> SweepResult:
+        self.completed += 1
+        if result.error is not None:
+            self.failed += 1
+            logger.debug(f"Sweep combination {result.params} failed: {result.error}")
+        return result
+    
+    def run(self, strategy_class, combinations: Sequence[Dict[str, Any]]) -> Iterator[SweepResult]:
+        """
+        Backtest every combination
+        
+        Args:
+            strategy_class: Strategy class (instantiated with the config)
+            combinations: Parameter dicts (attribute name -> value)
+        
+        Yields:
+            SweepResult per combination, in completion order
+        """
+        tasks = ((strategy_class, params, self.engine) for params in combinations)
+        for result in self._stream(_run_combination, tasks):
+            yield self._record(result)
+    
+    def run_windows(self,
+                    strategy_class,
+                    jobs: Sequence[Tuple[Dict[str, Any], Sequence[Tuple[int, int, int]]]],
+                    keep_curves: bool = False) -> Iterator[List[SweepResult]]:
+        """
+        Backtest combinations on bar ranges of the data
+        
+        One task per combination covers all of its windows, so the
+        strategy's indicators are computed once however many windows
+        overlap.
+        
+        Args:
+            strategy_class: Strategy class
+            jobs: (params, windows) pairs; windows are (history_start, start, stop) bar indices
+            keep_curves: Return each window's equity curve
+        
+        Yields:
+            Per-window results of one combination, in completion order
+        """
+        tasks = ((strategy_class, params, self.engine, list(windows), keep_curves) for params, windows in jobs)
+        for results in self._stream(_run_windows, tasks):
+            yield [self._record(result) for result in results]
+    
+    def bayesian(self,
+                 strategy_class,
+                 space: Sequence[ParameterRange],
+                 n_iter: int = 50,
+                 n_initial: Optional[int] = None,
+                 seed: Optional[int] = None) -> Iterator[SweepResult]:
+        """
+        Sequential model-based search maximizing ``metric``
+        
+        Starts from random samples, then proposes the candidate with the
+        highest expected improvement under a Gaussian process fitted to
+        the finished runs. Keeps every worker busy: each completed run
+        triggers one new proposal.
+        
+        Args:
+            strategy_class: Strategy class
+            space: Parameter ranges
+            n_iter: Total combinations to evaluate
+            n_initial: Random combinations before the model is used
+            seed: Random seed
+        
+        Yields:
+            SweepResult per combination, in completion order
+        """
+        rng = np.random.default_rng(seed)
+        n_initial = min(n_iter, n_initial or max(self.workers, 2 * len(space) + 2))
+        
+        observed_x: List[np.ndarray] = []
+        observed_y: List[float] = []
+        seen = set()
+        
+        def propose() -> Dict[str, Any]:
+            if len(observed_y) < n_initial:
+                u = rng.random(len(space))
+            else:
+                u = self._expected_improvement_choice(np.array(observed_x), np.array(observed_y), rng)
+            params = {r.name: r.from_unit([u[j]])[0] for j, r in enumerate(space)}
+            
+            # Resample duplicates of already evaluated points
+            for _ in range(10):
+                key = tuple(params.items())
+                if key not in seen:
+                    break
+                u = rng.random(len(space))
+                params = {r.name: r.from_unit([u[j]])[0] for j, r in enumerate(space)}
+            seen.add(tuple(params.items()))
+            return params
+        
+        def observe(result: SweepResult):
+            score = result.score(self.metric)
+            observed_x.append(np.array([r.to_unit(result.params[r.name]) for r in space]))
+            observed_y.append(score if np.isfinite(score) else np.nan)
+        
+        submitted = 0
+        if self.workers == 1:
+            while submitted < n_iter:
+                result = self._record(self._run_inline(_run_combination, strategy_class, propose(), self.engine))
+                submitted += 1
+                observe(result)
+                yield result
+            return
+        
+        pending = set()
+        initial_batch = min(n_iter, max(self.workers, 1))
+        for _ in range(initial_batch):
+            pending.add(self._submit(_run_combination, strategy_class, propose(), self.engine))
+        submitted = initial_batch
+        
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = self._record(future.result())
+                    observe(result)
+                    yield result
+                    if submitted < n_iter:
+                        pending.add(self._submit(_run_combination, strategy_class, propose(), self.engine))
+                        submitted += 1
+        finally:
+            for future in pending:
+                future.cancel()
+    
+    @staticmethod
+    def _expected_improvement_choice(x: np.ndarray,
+                                     y: np.ndarray,
+                                     rng: np.random.Generator,
+                                     candidates: int = 512,
+                                     length_scale: float = 0.2,
+                                     noise: float = 1e-4) -> np.ndarray:
+        """Candidate point of [0, 1]^d with the highest expected improvement"""
+        valid = np.isfinite(y)
+        if valid.sum() < 2:
+            return rng.random(x.shape[1])
+        
+        x, y = x[valid], y[valid]
+        mean, std = y.mean(), y.std() + 1e-12
+        z = (y - mean) / std
+        
+        def kernel(a, b):
+            d2 = ((a[:, None, :] - b[None, :, :]) ** 2).sum(axis=-1)
+            return np.exp(-0.5 * d2 / length_scale ** 2)
+        
+        k = kernel(x, x) + noise * np.eye(len(x))
+        chol = np.linalg.cholesky(k)
+        alpha = np.linalg.solve(chol.T, np.linalg.solve(chol, z))
+        
+        points = rng.random((candidates, x.shape[1]))
+        k_star = kernel(points, x)
+        mu = k_star @ alpha
+        v = np.linalg.solve(chol, k_star.T)
+        sigma = np.sqrt(np.maximum(1.0 - (v ** 2).sum(axis=0), 1e-12))
+        
+        # Expected improvement over the best observation
+        improvement = mu - z.max() - 0.01
+        u = improvement / sigma
+        cdf = 0.5 * (1 + np.vectorize(math.erf)(u / np.sqrt(2)))
+        pdf = np.exp(-0.5 * u ** 2) / np.sqrt(2 * np.pi)
+        ei = improvement * cdf + sigma * pdf
+        
+        return points[int(np.argmax(ei))]
+    
+    def best(self, results: Sequence[SweepResult], n: int = 10) -> List[SweepResult]:
+        """Top ``n`` results by ``metric``"""
+        ranked = sorted(results, key=lambda r: r.score(self.metric), reverse=True)
+        return [r for r in ranked[:n] if np.isfinite(r.score(self.metric))]
+    
+    def get_statistics(self) -> Dict:
+        """Sweep statistics"""
+        statistics = {
+            'completed': self.completed,
+            'failed': self.failed,
+            'workers': self.workers,
+            'bars': len(self.data)
+        }
+        if self.cache is not None:
+            statistics['cache'] = self.cache.get_statistics()  # This process's lookups
+        return statistics
+    
+    def close(self):
+        """Stop workers and release the shared market data"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+        if self._shared is not None:
+            self._shared.close()
+            self._shared = None
+    
+    def __enter__(self) -> 'ParameterSweep':
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,600 @@
+"""
+Pipeline Replay
+Historical bars through the live BotV2 trading pipeline
+
+``BacktestRunner`` tests one strategy with simplified sizing. The
+replay drives the components ``BotV2.main_loop`` uses, built from the
+same configuration, through the same stage sequence per bar:
+
+validation → normalization → liquidation check → risk / circuit
+breaker → strategy signals → adaptive allocation → correlation
+adjustment → ensemble voting → portfolio construction → execution →
+portfolio update
+
+- Time comes from a ``SimulatedClock`` set to each bar's timestamp, so
+  cooldowns, rebalance intervals and order timestamps follow the data;
+  there are no sleeps and scheduled child orders fill on the clock
+- Every stage is timed into an ``HdrHistogram`` (microseconds)
+- Validation and normalization run once per chunk of bars; a chunk that
+  fails validation is re-validated bar by bar and only failing bars skip
+- Incremental strategies see every bar through ``on_bar``; vectorized
+  strategies are evaluated only on bars where ``signals_vectorized``
+  fires; others get a window of the last ``lookback`` bars
+- The exchange connector, state checkpoints and user data stream are
+  not part of a replay
+"""
+
+import logging
+import time
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from bot.backtesting.date_range import date_bounds, filter_date_range
+from bot.core import clock
+from bot.core.execution_analytics import HdrHistogram
+from bot.core.execution_engine import ExecutionEngine
+from bot.core.liquidation_detector import LiquidationDetector
+from bot.core.risk_manager import CircuitBreaker, RiskManager
+from bot.data.data_validator import DataValidator
+from bot.data.normalization_pipeline import NormalizationPipeline
+from bot.ensemble.adaptive_allocation import AdaptiveAllocationEngine
+from bot.ensemble.correlation_manager import CorrelationManager
+from bot.ensemble.ensemble_voting import EnsembleVoting
+from bot.ensemble.portfolio_construction import PortfolioConstructor
+from bot.strategies import load_all_strategies, load_strategy
+
+logger = logging.getLogger(__name__)
+
+STAGES = (
+    'data', 'validation', 'normalization', 'liquidation', 'risk', 'signals',
+    'allocation', 'correlation', 'voting', 'construction', 'execution', 'portfolio'
+)
+
+
+@dataclass
+class _SymbolFeed:
+    """Bars and per-symbol strategy instances of one replayed symbol"""
+    symbol: str
+    frame: pd.DataFrame
+    bars: List[Dict]
+    rows: np.ndarray                      # Row of each timeline step (-1 = no bar)
+    strategies: Dict[str, object]
+    incremental: List[str] = field(default_factory=list)
+    actions: Dict[str, np.ndarray] = field(default_factory=dict)
+    lookbacks: Dict[str, int] = field(default_factory=dict)
+    chunk: int = -1                       # Index of the validated chunk
+    chunk_valid: bool = True
+
+
+class PipelineReplay:
+    """
+    Replays OHLCV bars through the production pipeline components
+    
+    Usage:
+        replay = PipelineReplay(config)
+        results = await replay.run({'BTC': btc_bars, 'ETH': eth_bars})
+    """
+    
+    def __init__(self,
+                 config,
+                 strategies: Optional[Sequence[str]] = None,
+                 validation_chunk: Optional[int] = None,
+                 seed: Optional[int] = None):
+        """
+        Args:
+            config: ConfigManager (the live bot's configuration)
+            strategies: Strategy names (default: backtesting.replay.strategies,
+                else every enabled strategy as in the live bot)
+            validation_chunk: Bars per validation/normalization call
+            seed: Seed for slippage noise and Monte Carlo VaR (overrides config)
+        """
+        bt_config = config.get('backtesting', {})
+        replay_config = bt_config.get('replay', {})
+        
+        self.config = config
+        self.start_date, self.end_date = date_bounds(bt_config)
+        self.initial_capital = bt_config.get('initial_capital', 3000)
+        self.warmup_bars = bt_config.get('warmup_bars', 50)
+        self.lookback = bt_config.get('lookback', 200)
+        self.strategy_names = list(strategies or replay_config.get('strategies') or [])
+        self.validation_chunk = validation_chunk or replay_config.get('validation_chunk', 500)
+        self.cascade_threshold = config.get('liquidation_detection.cascade_threshold', 0.6)
+        self.cascade_action = config.get('liquidation_detection.action_on_cascade', 'reduce_positions')
+        self.seed = replay_config.get('seed') if seed is None else seed
+        
+        self.clock = clock.SimulatedClock()
+        self._init_components()
+        
+        # State
+        self.portfolio = {'cash': self.initial_capital, 'positions': {}, 'equity': self.initial_capital}
+        self.latest_prices: Dict[str, float] = {}
+        self.trade_history: List[Dict] = []
+        self.equity_curve: List[float] = []
+        self.skipped: Dict[str, int] = {}
+        self.stages = {name: HdrHistogram(lowest=0.1, highest=1e7) for name in STAGES}
+        self.iterations = 0
+        self.elapsed_seconds = 0.0
+        
+        logger.info(
+            f"✓ Pipeline Replay initialized "
+            f"(capital=€{self.initial_capital}, strategies={self.strategy_names or 'enabled'}, "
+            f"validation_chunk={self.validation_chunk})"
+        )
+    
+    def _init_components(self):
+        """Pipeline components, configured as in ``BotV2._init_components``"""
+        config = self.config
+        
+        self.data_validator = DataValidator(
+            outlier_threshold=config.get('data.validation.outlier_std_threshold', 5)
+        )
+        self.normalizer = NormalizationPipeline(
+            lookback=config.get('data.normalization.lookback_period', 252)
+        )
+        # Replayed metrics stay in memory; the spill files feed the live dashboard
+        self.risk_manager = RiskManager(config, spill_history=False)
+        self.circuit_breaker = CircuitBreaker(
+            level_1=config.risk.circuit_breaker['level_1_drawdown'],
+            level_2=config.risk.circuit_breaker['level_2_drawdown'],
+            level_3=config.risk.circuit_breaker['level_3_drawdown']
+        )
+        
+        self.allocation_engine = AdaptiveAllocationEngine(
+            rebalance_freq=config.get('ensemble.adaptive_allocation.rebalance_frequency', 'daily'),
+            smoothing_alpha=config.get('ensemble.adaptive_allocation.smoothing_alpha', 0.7),
+            lookback_days=config.get('ensemble.adaptive_allocation.lookback_days', 20),
+            drift_threshold=config.get('ensemble.adaptive_allocation.drift_threshold', 0.05)
+        )
+        self.correlation_manager = CorrelationManager(
+            threshold=config.risk.correlation_threshold,
+            method=config.get('ensemble.correlation_management.method', 'pearson')
+        )
+        self.ensemble_voting = EnsembleVoting(
+            method=config.get('ensemble.voting_method', 'weighted_average'),
+            confidence_threshold=config.get('ensemble.confidence_threshold', 0.5)
+        )
+        self.portfolio_constructor = PortfolioConstructor(
+            max_position_size=config.trading.max_position_size,
+            min_position_size=config.trading.min_position_size,
+            max_open_positions=config.trading.max_open_positions,
+            kelly_fraction=config.risk.kelly['fraction'],
+            min_probability=config.risk.kelly['min_probability'],
+            max_gross_exposure=config.get('ensemble.portfolio_construction.max_gross_exposure', 1.0),
+            correlation_shrinkage=config.get('ensemble.portfolio_construction.correlation_shrinkage', 0.1)
+        )
+        
+        self.liquidation_detector = LiquidationDetector(
+            cascade_threshold=config.get('liquidation_detection.cascade_threshold', 0.6),
+            lookback_window=config.get('liquidation_detection.lookback_window', 300)
+        )
+        self.execution_engine = ExecutionEngine(config)
+        if self.execution_engine.analytics is not None:
+            # Replayed fills stay in memory, like the risk history
+            self.execution_engine.analytics.snapshot_path = None
+        self.execution_engine.add_fill_listener(self._on_scheduled_fill)
+        # Deferred slices fill on the simulated clock instead of a background task
+        self.execution_engine.scheduler.driven = True
+        
+        # Reproducible runs
+        if self.seed is not None:
+            self.execution_engine.cost_model.reseed(self.seed)
+            self.risk_manager.risk_engine.rng = np.random.default_rng(self.seed)
+    
+    def _load_strategies(self) -> Dict[str, object]:
+        """Fresh strategy instances (one set per replayed symbol)"""
+        if not self.strategy_names:
+            return load_all_strategies(self.config)
+        
+        strategies = {}
+        for name in self.strategy_names:
+            strategy = load_strategy(name, self.config)
+            if strategy is not None:
+                strategies[name] = strategy
+        return strategies
+    
+    # ==================== REPLAY ====================
+    
+    async def run(self, data: Union[pd.DataFrame, Dict[str, pd.DataFrame]], symbol: str = 'BTC') -> Dict:
+        """
+        Replay historical bars through the pipeline
+        
+        Args:
+            data: OHLCV DataFrame with a timestamp column, or dict of
+                symbol -> DataFrame (bars aligned on timestamp)
+            symbol: Symbol of a single DataFrame
+        
+        Returns:
+            Dict with performance, trades, skipped iterations and
+            per-stage timing summaries (microseconds)
+        """
+        if isinstance(data, pd.DataFrame):
+            data = {symbol: data}
+        
+        frames = {s: filter_date_range(frame, self.start_date, self.end_date) for s, frame in data.items()}
+        frames = {s: frame for s, frame in frames.items() if not frame.empty}
+        if not frames:
+            logger.error("No data in specified date range")
+            return {}
+        
+        for s, frame in frames.items():
+            if 'timestamp' not in frame.columns:
+                raise ValueError(f"Replay data for {s} needs a timestamp column")
+        
+        timeline = np.unique(np.concatenate([f['timestamp'].to_numpy() for f in frames.values()]))
+        setup_start = time.perf_counter()
+        feeds = [self._feed(s, frame, timeline) for s, frame in frames.items()]
+        setup_seconds = time.perf_counter() - setup_start
+        
+        logger.info(f"Replaying {len(timeline)} steps for {len(feeds)} symbols...")
+        
+        self._reset()
+        day = None
+        start = time.perf_counter()
+        
+        with clock.use_clock(self.clock):
+            for step, timestamp in enumerate(timeline):
+                now = pd.Timestamp(timestamp)
+                self.clock.set(now)
+                
+                # Daily risk tracking follows the simulated calendar
+                if day is not None and now.date() != day:
+                    self.risk_manager.reset_daily_tracking()
+                day = now.date()
+                
+                await self._iteration(step, feeds)
+            
+            self.elapsed_seconds = time.perf_counter() - start
+        
+        self.iterations = len(timeline)
+        results = self._calculate_performance()
+        results['setup_seconds'] = setup_seconds
+        
+        logger.info(
+            f"✓ Replay complete: {results['total_return']:.2%} return, {len(self.trade_history)} trades "
+            f"({self.iterations} iterations, {results['iterations_per_second']:,.0f} it/s)"
+        )
+        
+        return results
+    
+    def _feed(self, symbol: str, frame: pd.DataFrame, timeline: np.ndarray) -> _SymbolFeed:
+        """Bars, timeline rows and strategies of one symbol"""
+        frame = frame.reset_index(drop=True)
+        strategies = self._load_strategies()
+        feed = _SymbolFeed(
+            symbol=symbol,
+            frame=frame,
+            bars=frame.to_dict('records'),
+            rows=pd.Index(frame['timestamp']).get_indexer(timeline),
+            strategies=strategies
+        )
+        
+        for name, strategy in strategies.items():
+            feed.lookbacks[name] = max(getattr(strategy, 'history_bars', None) or self.lookback, self.warmup_bars)
+            if getattr(strategy, 'supports_incremental', False):
+                strategy.reset_state()
+                feed.incremental.append(name)
+            elif getattr(strategy, 'supports_vectorized', False):
+                feed.actions[name] = strategy.signals_vectorized(frame)[0]
+        
+        return feed
+    
+    def _reset(self):
+        """Clear portfolio, trades and timings before a run"""
+        self.portfolio['cash'] = self.initial_capital
+        self.portfolio['positions'].clear()
+        self.portfolio['equity'] = self.initial_capital
+        self.latest_prices.clear()
+        self.trade_history.clear()
+        self.equity_curve = [self.initial_capital]
+        self.skipped = {}
+        for hist in self.stages.values():
+            hist.reset()
+    
+    def _lap(self, stage: str, started: float) -> float:
+        """Record the time since ``started`` for a stage; returns now"""
+        now = time.perf_counter()
+        self.stages[stage].record((now - started) * 1e6)
+        return now
+    
+    def _skip(self, reason: str):
+        self.skipped[reason] = self.skipped.get(reason, 0) + 1
+    
+    async def _iteration(self, step: int, feeds: List[_SymbolFeed]):
+        """One ``main_loop`` iteration at the current simulated time"""
+        t = time.perf_counter()
+        
+        # ===== DATA =====
+        current: List[Tuple[_SymbolFeed, int]] = [(f, int(f.rows[step])) for f in feeds if f.rows[step] >= 0]
+        raw_data = {f.symbol: f.bars[row] for f, row in current}
+        for symbol, bar in raw_data.items():
+            self.latest_prices[symbol] = bar['close']
+        
+        self.execution_engine.update_market_data(raw_data)
+        await self.execution_engine.scheduler.run_due()
+        t = self._lap('data', t)
+        
+        signals_done = await self._pipeline(current, raw_data, t)
+        
+        # Incremental strategies keep their state on iterations that stop early
+        if not signals_done:
+            t = time.perf_counter()
+            for feed, row in current:
+                for name in feed.incremental:
+                    await feed.strategies[name].on_bar(feed.bars[row])
+            if any(feed.incremental for feed, _ in current):
+                self._lap('signals', t)
+        
+        # ===== PORTFOLIO (mark to market) =====
+        t = time.perf_counter()
+        self.portfolio['equity'] = self._calculate_equity()
+        self.equity_curve.append(self.portfolio['equity'])
+        self._lap('portfolio', t)
+    
+    async def _pipeline(self, current: List[Tuple[_SymbolFeed, int]], raw_data: Dict[str, Dict], t: float) -> bool:
+        """
+        Stages 2-11 of the live loop
+        
+        Returns:
+            True if strategy signals were generated for this step
+        """
+        # ===== VALIDATION =====
+        valid = all([self._validate(feed, row) for feed, row in current])
+        t = self._lap('validation', t)
+        if not valid:
+            self._skip('validation')
+            return False
+        
+        # ===== NORMALIZATION (once per chunk over the trailing lookback) =====
+        for feed, row in current:
+            if row % self.validation_chunk == 0:
+                self.normalizer.normalize_features(
+                    feed.frame.iloc[max(0, row + 1 - self.normalizer.lookback):row + 1],
+                    feed.symbol
+                )
+        t = self._lap('normalization', t)
+        
+        # ===== LIQUIDATION CASCADE CHECK =====
+        cascade_risk = await self.liquidation_detector.detect_cascade_risk(raw_data, [])
+        if cascade_risk['probability'] > self.cascade_threshold:
+            if self.cascade_action == 'reduce_positions':
+                await self.risk_manager.emergency_reduce_positions(self.portfolio)
+            elif self.cascade_action == 'close_all':
+                await self.risk_manager.close_all_positions(self.portfolio)
+            self._lap('liquidation', t)
+            self._skip('liquidation_cascade')
+            return False
+        t = self._lap('liquidation', t)
+        
+        # ===== PRE-TRADE RISK CHECK =====
+        self.risk_manager.update_prices({symbol: bar['close'] for symbol, bar in raw_data.items()})
+        self.risk_manager.update_metrics(self.portfolio['equity'], self.portfolio['positions'])
+        self.circuit_breaker.check(self.risk_manager.get_daily_drawdown())
+        t = self._lap('risk', t)
+        if not self.circuit_breaker.can_trade():
+            self._skip('circuit_breaker')
+            return False
+        
+        # ===== STRATEGY SIGNALS =====
+        signals_by_symbol, strategy_performance = await self._signals(current)
+        t = self._lap('signals', t)
+        if not signals_by_symbol:
+            self._skip('no_signals')
+            return True
+        
+        # ===== ADAPTIVE ALLOCATION =====
+        self.allocation_engine.update_performance(strategy_performance)
+        if self.allocation_engine.should_rebalance():
+            weights = self.allocation_engine.calculate_weights(strategy_performance)
+        else:
+            weights = self.allocation_engine.current_weights
+        t = self._lap('allocation', t)
+        
+        # ===== CORRELATION MANAGEMENT =====
+        self.correlation_manager.update_correlations(signals_by_symbol, strategy_performance)
+        adjusted = {
+            symbol: self.correlation_manager.adjust_for_correlation(signals, self.portfolio['positions'])
+            for symbol, signals in signals_by_symbol.items()
+        }
+        portfolio_corr = self.correlation_manager.get_portfolio_correlation()
+        t = self._lap('correlation', t)
+        
+        # ===== ENSEMBLE VOTING (per symbol; signals keyed by strategy) =====
+        decisions = {}
+        for signals in adjusted.values():
+            decisions.update(self.ensemble_voting.vote_by_symbol(signals, weights))
+        t = self._lap('voting', t)
+        if not decisions:
+            self._skip('no_consensus')
+            return True
+        
+        # ===== PORTFOLIO CONSTRUCTION =====
+        correlation_factor = self.correlation_manager.get_correlation_factor(portfolio_corr)
+        cb_multiplier = self.circuit_breaker.get_size_multiplier()
+        prices = {symbol: bar['close'] for symbol, bar in raw_data.items()}
+        pending_buys = self.execution_engine.scheduler.pending_value('BUY')
+        orders = self.portfolio_constructor.construct(
+            decisions,
+            {**self.portfolio, 'cash': self.portfolio['cash'] - pending_buys},
+            prices,
+            correlation=self.risk_manager.risk_engine.correlation_matrix(list(decisions)),
+            size_multiplier=correlation_factor * cb_multiplier
+        )
+        t = self._lap('construction', t)
+        if not orders:
+            self._skip('no_orders')
+            return True
+        
+        # ===== EXECUTE ORDER BATCH =====
+        results = await self.execution_engine.execute_batch(orders, raw_data, self.portfolio)
+        t = self._lap('execution', t)
+        
+        for trade_result in results:
+            if trade_result.get('executed'):
+                trade_result['size'] = trade_result.get('shares', 0)
+                self._update_portfolio(trade_result)
+                self.trade_history.append(trade_result)
+        self._lap('portfolio', t)
+        
+        return True
+    
+    def _validate(self, feed: _SymbolFeed, row: int) -> bool:
+        """Chunk validation, bar by bar inside chunks that fail"""
+        chunk = row // self.validation_chunk
+        if chunk != feed.chunk:
+            start = chunk * self.validation_chunk
+            block = feed.frame.iloc[start:start + self.validation_chunk]
+            
+            # Validated as of its last bar (no false "future" timestamps)
+            now = self.clock.now()
+            self.clock.set(block['timestamp'].iloc[-1])
+            feed.chunk_valid = self.data_validator.validate_market_data(block).is_valid
+            self.clock.set(now)
+            feed.chunk = chunk
+        
+        if feed.chunk_valid:
+            return True
+        
+        # The bar with its predecessor (order, gaps and OHLC of this bar)
+        return self.data_validator.validate_market_data(feed.frame.iloc[max(0, row - 1):row + 1]).is_valid
+    
+    async def _signals(self, current: List[Tuple[_SymbolFeed, int]]) -> Tuple[Dict[str, Dict], Dict[str, Dict]]:
+        """
+        Signals of every strategy for every symbol with a bar
+        
+        Returns:
+            (symbol -> strategy name -> TradeSignal, strategy name -> performance)
+        """
+        signals_by_symbol = {}
+        strategy_performance = {}
+        
+        for feed, row in current:
+            bar = feed.bars[row]
+            warm = row + 1 >= self.warmup_bars
+            signals = {}
+            
+            for name, strategy in feed.strategies.items():
+                try:
+                    if name in feed.actions:
+                        signal = None
+                        if warm and feed.actions[name][row] != 0:
+                            signal = await strategy.generate_signal(self._window(feed, name, row))
+                    elif name in feed.incremental:
+                        signal = await strategy.on_bar(bar)
+                        signal = signal if warm else None
+                    else:
+                        signal = await strategy.generate_signal(self._window(feed, name, row)) if warm else None
+                except Exception as e:
+                    logger.error(f"Strategy {name} error: {e}")
+                    continue
+                
+                if signal is not None:
+                    # Strategies emit their default symbol; stamp the replayed one
+                    if signal.symbol != feed.symbol:
+                        signal = replace(signal, symbol=feed.symbol)
+                    signals[name] = signal
+                    strategy_performance[name] = strategy.get_performance_metrics()
+            
+            if signals:
+                signals_by_symbol[feed.symbol] = signals
+        
+        return signals_by_symbol, strategy_performance
+    
+    def _window(self, feed: _SymbolFeed, name: str, row: int) -> pd.DataFrame:
+        """Last ``lookback`` bars of a strategy up to and including ``row``"""
+        return feed.frame.iloc[max(0, row + 1 - feed.lookbacks[name]):row + 1]
+    
+    # ==================== PORTFOLIO ====================
+    
+    def _on_scheduled_fill(self, fill: Dict):
+        """Apply a scheduled child order fill to the portfolio"""
+        self._update_portfolio(fill)
+        self.trade_history.append(fill)
+    
+    def _update_portfolio(self, trade_result: Dict):
+        """Update portfolio with a fill (as ``BotV2._update_portfolio``)"""
+        symbol = trade_result['symbol']
+        size = trade_result['size']
+        price = trade_result['price']
+        positions = self.portfolio['positions']
+        
+        if trade_result['action'] == 'BUY':
+            if symbol in positions:
+                current_size = positions[symbol]['size']
+                new_size = current_size + size
+                positions[symbol] = {
+                    'size': new_size,
+                    'avg_price': (current_size * positions[symbol]['avg_price'] + size * price) / new_size,
+                    'last_update': clock.now()
+                }
+            else:
+                positions[symbol] = {'size': size, 'avg_price': price, 'last_update': clock.now()}
+            
+            self.portfolio['cash'] -= size * price
+        
+        elif symbol in positions:
+            current_size = positions[symbol]['size']
+            if size >= current_size:
+                trade_result['pnl'] = (price - positions[symbol]['avg_price']) * current_size
+                del positions[symbol]
+                self.portfolio['cash'] += current_size * price
+            else:
+                positions[symbol]['size'] -= size
+                self.portfolio['cash'] += size * price
+        
+        self.portfolio['equity'] = self._calculate_equity()
+    
+    def _calculate_equity(self) -> float:
+        """Cash plus positions at the latest replayed closes"""
+        equity = self.portfolio['cash']
+        for symbol, position in self.portfolio['positions'].items():
+            equity += position['size'] * self.latest_prices.get(symbol, position['avg_price'])
+        return equity
+    
+    # ==================== RESULTS ====================
+    
+    def get_stage_timings(self) -> Dict[str, Dict]:
+        """Per-stage latency summary (microseconds) with each stage's share of the run"""
+        total = sum(hist.total for hist in self.stages.values())
+        return {
+            name: {
+                **hist.summary(),
+                'total_ms': hist.total / 1000,
+                'share': hist.total / total if total > 0 else 0.0
+            }
+            for name, hist in self.stages.items()
+        }
+    
+    def _calculate_performance(self) -> Dict:
+        """Performance metrics and replay statistics"""
+        equity_curve = np.array(self.equity_curve)
+        returns = np.diff(equity_curve) / equity_curve[:-1]
+        
+        total_return = (equity_curve[-1] - self.initial_capital) / self.initial_capital
+        sharpe = np.mean(returns) / (np.std(returns) + 1e-8) * np.sqrt(252) if len(returns) > 1 else 0.0
+        running_max = np.maximum.accumulate(equity_curve)
+        max_drawdown = float(np.min((equity_curve - running_max) / running_max))
+        closed = [t for t in self.trade_history if 'pnl' in t]
+        
+        return {
+            'initial_capital': self.initial_capital,
+            'final_equity': float(equity_curve[-1]),
+            'total_return': float(total_return),
+            'total_return_pct': float(total_return * 100),
+            'sharpe_ratio': float(sharpe),
+            'max_drawdown': max_drawdown,
+            'max_drawdown_pct': max_drawdown * 100,
+            'total_trades': len(self.trade_history),
+            'winning_trades': sum(1 for t in closed if t['pnl'] > 0),
+            'win_rate': sum(1 for t in closed if t['pnl'] > 0) / len(closed) if closed else 0.0,
+            'equity_curve': self.equity_curve,
+            'daily_returns': returns,
+            'trades': self.trade_history,
+            'skipped': dict(self.skipped),
+            'iterations': self.iterations,
+            'elapsed_seconds': self.elapsed_seconds,
+            'iterations_per_second': self.iterations / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0,
+            'stages': self.get_stage_timings(),
+            'execution': self.execution_engine.get_execution_stats()
+        }
@@ -9,6 +9,8 @@ import numpy as np
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 
+from bot.core.cost_model import CostModel
+
 logger = logging.getLogger(__name__)
 
 
@@ -40,11 +42,20 @@ class RealisticSimulator:
         # Market microstructure
         self.avg_spread_bps = 5  # 5 basis points average spread
         self.depth_per_level = 10000  # $10k per price level
+        self.depth_levels = 5  # Levels available to a single order
+        self.off_hours = (22, 6)  # UTC hours with thin books (wider spread)
+        self.off_hours_spread_multiplier = 1.5
         
         # Transaction costs
         self.commission_pct = config.execution.commission_percent
         self.market_impact_pct = config.execution.market_impact_percent
         
+        # Same cost model as live execution; crossing pays half the spread
+        self.cost_model = CostModel.from_config(
+            config,
+            spread_weight=0.5 if self.include_spread else 0.0
+        )
+        
         # State
         self.simulated_trades: List[Dict] = []
         self.total_slippage = 0.0
@@ -56,4 +67,118 @@ class RealisticSimulator:
                       action: str,
                       size: float,
                       price: float,
-                      ma
+                      market_data: pd.DataFrame,
+                      portfolio_value: Optional[float] = None) -> Dict:
+        """
+        Simulate execution of one order
+        
+        Args:
+            action: BUY or SELL
+            size: Order value (EUR)
+            price: Reference price
+            market_data: OHLCV history up to the current bar
+            portfolio_value: Equity for the size fraction (default: visible book depth)
+        
+        Returns:
+            Execution dict (executed, execution_price, size_filled, commission, total_cost, ...)
+        """
+        
+        if size <= 0 or price <= 0:
+            return {'executed': False, 'reason': 'invalid_order'}
+        
+        volatility, spread, timestamp = self._market_state(market_data)
+        
+        # Partial fills beyond the depth a single order can take
+        size_filled = size
+        if self.realistic_fills and self.include_depth:
+            size_filled = min(size, self.depth_per_level * self.depth_levels)
+        
+        reference = portfolio_value if portfolio_value else self.depth_per_level * self.depth_levels
+        cost = self.cost_model.estimate(action, size_filled / reference, volatility, spread=spread)
+        
+        execution_price = float(cost.execution_prices(price)[0])
+        slippage = float(cost.slippage[0])
+        commission = size_filled * self.commission_pct
+        
+        execution = {
+            'executed': True,
+            'timestamp': timestamp,
+            'action': action,
+            'price': price,
+            'execution_price': execution_price,
+            'size_requested': size,
+            'size_filled': size_filled,
+            'fill_ratio': size_filled / size,
+            'slippage': slippage,
+            'market_impact': float(cost.impact[0]),
+            'spread': spread,
+            'commission': commission,
+            'total_cost': size_filled + commission
+        }
+        
+        self.simulated_trades.append(execution)
+        self.total_slippage += slippage
+        self.total_commission += commission
+        
+        return execution
+    
+    def _market_state(self, market_data: pd.DataFrame):
+        """Volatility, effective spread and timestamp of the current bar"""
+        
+        volatility = 0.02
+        timestamp = datetime.now()
+        if market_data is not None and len(market_data) > 0:
+            closes = market_data['close'].to_numpy(dtype=np.float64)[-21:]
+            if len(closes) > 2:
+                volatility = float(np.std(np.diff(closes) / closes[:-1]))
+            
+            latest = market_data.iloc[-1]
+            stamp = latest['timestamp'] if 'timestamp' in market_data.columns else latest.name
+            if isinstance(stamp, (datetime, pd.Timestamp)):
+                timestamp = stamp
+        
+        spread = self.avg_spread_bps / 10000 if self.include_spread else 0.0
+        if self.include_time_effects:
+            start, end = self.off_hours
+            if timestamp.hour >= start or timestamp.hour < end:
+                spread *= self.off_hours_spread_multiplier
+        
+        return volatility, spread, timestamp
+    
+    def market_state_vectorized(self, market_data: pd.DataFrame):
+        """
+        Volatility and effective spread for every bar at once
+        
+        Same quantities as ``_market_state`` evaluated on the history
+        up to each bar (vectorized backtests).
+        
+        Returns:
+            (volatility, spread) arrays, one entry per row
+        """
+        returns = market_data['close'].astype(np.float64).pct_change()
+        volatility = returns.rolling(20, min_periods=2).std(ddof=0).fillna(0.02).to_numpy()
+        
+        spread = np.full(len(market_data), self.avg_spread_bps / 10000 if self.include_spread else 0.0)
+        if self.include_time_effects:
+            if 'timestamp' in market_data.columns:
+                hours = pd.DatetimeIndex(market_data['timestamp']).hour.to_numpy()
+            elif isinstance(market_data.index, pd.DatetimeIndex):
+                hours = market_data.index.hour.to_numpy()
+            else:
+                hours = np.full(len(market_data), datetime.now().hour)
+            
+            start, end = self.off_hours
+            spread = np.where((hours >= start) | (hours < end), spread * self.off_hours_spread_multiplier, spread)
+        
+        return volatility, spread
+    
+    def get_statistics(self) -> Dict:
+        """Simulation statistics"""
+        
+        n = len(self.simulated_trades)
+        return {
+            'total_trades': n,
+            'total_slippage': self.total_slippage,
+            'avg_slippage': self.total_slippage / n if n else 0.0,
+            'total_commission': self.total_commission
+        }
@@ -0,0 +1,320 @@
+"""
+Result Cache
+Content-addressed on-disk cache of backtest results
+
+Entries are keyed by a hash of everything that determines them:
+
+- data: bar range plus a digest of the column values
+- strategy: class path and configured parameter values
+- settings: simulator/backtest configuration (results only)
+- code: digest of the strategy and backtest engine sources
+
+Two kinds of entries share one directory:
+
+- ``signals``: a strategy's vectorized action/confidence arrays,
+  valid under any simulator settings
+- ``results`` / ``windows``: final metrics of a run or of a set of
+  walk-forward windows
+
+Entries are pickled files written atomically and evicted least
+recently used once the directory exceeds ``max_bytes``. Several
+processes (sweep workers) can share a directory. Event-driven runs
+with an unseeded cost model are cached as the first draw.
+"""
+
+import hashlib
+import importlib
+import json
+import logging
+import os
+import pickle
+import numpy as np
+import pandas as pd
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Modules whose source changes invalidate every cached result
+ENGINE_MODULES = (
+    'bot.backtesting.backtest_runner',
+    'bot.backtesting.vectorized_backtest',
+    'bot.backtesting.realistic_simulator',
+    'bot.backtesting.market_microstructure',
+    'bot.backtesting.monte_carlo',
+    'bot.backtesting.parameter_sweep',
+    'bot.backtesting.walk_forward',
+    'bot.core.cost_model',
+    'bot.strategies.base_strategy',
+)
+
+ENTRY_SUFFIX = '.pkl'
+
+# Module name -> source digest (sources do not change within a process)
+_source_digests: Dict[str, str] = {}
+
+
+def _source_digest(module_name: str) -> str:
+    """Digest of a module's source file (module name if it has none)"""
+    if module_name not in _source_digests:
+        digest = hashlib.blake2b(module_name.encode(), digest_size=16)
+        path = getattr(importlib.import_module(module_name), '__file__', None)
+        if path and os.path.exists(path):
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+        _source_digests[module_name] = digest.hexdigest()
+    return _source_digests[module_name]
+
+
+def _jsonable(value: Any) -> Any:
+    """JSON fallback for key payloads"""
+    if isinstance(value, (np.integer, np.floating, np.bool_)):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if hasattr(value, '__dict__'):
+        return vars(value)
+    return str(value)
+
+
+class ResultCache:
+    """
+    Size-bounded, content-addressed backtest cache
+    
+    Usage:
+        cache = ResultCache('data/backtest_cache')
+        key = cache.key('results', cache.fingerprint(data), strategy_class, params, settings)
+        metrics = cache.get(key)
+        if metrics is None:
+            metrics = ...
+            cache.put(key, metrics)
+    """
+    
+    def __init__(self,
+                 directory: Union[str, Path] = 'data/backtest_cache',
+                 max_bytes: int = 512 * 2 ** 20,
+                 code_version: Optional[str] = None):
+        """
+        Args:
+            directory: Cache directory (created on demand)
+            max_bytes: Directory size above which least recently used entries are evicted
+            code_version: Fixed code version (default: digest of the engine and strategy sources)
+        """
+        self.directory = Path(directory)
+        self.max_bytes = int(max_bytes)
+        self.code_version = code_version
+        
+        # Key -> entry size, least recently used first
+        self._index: 'OrderedDict[str, int]' = OrderedDict()
+        self._bytes = 0
+        
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._scan()
+        
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        
+        logger.info(
+            f"✓ Result Cache initialized "
+            f"({self.directory}, {len(self._index)} entries, {self._bytes / 2 ** 20:.1f}/{self.max_bytes / 2 ** 20:.0f} MB)"
+        )
+    
+    @classmethod
+    def from_config(cls, config) -> Optional['ResultCache']:
+        """Cache from backtesting.cache (None when disabled)"""
+        cache_config = config.get('backtesting', {}).get('cache', {}) or {}
+        if not cache_config.get('enabled', False):
+            return None
+        
+        return cls(
+            cache_config.get('dir', 'data/backtest_cache'),
+            max_bytes=int(cache_config.get('max_mb', 512) * 2 ** 20),
+            code_version=cache_config.get('code_version')
+        )
+    
+    # ==================== KEYS ====================
+    
+    @staticmethod
+    def fingerprint(data: pd.DataFrame) -> str:
+        """
+        Bar range plus a digest of every column
+        
+        Numeric and datetime columns are hashed as raw bytes, others
+        through pandas' row hashes.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr((len(data), [str(c) for c in data.columns])).encode())
+        
+        for column in data.columns:
+            values = data[column].to_numpy()
+            if values.dtype.kind not in 'biufcmM':
+                values = pd.util.hash_pandas_object(data[column], index=False).to_numpy()
+            digest.update(np.ascontiguousarray(values).view(np.uint8))
+        
+        if 'timestamp' in data.columns and len(data):
+            span = f"{data['timestamp'].iloc[0]}/{data['timestamp'].iloc[-1]}"
+        else:
+            span = f"0/{len(data)}"
+        return f"{span}:{digest.hexdigest()}"
+    
+    @staticmethod
+    def strategy_params(strategy) -> Dict[str, Any]:
+        """Public scalar attributes of a configured strategy instance"""
+        return {
+            name: value for name, value in sorted(vars(strategy).items())
+            if not name.startswith('_') and isinstance(value, (bool, int, float, str, np.number))
+        }
+    
+    @staticmethod
+    def simulator_settings(config) -> Dict[str, Any]:
+        """Configuration read by the backtesters and the simulator's cost model"""
+        backtesting = {k: v for k, v in (config.get('backtesting', {}) or {}).items() if k not in ('cache', 'output')}
+        execution = getattr(config, 'execution', None)
+        return {
+            'backtesting': backtesting,
+            'execution': vars(execution) if execution is not None else {},
+            'cost_model': config.get('execution.cost_model', {}) or {}
+        }
+    
+    def version_of(self, strategy_class) -> str:
+        """Code version of a strategy's results"""
+        if self.code_version is not None:
+            return str(self.code_version)
+        
+        digest = hashlib.blake2b(digest_size=16)
+        for module_name in ENGINE_MODULES + (strategy_class.__module__,):
+            digest.update(_source_digest(module_name).encode())
+        return digest.hexdigest()
+    
+    def key(self,
+            kind: str,
+            fingerprint: str,
+            strategy_class,
+            params: Dict[str, Any],
+            settings: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Entry key
+        
+        Args:
+            kind: Entry kind (signals, results, windows)
+            fingerprint: Data fingerprint (``fingerprint``)
+            strategy_class: Strategy class
+            params: Strategy parameters (``strategy_params``)
+            settings: Anything else the entry depends on (simulator settings, engine, windows)
+        
+        Returns:
+            Hex digest
+        """
+        payload = json.dumps({
+            'kind': kind,
+            'data': fingerprint,
+            'strategy': f"{strategy_class.__module__}.{strategy_class.__qualname__}",
+            'params': params,
+            'settings': settings,
+            'code': self.version_of(strategy_class)
+        }, sort_keys=True, default=_jsonable)
+        return hashlib.blake2b(payload.encode(), digest_size=20).hexdigest()
+    
+    # ==================== STORAGE ====================
+    
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{ENTRY_SUFFIX}"
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Cached value (None on a miss)"""
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+            os.utime(path)  # Recency survives restarts and is shared between processes
+        except FileNotFoundError:
+            self._forget(key)
+            self.misses += 1
+            return None
+        except (EOFError, pickle.UnpicklingError, AttributeError, ImportError) as e:
+            logger.warning(f"Dropping unreadable cache entry {key}: {e}")
+            self.discard(key)
+            self.misses += 1
+            return None
+        
+        if key not in self._index:
+            self._add(key, path.stat().st_size)
+        self._index.move_to_end(key)
+        self.hits += 1
+        return value
+    
+    def put(self, key: str, value: Any):
+        """Store a value (replacing any entry under the key)"""
+        path = self._path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        
+        self._forget(key)
+        self._add(key, path.stat().st_size)
+        if self._bytes > self.max_bytes:
+            self._evict()
+    
+    def discard(self, key: str):
+        """Remove an entry"""
+        self._forget(key)
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            pass
+    
+    def clear(self):
+        """Remove every entry"""
+        self._scan()
+        for key in list(self._index):
+            self.discard(key)
+    
+    def _add(self, key: str, size: int):
+        self._index[key] = size
+        self._bytes += size
+    
+    def _forget(self, key: str):
+        self._bytes -= self._index.pop(key, 0)
+    
+    def _scan(self):
+        """Rebuild the index from the directory (oldest access first)"""
+        # Equal mtimes (coarse filesystem clocks) keep this process's order
+        rank = {key: i for i, key in enumerate(self._index)}
+        entries = []
+        for path in self.directory.glob(f"*{ENTRY_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue  # Evicted by another process
+            key = path.name[:-len(ENTRY_SUFFIX)]
+            entries.append((stat.st_mtime, rank.get(key, -1), key, stat.st_size))
+        
+        self._index.clear()
+        self._bytes = 0
+        for _, _, key, size in sorted(entries):
+            self._add(key, size)
+    
+    def _evict(self):
+        """Drop least recently used entries until the directory fits"""
+        self._scan()  # Other processes may have added or evicted entries
+        while self._bytes > self.max_bytes and self._index:
+            key = next(iter(self._index))
+            self.discard(key)
+            self.evictions += 1
+    
+    def get_statistics(self) -> Dict:
+        """Cache statistics"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._index),
+            'bytes': self._bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions
+        }
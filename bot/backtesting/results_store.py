@@ -0,0 +1,368 @@
+"""
+Backtest Results Store
+Columnar, chunk-streamed backtest output
+
+A run is a directory with one fixed-width binary file per table and
+a small JSON manifest:
+
+- equity.bin: (timestamp, equity) per marked bar
+- trades.bin: one record per fill; symbols and strategies are stored
+  as codes into the manifest's name lists
+- manifest.json: schema, row counts, scalar metrics and run metadata
+
+``ResultsWriter`` buffers records in preallocated arrays and appends
+them to the table files every ``chunk_rows`` records, so a run's
+memory does not grow with its length. ``load_results`` memory-maps
+the tables: readers (the dashboard) slice and downsample large runs
+without parsing them, and can follow a run that is still writing.
+
+Timestamps are epoch seconds; naive bar timestamps are read as UTC.
+"""
+
+import json
+import logging
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = 'manifest.json'
+FORMAT_VERSION = 1
+
+EQUITY_DTYPE = np.dtype([('timestamp', 'f8'), ('equity', 'f8')])
+
+TRADE_DTYPE = np.dtype([
+    ('timestamp', 'f8'),
+    ('symbol', 'i4'),
+    ('strategy', 'i4'),
+    ('side', 'i1'),                 # +1 BUY, -1 SELL
+    ('price', 'f8'),
+    ('execution_price', 'f8'),
+    ('size_requested', 'f8'),
+    ('size_filled', 'f8'),
+    ('slippage', 'f8'),
+    ('market_impact', 'f8'),
+    ('spread', 'f8'),
+    ('commission', 'f8'),
+    ('total_cost', 'f8'),
+    ('pnl', 'f8'),                  # NaN on entries
+    ('trade_return', 'f8'),
+    ('portfolio_value', 'f8'),
+])
+
+TABLES = {'equity': EQUITY_DTYPE, 'trades': TRADE_DTYPE}
+
+
+def to_epoch(timestamp: Any) -> float:
+    """Epoch seconds of a datetime/Timestamp/number (naive = UTC)"""
+    if timestamp is None:
+        return np.nan
+    if isinstance(timestamp, (int, float, np.integer, np.floating)):
+        return float(timestamp)
+    return pd.Timestamp(timestamp).timestamp()
+
+
+def _scalars(values: Dict) -> Dict[str, Any]:
+    """JSON-safe scalar entries of a results dict"""
+    scalars = {}
+    for key, value in values.items():
+        if isinstance(value, (bool, np.bool_)):
+            scalars[key] = bool(value)
+        elif isinstance(value, (int, np.integer)):
+            scalars[key] = int(value)
+        elif isinstance(value, (float, np.floating)):
+            scalars[key] = float(value) if np.isfinite(value) else None
+        elif isinstance(value, str):
+            scalars[key] = value
+    return scalars
+
+
+class _Table:
+    """Preallocated chunk of records appended to one table file"""
+    
+    def __init__(self, path: Path, dtype: np.dtype, chunk_rows: int):
+        self.path = path
+        self.buffer = np.zeros(max(1, int(chunk_rows)), dtype=dtype)
+        self.pending = 0
+        self.rows = 0
+        
+        path.write_bytes(b'')  # A new run replaces the table
+    
+    def append(self, record: tuple):
+        self.buffer[self.pending] = record
+        self.pending += 1
+        if self.pending == len(self.buffer):
+            self.flush()
+    
+    def extend(self, records: np.ndarray):
+        self.flush()
+        with open(self.path, 'ab') as f:
+            records.tofile(f)
+        self.rows += len(records)
+    
+    def flush(self):
+        if self.pending:
+            with open(self.path, 'ab') as f:
+                self.buffer[:self.pending].tofile(f)
+            self.rows += self.pending
+            self.pending = 0
+
+
+class ResultsWriter:
+    """
+    Streams one backtest's equity points and trades to disk
+    
+    Usage:
+        with ResultsWriter('data/backtest_results/run_1') as writer:
+            writer.append_equity(bar['timestamp'], equity)
+            writer.append_trade(trade)
+            writer.close(metrics)
+    """
+    
+    def __init__(self,
+                 directory: Union[str, Path],
+                 chunk_rows: int = 4096,
+                 metadata: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            directory: Run directory (created; existing tables are replaced)
+            chunk_rows: Records buffered per table before they are appended to disk
+            metadata: JSON-serializable run description kept in the manifest
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.metadata = dict(metadata or {})
+        
+        self._tables = {
+            name: _Table(self.directory / f'{name}.bin', dtype, chunk_rows)
+            for name, dtype in TABLES.items()
+        }
+        self._symbols: Dict[str, int] = {}
+        self._strategies: Dict[str, int] = {}
+        self.metrics: Dict[str, Any] = {}
+        self.closed = False
+        self.created = datetime.now().isoformat()
+        
+        self._write_manifest()
+    
+    def append_equity(self, timestamp: Any, equity: float):
+        """Record the marked equity of one bar"""
+        self._tables['equity'].append((to_epoch(timestamp), equity))
+    
+    def append_trade(self, trade: Dict):
+        """Record one fill (BacktestRunner trade record)"""
+        symbol = self._symbols.setdefault(str(trade.get('symbol', '')), len(self._symbols))
+        strategy = self._strategies.setdefault(str(trade.get('strategy', '')), len(self._strategies))
+        
+        self._tables['trades'].append((
+            to_epoch(trade.get('timestamp')),
+            symbol,
+            strategy,
+            1 if trade.get('action') == 'BUY' else -1,
+            trade.get('price', np.nan),
+            trade.get('execution_price', np.nan),
+            trade.get('size_requested', np.nan),
+            trade.get('size_filled', np.nan),
+            trade.get('slippage', np.nan),
+            trade.get('market_impact', np.nan),
+            trade.get('spread', np.nan),
+            trade.get('commission', np.nan),
+            trade.get('total_cost', np.nan),
+            trade.get('pnl', np.nan),
+            trade.get('trade_return', np.nan),
+            trade.get('portfolio_value', np.nan),
+        ))
+    
+    def extend_equity(self, timestamps: np.ndarray, equity: np.ndarray):
+        """Record many equity points at once"""
+        records = np.zeros(len(equity), dtype=EQUITY_DTYPE)
+        records['timestamp'] = timestamps
+        records['equity'] = equity
+        self._tables['equity'].extend(records)
+    
+    def flush(self):
+        """Append buffered records to the table files"""
+        for table in self._tables.values():
+            table.flush()
+        self._write_manifest()
+    
+    def close(self, metrics: Optional[Dict] = None):
+        """
+        Flush and mark the run complete
+        
+        Args:
+            metrics: Results dict; its scalar entries are kept in the manifest
+        """
+        if self.closed:
+            return
+        if metrics:
+            self.metrics.update(_scalars(metrics))
+        self.closed = True
+        self.flush()
+    
+    def results(self) -> 'StoredResults':
+        """Reader over what has been flushed so far"""
+        return StoredResults(self.directory)
+    
+    def _write_manifest(self):
+        manifest = {
+            'version': FORMAT_VERSION,
+            'created': self.created,
+            'complete': self.closed,
+            'metadata': self.metadata,
+            'metrics': self.metrics,
+            'symbols': list(self._symbols),
+            'strategies': list(self._strategies),
+            'tables': {
+                name: {'file': table.path.name, 'dtype': TABLES[name].descr, 'rows': table.rows}
+                for name, table in self._tables.items()
+            }
+        }
+        path = self.directory / MANIFEST_FILE
+        tmp_path = path.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps(manifest, default=str))
+        tmp_path.replace(path)
+    
+    def __enter__(self) -> 'ResultsWriter':
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.flush()  # Keep what was written; the run stays incomplete
+
+
+class StoredResults:
+    """
+    Lazy reader of a stored run
+    
+    Tables are memory-mapped on access; row counts follow the file
+    sizes, so a run still being written can be read.
+    """
+    
+    def __init__(self, directory: Union[str, Path]):
+        """
+        Args:
+            directory: Run directory written by ``ResultsWriter``
+        """
+        self.directory = Path(directory)
+        manifest_path = self.directory / MANIFEST_FILE
+        if not manifest_path.exists():
+            raise FileNotFoundError(f"No backtest results in {self.directory}")
+        self.manifest = json.loads(manifest_path.read_text())
+    
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        return self.manifest.get('metrics', {})
+    
+    @property
+    def complete(self) -> bool:
+        return bool(self.manifest.get('complete'))
+    
+    def table(self, name: str) -> np.ndarray:
+        """Memory-mapped records of a table"""
+        spec = self.manifest['tables'][name]
+        dtype = np.dtype([tuple(field) for field in spec['dtype']])
+        path = self.directory / spec['file']
+        
+        count = path.stat().st_size // dtype.itemsize if path.exists() else 0
+        if count == 0:
+            return np.zeros(0, dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode='r', shape=(count,))
+    
+    @property
+    def equity(self) -> np.ndarray:
+        return self.table('equity')
+    
+    @property
+    def trades(self) -> np.ndarray:
+        return self.table('trades')
+    
+    def returns(self) -> np.ndarray:
+        """Bar-to-bar returns of the equity curve"""
+        equity = self.equity['equity']
+        return np.diff(equity) / equity[:-1] if len(equity) > 1 else np.zeros(0)
+    
+    def equity_curve(self,
+                     start: Any = None,
+                     end: Any = None,
+                     max_points: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        Equity and drawdown over a time range
+        
+        Args:
+            start: Inclusive range start (datetime or epoch seconds)
+            end: Inclusive range end
+            max_points: Evenly strided sample size (the last point is kept)
+        
+        Returns:
+            Dict of timestamp, equity and drawdown arrays
+        """
+        records = self.equity
+        ts = records['timestamp']
+        lo = 0 if start is None else int(np.searchsorted(ts, to_epoch(start), side='left'))
+        hi = len(records) if end is None else int(np.searchsorted(ts, to_epoch(end), side='right'))
+        
+        equity = np.asarray(records['equity'][lo:hi])
+        drawdown = equity / np.maximum.accumulate(equity) - 1 if len(equity) else equity
+        index = np.arange(len(equity))
+        if max_points and len(equity) > max_points:
+            stride = -(-len(equity) // max_points)
+            index = np.unique(np.append(index[::stride], len(equity) - 1))
+        
+        return {
+            'timestamp': np.asarray(ts[lo:hi])[index],
+            'equity': equity[index],
+            'drawdown': drawdown[index]
+        }
+    
+    def trades_frame(self, start: Any = None, end: Any = None) -> pd.DataFrame:
+        """Trades as a DataFrame (names and sides decoded)"""
+        records = self.trades
+        ts = records['timestamp']
+        lo = 0 if start is None else int(np.searchsorted(ts, to_epoch(start), side='left'))
+        hi = len(records) if end is None else int(np.searchsorted(ts, to_epoch(end), side='right'))
+        
+        frame = pd.DataFrame(np.asarray(records[lo:hi]))
+        frame['timestamp'] = pd.to_datetime(frame['timestamp'], unit='s')
+        frame['symbol'] = np.asarray(self.manifest['symbols'] or [''], dtype=object)[frame['symbol']]
+        frame['strategy'] = np.asarray(self.manifest['strategies'] or [''], dtype=object)[frame['strategy']]
+        frame['side'] = np.where(frame['side'] > 0, 'BUY', 'SELL')
+        return frame.rename(columns={'side': 'action'})
+    
+    def summary(self) -> Dict[str, Any]:
+        """Manifest fields listed by the dashboard"""
+        return {
+            'name': self.directory.name,
+            'created': self.manifest.get('created'),
+            'complete': self.complete,
+            'metadata': self.manifest.get('metadata', {}),
+            'metrics': self.metrics,
+            'equity_points': len(self.equity),
+            'trades': len(self.trades)
+        }
+
+
+def load_results(directory: Union[str, Path]) -> StoredResults:
+    """Open a stored run"""
+    return StoredResults(directory)
+
+
+def list_results(root: Union[str, Path]) -> List[Dict[str, Any]]:
+    """Summaries of the runs stored under ``root`` (newest first)"""
+    root = Path(root)
+    if not root.exists():
+        return []
+    
+    runs = []
+    for manifest in root.glob(f'*/{MANIFEST_FILE}'):
+        try:
+            runs.append(StoredResults(manifest.parent).summary())
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Skipping unreadable backtest results {manifest.parent}: {e}")
+    
+    return sorted(runs, key=lambda run: run['created'] or '', reverse=True)
@@ -0,0 +1,246 @@
+"""
+Walk-Forward Optimization
+Out-of-sample validation of optimized strategy parameters
+
+The history is cut into consecutive test windows, each preceded by a
+training window (rolling: fixed length, anchored: from the first bar).
+Per window the parameter combination with the best in-sample metric is
+selected, then backtested on the following unseen bars. The test
+segments are chained into one out-of-sample equity curve.
+
+- Optimization runs on ParameterSweep's process pool: one task per
+  combination covers every training window, so indicators are computed
+  once per combination rather than once per window
+- Positions still open at the end of a test window are marked at its
+  last close; the next window starts flat from that equity
+"""
+
+import logging
+import time
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .parameter_sweep import ParameterRange, ParameterSweep, SweepResult
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WalkForwardWindow:
+    """One train/test split (bar indices, end exclusive)"""
+    index: int
+    train_start: int
+    train_end: int
+    test_start: int
+    test_end: int
+    best_params: Optional[Dict[str, Any]] = None
+    in_sample: Dict[str, float] = field(default_factory=dict)
+    out_of_sample: Dict[str, float] = field(default_factory=dict)
+    equity_curve: Optional[np.ndarray] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary (without the equity curve)"""
+        return {
+            'index': self.index,
+            'train_start': self.train_start,
+            'train_end': self.train_end,
+            'test_start': self.test_start,
+            'test_end': self.test_end,
+            'best_params': self.best_params,
+            'in_sample': self.in_sample,
+            'out_of_sample': self.out_of_sample
+        }
+
+
+class WalkForwardOptimizer:
+    """
+    Rolling or anchored walk-forward analysis
+    
+    Usage:
+        optimizer = WalkForwardOptimizer(config, data)
+        results = optimizer.run(MACDMomentumStrategy, space)
+    """
+    
+    def __init__(self,
+                 config,
+                 data: pd.DataFrame,
+                 train_bars: Optional[int] = None,
+                 test_bars: Optional[int] = None,
+                 anchored: Optional[bool] = None,
+                 workers: Optional[int] = None,
+                 engine: str = 'auto',
+                 metric: str = 'sharpe_ratio'):
+        """
+        Args:
+            config: Configuration (backtesting.walk_forward section; picklable)
+            data: OHLCV market data
+            train_bars: Bars per training window
+            test_bars: Bars per test window
+            anchored: Training windows start at the first bar
+            workers: Worker processes (default: CPU count)
+            engine: auto (vectorized when supported) or event
+            metric: In-sample metric maximized per window
+        """
+        bt_config = config.get('backtesting', {})
+        wf_config = bt_config.get('walk_forward', {})
+        
+        self.config = config
+        self.data = data.reset_index(drop=True)
+        self.train_bars = train_bars or wf_config.get('train_bars', 2000)
+        self.test_bars = test_bars or wf_config.get('test_bars', 500)
+        self.anchored = wf_config.get('anchored', False) if anchored is None else anchored
+        self.history_bars = bt_config.get('lookback', 200)
+        self.initial_capital = bt_config.get('initial_capital', 3000)
+        self.workers = workers
+        self.engine = engine
+        self.metric = metric
+        
+        logger.info(
+            f"✓ Walk-Forward Optimizer initialized "
+            f"(train={self.train_bars}, test={self.test_bars}, "
+            f"{'anchored' if self.anchored else 'rolling'})"
+        )
+    
+    def windows(self) -> List[WalkForwardWindow]:
+        """Train/test splits covering the data after the first training window"""
+        windows = []
+        test_start = self.train_bars
+        
+        while test_start < len(self.data):
+            test_end = min(test_start + self.test_bars, len(self.data))
+            train_start = 0 if self.anchored else test_start - self.train_bars
+            windows.append(WalkForwardWindow(len(windows), train_start, test_start, test_start, test_end))
+            test_start = test_end
+        
+        return windows
+    
+    def _span(self, start: int, stop: int) -> Tuple[int, int, int]:
+        """Sweep window trading ``[start, stop)`` with indicator history before it"""
+        return max(0, start - self.history_bars), start, stop
+    
+    def run(self,
+            strategy_class,
+            space: Sequence[ParameterRange],
+            method: str = 'grid',
+            samples: int = 50,
+            seed: Optional[int] = None) -> Dict:
+        """
+        Optimize per window and validate on the following bars
+        
+        Args:
+            strategy_class: Strategy class
+            space: Parameter ranges
+            method: grid or random (same candidates for every window)
+            samples: Combinations for random
+            seed: Sampling seed
+        
+        Returns:
+            Dict with per-window results and the stitched out-of-sample curve
+        """
+        if method not in ('grid', 'random'):
+            raise ValueError(f"Unknown walk-forward method: {method}")
+        
+        windows = self.windows()
+        if not windows:
+            logger.error(f"Not enough data for walk-forward ({len(self.data)} bars, train={self.train_bars})")
+            return {}
+        
+        combinations = ParameterSweep.grid(space) if method == 'grid' else ParameterSweep.random(space, samples, seed)
+        order = {self._key(params): i for i, params in enumerate(combinations)}
+        
+        start = time.perf_counter()
+        
+        with ParameterSweep(self.config, self.data, workers=self.workers,
+                            engine=self.engine, metric=self.metric) as sweep:
+            # In-sample: every combination on every training window
+            train_spans = [self._span(w.train_start, w.train_end) for w in windows]
+            in_sample: List[List[SweepResult]] = [[] for _ in windows]
+            for results in sweep.run_windows(strategy_class, [(params, train_spans) for params in combinations]):
+                for result in results:
+                    in_sample[result.window].append(result)
+            
+            # Ties go to the earlier combination, independent of completion order
+            jobs: Dict[Tuple, Tuple[Dict[str, Any], List[WalkForwardWindow]]] = {}
+            for window, results in zip(windows, in_sample):
+                scored = [r for r in results if np.isfinite(r.score(self.metric))]
+                if not scored:
+                    continue
+                best = max(scored, key=lambda r: (r.score(self.metric), -order[self._key(r.params)]))
+                window.best_params = best.params
+                window.in_sample = best.metrics
+                jobs.setdefault(self._key(best.params), (best.params, []))[1].append(window)
+            
+            # Out-of-sample: each window's selection on its test bars
+            test_jobs = [
+                (params, [self._span(w.test_start, w.test_end) for w in group])
+                for params, group in jobs.values()
+            ]
+            for results in sweep.run_windows(strategy_class, test_jobs, keep_curves=True):
+                group = jobs[self._key(results[0].params)][1]
+                for result in results:
+                    window = group[result.window]
+                    window.out_of_sample = result.metrics
+                    window.equity_curve = result.equity_curve
+        
+        results = self._stitch(windows)
+        results['combinations'] = len(combinations)
+        results['elapsed_seconds'] = time.perf_counter() - start
+        
+        logger.info(
+            f"✓ Walk-forward complete: {len(windows)} windows, "
+            f"{results['total_return']:.2%} out-of-sample return"
+        )
+        
+        return results
+    
+    def _stitch(self, windows: List[WalkForwardWindow]) -> Dict:
+        """Chain the test segments into one out-of-sample result"""
+        capital = float(self.initial_capital)
+        curve = [np.array([capital])]
+        
+        for window in windows:
+            bars = window.test_end - window.test_start
+            if window.equity_curve is None:
+                segment = np.full(bars, capital)  # No selection or no trades: stay flat
+            else:
+                segment = capital * window.equity_curve[1:] / window.equity_curve[0]
+            curve.append(segment)
+            capital = float(segment[-1]) if len(segment) else capital
+        
+        equity_curve = np.concatenate(curve)
+        returns = np.diff(equity_curve) / equity_curve[:-1]
+        
+        total_return = (equity_curve[-1] - self.initial_capital) / self.initial_capital
+        sharpe = np.mean(returns) / (np.std(returns) + 1e-8) * np.sqrt(252) if len(returns) > 1 else 0.0
+        running_max = np.maximum.accumulate(equity_curve)
+        max_drawdown = float(np.min((equity_curve - running_max) / running_max))
+        
+        # Out-of-sample return per bar relative to in-sample return per bar
+        in_sample_rate = np.mean([
+            w.in_sample.get('total_return', 0.0) / (w.train_end - w.train_start) for w in windows
+        ])
+        out_of_sample_rate = np.mean([
+            w.out_of_sample.get('total_return', 0.0) / (w.test_end - w.test_start) for w in windows
+        ])
+        efficiency = float(out_of_sample_rate / in_sample_rate) if in_sample_rate > 0 else None
+        
+        return {
+            'initial_capital': self.initial_capital,
+            'final_equity': float(equity_curve[-1]),
+            'total_return': float(total_return),
+            'total_return_pct': float(total_return * 100),
+            'sharpe_ratio': float(sharpe),
+            'max_drawdown': max_drawdown,
+            'max_drawdown_pct': max_drawdown * 100,
+            'total_trades': int(sum(w.out_of_sample.get('total_trades', 0) for w in windows)),
+            'walk_forward_efficiency': efficiency,
+            'windows': [w.to_dict() for w in windows],
+            'equity_curve': equity_curve,
+            'daily_returns': returns
+        }
+    
+    @staticmethod
+    def _key(params: Dict[str, Any]) -> Tuple:
+        return tuple(sorted(params.items()))
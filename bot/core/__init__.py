@@ -4,13 +4,23 @@ Core Engine Modules
 Includes:
 - ExecutionEngine: Order execution with realistic simulation
 - RiskManager: Portfolio risk management
+- PortfolioRiskEngine: Vectorized portfolio VaR/CVaR
+- TieredHistory: Bounded multi-resolution metrics history
 - LiquidationDetector: Liquidation cascade detection
 - StateManager: Persistent state management
 - OrderOptimizer: Commission and slippage minimization
+- ChildOrderScheduler: Background pacing of split/TWAP/VWAP slices
+- UserDataStream: Push-based order/fill events from exchange streams
+- SmartOrderRouter: Latency-aware venue selection and order splitting
+- RateGovernor: Shared per-exchange request budget with priority lanes
+- clock: Pipeline time source (system or simulated for replays)
 """
 
+from .clock import SimulatedClock, SystemClock
 from .execution_engine import ExecutionEngine
 from .risk_manager import RiskManager
+from .portfolio_risk import PortfolioRiskEngine, PortfolioRiskSnapshot
+from .risk_history import TieredHistory
 from .liquidation_detector import LiquidationDetector
 from .state_manager import StateManager
 from .order_optimizer import (
@@ -20,14 +30,52 @@ from .order_optimizer import (
     OrderExecutionPlan,
     ExchangeCommissionConfig
 )
+from .order_scheduler import (
+    ChildOrderScheduler,
+    ParentOrder,
+    ChildOrder,
+    ParentOrderStatus
+)
+from .order_events import (
+    UserDataStream,
+    OrderEvent,
+    OrderEventType,
+    WebSocketOrderSource,
+    CCXTOrderSource,
+    LocalOrderStreamServer
+)
+from .smart_order_router import (
+    SmartOrderRouter,
+    RoutingDecision,
+    VenueAllocation
+)
+from .execution_analytics import (
+    ExecutionAnalytics,
+    HdrHistogram
+)
+from .cost_model import (
+    CostModel,
+    CostEstimate
+)
+from .rate_governor import (
+    RateGovernor,
+    Priority,
+    configure_rate_governor,
+    get_rate_governor
+)
 from .order_optimizer_config import (
     ExchangeConfigs,
     get_optimizer_for_exchange
 )
 
 __all__ = [
+    'SimulatedClock',
+    'SystemClock',
     'ExecutionEngine',
     'RiskManager',
+    'PortfolioRiskEngine',
+    'PortfolioRiskSnapshot',
+    'TieredHistory',
     'LiquidationDetector',
     'StateManager',
     'OrderOptimizer',
@@ -35,6 +83,27 @@ __all__ = [
     'OrderOptimizationStrategy',
     'OrderExecutionPlan',
     'ExchangeCommissionConfig',
+    'ChildOrderScheduler',
+    'ParentOrder',
+    'ChildOrder',
+    'ParentOrderStatus',
+    'UserDataStream',
+    'OrderEvent',
+    'OrderEventType',
+    'WebSocketOrderSource',
+    'CCXTOrderSource',
+    'LocalOrderStreamServer',
+    'SmartOrderRouter',
+    'RoutingDecision',
+    'VenueAllocation',
+    'ExecutionAnalytics',
+    'HdrHistogram',
+    'CostModel',
+    'CostEstimate',
+    'RateGovernor',
+    'Priority',
+    'configure_rate_governor',
+    'get_rate_governor',
     'ExchangeConfigs',
     'get_optimizer_for_exchange'
 ]
@@ -0,0 +1,118 @@
+"""
+Clock
+Time source shared by the trading pipeline
+
+Pipeline components read the current time through ``now()`` /
+``time()`` instead of ``datetime.now()``, so a replay can run them
+against historical bars: with a ``SimulatedClock`` installed,
+circuit breaker cooldowns, rebalance intervals, liquidation windows
+and order timestamps follow the replayed bar timestamps, and nothing
+waits on wall-clock time.
+
+Simulated time is naive and read as UTC (as the data validator reads
+naive bar timestamps).
+"""
+
+import calendar
+import time as _time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Union
+
+import pandas as pd
+
+TimeLike = Union[datetime, pd.Timestamp, float, int, str]
+
+
+class SystemClock:
+    """Wall-clock time (live trading)"""
+    
+    def now(self) -> datetime:
+        return datetime.now()
+    
+    def time(self) -> float:
+        return _time.time()
+
+
+class SimulatedClock:
+    """
+    Manually driven time (backtests and replays)
+    
+    Usage:
+        clock = SimulatedClock(bars['timestamp'].iloc[0])
+        with use_clock(clock):
+            clock.set(bar['timestamp'])
+    """
+    
+    def __init__(self, start: Optional[TimeLike] = None):
+        """
+        Args:
+            start: Initial time (default: 1970-01-01)
+        """
+        self._now = datetime(1970, 1, 1)
+        self._epoch = 0.0
+        if start is not None:
+            self.set(start)
+    
+    def now(self) -> datetime:
+        return self._now
+    
+    def time(self) -> float:
+        return self._epoch
+    
+    def set(self, when: TimeLike):
+        """Move to ``when`` (datetime, pandas Timestamp, ISO string or epoch seconds)"""
+        if isinstance(when, (int, float)):
+            when = datetime.fromtimestamp(when, tz=timezone.utc)
+        when = pd.Timestamp(when)
+        if when.tzinfo is not None:
+            when = when.tz_convert('UTC').tz_localize(None)
+        
+        self._now = when.to_pydatetime()
+        self._epoch = calendar.timegm(self._now.timetuple()) + self._now.microsecond / 1e6
+    
+    def advance(self, seconds: float):
+        """Move forward by ``seconds``"""
+        self._now += timedelta(seconds=seconds)
+        self._epoch += seconds
+
+
+_clock = SystemClock()
+
+
+def get_clock():
+    """Currently installed clock"""
+    return _clock
+
+
+def set_clock(clock) -> object:
+    """
+    Install a clock (None restores the system clock)
+    
+    Returns:
+        The previously installed clock
+    """
+    global _clock
+    previous = _clock
+    _clock = clock if clock is not None else SystemClock()
+    return previous
+
+
+@contextmanager
+def use_clock(clock):
+    """Install ``clock`` for the duration of a block"""
+    previous = set_clock(clock)
+    try:
+        yield clock
+    finally:
+        set_clock(previous)
+
+
+def now() -> datetime:
+    """Current (naive) datetime of the installed clock"""
+    return _clock.now()
+
+
+def time() -> float:
+    """Current epoch seconds of the installed clock"""
+    return _clock.time()
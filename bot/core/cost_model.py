@@ -0,0 +1,226 @@
+"""
+Transaction Cost Model
+Vectorized slippage, market impact and commission estimates
+
+One model shared by live execution (ExecutionEngine), the backtest
+simulator (RealisticSimulator) and the order optimizer, so the three
+price the same order the same way. Inputs are arrays (scalars
+broadcast) of side, size, volatility, spread and liquidity rank:
+
+    impact   = size_coefficient * min(size / size_scale, size_cap) + fixed_impact
+    slippage = (base + spread_weight * spread + impact
+                + liquidity_coefficient * rank / 5
+                + volatility_coefficient * volatility) * noise
+
+``noise`` is uniform in [1 - random_range, 1 + random_range], drawn
+from the model's seeded generator; ``randomize=False`` gives the
+expected cost for what-if evaluation.
+"""
+
+import logging
+import numpy as np
+from dataclasses import dataclass
+from typing import Optional, Union
+
+logger = logging.getLogger(__name__)
+
+ArrayLike = Union[float, int, str, np.ndarray, list]
+
+# Presets matching ExecutionEngine slippage models (config execution.slippage_model)
+SLIPPAGE_PRESETS = {
+    'realistic': {'base': 0.0015, 'size_coefficient': 0.01, 'volatility_coefficient': 0.5, 'random_range': 0.2},
+    'aggressive': {'base': 0.003},
+    'conservative': {'base': 0.001}
+}
+
+# Optimizer estimate: size in EUR, full impact at 10k EUR, liquidity rank penalty
+OPTIMIZER_PRESET = {
+    'base': 0.0005,
+    'size_coefficient': 0.002,
+    'size_scale': 10000.0,
+    'size_cap': 1.0,
+    'liquidity_coefficient': 0.001,
+    'volatility_coefficient': 0.5
+}
+
+
+@dataclass
+class CostEstimate:
+    """Per-order cost components (decimals of notional)"""
+    slippage: np.ndarray    # Total adverse price move, impact included
+    impact: np.ndarray      # Size-driven part of the slippage
+    commission: np.ndarray
+    sign: np.ndarray        # +1 buy, -1 sell
+    
+    @property
+    def total(self) -> np.ndarray:
+        return self.slippage + self.commission
+    
+    def execution_prices(self, price: ArrayLike) -> np.ndarray:
+        """Fill prices after slippage (buys pay up, sells receive less)"""
+        return np.asarray(price, dtype=np.float64) * (1 + self.sign * self.slippage)
+    
+    def __len__(self) -> int:
+        return len(self.slippage)
+
+
+def side_sign(side: ArrayLike) -> np.ndarray:
+    """+1 for BUY, -1 for SELL (accepts strings or signed numbers)"""
+    side = np.atleast_1d(np.asarray(side))
+    if side.dtype.kind in ('U', 'S', 'O'):
+        return np.where(np.char.upper(side.astype(str)) == 'BUY', 1.0, -1.0)
+    return np.where(side.astype(np.float64) >= 0, 1.0, -1.0)
+
+
+class CostModel:
+    """
+    Linear slippage / impact / commission model over order arrays
+    
+    Features:
+    - Any number of orders per call (broadcast inputs)
+    - Seeded random component, reproducible across runs
+    - Presets for the engine slippage models and the optimizer estimate
+    """
+    
+    def __init__(self,
+                 base: float = 0.0015,
+                 spread_weight: float = 0.0,
+                 size_coefficient: float = 0.0,
+                 size_scale: float = 1.0,
+                 size_cap: float = np.inf,
+                 fixed_impact: float = 0.0,
+                 liquidity_coefficient: float = 0.0,
+                 volatility_coefficient: float = 0.0,
+                 random_range: float = 0.0,
+                 commission_pct: float = 0.001,
+                 seed: Optional[int] = None):
+        """
+        Args:
+            base: Slippage independent of the order
+            spread_weight: Fraction of the quoted spread paid (0.5 = half spread)
+            size_coefficient: Impact per unit of ``size / size_scale``
+            size_scale: Size unit (1 = size is a fraction; 10000 = per 10k EUR)
+            size_cap: Cap on ``size / size_scale``
+            fixed_impact: Impact added to every order
+            liquidity_coefficient: Slippage at liquidity rank 5 (scaled by rank / 5)
+            volatility_coefficient: Slippage per unit of volatility
+            random_range: Relative half-width of the uniform noise factor
+            commission_pct: Default commission as decimal
+            seed: Seed of the noise generator
+        """
+        self.base = base
+        self.spread_weight = spread_weight
+        self.size_coefficient = size_coefficient
+        self.size_scale = size_scale
+        self.size_cap = size_cap
+        self.fixed_impact = fixed_impact
+        self.liquidity_coefficient = liquidity_coefficient
+        self.volatility_coefficient = volatility_coefficient
+        self.random_range = random_range
+        self.commission_pct = commission_pct
+        
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+    
+    @classmethod
+    def preset(cls, slippage_model: str, market_impact_pct: float = 0.0, **overrides) -> 'CostModel':
+        """
+        Model for an ExecutionEngine slippage model name
+        
+        Args:
+            slippage_model: realistic, aggressive or conservative (others: flat 0.15%)
+            market_impact_pct: Impact added to every order (realistic only)
+            **overrides: Any constructor argument
+        """
+        params = dict(SLIPPAGE_PRESETS.get(slippage_model, {}))
+        if slippage_model == 'realistic':
+            params['fixed_impact'] = market_impact_pct
+        params.update(overrides)
+        return cls(**params)
+    
+    @classmethod
+    def for_optimizer(cls, **overrides) -> 'CostModel':
+        """Deterministic model used by OrderOptimizer (size in EUR)"""
+        return cls(**{**OPTIMIZER_PRESET, **overrides})
+    
+    @classmethod
+    def from_config(cls, config, **overrides) -> 'CostModel':
+        """
+        Model from config (execution.slippage_model / market_impact_percent /
+        commission_percent, with execution.cost_model overrides such as seed)
+        """
+        settings = dict(config.get('execution.cost_model', {}) or {})
+        settings.update(overrides)
+        settings.setdefault('commission_pct', float(config.execution.commission_percent))
+        
+        return cls.preset(
+            config.execution.slippage_model,
+            float(config.execution.market_impact_percent),
+            **settings
+        )
+    
+    def reseed(self, seed: Optional[int] = None):
+        """Restart the noise generator (default: configured seed)"""
+        self.seed = self.seed if seed is None else seed
+        self.rng = np.random.default_rng(self.seed)
+    
+    def estimate(self,
+                 side: ArrayLike,
+                 size: ArrayLike,
+                 volatility: ArrayLike = 0.02,
+                 spread: ArrayLike = 0.0,
+                 liquidity_rank: ArrayLike = 3,
+                 commission_pct: Optional[ArrayLike] = None,
+                 randomize: bool = True) -> CostEstimate:
+        """
+        Estimate costs for a batch of orders
+        
+        Args:
+            side: BUY/SELL (or +1/-1) per order
+            size: Order size in units of ``size_scale``
+            volatility: Volatility per order
+            spread: Quoted spread as decimal per order
+            liquidity_rank: 1=most liquid .. 5=least
+            commission_pct: Commission per order (default: model commission)
+            randomize: Apply the seeded noise factor (False = expected cost)
+        
+        Returns:
+            CostEstimate with one entry per order
+        """
+        sign, size, volatility, spread, rank = np.broadcast_arrays(
+            side_sign(side),
+            np.asarray(size, dtype=np.float64),
+            np.asarray(volatility, dtype=np.float64),
+            np.asarray(spread, dtype=np.float64),
+            np.asarray(liquidity_rank, dtype=np.float64)
+        )
+        
+        impact = self.size_coefficient * np.minimum(np.abs(size) / self.size_scale, self.size_cap) + self.fixed_impact
+        slippage = (
+            self.base
+            + self.spread_weight * spread
+            + impact
+            + self.liquidity_coefficient * rank / 5.0
+            + self.volatility_coefficient * volatility
+        )
+        
+        if randomize and self.random_range > 0:
+            noise = self.rng.uniform(1 - self.random_range, 1 + self.random_range, len(slippage))
+            slippage = slippage * noise
+            impact = impact * noise
+        
+        commission = np.broadcast_to(
+            np.asarray(self.commission_pct if commission_pct is None else commission_pct, dtype=np.float64),
+            slippage.shape
+        ).copy()
+        
+        return CostEstimate(
+            slippage=np.maximum(0.0, slippage),
+            impact=impact,
+            commission=commission,
+            sign=sign.copy()
+        )
+    
+    def slippage(self, side: str, size: float, volatility: float = 0.02, **kwargs) -> float:
+        """Slippage of a single order (see ``estimate``)"""
+        return float(self.estimate(side, size, volatility, **kwargs).slippage[0])
@@ -0,0 +1,403 @@
+"""
+Execution Quality Analytics
+Streaming distributions of execution quality per symbol, strategy and order type
+
+Metrics:
+- slippage_bps:   adverse slippage vs signal price (negative = price improvement)
+- fill_ratio:     filled / requested notional
+- latency_ms:     signal received -> fill
+- commission_bps: commission / filled notional
+
+Each metric is kept in a log-bucketed HDR-style histogram: recording is
+O(1) with fixed memory, quantiles are accurate to the bucket precision,
+and snapshots of separate runs or processes can be merged bucket-wise.
+Snapshots are written as JSON so the dashboard can read them.
+"""
+
+import json
+import logging
+import math
+import os
+import time
+import numpy as np
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+METRICS = ('slippage_bps', 'fill_ratio', 'latency_ms', 'commission_bps')
+DIMENSIONS = ('symbol', 'strategy', 'order_type')
+
+# Magnitude range (lowest, highest) per metric; smaller values count as zero
+METRIC_RANGES = {
+    'slippage_bps': (0.01, 1e5),
+    'fill_ratio': (1e-4, 10.0),
+    'latency_ms': (0.01, 1e8),
+    'commission_bps': (0.01, 1e4)
+}
+
+
+class HdrHistogram:
+    """
+    Signed log-bucketed histogram
+    
+    Bucket ``i`` covers magnitudes ``lowest * (1 + precision) ** [i, i + 1)``
+    on each side of zero; magnitudes below ``lowest`` share a zero bucket
+    and values above ``highest`` land in the last bucket.
+    """
+    
+    def __init__(self, lowest: float = 0.01, highest: float = 1e6, precision: float = 0.01):
+        """
+        Args:
+            lowest: Smallest magnitude distinguished from zero
+            highest: Largest magnitude with full precision
+            precision: Relative bucket width
+        """
+        self.lowest = lowest
+        self.highest = highest
+        self.precision = precision
+        
+        self._log_base = math.log1p(precision)
+        self.buckets = int(math.ceil(math.log(highest / lowest) / self._log_base)) + 1
+        self.positive = np.zeros(self.buckets, dtype=np.int64)
+        self.negative = np.zeros(self.buckets, dtype=np.int64)
+        self.reset()
+    
+    def reset(self):
+        self.positive[:] = 0
+        self.negative[:] = 0
+        self.zero = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+    
+    def record(self, value: float):
+        """Add one value (NaN is ignored)"""
+        if value != value:
+            return
+        
+        magnitude = abs(value)
+        if magnitude < self.lowest:
+            self.zero += 1
+        else:
+            index = min(int(math.log(magnitude / self.lowest) / self._log_base), self.buckets - 1)
+            if value > 0:
+                self.positive[index] += 1
+            else:
+                self.negative[index] += 1
+        
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+    
+    def same_layout(self, other: 'HdrHistogram') -> bool:
+        return (self.lowest, self.highest, self.precision) == (other.lowest, other.highest, other.precision)
+    
+    def merge(self, other: 'HdrHistogram'):
+        """Add the counts of a histogram with the same layout"""
+        if not self.same_layout(other):
+            raise ValueError("Cannot merge histograms with different bucket layouts")
+        
+        self.positive += other.positive
+        self.negative += other.negative
+        self.zero += other.zero
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+    
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+    
+    def percentiles(self, quantiles: Iterable[float] = (50, 95, 99)) -> Dict[float, float]:
+        """
+        Values at the given percentiles (0-100)
+        
+        Returns:
+            Dict mapping percentile to bucket midpoint (clipped to min/max)
+        """
+        quantiles = list(quantiles)
+        if self.count == 0:
+            return {q: 0.0 for q in quantiles}
+        
+        mids = self.lowest * (1 + self.precision) ** (np.arange(self.buckets) + 0.5)
+        values = np.concatenate([-mids[::-1], [0.0], mids])
+        counts = np.concatenate([self.negative[::-1], [self.zero], self.positive])
+        cumulative = np.cumsum(counts)
+        
+        result = {}
+        for q in quantiles:
+            rank = max(1, math.ceil(q / 100 * self.count))
+            value = values[int(np.searchsorted(cumulative, rank))]
+            result[q] = float(min(max(value, self.min), self.max))
+        return result
+    
+    def percentile(self, q: float) -> float:
+        return self.percentiles([q])[q]
+    
+    def summary(self) -> Dict:
+        """Count, mean, extremes and p50/p95/p99"""
+        p = self.percentiles((50, 95, 99))
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'min': self.min if self.count else 0.0,
+            'max': self.max if self.count else 0.0,
+            'p50': p[50],
+            'p95': p[95],
+            'p99': p[99]
+        }
+    
+    def to_dict(self) -> Dict:
+        """Sparse JSON-serializable snapshot"""
+        return {
+            'lowest': self.lowest,
+            'highest': self.highest,
+            'precision': self.precision,
+            'count': self.count,
+            'total': self.total,
+            'min': self.min if self.count else None,
+            'max': self.max if self.count else None,
+            'zero': self.zero,
+            'positive': {str(i): int(self.positive[i]) for i in np.flatnonzero(self.positive)},
+            'negative': {str(i): int(self.negative[i]) for i in np.flatnonzero(self.negative)}
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'HdrHistogram':
+        """Rebuild a histogram from ``to_dict`` output"""
+        hist = cls(data['lowest'], data['highest'], data['precision'])
+        for side, counts in (('positive', hist.positive), ('negative', hist.negative)):
+            for index, count in data.get(side, {}).items():
+                counts[int(index)] = count
+        hist.zero = data.get('zero', 0)
+        hist.count = data.get('count', 0)
+        hist.total = data.get('total', 0.0)
+        if hist.count:
+            hist.min = data['min']
+            hist.max = data['max']
+        return hist
+
+
+class ExecutionAnalytics:
+    """
+    Execution quality histograms grouped by symbol, strategy and order type
+    
+    Every record updates the ('all', 'all') group and one group per
+    dimension, so any breakdown is available without post-processing.
+    """
+    
+    def __init__(self,
+                 precision: float = 0.01,
+                 snapshot_path: Optional[Union[str, Path]] = None,
+                 flush_interval: float = 60.0):
+        """
+        Args:
+            precision: Relative histogram bucket width
+            snapshot_path: JSON file the snapshot is written to (None = in memory only)
+            flush_interval: Minimum seconds between automatic snapshot writes
+        """
+        self.precision = precision
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self.flush_interval = flush_interval
+        
+        self.groups: Dict[Tuple[str, str], Dict[str, HdrHistogram]] = {}
+        self.records = 0
+        self._last_flush = time.monotonic()
+        
+        logger.info(
+            f"✓ Execution Analytics initialized "
+            f"(precision={precision:.1%}, snapshot={self.snapshot_path})"
+        )
+    
+    def _group(self, dimension: str, key: str) -> Dict[str, HdrHistogram]:
+        group = self.groups.get((dimension, key))
+        if group is None:
+            group = {
+                metric: HdrHistogram(*METRIC_RANGES[metric], self.precision)
+                for metric in METRICS
+            }
+            self.groups[(dimension, key)] = group
+        return group
+    
+    # ==================== RECORDING ====================
+    
+    def record(self,
+               symbol: str,
+               strategy: str,
+               order_type: str,
+               slippage_bps: Optional[float] = None,
+               fill_ratio: Optional[float] = None,
+               latency_ms: Optional[float] = None,
+               commission_bps: Optional[float] = None):
+        """
+        Record one execution (metrics left as None are skipped)
+        
+        Args:
+            symbol: Traded symbol
+            strategy: Strategy that produced the signal
+            order_type: Order type used (market, limit, ...)
+            slippage_bps: Adverse slippage in basis points
+            fill_ratio: Filled / requested notional
+            latency_ms: Signal-to-fill latency
+            commission_bps: Commission in basis points of filled notional
+        """
+        values = (
+            ('slippage_bps', slippage_bps),
+            ('fill_ratio', fill_ratio),
+            ('latency_ms', latency_ms),
+            ('commission_bps', commission_bps)
+        )
+        
+        for dimension, key in (('all', 'all'), ('symbol', symbol),
+                               ('strategy', strategy), ('order_type', order_type)):
+            group = self._group(dimension, str(key))
+            for metric, value in values:
+                if value is not None:
+                    group[metric].record(value)
+        
+        self.records += 1
+        if self.snapshot_path is not None and time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+    
+    def record_fill(self,
+                    result: Dict,
+                    requested_value: Optional[float] = None,
+                    latency_ms: Optional[float] = None):
+        """
+        Record an execution result dict (ExecutionEngine format)
+        
+        Args:
+            result: Result with signal_price, execution_price, action, position_value, commission
+            requested_value: Notional requested for this fill (for the fill ratio)
+            latency_ms: Signal-to-fill latency
+        """
+        reference = result.get('signal_price') or 0.0
+        price = result.get('execution_price', result.get('price')) or 0.0
+        filled = result.get('position_value', 0.0)
+        
+        slippage_bps = None
+        if reference > 0 and price > 0:
+            direction = 1.0 if result.get('action') == 'BUY' else -1.0
+            slippage_bps = direction * (price - reference) / reference * 1e4
+        
+        self.record(
+            symbol=result.get('symbol', 'unknown'),
+            strategy=result.get('strategy', 'unknown'),
+            order_type=result.get('order_type', 'market'),
+            slippage_bps=slippage_bps,
+            fill_ratio=filled / requested_value if requested_value else None,
+            latency_ms=latency_ms,
+            commission_bps=result.get('commission', 0.0) / filled * 1e4 if filled > 0 else None
+        )
+    
+    # ==================== SNAPSHOTS ====================
+    
+    def snapshot(self) -> Dict:
+        """JSON-serializable snapshot of all histograms"""
+        groups: Dict[str, Dict] = {}
+        for (dimension, key), group in self.groups.items():
+            groups.setdefault(dimension, {})[key] = {
+                metric: hist.to_dict() for metric, hist in group.items()
+            }
+        
+        return {
+            'timestamp': datetime.now().isoformat(),
+            'precision': self.precision,
+            'records': self.records,
+            'groups': groups
+        }
+    
+    def merge(self, other: Union['ExecutionAnalytics', Dict]):
+        """
+        Add another analytics instance or snapshot into this one
+        
+        Args:
+            other: ExecutionAnalytics or ``snapshot()`` dict
+        """
+        if isinstance(other, ExecutionAnalytics):
+            other = other.snapshot()
+        
+        for dimension, keys in other.get('groups', {}).items():
+            for key, metrics in keys.items():
+                group = self._group(dimension, key)
+                for metric, data in metrics.items():
+                    incoming = HdrHistogram.from_dict(data)
+                    if group[metric].same_layout(incoming):
+                        group[metric].merge(incoming)
+                    else:
+                        # Different precision: keep the incoming layout if ours is empty
+                        if group[metric].count:
+                            raise ValueError(f"Cannot merge {metric} histograms with different layouts")
+                        group[metric] = incoming
+        
+        self.records += other.get('records', 0)
+    
+    @classmethod
+    def from_snapshot(cls, snapshot: Dict) -> 'ExecutionAnalytics':
+        """Rebuild analytics from a ``snapshot()`` dict"""
+        analytics = cls(precision=snapshot.get('precision', 0.01))
+        analytics.merge(snapshot)
+        return analytics
+    
+    def flush(self):
+        """Write the snapshot to ``snapshot_path`` (atomic replace)"""
+        self._last_flush = time.monotonic()
+        if self.snapshot_path is None:
+            return
+        
+        try:
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.snapshot_path.with_suffix(self.snapshot_path.suffix + '.tmp')
+            tmp_path.write_text(json.dumps(self.snapshot()))
+            os.replace(tmp_path, self.snapshot_path)
+        except Exception as e:
+            logger.error(f"Could not write execution analytics snapshot: {e}")
+    
+    def reset(self):
+        """Drop all recorded data"""
+        self.groups.clear()
+        self.records = 0
+    
+    # ==================== REPORTING ====================
+    
+    def summary(self, dimension: Optional[str] = None, key: Optional[str] = None) -> Dict:
+        """
+        Quantile summaries
+        
+        Args:
+            dimension: 'all', 'symbol', 'strategy' or 'order_type' (None = every dimension)
+            key: Single key within the dimension (None = all keys)
+        
+        Returns:
+            {dimension: {key: {metric: {count, mean, min, max, p50, p95, p99}}}}
+        """
+        result: Dict[str, Dict] = {}
+        for (dim, k), group in self.groups.items():
+            if dimension is not None and dim != dimension:
+                continue
+            if key is not None and k != key:
+                continue
+            result.setdefault(dim, {})[k] = {
+                metric: hist.summary() for metric, hist in group.items() if hist.count
+            }
+        return result
+
+
+def load_snapshot(path: Union[str, Path]) -> ExecutionAnalytics:
+    """
+    Load analytics written by ``ExecutionAnalytics.flush``
+    
+    Returns:
+        ExecutionAnalytics (empty if the file does not exist)
+    """
+    path = Path(path)
+    if not path.exists():
+        return ExecutionAnalytics()
+    return ExecutionAnalytics.from_snapshot(json.loads(path.read_text()))
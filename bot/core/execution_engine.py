@@ -18,7 +18,12 @@ from datetime import datetime
 from typing import Dict, Optional, Tuple, List
 from enum import Enum
 import numpy as np
-from bot.core.order_optimizer import OrderOptimizer, OrderOptimizationStrategy
+from bot.core import clock
+from bot.core.order_optimizer import OrderOptimizer, OrderOptimizationStrategy, OrderType
+from bot.core.order_scheduler import ChildOrder, ChildOrderScheduler, ParentOrder
+from bot.core.smart_order_router import RoutingDecision, SmartOrderRouter, VenueAllocation
+from bot.core.execution_analytics import ExecutionAnalytics
+from bot.core.cost_model import CostEstimate, CostModel
 
 from bot.core.order_optimizer_config import get_optimizer_for_exchange
 
@@ -57,6 +62,13 @@ class ExecutionEngine:
         self.market_impact_pct = config.execution.market_impact_percent
         self.order_types = config.execution.order_types
         
+        # Slippage/impact/commission model shared with the simulator and optimizer
+        try:
+            self.cost_model = CostModel.from_config(config)
+        except Exception as e:
+            logger.warning(f"Could not build cost model from config: {e}, using preset")
+            self.cost_model = CostModel.preset(self.slippage_model, self.market_impact_pct)
+        
         # Execution stats
         self.total_executions = 0
         self.total_slippage = 0.0
@@ -66,10 +78,25 @@ class ExecutionEngine:
         self.order_optimizer = None
         self._initialize_order_optimizer(config)
         
+        # Deferred plan slices run in the background; latest prices feed their fills
+        self.scheduler = ChildOrderScheduler(self._fill_child_order)
+        self.latest_market_data: Dict[str, Dict] = {}
+        
+        # CRYPTO TRADING: Venue routing across configured exchanges
+        self.router = None
+        self.venue_submitter = self._simulate_venue_fill
+        self._initialize_router(config)
+        
+        # Execution quality distributions (slippage, fill ratio, latency, commission)
+        self.analytics = None
+        self._initialize_analytics(config)
+        
         logger.info(
             f"✓ Execution Engine initialized "
             f"(model={self.slippage_model}, "
-            f"optimizer={self.order_optimizer is not None})"
+            f"optimizer={self.order_optimizer is not None}, "
+            f"router={self.router is not None}, "
+            f"analytics={self.analytics is not None})"
         )
     
     def _initialize_order_optimizer(self, config):
@@ -104,6 +131,51 @@ class ExecutionEngine:
             logger.warning(f"Could not initialize order optimizer: {e}")
             self.order_optimizer = None
     
+    def _initialize_router(self, config):
+        """Initialize smart order router over the crypto exchanges (execution.routing)"""
+        try:
+            settings = config.get('execution.routing', {}) or {}
+            if not settings.get('enabled', True):
+                logger.info("Smart order routing disabled")
+                return
+            
+            venues = {
+                venue: config.exchanges.get(venue, {}).get('commission', 0.001)
+                for venue in config.get('markets.crypto_exchanges', ['binance'])
+            }
+            
+            self.router = SmartOrderRouter(
+                venues,
+                max_quote_age=settings.get('max_quote_age', 5.0),
+                impact_coefficient=settings.get('impact_coefficient', 0.001),
+                volatility=settings.get('volatility', 0.0005),
+                latency_risk_aversion=settings.get('latency_risk_aversion', 1.0),
+                min_child_notional=settings.get('min_child_notional', 10.0),
+                unavailable_cooldown=settings.get('unavailable_cooldown', 30.0)
+            )
+            
+        except Exception as e:
+            logger.warning(f"Could not initialize smart order router: {e}")
+            self.router = None
+    
+    def _initialize_analytics(self, config):
+        """Initialize execution quality analytics (execution.analytics)"""
+        try:
+            settings = config.get('execution.analytics', {}) or {}
+            if not settings.get('enabled', True):
+                logger.info("Execution analytics disabled")
+                return
+            
+            self.analytics = ExecutionAnalytics(
+                precision=settings.get('precision', 0.01),
+                snapshot_path=settings.get('snapshot_path'),
+                flush_interval=settings.get('flush_interval', 60.0)
+            )
+            
+        except Exception as e:
+            logger.warning(f"Could not initialize execution analytics: {e}")
+            self.analytics = None
+    
     async def execute(
         self,
         signal: 'TradeSignal',
@@ -139,12 +211,112 @@ class ExecutionEngine:
             logger.error(f"Unknown market type: {market_type}")
             return self._failed_execution()
     
+    async def execute_batch(
+        self,
+        orders: List,
+        market_data: Dict[str, Dict],
+        portfolio: Dict,
+        market_type: MarketType = MarketType.CRYPTO_SPOT
+    ) -> List[Dict]:
+        """
+        Execute a batch of orders from the portfolio construction stage
+        
+        Orders run concurrently so split/delayed plans do not serialize
+        the batch. Cash is budgeted by the constructor before submission.
+        Crypto spot plans are created in one vectorized optimizer call.
+        
+        Args:
+            orders: PortfolioOrder list (signal + size as fraction of portfolio)
+            market_data: Current market data per symbol
+            portfolio: Current portfolio state
+            market_type: Type of market (CRYPTO_SPOT or PREDICTION_MARKET)
+            
+        Returns:
+            Execution results in order
+        """
+        
+        if market_type == MarketType.CRYPTO_SPOT:
+            plans = self._batch_execution_plans(orders, market_data, portfolio)
+            coroutines = [
+                self._execute_crypto_spot(
+                    order.signal,
+                    order.size,
+                    market_data.get(order.symbol, {}),
+                    portfolio,
+                    execution_plan=plan
+                )
+                for order, plan in zip(orders, plans)
+            ]
+        else:
+            coroutines = [
+                self.execute(
+                    order.signal,
+                    order.size,
+                    market_data.get(order.symbol, {}),
+                    portfolio,
+                    market_type
+                )
+                for order in orders
+            ]
+        
+        results = await asyncio.gather(*coroutines, return_exceptions=True)
+        
+        for i, result in enumerate(results):
+            if isinstance(result, Exception):
+                logger.error(f"Execution failed for {orders[i].symbol}: {result}")
+                results[i] = self._failed_execution()
+        
+        return list(results)
+    
+    def _batch_execution_plans(
+        self,
+        orders: List,
+        market_data: Dict[str, Dict],
+        portfolio: Dict
+    ) -> List:
+        """
+        Optimizer plans for a batch of orders (None where unavailable)
+        
+        Args:
+            orders: PortfolioOrder list
+            market_data: Current market data per symbol
+            portfolio: Current portfolio state
+            
+        Returns:
+            Plan per order, or None to let execution plan it individually
+        """
+        if not self.order_optimizer:
+            return [None] * len(orders)
+        
+        portfolio_value = portfolio.get('equity', portfolio.get('cash', 0))
+        requests = []
+        for order in orders:
+            data = market_data.get(order.symbol, {})
+            requests.append({
+                'symbol': order.symbol,
+                'side': order.action,
+                'amount': portfolio_value * order.size,
+                'current_price': data.get('close', 0),
+                'market_volatility': data.get('volatility', 0.02),
+                'market_spread': data.get('spread', 0.0005),
+                'strategy_name': order.signal.strategy,
+                'confidence': order.signal.confidence,
+                'liquidity_rank': self._get_liquidity_rank(order.symbol)
+            })
+        
+        try:
+            return self.order_optimizer.create_execution_plans(requests)
+        except Exception as e:
+            logger.warning(f"Batch order optimization failed: {e}, planning individually")
+            return [None] * len(orders)
+    
     async def _execute_crypto_spot(
         self,
         signal: 'TradeSignal',
         position_size: float,
         market_data: Dict,
-        portfolio: Dict
+        portfolio: Dict,
+        execution_plan=None
     ) -> Dict:
         """
         Execute crypto spot trade with order optimization
@@ -159,11 +331,14 @@ class ExecutionEngine:
             position_size: Position size fraction
             market_data: Market data
             portfolio: Portfolio state
+            execution_plan: Precomputed plan (batch execution)
             
         Returns:
             Execution result
         """
         
+        received_at = clock.now()
+        
         # Validate inputs
         current_price = market_data.get('close', 0)
         if current_price == 0:
@@ -174,8 +349,8 @@ class ExecutionEngine:
         portfolio_value = portfolio.get('equity', portfolio.get('cash', 0))
         position_value = portfolio_value * position_size
         
-        # Check cash
-        if position_value > portfolio['cash']:
+        # Check cash (buys only; sells release cash)
+        if signal.action == 'BUY' and position_value > portfolio['cash']:
             logger.warning(
                 f"Insufficient cash: need €{position_value:.2f}, "
                 f"have €{portfolio['cash']:.2f}"
@@ -183,8 +358,7 @@ class ExecutionEngine:
             return self._failed_execution()
         
         # Use OrderOptimizer if available
-        execution_plan = None
-        if self.order_optimizer:
+        if execution_plan is None and self.order_optimizer:
             try:
                 execution_plan = self.order_optimizer.create_execution_plan(
                     symbol=signal.symbol,
@@ -224,7 +398,8 @@ class ExecutionEngine:
             position_value,
             current_price,
             portfolio_value,
-            market_data
+            market_data,
+            received_at=received_at
         )
         
         return result
@@ -264,8 +439,8 @@ class ExecutionEngine:
         portfolio_value = portfolio.get('equity', portfolio.get('cash', 0))
         position_value = portfolio_value * position_size
         
-        # Check cash
-        if position_value > portfolio['cash']:
+        # Check cash (buys only; sells release cash)
+        if signal.action == 'BUY' and position_value > portfolio['cash']:
             logger.warning(
                 f"Insufficient cash for prediction: "
                 f"need €{position_value:.2f}, have €{portfolio['cash']:.2f}"
@@ -289,7 +464,7 @@ class ExecutionEngine:
         # Build result
         result = {
             'executed': True,
-            'timestamp': datetime.now(),
+            'timestamp': clock.now(),
             'market_type': MarketType.PREDICTION_MARKET.value,
             'symbol': signal.symbol,
             'action': signal.action,
@@ -321,11 +496,15 @@ class ExecutionEngine:
         position_value: float,
         current_price: float,
         portfolio_value: float,
-        market_data: Dict
+        market_data: Dict,
+        received_at: Optional[datetime] = None
     ) -> Dict:
         """
         Execute the optimized plan orders
         
+        Orders without delay fill immediately; delayed slices are handed
+        to the child order scheduler and reported through fill listeners.
+        
         Args:
             execution_plan: OrderExecutionPlan from optimizer
             signal: Original trade signal
@@ -333,6 +512,7 @@ class ExecutionEngine:
             current_price: Current market price
             portfolio_value: Total portfolio value
             market_data: Market data
+            received_at: When the signal reached the engine (signal-to-fill latency)
             
         Returns:
             Execution result
@@ -340,49 +520,81 @@ class ExecutionEngine:
         
         total_shares = 0.0
         total_cost = 0.0
+        commission = 0.0
         execution_prices = []
+        deferred = []
+        venues: Dict[str, float] = {}
+        received_at = received_at or clock.now()
         
-        # Execute each order in the plan
-        for order in execution_plan.orders:
+        # Execute immediate orders now; delayed slices go to the scheduler
+        for index, order in enumerate(execution_plan.orders):
             order_size = order.get('size', position_value)
-            order_type = order.get('type', 'market')
             
-            # Calculate slippage
-            slippage = self._calculate_slippage(
-                signal.action,
-                order_size / portfolio_value if portfolio_value > 0 else 0,
-                market_data
-            )
+            if order.get('delay_seconds', 0) > 0:
+                deferred.append(ChildOrder(
+                    index=index,
+                    size=order_size,
+                    order_type=order.get('type', 'market'),
+                    price=order.get('price'),
+                    delay_seconds=order['delay_seconds']
+                ))
+                continue
             
-            # Apply slippage
-            if signal.action == 'BUY':
-                execution_price = current_price * (1 + slippage)
-            else:
-                execution_price = current_price * (1 - slippage)
+            # Routed across venues when quotes are available
+            decision = None
+            if self.router is not None and self.router.has_quotes(signal.symbol):
+                decision = self.router.route(signal.symbol, signal.action, order_size)
+            
+            if decision is not None:
+                # Paper fills are instantaneous and would skew venue latency
+                fills = await self.router.dispatch(
+                    decision, self.venue_submitter,
+                    measure_latency=self.venue_submitter != self._simulate_venue_fill
+                )
+                for allocation, fill in zip(decision.allocations, fills):
+                    if fill is None:
+                        continue
+                    execution_prices.append(fill['price'])
+                    total_shares += fill['shares']
+                    total_cost += fill['position_value']
+                    commission += fill['commission']
+                    venue = fill.get('venue', allocation.venue)  # Re-routed slices report their venue
+                    venues[venue] = venues.get(venue, 0.0) + fill['position_value']
+                continue
             
+            execution_price = self._slipped_price(
+                signal.action, current_price, order_size, portfolio_value, market_data
+            )
             execution_prices.append(execution_price)
             
             # Calculate shares
-            shares = order_size / execution_price
-            total_shares += shares
+            total_shares += order_size / execution_price
             
             # Add to cost
             total_cost += order_size
-            
-            # Simulate execution delay for split orders
-            if 'delay_seconds' in order:
-                await asyncio.sleep(order['delay_seconds'])
+            commission += order_size * execution_plan.estimated_commission_percent
+        
+        parent_id = None
+        if deferred:
+            parent_id = self.scheduler.submit(ParentOrder(
+                parent_id='',
+                signal=signal,
+                plan=execution_plan,
+                reference_price=current_price,
+                portfolio_value=portfolio_value,
+                market_data=market_data,
+                children=deferred
+            ))
+        
+        position_value = total_cost
         
         # Calculate average execution price
         avg_execution_price = total_cost / total_shares if total_shares > 0 else current_price
         
-        # Commission
-        commission = execution_plan.estimated_total_commission
-        
         # Build final result
         result = {
-            'executed': True,
-            'timestamp': datetime.now(),
+            'executed': total_shares > 0,
+            'timestamp': clock.now(),
             'market_type': MarketType.CRYPTO_SPOT.value,
             'symbol': signal.symbol,
             'action': signal.action,
@@ -396,15 +608,34 @@ class ExecutionEngine:
             'slippage': np.mean(execution_prices) - current_price if execution_prices else 0,
             'slippage_pct': (np.mean(execution_prices) - current_price) / current_price if execution_prices else 0,
             'commission': commission,
-            'commission_pct': execution_plan.estimated_commission_percent,
+            'commission_pct': commission / position_value if position_value > 0 else execution_plan.estimated_commission_percent,
             'total_cost': position_value + commission,
             'num_orders': execution_plan.number_of_orders,
+            'venues': venues,
             'order_type': execution_plan.order_type.value,
             'optimization_strategy': execution_plan.optimization_strategy.value,
             'confidence': signal.confidence,
-            'savings_vs_market': max(0, (0.001 - execution_plan.estimated_commission_percent) * position_value)
+            'savings_vs_market': max(0, (0.001 - execution_plan.estimated_commission_percent) * position_value),
+            'parent_id': parent_id,
+            'scheduled_orders': len(deferred),
+            'scheduled_value': sum(c.size for c in deferred)
         }
         
+        requested = sum(
+            order.get('size', position_value) for order in execution_plan.orders
+            if order.get('delay_seconds', 0) <= 0
+        )
+        if self.analytics is not None and requested > 0:
+            self.analytics.record_fill(
+                result,
+                requested_value=requested,
+                latency_ms=(result['timestamp'] - received_at).total_seconds() * 1000
+            )
+        
+        if total_shares == 0:
+            result['reason'] = 'scheduled' if deferred else 'empty_plan'
+            return result
+        
         # Update stats
         self.total_executions += 1
         self.total_commissions += commission
@@ -419,6 +650,144 @@ class ExecutionEngine:
         
         return result
     
+    def _slipped_price(
+        self,
+        action: str,
+        current_price: float,
+        order_size: float,
+        portfolio_value: float,
+        market_data: Dict
+    ) -> float:
+        """Execution price of one order after slippage"""
+        slippage = self._calculate_slippage(
+            action,
+            order_size / portfolio_value if portfolio_value > 0 else 0,
+            market_data
+        )
+        
+        if action == 'BUY':
+            return current_price * (1 + slippage)
+        return current_price * (1 - slippage)
+    
+    def _fill_child_order(self, parent: ParentOrder, child: ChildOrder) -> Optional[Dict]:
+        """
+        Fill a deferred slice at the latest known price (scheduler callback)
+        
+        Limit slices fill only once the price reaches their limit and never
+        beyond it; until then the slice stays working.
+        
+        Returns:
+            Fill dict in the execution result format
+        """
+        market_data = self.latest_market_data.get(parent.symbol, parent.market_data)
+        current_price = market_data.get('close', 0) or parent.reference_price
+        if current_price <= 0:
+            if self.analytics is not None:
+                self.analytics.record(parent.symbol, parent.signal.strategy, child.order_type, fill_ratio=0.0)
+            return None
+        
+        limit = child.price if child.order_type == 'limit' else None
+        if limit is not None and (current_price > limit if parent.side == 'BUY' else current_price < limit):
+            return {'executed': False, 'reason': 'limit_not_reached', 'limit_price': limit}
+        
+        execution_price = self._slipped_price(
+            parent.side, current_price, child.size, parent.portfolio_value, market_data
+        )
+        if limit is not None:
+            execution_price = min(execution_price, limit) if parent.side == 'BUY' else max(execution_price, limit)
+        shares = child.size / execution_price
+        commission = child.size * parent.plan.estimated_commission_percent
+        slippage_pct = (execution_price - current_price) / current_price
+        
+        self.total_executions += 1
+        self.total_commissions += commission
+        self.total_slippage += slippage_pct
+        
+        fill = {
+            'executed': True,
+            'timestamp': clock.now(),
+            'market_type': MarketType.CRYPTO_SPOT.value,
+            'symbol': parent.symbol,
+            'action': parent.side,
+            'strategy': parent.signal.strategy,
+            'signal_price': current_price,
+            'execution_price': execution_price,
+            'price': execution_price,
+            'shares': shares,
+            'size': shares,
+            'position_size': child.size,
+            'position_value': child.size,
+            'slippage': execution_price - current_price,
+            'slippage_pct': slippage_pct,
+            'commission': commission,
+            'commission_pct': parent.plan.estimated_commission_percent,
+            'total_cost': child.size + commission,
+            'order_type': child.order_type,
+            'parent_id': parent.parent_id,
+            'child_index': child.index,
+            'confidence': parent.signal.confidence
+        }
+        
+        if self.analytics is not None:
+            self.analytics.record_fill(
+                fill,
+                requested_value=child.size,
+                latency_ms=(fill['timestamp'] - parent.created_at).total_seconds() * 1000
+            )
+        
+        return fill
+    
+    async def _simulate_venue_fill(self, allocation: VenueAllocation, decision: RoutingDecision) -> Dict:
+        """
+        Paper fill of one routed slice at the venue's expected price
+        
+        Replace ``venue_submitter`` with a coroutine placing real orders
+        to trade live; it must return a dict with the same keys.
+        """
+        shares = allocation.notional / allocation.expected_price
+        return {
+            'venue': allocation.venue,
+            'price': allocation.expected_price,
+            'shares': shares,
+            'position_value': allocation.notional,
+            'commission': allocation.notional * allocation.fee_pct
+        }
+    
+    def update_market_data(self, market_data: Dict[str, Dict]):
+        """
+        Latest per-symbol market data used to price scheduled slices
+        and to refresh venue quotes for routing
+        
+        Args:
+            market_data: Dict mapping symbol to market data
+        """
+        self.latest_market_data = market_data
+        
+        if self.router is not None:
+            self.router.update_from_market_data(market_data)
+    
+    def add_fill_listener(self, listener):
+        """Register a callback (sync or async) for asynchronous slice fills"""
+        self.scheduler.add_fill_listener(listener)
+    
+    def cancel_order(self, parent_id: str) -> bool:
+        """Cancel the pending slices of a scheduled plan"""
+        return self.scheduler.cancel(parent_id)
+    
+    def amend_order(self,
+                    parent_id: str,
+                    remaining_value: Optional[float] = None,
+                    limit_price: Optional[float] = None) -> bool:
+        """Amend the pending slices of a scheduled plan"""
+        return self.scheduler.amend(parent_id, remaining_value, limit_price)
+    
+    async def shutdown(self):
+        """Stop the child order scheduler (cancels working plans)"""
+        await self.scheduler.stop()
+        
+        if self.analytics is not None:
+            self.analytics.flush()
+    
     def _create_fallback_plan(self, symbol: str, side: str, amount: float, price: float):
         """
         Create fallback execution plan if optimizer unavailable
@@ -495,43 +864,59 @@ class ExecutionEngine:
             Slippage as decimal (e.g., 0.0015 = 0.15%)
         """
         
-        if self.slippage_model == 'realistic':
-            # Base slippage
-            base_slippage = 0.0015  # 0.15% average
-            
-            # Size impact (larger positions = more slippage)
-            size_impact = position_size * 0.01  # 1% per 1 position size
-            
-            # Volatility impact
-            volatility = market_data.get('volatility', 0.02)
-            volatility_impact = volatility * 0.5
-            
-            # Market impact
-            market_impact = self.market_impact_pct
-            
-            # Total slippage
-            total_slippage = base_slippage + size_impact + volatility_impact + market_impact
-            
-            # Add random component (±20%)
-            random_factor = np.random.uniform(0.8, 1.2)
-            total_slippage *= random_factor
-            
-        elif self.slippage_model == 'aggressive':
-            total_slippage = 0.003  # 0.3%
-            
-        elif self.slippage_model == 'conservative':
-            total_slippage = 0.001  # 0.1%
+        return self.cost_model.slippage(
+            action,
+            position_size,
+            market_data.get('volatility', 0.02),
+            spread=market_data.get('spread') or 0.0,
+            liquidity_rank=self._get_liquidity_rank(market_data['symbol']) if 'symbol' in market_data else 3
+        )
+    
+    def estimate_costs(
+        self,
+        orders: List,
+        market_data: Dict[str, Dict],
+        portfolio: Dict,
+        randomize: bool = False
+    ) -> CostEstimate:
+        """
+        Expected slippage, impact and commission for a batch of orders
+        
+        Vectorized what-if pricing for portfolio sizing; uses the same
+        cost model as execution.
+        
+        Args:
+            orders: PortfolioOrder list (signal + size as fraction of portfolio)
+            market_data: Current market data per symbol
+            portfolio: Current portfolio state
+            randomize: Include the seeded noise component
             
-        else:
-            total_slippage = 0.0015
+        Returns:
+            CostEstimate aligned with ``orders``
+        """
+        data = [market_data.get(order.symbol, {}) for order in orders]
+        commission = None
+        if self.order_optimizer:
+            optimizer = self.order_optimizer
+            commission = optimizer.exchange_config.get_effective_fee(
+                OrderType.MARKET, optimizer.volume_30d, optimizer.has_bnb
+            )
         
-        return max(0, total_slippage)
+        return self.cost_model.estimate(
+            [order.action for order in orders],
+            np.array([order.size for order in orders], dtype=np.float64),
+            np.array([d.get('volatility', 0.02) for d in data], dtype=np.float64),
+            spread=np.array([d.get('spread') or 0.0 for d in data], dtype=np.float64),
+            liquidity_rank=np.array([self._get_liquidity_rank(order.symbol) for order in orders]),
+            commission_pct=commission,
+            randomize=randomize
+        )
     
     def _failed_execution(self) -> Dict:
         """Return failed execution result"""
         return {
             'executed': False,
-            'timestamp': datetime.now(),
+            'timestamp': clock.now(),
             'reason': 'execution_failed'
         }
     
@@ -561,7 +946,10 @@ class ExecutionEngine:
             'average_commission': avg_commission,
             'average_slippage': avg_slippage,
             'slippage_model': self.slippage_model,
-            'optimizer_active': self.order_optimizer is not None
+            'optimizer_active': self.order_optimizer is not None,
+            'scheduler': self.scheduler.get_statistics(),
+            'router': self.router.get_statistics() if self.router else None,
+            'execution_quality': self.analytics.summary('all').get('all', {}).get('all', {}) if self.analytics else None
         }
         
         # Add optimizer stats if available
@@ -5,10 +5,13 @@ Detects potential liquidation cascades to prevent catastrophic losses
 
 import logging
 import numpy as np
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from collections import deque
+from datetime import datetime
+from typing import Deque, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
 
+from . import clock
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,6 +25,15 @@ class LiquidationEvent:
     direction: str  # 'long' or 'short'
 
 
+def _to_epoch(timestamp: Union[datetime, float, int, None]) -> float:
+    """Convert datetime/epoch to epoch seconds (None = now)"""
+    if timestamp is None:
+        return clock.time()
+    if isinstance(timestamp, datetime):
+        return timestamp.timestamp()
+    return float(timestamp)
+
+
 class LiquidationDetector:
     """
     Detects liquidation cascades in real-time
@@ -31,6 +43,12 @@ class LiquidationDetector:
     - Consecutive liquidations in short timeframe
     - Price impact of liquidations
     - Clustering of liquidation prices
+    
+    The lookback window is a time-ordered deque split at the baseline
+    cutoff (half the window). Sizes, direction counts, short
+    inter-arrival gaps and the baseline volume are maintained as
+    running values on insert/evict, and monotonic deques track the
+    window price range, so every sub-score is O(1) per event.
     """
     
     def __init__(self, 
@@ -45,7 +63,6 @@ class LiquidationDetector:
         self.lookback_window = lookback_window
         
         # Liquidation tracking
-        self.recent_liquidations: List[LiquidationEvent] = []
         self.cascade_history: List[Dict] = []
         
         # Thresholds
@@ -53,6 +70,24 @@ class LiquidationDetector:
         self.time_clustering_seconds = 60   # Events within 60s
         self.min_events_for_cascade = 5
         
+        # Time-ordered window: (epoch, symbol, size, price, is_long)
+        self._baseline: Deque[Tuple] = deque()  # older than half the window
+        self._recent: Deque[Tuple] = deque()
+        
+        # Sliding price max/min as monotonic deques of (seq, price)
+        self._max_prices: Deque[Tuple[int, float]] = deque()
+        self._min_prices: Deque[Tuple[int, float]] = deque()
+        self._next_seq = 0
+        self._head_seq = 0
+        
+        # Running window aggregates
+        self._total_size = 0.0
+        self._baseline_size = 0.0
+        self._size_by_direction = {'long': 0.0, 'short': 0.0}
+        self._long_count = 0
+        self._clustered_gaps = 0
+        self._last_timestamp: Optional[float] = None
+        
         logger.info(
             f"✓ Liquidation Detector initialized "
             f"(threshold={cascade_threshold:.0%}, window={lookback_window}s)"
@@ -65,7 +100,10 @@ class LiquidationDetector:
         Args:
             event: LiquidationEvent object
         """
-        self.recent_liquidations.append(event)
+        self._push(
+            _to_epoch(event.timestamp), event.symbol, event.size,
+            event.price, event.direction
+        )
         
         # Keep only recent events (within lookback window)
         self._cleanup_old_events()
@@ -75,15 +113,86 @@ class LiquidationDetector:
             f"size={event.size:.4f} @ {event.price:.2f}"
         )
     
-    def _cleanup_old_events(self):
-        """Remove events outside lookback window"""
-        cutoff_time = datetime.now() - timedelta(seconds=self.lookback_window)
-        
-        self.recent_liquidations = [
-            event for event in self.recent_liquidations
-            if event.timestamp >= cutoff_time
+    @property
+    def recent_liquidations(self) -> List[LiquidationEvent]:
+        """Events currently inside the lookback window, oldest first"""
+        return [
+            LiquidationEvent(
+                timestamp=datetime.fromtimestamp(ts),
+                symbol=symbol,
+                size=size,
+                price=price,
+                direction='long' if is_long else 'short'
+            )
+            for ts, symbol, size, price, is_long in (*self._baseline, *self._recent)
         ]
     
+    def _window_count(self) -> int:
+        return len(self._baseline) + len(self._recent)
+    
+    def _push(self, timestamp: float, symbol: str, size: float, price: float, direction: str):
+        """Append one event to the window and update running aggregates"""
+        # Keep the window monotonic: late events are stamped at the newest time
+        if self._last_timestamp is not None and timestamp < self._last_timestamp:
+            timestamp = self._last_timestamp
+        
+        if self._window_count() and timestamp - self._last_timestamp <= self.time_clustering_seconds:
+            self._clustered_gaps += 1
+        
+        is_long = direction == 'long'
+        self._recent.append((timestamp, symbol, size, price, is_long))
+        self._last_timestamp = timestamp
+        
+        self._total_size += size
+        self._size_by_direction['long' if is_long else 'short'] += size
+        self._long_count += is_long
+        
+        seq = self._next_seq
+        self._next_seq += 1
+        while self._max_prices and self._max_prices[-1][1] <= price:
+            self._max_prices.pop()
+        self._max_prices.append((seq, price))
+        while self._min_prices and self._min_prices[-1][1] >= price:
+            self._min_prices.pop()
+        self._min_prices.append((seq, price))
+    
+    def _cleanup_old_events(self, now: Optional[float] = None):
+        """Remove events outside lookback window and move the baseline split"""
+        now = _to_epoch(now)
+        cutoff_time = now - self.lookback_window
+        baseline_cutoff = now - self.lookback_window // 2
+        
+        while self._recent and self._recent[0][0] < baseline_cutoff:
+            event = self._recent.popleft()
+            self._baseline.append(event)
+            self._baseline_size += event[2]
+        
+        while self._baseline and self._baseline[0][0] < cutoff_time:
+            ts, _, size, _, is_long = self._baseline.popleft()
+            
+            self._total_size -= size
+            self._baseline_size -= size
+            self._size_by_direction['long' if is_long else 'short'] -= size
+            self._long_count -= is_long
+            
+            # The gap to the new head leaves the window with the event
+            head = self._baseline[0] if self._baseline else (self._recent[0] if self._recent else None)
+            if head is not None and head[0] - ts <= self.time_clustering_seconds:
+                self._clustered_gaps -= 1
+            
+            self._head_seq += 1
+            while self._max_prices and self._max_prices[0][0] < self._head_seq:
+                self._max_prices.popleft()
+            while self._min_prices and self._min_prices[0][0] < self._head_seq:
+                self._min_prices.popleft()
+        
+        # Drop accumulated float error once a window fully drains
+        if not self._baseline:
+            self._baseline_size = 0.0
+            if not self._recent:
+                self._total_size = 0.0
+                self._size_by_direction = {'long': 0.0, 'short': 0.0}
+    
     async def detect_cascade_risk(self, 
                                    market_data: Dict,
                                    recent_liquidations: List[Dict]) -> Dict:
@@ -98,16 +207,18 @@ class LiquidationDetector:
             Dict with cascade probability and details
         """
         
-        # Convert to LiquidationEvent objects
+        # Ingest feed events straight into the window
+        now = clock.time()
         for liq in recent_liquidations:
-            event = LiquidationEvent(
-                timestamp=liq.get('timestamp', datetime.now()),
-                symbol=liq.get('symbol', 'UNKNOWN'),
-                size=liq.get('size', 0),
-                price=liq.get('price', 0),
-                direction=liq.get('direction', 'long')
+            self._push(
+                _to_epoch(liq.get('timestamp', now)),
+                liq.get('symbol', 'UNKNOWN'),
+                liq.get('size', 0),
+                liq.get('price', 0),
+                liq.get('direction', 'long')
             )
-            self.add_liquidation(event)
+        self._cleanup_old_events(now)
+        count = self._window_count()
         
         # Analyze cascade indicators
         volume_score = self._analyze_volume_spike()
@@ -141,15 +252,15 @@ class LiquidationDetector:
                 'directional_bias': direction_score,
                 'price_impact': price_impact_score
             },
-            'recent_count': len(self.recent_liquidations),
-            'timestamp': datetime.now()
+            'recent_count': count,
+            'timestamp': clock.now()
         }
         
         # Log if high risk
         if result['triggered']:
             logger.warning(
                 f"🚨 CASCADE RISK DETECTED: {cascade_probability:.2%} probability "
-                f"({len(self.recent_liquidations)} liquidations in {self.lookback_window}s)"
+                f"({count} liquidations in {self.lookback_window}s)"
             )
             self.cascade_history.append(result)
         
@@ -162,34 +273,22 @@ class LiquidationDetector:
         Returns:
             Score 0-1 (0=normal, 1=extreme spike)
         """
-        if len(self.recent_liquidations) < 2:
+        count = self._window_count()
+        if count < 2:
             return 0.0
         
-        # Calculate total volume in recent window
-        recent_volume = sum(event.size for event in self.recent_liquidations)
-        
-        # Compare to baseline (use half the window as baseline)
-        baseline_window = self.lookback_window // 2
-        cutoff_time = datetime.now() - timedelta(seconds=baseline_window)
-        
-        baseline_events = [
-            event for event in self.recent_liquidations
-            if event.timestamp < cutoff_time
-        ]
-        
-        if not baseline_events:
+        # Compare window volume to baseline (events older than half the window)
+        if not self._baseline:
             # No baseline, use count as proxy
-            if len(self.recent_liquidations) > self.min_events_for_cascade:
+            if count > self.min_events_for_cascade:
                 return 0.7
             return 0.0
         
-        baseline_volume = sum(event.size for event in baseline_events)
-        
-        if baseline_volume == 0:
+        if self._baseline_size <= 0:
             return 0.5
         
         # Calculate spike multiplier
-        spike_multiplier = recent_volume / baseline_volume
+        spike_multiplier = self._total_size / self._baseline_size
         
         # Normalize to 0-1
         score = min(1.0, spike_multiplier / self.volume_spike_multiplier)
@@ -205,23 +304,12 @@ class LiquidationDetector:
         Returns:
             Score 0-1 (0=spread out, 1=highly clustered)
         """
-        if len(self.recent_liquidations) < 2:
+        count = self._window_count()
+        if count < 2:
             return 0.0
         
-        # Sort by timestamp
-        sorted_events = sorted(self.recent_liquidations, key=lambda e: e.timestamp)
-        
-        # Calculate time gaps between consecutive events
-        time_gaps = []
-        for i in range(1, len(sorted_events)):
-            gap = (sorted_events[i].timestamp - sorted_events[i-1].timestamp).total_seconds()
-            time_gaps.append(gap)
-        
-        # Check how many gaps are below clustering threshold
-        clustered_gaps = sum(1 for gap in time_gaps if gap <= self.time_clustering_seconds)
-        
-        # Calculate clustering ratio
-        clustering_ratio = clustered_gaps / len(time_gaps) if time_gaps else 0.0
+        # Share of consecutive gaps below the clustering threshold
+        clustering_ratio = self._clustered_gaps / (count - 1)
         
         logger.debug(f"Time clustering score: {clustering_ratio:.2f}")
         
@@ -234,14 +322,12 @@ class LiquidationDetector:
         Returns:
             Score 0-1 (0=balanced, 1=all same direction)
         """
-        if len(self.recent_liquidations) < 2:
+        total = self._window_count()
+        if total < 2:
             return 0.0
         
-        # Count directions
-        long_count = sum(1 for e in self.recent_liquidations if e.direction == 'long')
-        short_count = len(self.recent_liquidations) - long_count
-        
-        total = len(self.recent_liquidations)
+        long_count = self._long_count
+        short_count = total - long_count
         
         # Calculate bias (how far from 50/50)
         bias = abs(long_count - short_count) / total
@@ -263,7 +349,7 @@ class LiquidationDetector:
         Returns:
             Score 0-1 (0=no impact, 1=extreme impact)
         """
-        if not self.recent_liquidations or not market_data:
+        if not self._window_count() or not market_data:
             return 0.0
         
         # Get recent price change
@@ -271,12 +357,8 @@ class LiquidationDetector:
         if current_price == 0:
             return 0.0
         
-        # Calculate price range during liquidation window
-        prices = [event.price for event in self.recent_liquidations]
-        if not prices:
-            return 0.0
-        
-        price_range = max(prices) - min(prices)
+        # Price range during liquidation window
+        price_range = self._max_prices[0][1] - self._min_prices[0][1]
         price_volatility = price_range / current_price
         
         # Normalize (assume >5% volatility is extreme)
@@ -290,7 +372,8 @@ class LiquidationDetector:
         """Get summary of cascade detection state"""
         
         return {
-            'recent_liquidations_count': len(self.recent_liquidations),
+            'recent_liquidations_count': self._window_count(),
+            'volume_by_direction': dict(self._size_by_direction),
             'cascade_history_count': len(self.cascade_history),
             'last_cascade': self.cascade_history[-1] if self.cascade_history else None,
             'lookback_window_seconds': self.lookback_window,
@@ -299,6 +382,17 @@ class LiquidationDetector:
     
     def reset(self):
         """Reset detector state"""
-        self.recent_liquidations.clear()
+        self._baseline.clear()
+        self._recent.clear()
+        self._max_prices.clear()
+        self._min_prices.clear()
+        self._next_seq = 0
+        self._head_seq = 0
+        self._total_size = 0.0
+        self._baseline_size = 0.0
+        self._size_by_direction = {'long': 0.0, 'short': 0.0}
+        self._long_count = 0
+        self._clustered_gaps = 0
+        self._last_timestamp = None
         self.cascade_history.clear()
         logger.info("Liquidation detector reset")
@@ -0,0 +1,640 @@
+"""
+Order Event Stream
+Push-based order/fill events from exchange user-data streams
+
+Each exchange source (WebSocket or CCXT Pro ``watch_orders``) yields raw
+messages that are normalized into one ``OrderEvent`` type covering new
+orders, partial fills, fills and cancels. ``UserDataStream`` runs all
+sources as background tasks and notifies listeners per event, so
+portfolio updates follow exchange fills within milliseconds instead of
+waiting for the next status poll.
+
+``LocalOrderStreamServer`` is a minimal WebSocket stand-in for an
+exchange user stream (tests, paper trading).
+"""
+
+import asyncio
+import inspect
+import json
+import logging
+import os
+import time
+from abc import ABC, abstractmethod
+from collections import Counter, OrderedDict, deque
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import AsyncIterator, Callable, Dict, List, Optional
+
+import websockets
+
+logger = logging.getLogger(__name__)
+
+
+class OrderEventType(Enum):
+    """Normalized order lifecycle events"""
+    NEW = "new"
+    PARTIAL_FILL = "partial_fill"
+    FILL = "fill"
+    CANCELED = "canceled"
+    REJECTED = "rejected"
+    EXPIRED = "expired"
+
+
+TERMINAL_EVENTS = (OrderEventType.FILL, OrderEventType.CANCELED,
+                   OrderEventType.REJECTED, OrderEventType.EXPIRED)
+
+
+@dataclass
+class OrderEvent:
+    """Exchange-independent order/fill event"""
+    exchange: str
+    event_type: OrderEventType
+    order_id: str
+    symbol: str
+    side: str                       # BUY / SELL
+    last_qty: float = 0.0           # Quantity of this fill
+    last_price: float = 0.0         # Price of this fill
+    cumulative_qty: float = 0.0     # Total filled on the order
+    avg_price: float = 0.0          # Average fill price on the order
+    order_qty: float = 0.0
+    commission: float = 0.0
+    commission_asset: str = ''
+    trade_id: Optional[str] = None
+    client_order_id: Optional[str] = None
+    event_time: float = 0.0         # Exchange timestamp (epoch seconds)
+    received_time: float = field(default_factory=time.time)
+    raw: Optional[Dict] = None
+    
+    @property
+    def is_fill(self) -> bool:
+        return self.event_type in (OrderEventType.PARTIAL_FILL, OrderEventType.FILL)
+    
+    @property
+    def latency_ms(self) -> float:
+        """Exchange event to local receipt"""
+        if self.event_time <= 0:
+            return 0.0
+        return max(0.0, (self.received_time - self.event_time) * 1000)
+    
+    def to_fill(self) -> Dict:
+        """Fill in the trade result format used for portfolio updates"""
+        return {
+            'executed': True,
+            'symbol': self.symbol,
+            'action': self.side,
+            'size': self.last_qty,
+            'shares': self.last_qty,
+            'price': self.last_price,
+            'position_value': self.last_qty * self.last_price,
+            'commission': self.commission,
+            'order_id': self.order_id,
+            'exchange': self.exchange,
+            'event_type': self.event_type.value,
+            'timestamp': self.event_time or self.received_time
+        }
+
+
+# ==================== NORMALIZERS ====================
+
+_BINANCE_EXECUTION_TYPES = {
+    'NEW': OrderEventType.NEW,
+    'CANCELED': OrderEventType.CANCELED,
+    'REJECTED': OrderEventType.REJECTED,
+    'EXPIRED': OrderEventType.EXPIRED
+}
+
+_CCXT_STATUS = {
+    'canceled': OrderEventType.CANCELED,
+    'cancelled': OrderEventType.CANCELED,
+    'rejected': OrderEventType.REJECTED,
+    'expired': OrderEventType.EXPIRED
+}
+
+
+def normalize_binance(message: Dict) -> Optional[OrderEvent]:
+    """Binance spot ``executionReport`` user-data message"""
+    if message.get('e') != 'executionReport':
+        return None
+    
+    execution = message.get('x')
+    if execution == 'TRADE':
+        event_type = OrderEventType.FILL if message.get('X') == 'FILLED' else OrderEventType.PARTIAL_FILL
+    elif execution in _BINANCE_EXECUTION_TYPES:
+        event_type = _BINANCE_EXECUTION_TYPES[execution]
+    else:
+        return None  # REPLACED / TRADE_PREVENTION
+    
+    cumulative = float(message.get('z', 0))
+    quote = float(message.get('Z', 0))
+    
+    return OrderEvent(
+        exchange='binance',
+        event_type=event_type,
+        order_id=str(message.get('i')),
+        client_order_id=message.get('c'),
+        symbol=message.get('s', ''),
+        side=message.get('S', '').upper(),
+        last_qty=float(message.get('l', 0)),
+        last_price=float(message.get('L', 0)),
+        cumulative_qty=cumulative,
+        avg_price=quote / cumulative if cumulative > 0 else 0.0,
+        order_qty=float(message.get('q', 0)),
+        commission=float(message.get('n') or 0),
+        commission_asset=message.get('N') or '',
+        trade_id=str(message['t']) if message.get('t', -1) != -1 else None,
+        event_time=message.get('E', 0) / 1000,
+        raw=message
+    )
+
+
+def normalize_ccxt(order: Dict) -> Optional[OrderEvent]:
+    """
+    CCXT unified order structure (``watch_orders``)
+    
+    Unified orders carry cumulative quantities only; the fill delta is
+    derived by the source from the previous update of the same order.
+    """
+    if not order or order.get('id') is None:
+        return None
+    
+    status = order.get('status')
+    filled = float(order.get('filled') or 0)
+    amount = float(order.get('amount') or 0)
+    
+    if status in _CCXT_STATUS:
+        event_type = _CCXT_STATUS[status]
+    elif status == 'closed':
+        event_type = OrderEventType.FILL
+    elif filled > 0:
+        event_type = OrderEventType.PARTIAL_FILL
+    else:
+        event_type = OrderEventType.NEW
+    
+    fee = order.get('fee') or {}
+    
+    return OrderEvent(
+        exchange='ccxt',
+        event_type=event_type,
+        order_id=str(order['id']),
+        client_order_id=order.get('clientOrderId'),
+        symbol=order.get('symbol', ''),
+        side=(order.get('side') or '').upper(),
+        cumulative_qty=filled,
+        avg_price=float(order.get('average') or order.get('price') or 0),
+        order_qty=amount,
+        commission=float(fee.get('cost') or 0),
+        commission_asset=fee.get('currency') or '',
+        event_time=(order.get('lastTradeTimestamp') or order.get('timestamp') or 0) / 1000,
+        raw=order
+    )
+
+
+_FINST_STATUS = {
+    'new': OrderEventType.NEW,
+    'partially_filled': OrderEventType.PARTIAL_FILL,
+    'filled': OrderEventType.FILL,
+    'cancelled': OrderEventType.CANCELED,
+    'rejected': OrderEventType.REJECTED,
+    'expired': OrderEventType.EXPIRED
+}
+
+
+def normalize_finst(message: Dict) -> Optional[OrderEvent]:
+    """Finst order update (estimated format - API not yet available)"""
+    if message.get('event') != 'order_update':
+        return None
+    
+    event_type = _FINST_STATUS.get(message.get('status'))
+    if event_type is None:
+        return None
+    
+    return OrderEvent(
+        exchange='finst',
+        event_type=event_type,
+        order_id=str(message.get('order_id')),
+        symbol=message.get('symbol', ''),
+        side=message.get('side', '').upper(),
+        last_qty=float(message.get('last_fill_amount') or 0),
+        last_price=float(message.get('last_fill_price') or 0),
+        cumulative_qty=float(message.get('filled_amount') or 0),
+        order_qty=float(message.get('amount') or 0),
+        commission=float(message.get('fee') or 0),
+        event_time=message.get('timestamp', 0) / 1000,
+        raw=message
+    )
+
+
+NORMALIZERS: Dict[str, Callable[[Dict], Optional[OrderEvent]]] = {
+    'binance': normalize_binance,
+    'ccxt': normalize_ccxt,
+    'finst': normalize_finst
+}
+
+
+# ==================== SOURCES ====================
+
+class OrderEventSource(ABC):
+    """
+    Base class for one exchange's user-data stream
+    
+    Subclasses implement ``_messages``; the base class normalizes,
+    derives per-fill quantities from cumulative ones, drops replayed
+    updates after reconnects and reconnects with exponential backoff.
+    """
+    
+    def __init__(self,
+                 exchange: str,
+                 normalizer: Optional[Callable[[Dict], Optional[OrderEvent]]] = None,
+                 symbol_map: Optional[Dict[str, str]] = None,
+                 reconnect_delay: float = 1.0,
+                 max_reconnect_delay: float = 30.0,
+                 max_tracked_orders: int = 10000):
+        """
+        Args:
+            exchange: Exchange name (also selects the default normalizer)
+            normalizer: Raw message -> OrderEvent (None = NORMALIZERS[exchange])
+            symbol_map: Exchange symbol -> bot symbol (e.g. 'BTCEUR' -> 'BTC/EUR')
+            reconnect_delay: Initial reconnect backoff in seconds
+            max_reconnect_delay: Backoff cap in seconds
+            max_tracked_orders: Orders whose fill state is kept for deduplication
+        """
+        self.exchange = exchange
+        self.normalizer = normalizer or NORMALIZERS[exchange]
+        self.symbol_map = symbol_map or {}
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.max_tracked_orders = max_tracked_orders
+        
+        # order_id -> (cumulative qty, avg price, cumulative commission, last event type)
+        self._orders: "OrderedDict[str, tuple]" = OrderedDict()
+        
+        self.connected = False
+        self.reconnects = 0
+        self.duplicates = 0
+    
+    @abstractmethod
+    def _messages(self) -> AsyncIterator[Dict]:
+        """Yield raw messages from one connection (async generator)"""
+    
+    async def run(self, dispatch: Callable[[OrderEvent], None]):
+        """Consume the stream until cancelled, reconnecting on errors"""
+        delay = self.reconnect_delay
+        
+        while True:
+            try:
+                async for message in self._messages():
+                    if not self.connected:
+                        self.connected = True
+                        delay = self.reconnect_delay
+                    event = self.normalize(message)
+                    if event is not None:
+                        await dispatch(event)
+                logger.warning(f"{self.exchange} user stream closed")
+            except asyncio.CancelledError:
+                self.connected = False
+                raise
+            except Exception as e:
+                logger.error(f"{self.exchange} user stream error: {e}")
+            
+            self.connected = False
+            self.reconnects += 1
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_reconnect_delay)
+    
+    def normalize(self, message: Dict) -> Optional[OrderEvent]:
+        """Normalize a raw message and reconcile it with the order's fill state"""
+        try:
+            event = self.normalizer(message)
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Unparseable {self.exchange} order message: {e}")
+            return None
+        
+        if event is None:
+            return None
+        
+        event.exchange = self.exchange
+        event.symbol = self.symbol_map.get(event.symbol, event.symbol)
+        return self._reconcile(event)
+    
+    def _reconcile(self, event: OrderEvent) -> Optional[OrderEvent]:
+        """
+        Derive fill deltas and drop updates already seen
+        
+        An update is a duplicate when neither its filled quantity nor its
+        status moved on. A status change without new quantity (e.g. a
+        cumulative feed reporting ``closed`` after the last partial fill)
+        is passed on as a fill event with zero ``last_qty``.
+        """
+        prev_qty, prev_avg, prev_fee, prev_type = self._orders.get(event.order_id, (0.0, 0.0, 0.0, None))
+        
+        if prev_type in TERMINAL_EVENTS:
+            self.duplicates += 1
+            return None
+        
+        if event.is_fill:
+            if event.cumulative_qty <= 0 and event.last_qty > 0:
+                event.cumulative_qty = prev_qty + event.last_qty  # Delta-only feeds
+            
+            if event.cumulative_qty <= prev_qty + 1e-12:
+                if event.event_type == prev_type:
+                    self.duplicates += 1  # Replay of an older update
+                    return None
+                # Status transition only
+                event.cumulative_qty, event.avg_price = prev_qty, prev_avg
+                event.last_qty = event.last_price = event.commission = 0.0
+            
+            elif event.last_qty <= 0:
+                # Cumulative-only feeds: fill and commission are deltas to the last update
+                event.last_qty = event.cumulative_qty - prev_qty
+                notional = event.avg_price * event.cumulative_qty - prev_avg * prev_qty
+                event.last_price = notional / event.last_qty if event.avg_price > 0 else 0.0
+                total_fee = event.commission
+                event.commission = max(0.0, total_fee - prev_fee)
+                prev_fee = total_fee
+            else:
+                prev_fee += event.commission
+            
+            if event.avg_price <= 0 and event.cumulative_qty > 0:
+                event.avg_price = (prev_avg * prev_qty + event.last_price * event.last_qty) / event.cumulative_qty
+            
+            prev_qty, prev_avg = event.cumulative_qty, event.avg_price
+        
+        self._orders[event.order_id] = (prev_qty, prev_avg, prev_fee, event.event_type)
+        self._orders.move_to_end(event.order_id)
+        while len(self._orders) > self.max_tracked_orders:
+            self._orders.popitem(last=False)
+        
+        return event
+
+
+class WebSocketOrderSource(OrderEventSource):
+    """User-data stream over a WebSocket connection"""
+    
+    def __init__(self,
+                 exchange: str,
+                 url: str,
+                 subscribe: Optional[Dict] = None,
+                 **kwargs):
+        """
+        Args:
+            exchange: Exchange name
+            url: WebSocket endpoint (authenticated stream URL)
+            subscribe: Message sent after connecting (None = nothing)
+            **kwargs: OrderEventSource options
+        """
+        super().__init__(exchange, **kwargs)
+        self.url = url
+        self.subscribe = subscribe
+    
+    async def _messages(self) -> AsyncIterator[Dict]:
+        async with websockets.connect(self.url) as ws:
+            if self.subscribe is not None:
+                await ws.send(json.dumps(self.subscribe))
+            
+            async for frame in ws:
+                message = json.loads(frame)
+                # Combined streams wrap payloads as {"stream": ..., "data": ...}
+                if isinstance(message, dict) and 'data' in message and 'stream' in message:
+                    message = message['data']
+                if isinstance(message, list):
+                    for item in message:
+                        yield item
+                else:
+                    yield message
+
+
+class CCXTOrderSource(OrderEventSource):
+    """User-data stream through CCXT Pro ``watch_orders``"""
+    
+    def __init__(self, exchange_client, symbol: Optional[str] = None, **kwargs):
+        """
+        Args:
+            exchange_client: ccxt.pro exchange instance with credentials
+            symbol: Restrict to one symbol (None = all)
+            **kwargs: OrderEventSource options
+        """
+        kwargs.setdefault('normalizer', normalize_ccxt)
+        super().__init__(exchange_client.id, **kwargs)
+        self.client = exchange_client
+        self.symbol = symbol
+    
+    async def _messages(self) -> AsyncIterator[Dict]:
+        while True:
+            orders = await self.client.watch_orders(self.symbol)
+            for order in orders:
+                yield order
+    
+    async def close(self):
+        await self.client.close()
+
+
+# ==================== STREAM HUB ====================
+
+class UserDataStream:
+    """
+    Runs all order event sources and fans events out to listeners
+    
+    Features:
+    - One background task per source, started with ``start()``
+    - Listeners (sync or async) receive every normalized event
+    - Receive latency and per-type event statistics
+    """
+    
+    def __init__(self, max_recent: int = 1000):
+        """
+        Args:
+            max_recent: Number of recent events kept for inspection
+        """
+        self.sources: List[OrderEventSource] = []
+        self._listeners: List[Callable] = []
+        self._tasks: List[asyncio.Task] = []
+        
+        self.recent_events: deque = deque(maxlen=max_recent)
+        self.event_counts: Counter = Counter()
+        self._latencies: deque = deque(maxlen=max_recent)
+        
+        logger.info("✓ User data stream initialized")
+    
+    def add_source(self, source: OrderEventSource):
+        """Register an exchange source (started by ``start``)"""
+        self.sources.append(source)
+    
+    def add_listener(self, listener: Callable[[OrderEvent], None]):
+        """Register a callback (sync or async) receiving each event"""
+        self._listeners.append(listener)
+    
+    @property
+    def running(self) -> bool:
+        return any(not t.done() for t in self._tasks)
+    
+    async def start(self):
+        """Start one task per source on the running loop"""
+        if self.running:
+            return
+        
+        loop = asyncio.get_running_loop()
+        self._tasks = [loop.create_task(source.run(self._dispatch)) for source in self.sources]
+        logger.info(f"User data stream started ({len(self.sources)} sources)")
+    
+    async def stop(self):
+        """Cancel all source tasks"""
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+        
+        for source in self.sources:
+            if hasattr(source, 'close'):
+                await source.close()
+    
+    async def _dispatch(self, event: OrderEvent):
+        """Record an event and notify listeners"""
+        self.recent_events.append(event)
+        self.event_counts[event.event_type.value] += 1
+        if event.event_time > 0:
+            self._latencies.append(event.latency_ms)
+        
+        for listener in self._listeners:
+            try:
+                outcome = listener(event)
+                if inspect.isawaitable(outcome):
+                    await outcome
+            except Exception as e:
+                logger.error(f"Order event listener error: {e}")
+    
+    def get_statistics(self) -> Dict:
+        """Stream statistics"""
+        latencies = sorted(self._latencies)
+        return {
+            'sources': {
+                s.exchange: {'connected': s.connected, 'reconnects': s.reconnects, 'duplicates': s.duplicates}
+                for s in self.sources
+            },
+            'events': dict(self.event_counts),
+            'latency_ms_median': latencies[len(latencies) // 2] if latencies else 0.0,
+            'latency_ms_max': latencies[-1] if latencies else 0.0,
+            'running': self.running
+        }
+
+
+def build_user_stream(config) -> Optional[UserDataStream]:
+    """
+    Create the user data stream from ``execution.user_stream`` config
+    
+    Sources: ``{exchange, type: websocket, url, subscribe, symbol_map}``
+    or ``{exchange, type: ccxt}`` (credentials from ``exchanges.<name>``).
+    
+    Returns:
+        UserDataStream, or None if disabled
+    """
+    settings = config.get('execution.user_stream', {}) or {}
+    if not settings.get('enabled', False):
+        return None
+    
+    stream = UserDataStream()
+    
+    for spec in settings.get('sources', []):
+        exchange = spec['exchange']
+        options = {
+            'symbol_map': spec.get('symbol_map'),
+            'reconnect_delay': settings.get('reconnect_delay', 1.0),
+            'max_reconnect_delay': settings.get('max_reconnect_delay', 30.0)
+        }
+        
+        if spec.get('type', 'websocket') == 'ccxt':
+            import ccxt.pro as ccxtpro
+            
+            exchange_config = config.exchanges.get(exchange, {})
+            client = getattr(ccxtpro, exchange)({
+                'apiKey': os.getenv(exchange_config.get('api_key_env', '')),
+                'secret': os.getenv(exchange_config.get('api_secret_env', '')),
+                'enableRateLimit': True
+            })
+            stream.add_source(CCXTOrderSource(client, **options))
+        else:
+            stream.add_source(WebSocketOrderSource(
+                exchange, spec['url'], subscribe=spec.get('subscribe'),
+                normalizer=NORMALIZERS.get(spec.get('format', exchange)), **options
+            ))
+    
+    return stream
+
+
+# ==================== LOCAL STREAM SERVER ====================
+
+class LocalOrderStreamServer:
+    """
+    Local stand-in for an exchange user-data WebSocket
+    
+    Broadcasts published messages (in any exchange format) to all
+    connected clients.
+    """
+    
+    def __init__(self, host: str = '127.0.0.1', port: int = 0):
+        """
+        Args:
+            host: Bind address
+            port: Bind port (0 = any free port)
+        """
+        self.host = host
+        self.port = port
+        self.clients = set()
+        self._server = None
+        self._client_event: Optional[asyncio.Event] = None
+    
+    @property
+    def url(self) -> str:
+        return f"ws://{self.host}:{self.port}"
+    
+    async def start(self) -> str:
+        """Start serving; returns the WebSocket URL"""
+        self._client_event = asyncio.Event()
+        self._server = await websockets.serve(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self.url
+    
+    async def _handle(self, ws):
+        self.clients.add(ws)
+        self._client_event.set()
+        try:
+            await ws.wait_closed()
+        finally:
+            self.clients.discard(ws)
+    
+    async def wait_for_clients(self, count: int = 1, timeout: float = 5.0):
+        """Wait until ``count`` clients are connected"""
+        deadline = time.monotonic() + timeout
+        while len(self.clients) < count:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise asyncio.TimeoutError(f"{len(self.clients)}/{count} clients connected")
+            self._client_event.clear()
+            try:
+                await asyncio.wait_for(self._client_event.wait(), remaining)
+            except asyncio.TimeoutError:
+                pass
+    
+    async def publish(self, message: Dict):
+        """Send a message to every connected client"""
+        frame = json.dumps(message)
+        for ws in list(self.clients):
+            try:
+                await ws.send(frame)
+            except websockets.ConnectionClosed:
+                self.clients.discard(ws)
+    
+    async def disconnect_clients(self):
+        """Drop all client connections (exercise reconnects)"""
+        for ws in list(self.clients):
+            await ws.close()
+    
+    async def stop(self):
+        """Stop serving"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
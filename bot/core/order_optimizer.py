@@ -17,6 +17,8 @@ from decimal import Decimal
 import time
 import numpy as np
 
+from .cost_model import CostModel
+
 logger = logging.getLogger(__name__)
 
 
@@ -106,6 +108,7 @@ class ExchangeCommissionConfig:
         self.maker_fee = maker_fee
         self.taker_fee = taker_fee
         self.volume_tier_discounts = volume_tier_discounts or {}
+        self._sorted_tiers = sorted(self.volume_tier_discounts.items(), reverse=True)
         self.flat_fee = flat_fee
         self.supports_bnb_discount = supports_bnb_discount
         self.bnb_discount_percent = bnb_discount_percent
@@ -139,9 +142,7 @@ class ExchangeCommissionConfig:
             base_fee = self.taker_fee
         
         # Apply volume tiers
-        for tier_volume, tier_fee in sorted(
-            self.volume_tier_discounts.items(), reverse=True
-        ):
+        for tier_volume, tier_fee in self._sorted_tiers:
             if volume_30d >= tier_volume:
                 base_fee = tier_fee
                 break
@@ -153,6 +154,18 @@ class ExchangeCommissionConfig:
         return base_fee
 
 
+# Plan branch codes used by batch planning
+_BRANCH_EMPTY = -1
+_BRANCH_MARKET = 0
+_BRANCH_MAKER = 1
+_BRANCH_SPLIT = 2
+_BRANCH_ICEBERG = 3
+_BRANCH_VWAP = 4
+
+# Liquidity rank (1=best .. 5=worst) -> hybrid factor; ranks are clipped to 1..5
+_LIQUIDITY_FACTOR = np.arange(6) / 5.0
+
+
 class OrderOptimizer:
     """
     Main Order Optimization Engine
@@ -169,7 +182,8 @@ class OrderOptimizer:
         optimization_strategy: OrderOptimizationStrategy = OrderOptimizationStrategy.HYBRID,
         volume_30d: float = 0.0,
         has_bnb: bool = False,
-        max_execution_time: int = 300
+        max_execution_time: int = 300,
+        cost_model: Optional[CostModel] = None
     ):
         """
         Initialize Order Optimizer
@@ -180,17 +194,22 @@ class OrderOptimizer:
             volume_30d: 30-day trading volume for tier discounts
             has_bnb: Whether user has BNB for discount
             max_execution_time: Maximum time to execute orders (seconds)
+            cost_model: Slippage model (size in EUR); default CostModel.for_optimizer()
         """
         self.exchange_config = exchange_config
         self.optimization_strategy = optimization_strategy
         self.volume_30d = volume_30d
         self.has_bnb = has_bnb
         self.max_execution_time = max_execution_time
+        self.cost_model = cost_model or CostModel.for_optimizer()
         
         # Statistics
         self.total_commissions_saved = 0.0
         self.total_orders_optimized = 0
         
+        # Effective fee lookup (refreshed on volume/BNB changes)
+        self._refresh_fee_table()
+        
         logger.info(
             f"✓ Order Optimizer initialized for {exchange_config.exchange_name} "
             f"(strategy={optimization_strategy.value})"
@@ -235,6 +254,8 @@ class OrderOptimizer:
             )
             return self._create_empty_plan()
         
+        liquidity_rank = int(np.clip(liquidity_rank, 1, 5))
+        
         # Decide execution method based on strategy
         if self.optimization_strategy == OrderOptimizationStrategy.AGGRESSIVE_MARKET:
             plan = self._plan_aggressive_market(
@@ -290,7 +311,8 @@ class OrderOptimizer:
         market_volatility: float,
         strategy_name: str,
         confidence: float,
-        liquidity_rank: int
+        liquidity_rank: int,
+        slippage: Optional[float] = None
     ) -> OrderExecutionPlan:
         """
         Aggressive market strategy: Always use market orders (taker)
@@ -299,15 +321,14 @@ class OrderOptimizer:
         Commission: ~0.10% per side (Binance taker)
         """
         
-        # Estimate slippage
-        slippage = self._estimate_slippage(
-            side, amount, current_price, market_volatility, liquidity_rank
-        )
+        # Estimate slippage (batch planning passes it precomputed)
+        if slippage is None:
+            slippage = self._estimate_slippage(
+                side, amount, current_price, market_volatility, liquidity_rank
+            )
         
         # Get taker fee
-        taker_fee = self.exchange_config.get_effective_fee(
-            OrderType.MARKET, self.volume_30d, self.has_bnb
-        )
+        taker_fee = self._fee_table[OrderType.MARKET]
         
         plan = OrderExecutionPlan(
             symbol=symbol,
@@ -355,9 +376,7 @@ class OrderOptimizer:
         """
         
         # Get maker fee (typically cheaper)
-        maker_fee = self.exchange_config.get_effective_fee(
-            OrderType.LIMIT, self.volume_30d, self.has_bnb
-        )
+        maker_fee = self._fee_table[OrderType.LIMIT]
         
         # Place limit just inside the spread to improve fill odds
         if side == 'BUY':
@@ -415,19 +434,7 @@ class OrderOptimizer:
         Commission: Blend of 0.075% and 0.10% depending on mix
         """
         
-        # Calculate decision factors
-        size_factor = min(1.0, (amount / 5000.0))  # 0-1, 5000 EUR = threshold
-        liquidity_factor = liquidity_rank / 5.0  # 0.2 (best) to 1.0 (worst)
-        confidence_factor = confidence  # 0-1
-        volatility_factor = min(1.0, market_volatility / 0.05)  # Normalize to 5%
-        
-        # Score: Higher = more likely to use market orders
-        market_score = (
-            0.4 * confidence_factor +  # High confidence → market
-            0.2 * (1 - size_factor) +  # Small size → market
-            0.2 * (1 - liquidity_factor) +  # Good liquidity → market
-            0.2 * (1 - volatility_factor)  # Low volatility → market
-        )
+        market_score = self._market_score(amount, confidence, market_volatility, liquidity_rank)
         
         # Decision threshold
         if market_score > 0.65:
@@ -452,6 +459,27 @@ class OrderOptimizer:
                 market_ratio=0.40, limit_ratio=0.60
             )
     
+    @staticmethod
+    def _market_score(amount, confidence, market_volatility, liquidity_rank):
+        """
+        Hybrid decision score (higher = more likely to use market orders)
+        
+        Works on scalars or arrays of candidates.
+        """
+        
+        # Calculate decision factors
+        size_factor = np.minimum(1.0, amount / 5000.0)  # 0-1, 5000 EUR = threshold
+        liquidity_factor = _LIQUIDITY_FACTOR[liquidity_rank]  # 0.2 (best) to 1.0 (worst)
+        confidence_factor = confidence  # 0-1
+        volatility_factor = np.minimum(1.0, market_volatility / 0.05)  # Normalize to 5%
+        
+        return (
+            0.4 * confidence_factor +  # High confidence → market
+            0.2 * (1 - size_factor) +  # Small size → market
+            0.2 * (1 - liquidity_factor) +  # Good liquidity → market
+            0.2 * (1 - volatility_factor)  # Low volatility → market
+        )
+    
     def _plan_size_aware(
         self,
         symbol: str,
@@ -486,12 +514,8 @@ class OrderOptimizer:
             num_orders = 3
             order_size = amount / num_orders
             
-            maker_fee = self.exchange_config.get_effective_fee(
-                OrderType.LIMIT, self.volume_30d, self.has_bnb
-            )
-            taker_fee = self.exchange_config.get_effective_fee(
-                OrderType.MARKET, self.volume_30d, self.has_bnb
-            )
+            maker_fee = self._fee_table[OrderType.LIMIT]
+            taker_fee = self._fee_table[OrderType.MARKET]
             
             # Mix: 1 limit (patient), 2 market (for fill)
             avg_fee = (maker_fee + 2 * taker_fee) / 3
@@ -541,9 +565,7 @@ class OrderOptimizer:
             order_size = amount / num_orders
             time_between = self.max_execution_time // num_orders
             
-            maker_fee = self.exchange_config.get_effective_fee(
-                OrderType.LIMIT, self.volume_30d, self.has_bnb
-            )
+            maker_fee = self._fee_table[OrderType.LIMIT]
             
             plan = OrderExecutionPlan(
                 symbol=symbol,
@@ -597,12 +619,8 @@ class OrderOptimizer:
         market_size = amount * market_ratio
         limit_size = amount * limit_ratio
         
-        market_fee = self.exchange_config.get_effective_fee(
-            OrderType.MARKET, self.volume_30d, self.has_bnb
-        )
-        maker_fee = self.exchange_config.get_effective_fee(
-            OrderType.LIMIT, self.volume_30d, self.has_bnb
-        )
+        market_fee = self._fee_table[OrderType.MARKET]
+        maker_fee = self._fee_table[OrderType.LIMIT]
         
         # Weighted average fee
         avg_fee = (market_size * market_fee + limit_size * maker_fee) / amount
@@ -663,23 +681,112 @@ class OrderOptimizer:
             Estimated slippage as decimal
         """
         
-        # Base slippage from bid-ask spread
-        base_slippage = 0.0005  # 0.05% typical spread
+        return self._estimate_slippage_batch(
+            np.array([amount], dtype=np.float64),
+            np.array([market_volatility], dtype=np.float64),
+            np.array([liquidity_rank]),
+            side
+        )[0]
+    
+    def _refresh_fee_table(self):
+        """Precompute effective fees for the current volume tier and BNB state"""
+        self._fee_table = {
+            order_type: self.exchange_config.get_effective_fee(order_type, self.volume_30d, self.has_bnb)
+            for order_type in OrderType
+        }
+    
+    def _estimate_slippage_batch(
+        self,
+        amount: np.ndarray,
+        market_volatility: np.ndarray,
+        liquidity_rank: np.ndarray,
+        side='BUY'
+    ) -> np.ndarray:
+        """Vectorized ``_estimate_slippage`` over candidates (expected cost, no noise)"""
+        return self.cost_model.estimate(
+            side, amount, market_volatility, liquidity_rank=liquidity_rank, randomize=False
+        ).slippage
+    
+    def create_execution_plans(self, orders: List[Dict]) -> List[OrderExecutionPlan]:
+        """
+        Create execution plans for many orders at once
+        
+        Branch selection and slippage are scored vectorized over all
+        candidates using the precomputed fee and liquidity tables; each
+        plan is identical to ``create_execution_plan`` for the same order
+        (liquidity ranks outside 1..5 are clipped in both).
         
-        # Market impact: larger orders have more slippage
-        # Order value factor (0-1)
-        amount_factor = min(1.0, amount / 10000.0)  # 10k EUR = max impact
-        market_impact = amount_factor * 0.002  # Up to 0.2%
+        Args:
+            orders: Dicts with the ``create_execution_plan`` arguments
+                (symbol, side, amount, current_price required)
+            
+        Returns:
+            OrderExecutionPlan per order, in order
+        """
+        n = len(orders)
+        if n == 0:
+            return []
+        
+        amount = np.fromiter((o['amount'] for o in orders), dtype=np.float64, count=n)
+        confidence = np.fromiter((o.get('confidence', 0.5) for o in orders), dtype=np.float64, count=n)
+        volatility = np.fromiter((o.get('market_volatility', 0.02) for o in orders), dtype=np.float64, count=n)
+        rank = np.clip(
+            np.fromiter((o.get('liquidity_rank', 1) for o in orders), dtype=np.int64, count=n), 1, 5
+        )
         
-        # Liquidity factor: worse liquidity = more slippage
-        liquidity_impact = (liquidity_rank / 5.0) * 0.001  # Up to 0.1%
+        # Branch per candidate
+        score = self._market_score(amount, confidence, volatility, rank)
+        hybrid = np.select([score > 0.65, score < 0.35], [_BRANCH_MARKET, _BRANCH_MAKER], _BRANCH_SPLIT)
+        
+        strategy = self.optimization_strategy
+        if strategy == OrderOptimizationStrategy.AGGRESSIVE_MARKET:
+            branch = np.full(n, _BRANCH_MARKET)
+        elif strategy == OrderOptimizationStrategy.PATIENT_MAKER:
+            branch = np.full(n, _BRANCH_MAKER)
+        elif strategy == OrderOptimizationStrategy.SIZE_AWARE:
+            branch = np.select([amount <= 1000, amount <= 5000], [hybrid, _BRANCH_ICEBERG], _BRANCH_VWAP)
+        else:
+            branch = hybrid
+        branch = np.where(amount < self.exchange_config.min_order_size, _BRANCH_EMPTY, branch)
         
-        # Volatility factor: higher vol = more slippage
-        volatility_impact = market_volatility * 0.5  # Scale by 50%
+        slippage = self._estimate_slippage_batch(amount, volatility, rank)
         
-        total_slippage = base_slippage + market_impact + liquidity_impact + volatility_impact
+        plans = []
+        for i, order in enumerate(orders):
+            code = branch[i]
+            if code == _BRANCH_EMPTY:
+                plans.append(self._create_empty_plan())
+                continue
+            
+            args = (
+                order['symbol'], order['side'], float(amount[i]), order['current_price'],
+                float(volatility[i])
+            )
+            tail = (order.get('strategy_name', 'unknown'), float(confidence[i]), int(rank[i]))
+            
+            if code == _BRANCH_MARKET:
+                plan = self._plan_aggressive_market(*args, *tail, slippage=float(slippage[i]))
+            elif code == _BRANCH_MAKER:
+                plan = self._plan_patient_maker(*args, *tail)
+            elif code == _BRANCH_SPLIT:
+                plan = self._plan_split_execution(*args, *tail, market_ratio=0.40, limit_ratio=0.60)
+            else:
+                plan = self._plan_size_aware(*args, *tail)
+            plans.append(plan)
+        
+        # Commission savings vs taker for the planned orders
+        planned = branch != _BRANCH_EMPTY
+        fees = np.array([p.estimated_commission_percent for p in plans])
+        savings = (self.exchange_config.taker_fee - fees[planned]) * amount[planned]
+        self.total_commissions_saved += float(np.maximum(0, savings).sum())
+        self.total_orders_optimized += int(planned.sum())
+        
+        logger.debug(
+            f"Batch execution plans: {n} orders "
+            f"({int((~planned).sum())} below minimum, savings vs taker: €{savings.sum():.2f})"
+        )
         
-        return total_slippage
+        return plans
     
     def _create_empty_plan(self) -> OrderExecutionPlan:
         """Create empty/failed plan"""
@@ -696,11 +803,13 @@ class OrderOptimizer:
     def update_volume_30d(self, new_volume: float):
         """Update 30-day trading volume (affects fee tiers)"""
         self.volume_30d = new_volume
+        self._refresh_fee_table()
         logger.info(f"Updated 30-day volume to €{new_volume:,.2f}")
     
     def toggle_bnb(self, has_bnb: bool):
         """Toggle BNB discount eligibility"""
         self.has_bnb = has_bnb
+        self._refresh_fee_table()
         logger.info(f"BNB discount {'enabled' if has_bnb else 'disabled'}")
     
     def get_optimizer_stats(self) -> Dict:
@@ -0,0 +1,405 @@
+"""
+Child Order Scheduler
+Paces split/TWAP/VWAP execution plans in a background asyncio task
+
+Deferred slices of an execution plan are kept in a heap keyed by due
+time. A single task sleeps until the earliest slice is due, fills it
+through the engine callback and reports the fill to listeners, so the
+trading loop never waits on order pacing.
+
+Limit slices whose price is not reached yet stay working: the fill
+handler returns ``executed: False`` and the slice is retried after
+``retry_seconds``. After ``max_retries`` unfilled attempts the slice
+expires and its parent is cancelled.
+
+In driven mode (replays) there is no background task: due times follow
+the installed clock and the caller fills due slices with ``run_due``.
+"""
+
+import asyncio
+import heapq
+import inspect
+import itertools
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Callable, Dict, List, Optional
+
+from . import clock
+
+logger = logging.getLogger(__name__)
+
+
+class ParentOrderStatus(Enum):
+    """Lifecycle of a parent (plan-level) order"""
+    WORKING = "working"        # Slices pending
+    COMPLETED = "completed"    # All slices filled
+    CANCELLED = "cancelled"    # Cancelled before completion
+    FAILED = "failed"          # A slice could not be filled
+
+
+@dataclass
+class ChildOrder:
+    """Single slice of an execution plan"""
+    index: int
+    size: float                 # Notional (EUR)
+    order_type: str = 'market'
+    price: Optional[float] = None   # Limit price (limit slices)
+    delay_seconds: float = 0.0  # Offset from parent submission
+    retries: int = 0            # Unfilled limit attempts
+    filled: bool = False
+    fill: Optional[Dict] = None
+
+
+@dataclass
+class ParentOrder:
+    """Plan-level order with its child slices"""
+    parent_id: str
+    signal: object
+    plan: object
+    reference_price: float
+    portfolio_value: float
+    market_data: Dict
+    children: List[ChildOrder] = field(default_factory=list)
+    status: ParentOrderStatus = ParentOrderStatus.WORKING
+    filled_value: float = 0.0
+    filled_shares: float = 0.0
+    commission: float = 0.0
+    created_at: datetime = field(default_factory=clock.now)
+    completed_at: Optional[datetime] = None
+    
+    @property
+    def symbol(self) -> str:
+        return self.signal.symbol
+    
+    @property
+    def side(self) -> str:
+        return self.signal.action
+    
+    @property
+    def pending_children(self) -> List[ChildOrder]:
+        return [c for c in self.children if not c.filled]
+    
+    @property
+    def remaining_value(self) -> float:
+        return sum(c.size for c in self.pending_children)
+    
+    @property
+    def avg_price(self) -> float:
+        return self.filled_value / self.filled_shares if self.filled_shares > 0 else 0.0
+
+
+class ChildOrderScheduler:
+    """
+    Heap-based timer for deferred child orders
+    
+    Features:
+    - One background task per event loop, started lazily on first submit
+    - Cancel (lazy heap deletion) and amend of working parent orders
+    - Fill listeners (sync or async) notified per slice
+    - Driven mode: slices fill on ``run_due`` against the installed clock
+    """
+    
+    def __init__(self,
+                 fill_handler: Callable[[ParentOrder, ChildOrder], Optional[Dict]],
+                 max_finished: int = 100,
+                 driven: bool = False,
+                 retry_seconds: float = 5.0,
+                 max_retries: Optional[int] = 720):
+        """
+        Args:
+            fill_handler: Fills one slice; returns a fill dict, None on failure
+                or a dict with ``executed: False`` when a limit is not reached
+            max_finished: Number of finished parent orders kept for inspection
+            driven: No background task; ``run_due`` fills due slices
+            retry_seconds: Delay before an unfilled limit slice is tried again
+            max_retries: Unfilled attempts before a limit slice expires and
+                its parent is cancelled (None keeps it working indefinitely)
+        """
+        self.fill_handler = fill_handler
+        self.max_finished = max_finished
+        self.driven = driven
+        self.retry_seconds = retry_seconds
+        self.max_retries = max_retries
+        
+        self.parents: Dict[str, ParentOrder] = {}
+        self.finished: "OrderedDict[str, ParentOrder]" = OrderedDict()
+        self._listeners: List[Callable] = []
+        
+        # (due, seq, parent_id, position in parent.children)
+        self._heap: List[tuple] = []
+        self._seq = itertools.count()
+        self._ids = itertools.count(1)
+        
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        
+        # Statistics
+        self.slices_filled = 0
+        self.slices_failed = 0
+        self.slices_retried = 0
+        self.slices_expired = 0
+    
+    # ==================== LIFECYCLE ====================
+    
+    def ensure_started(self):
+        """Start the background task on the running loop if needed"""
+        if self._task is not None and not self._task.done():
+            return
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+    
+    async def stop(self, cancel_pending: bool = True):
+        """
+        Stop the background task
+        
+        Args:
+            cancel_pending: Cancel all working parent orders
+        """
+        if cancel_pending:
+            for parent_id in list(self.parents):
+                self.cancel(parent_id)
+        
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    def add_fill_listener(self, listener: Callable[[Dict], None]):
+        """Register a callback (sync or async) receiving each slice fill"""
+        self._listeners.append(listener)
+    
+    # ==================== ORDER MANAGEMENT ====================
+    
+    def submit(self, parent: ParentOrder) -> str:
+        """
+        Schedule the unfilled children of a parent order
+        
+        Args:
+            parent: ParentOrder (``parent_id`` may be empty)
+        
+        Returns:
+            Parent order id
+        """
+        if not parent.parent_id:
+            parent.parent_id = f"{parent.symbol}-{next(self._ids)}"
+        
+        self.parents[parent.parent_id] = parent
+        if not self.driven:
+            self.ensure_started()
+        
+        now = self._time()
+        for position, child in enumerate(parent.children):
+            if not child.filled:
+                heapq.heappush(self._heap, (now + child.delay_seconds, next(self._seq),
+                                            parent.parent_id, position))
+        if self._wakeup is not None:
+            self._wakeup.set()
+        
+        logger.debug(
+            f"Scheduled {len(parent.pending_children)} slices for {parent.parent_id} "
+            f"({parent.side} {parent.symbol}, €{parent.remaining_value:.2f})"
+        )
+        return parent.parent_id
+    
+    def cancel(self, parent_id: str) -> bool:
+        """
+        Cancel the pending slices of a parent order
+        
+        Returns:
+            True if the order was working
+        """
+        parent = self.parents.get(parent_id)
+        if parent is None:
+            return False
+        
+        # Heap entries are dropped lazily when popped
+        self._finish(parent, ParentOrderStatus.CANCELLED)
+        logger.info(
+            f"Parent order cancelled: {parent_id} "
+            f"(filled €{parent.filled_value:.2f}, unfilled €{parent.remaining_value:.2f})"
+        )
+        return True
+    
+    def amend(self,
+              parent_id: str,
+              remaining_value: Optional[float] = None,
+              limit_price: Optional[float] = None) -> bool:
+        """
+        Amend the pending slices of a working parent order
+        
+        Args:
+            parent_id: Parent order id
+            remaining_value: New total notional for the unfilled slices
+                (redistributed pro rata; 0 cancels)
+            limit_price: New price for pending limit slices
+        
+        Returns:
+            True if the order was amended
+        """
+        parent = self.parents.get(parent_id)
+        if parent is None:
+            return False
+        
+        pending = parent.pending_children
+        if remaining_value is not None:
+            if remaining_value <= 0:
+                return self.cancel(parent_id)
+            current = sum(c.size for c in pending)
+            for child in pending:
+                child.size = (child.size / current if current > 0 else 1 / len(pending)) * remaining_value
+        
+        if limit_price is not None:
+            for child in pending:
+                if child.order_type == 'limit':
+                    child.price = limit_price
+        
+        logger.debug(f"Parent order amended: {parent_id} (remaining €{parent.remaining_value:.2f})")
+        return True
+    
+    def get_parent(self, parent_id: str) -> Optional[ParentOrder]:
+        """Working or recently finished parent order"""
+        return self.parents.get(parent_id) or self.finished.get(parent_id)
+    
+    def pending_value(self, side: Optional[str] = None) -> float:
+        """Unfilled notional of working orders (optionally one side)"""
+        return sum(
+            p.remaining_value for p in self.parents.values()
+            if side is None or p.side == side
+        )
+    
+    def get_statistics(self) -> Dict:
+        """Scheduler statistics"""
+        return {
+            'working_orders': len(self.parents),
+            'pending_slices': sum(len(p.pending_children) for p in self.parents.values()),
+            'pending_value': self.pending_value(),
+            'slices_filled': self.slices_filled,
+            'slices_failed': self.slices_failed,
+            'slices_retried': self.slices_retried,
+            'slices_expired': self.slices_expired,
+            'running': self._task is not None and not self._task.done()
+        }
+    
+    # ==================== TIMER LOOP ====================
+    
+    def _time(self) -> float:
+        """Due-time base: installed clock when driven, else the event loop"""
+        return clock.time() if self.driven else asyncio.get_running_loop().time()
+    
+    async def run_due(self) -> int:
+        """
+        Fill every slice due by the installed clock (driven mode)
+        
+        Returns:
+            Number of slices filled or failed
+        """
+        now = self._time()
+        processed = 0
+        
+        while self._heap and self._heap[0][0] <= now:
+            due = self._pop()
+            if due is not None:
+                await self._fill(*due)
+                processed += 1
+        
+        return processed
+    
+    async def _run(self):
+        """Sleep until the next slice is due, fill due slices, repeat"""
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            timeout = None
+            if self._heap:
+                timeout = max(0.0, self._heap[0][0] - loop.time())
+            
+            if timeout is None or timeout > 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            
+            due = self._pop()
+            if due is not None:
+                await self._fill(*due)
+    
+    def _pop(self) -> Optional[tuple]:
+        """Pop the earliest heap entry; (parent, child) unless stale"""
+        _, _, parent_id, position = heapq.heappop(self._heap)
+        parent = self.parents.get(parent_id)
+        if parent is None:
+            return None  # Cancelled or finished
+        
+        child = parent.children[position]
+        if child.filled:
+            return None
+        
+        return parent, child
+    
+    async def _fill(self, parent: ParentOrder, child: ChildOrder):
+        """Fill one slice and notify listeners"""
+        try:
+            fill = self.fill_handler(parent, child)
+        except Exception as e:
+            logger.error(f"Slice fill failed for {parent.parent_id}#{child.index}: {e}")
+            fill = None
+        
+        if fill is None:
+            self.slices_failed += 1
+            self._finish(parent, ParentOrderStatus.FAILED)
+            return
+        
+        if not fill.get('executed', True):
+            # Limit not reached: keep the slice working until it expires
+            if self.max_retries is not None and child.retries >= self.max_retries:
+                self.slices_expired += 1
+                self._finish(parent, ParentOrderStatus.CANCELLED)
+                logger.info(
+                    f"Limit slice expired: {parent.parent_id}#{child.index} "
+                    f"after {child.retries} retries (unfilled €{parent.remaining_value:.2f})"
+                )
+                return
+            
+            child.retries += 1
+            position = next(i for i, c in enumerate(parent.children) if c is child)
+            heapq.heappush(self._heap, (self._time() + self.retry_seconds, next(self._seq),
+                                        parent.parent_id, position))
+            self.slices_retried += 1
+            return
+        
+        child.filled = True
+        child.fill = fill
+        parent.filled_value += fill.get('position_value', child.size)
+        parent.filled_shares += fill.get('shares', 0.0)
+        parent.commission += fill.get('commission', 0.0)
+        self.slices_filled += 1
+        
+        if not parent.pending_children:
+            self._finish(parent, ParentOrderStatus.COMPLETED)
+        fill['parent_status'] = parent.status.value
+        
+        for listener in self._listeners:
+            try:
+                outcome = listener(fill)
+                if inspect.isawaitable(outcome):
+                    await outcome
+            except Exception as e:
+                logger.error(f"Fill listener error: {e}")
+    
+    def _finish(self, parent: ParentOrder, status: ParentOrderStatus):
+        """Move a parent order out of the working set"""
+        parent.status = status
+        parent.completed_at = clock.now()
+        self.parents.pop(parent.parent_id, None)
+        
+        self.finished[parent.parent_id] = parent
+        while len(self.finished) > self.max_finished:
+            self.finished.popitem(last=False)
@@ -0,0 +1,452 @@
+"""
+Portfolio Risk Engine
+Vectorized VaR/CVaR (historical, parametric, Monte Carlo) for open positions
+"""
+
+import logging
+import numpy as np
+from datetime import datetime
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from . import clock
+
+logger = logging.getLogger(__name__)
+
+# One-sided standard normal quantiles used by parametric VaR
+_NORMAL_QUANTILES = {0.90: 1.2815515655446004, 0.95: 1.6448536269514722,
+                     0.975: 1.959963984540054, 0.99: 2.3263478740408408}
+
+
+@dataclass
+class PortfolioRiskSnapshot:
+    """Portfolio risk figures (losses reported as positive currency amounts)"""
+    timestamp: datetime
+    gross_exposure: float
+    net_exposure: float
+    leverage_ratio: float
+    position_correlation: float
+    var_historical: float
+    cvar_historical: float
+    var_parametric: float
+    cvar_parametric: float
+    var_monte_carlo: float
+    cvar_monte_carlo: float
+    observations: int
+
+
+class PortfolioRiskEngine:
+    """
+    Real-time portfolio VaR/CVaR engine
+    
+    State is kept in arrays indexed by symbol slot:
+    - Return matrix ring buffer (window x symbols)
+    - Running sums / cross-products → covariance updated per price tick
+    - Exposure vector w, cached Σw and historical P&L vector R·w
+    
+    A change to a single position touches only its column: Σw, w'Σw,
+    the historical P&L vector and the Monte Carlo loading vector are
+    shifted by that column instead of being recomputed.
+    """
+    
+    def __init__(self,
+                 window: int = 250,
+                 confidence: float = 0.95,
+                 mc_paths: int = 10000,
+                 mc_batch_size: int = 2500,
+                 mc_distribution: str = "student_t",
+                 mc_dof: float = 5.0,
+                 seed: Optional[int] = None):
+        """
+        Args:
+            window: Number of return observations kept per symbol
+            confidence: VaR confidence level (0.90, 0.95, 0.975, 0.99)
+            mc_paths: Number of Monte Carlo scenarios
+            mc_batch_size: Scenarios generated/evaluated per NumPy batch
+            mc_distribution: Monte Carlo shock distribution (normal, student_t)
+            mc_dof: Degrees of freedom for Student-t shocks
+            seed: Random seed for reproducible scenarios
+        """
+        if confidence not in _NORMAL_QUANTILES:
+            raise ValueError(f"Unsupported confidence level: {confidence}")
+        
+        self.window = window
+        self.confidence = confidence
+        self.mc_paths = mc_paths
+        self.mc_batch_size = mc_batch_size
+        self.mc_distribution = mc_distribution
+        self.mc_dof = mc_dof
+        self.rng = np.random.default_rng(seed)
+        
+        self._z = _NORMAL_QUANTILES[confidence]
+        # E[Z | Z > z] for the standard normal (expected shortfall multiplier)
+        self._es_factor = np.exp(-0.5 * self._z ** 2) / np.sqrt(2 * np.pi) / (1 - confidence)
+        
+        # Symbol slots
+        self.symbols: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._last_prices = np.zeros(0)
+        
+        # Return ring buffer and running moments
+        self._returns = np.zeros((window, 0))
+        self._pos = 0
+        self._count = 0
+        self._pushes_since_rebuild = 0
+        self._sum = np.zeros(0)
+        self._cross = np.zeros((0, 0))
+        self._cov: Optional[np.ndarray] = None
+        self._chol: Optional[np.ndarray] = None
+        
+        # Exposure state
+        self._w = np.zeros(0)
+        self._sigma_w = np.zeros(0)
+        self._variance = 0.0
+        self._hist_pnl = np.zeros(window)
+        self._mc_loading = np.zeros(0)
+        
+        # Monte Carlo shocks (independent of covariance, redrawn on new symbols)
+        self._shocks: Optional[np.ndarray] = None
+        self._scale: Optional[np.ndarray] = None
+        
+        logger.info(
+            f"✓ Portfolio Risk Engine initialized "
+            f"(window={window}, confidence={confidence:.0%}, mc_paths={mc_paths})"
+        )
+    
+    # ==================== MARKET DATA ====================
+    
+    def _add_symbol(self, symbol: str, price: float) -> int:
+        """Allocate a slot for a new symbol (zero return history)"""
+        slot = len(self.symbols)
+        self.symbols.append(symbol)
+        self._index[symbol] = slot
+        
+        self._last_prices = np.append(self._last_prices, price)
+        self._returns = np.hstack([self._returns, np.zeros((self.window, 1))])
+        self._sum = np.append(self._sum, 0.0)
+        self._cross = np.pad(self._cross, ((0, 1), (0, 1)))
+        self._w = np.append(self._w, 0.0)
+        self._sigma_w = np.append(self._sigma_w, 0.0)
+        self._mc_loading = np.append(self._mc_loading, 0.0)
+        self._shocks = None
+        self._refresh_covariance()
+        return slot
+    
+    def update_prices(self, prices: Dict[str, float]):
+        """
+        Push one observation of prices (one return row for all symbols)
+        
+        Symbols missing from ``prices`` get a zero return for this row.
+        
+        Args:
+            prices: Dict mapping symbol to latest price
+        """
+        new_symbols = [s for s in prices if s not in self._index]
+        for symbol in new_symbols:
+            self._add_symbol(symbol, float(prices[symbol]))
+        
+        if not self.symbols:
+            return
+        
+        current = self._last_prices.copy()
+        for symbol, price in prices.items():
+            current[self._index[symbol]] = float(price)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            row = np.where(self._last_prices > 0, current / self._last_prices - 1.0, 0.0)
+        row = np.nan_to_num(row)
+        self._last_prices = current
+        
+        self._push_row(row)
+    
+    def _push_row(self, row: np.ndarray):
+        """Add a return row to the ring buffer, updating sums in O(k²)"""
+        pos = self._pos
+        
+        if self._count == self.window:
+            old = self._returns[pos]
+            self._sum -= old
+            self._cross -= np.outer(old, old)
+        else:
+            self._count += 1
+        
+        self._returns[pos] = row
+        self._sum += row
+        self._cross += np.outer(row, row)
+        self._hist_pnl[pos] = row @ self._w
+        self._pos = (pos + 1) % self.window
+        
+        # Running cross-products accumulate rounding error; rebuild periodically
+        self._pushes_since_rebuild += 1
+        if self._pushes_since_rebuild >= self.window:
+            self._rebuild_moments()
+        
+        self._refresh_covariance()
+    
+    def _rebuild_moments(self):
+        """Recompute running sums from the ring buffer"""
+        rows = self._returns[:self._count] if self._count < self.window else self._returns
+        self._sum = rows.sum(axis=0)
+        self._cross = rows.T @ rows
+        self._pushes_since_rebuild = 0
+    
+    def _refresh_covariance(self):
+        """Covariance, Cholesky factor and exposure-dependent caches"""
+        n = self._count
+        if n < 2:
+            self._cov = None
+            self._chol = None
+            return
+        
+        mean = self._sum / n
+        cov = (self._cross - n * np.outer(mean, mean)) / (n - 1)
+        self._cov = cov
+        
+        k = len(self.symbols)
+        jitter = 1e-12 * max(1.0, float(np.trace(cov)) / max(k, 1))
+        try:
+            self._chol = np.linalg.cholesky(cov + jitter * np.eye(k))
+        except np.linalg.LinAlgError:
+            # Not positive definite (e.g. duplicated series) - clip eigenvalues
+            vals, vecs = np.linalg.eigh(cov)
+            self._chol = vecs * np.sqrt(np.clip(vals, 0.0, None))
+        
+        self._sigma_w = cov @ self._w
+        self._variance = float(self._w @ self._sigma_w)
+        self._mc_loading = self._chol.T @ self._w
+    
+    # ==================== POSITIONS ====================
+    
+    def set_positions(self, positions: Dict[str, Dict], prices: Optional[Dict[str, float]] = None):
+        """
+        Synchronize exposures with ``portfolio['positions']``
+        
+        Only positions whose exposure changed are applied, each through
+        the O(k) single-position update.
+        
+        Args:
+            positions: Dict mapping symbol to {'size': ..., 'avg_price': ...}
+            prices: Optional current prices (defaults to last seen price)
+        """
+        prices = prices or {}
+        target = np.zeros(len(self.symbols))
+        
+        for symbol, position in positions.items():
+            if symbol not in self._index:
+                self._add_symbol(symbol, float(prices.get(symbol, position.get('avg_price', 0.0))))
+                target = np.append(target, 0.0)
+            slot = self._index[symbol]
+            price = prices.get(symbol)
+            if price is None:
+                price = self._last_prices[slot] or position.get('avg_price', 0.0)
+            target[slot] = position.get('size', 0.0) * price
+        
+        changed = np.flatnonzero(target != self._w)
+        if len(changed) > len(self.symbols) // 2:
+            self._w = target
+            self._recompute_exposure_caches()
+        else:
+            for slot in changed:
+                self.update_position(self.symbols[slot], target[slot])
+    
+    def update_position(self, symbol: str, exposure: float):
+        """
+        Change one position's exposure in O(window + k)
+        
+        Args:
+            symbol: Position symbol
+            exposure: New signed exposure in portfolio currency
+        """
+        slot = self._index.get(symbol)
+        if slot is None:
+            slot = self._add_symbol(symbol, 0.0)
+        
+        delta = exposure - self._w[slot]
+        if delta == 0:
+            return
+        
+        if self._cov is not None:
+            column = self._cov[:, slot]
+            self._variance += 2 * delta * self._sigma_w[slot] + delta * delta * column[slot]
+            self._sigma_w += delta * column
+            self._mc_loading += delta * self._chol[slot, :]
+        
+        self._hist_pnl += delta * self._returns[:, slot]
+        self._w[slot] = exposure
+    
+    def _recompute_exposure_caches(self):
+        """Full recompute of exposure-dependent caches"""
+        self._hist_pnl = self._returns @ self._w
+        if self._cov is not None:
+            self._sigma_w = self._cov @ self._w
+            self._variance = float(self._w @ self._sigma_w)
+            self._mc_loading = self._chol.T @ self._w
+    
+    # ==================== RISK MEASURES ====================
+    
+    def historical_var(self) -> tuple:
+        """
+        Historical-simulation VaR/CVaR over the return window
+        
+        Returns:
+            (VaR, CVaR) as positive loss amounts
+        """
+        if self._count < 2:
+            return 0.0, 0.0
+        
+        pnl = self._hist_pnl[:self._count] if self._count < self.window else self._hist_pnl
+        cutoff = np.quantile(pnl, 1 - self.confidence)
+        tail = pnl[pnl <= cutoff]
+        
+        return max(0.0, -float(cutoff)), max(0.0, -float(tail.mean()))
+    
+    def parametric_var(self) -> tuple:
+        """
+        Variance-covariance (normal) VaR/CVaR
+        
+        Returns:
+            (VaR, CVaR) as positive loss amounts
+        """
+        if self._cov is None:
+            return 0.0, 0.0
+        
+        sigma = np.sqrt(max(self._variance, 0.0))
+        mu = float((self._sum / self._count) @ self._w)
+        
+        return max(0.0, self._z * sigma - mu), max(0.0, self._es_factor * sigma - mu)
+    
+    def _ensure_shocks(self):
+        """Draw Monte Carlo shocks in batches (reused until symbols change)"""
+        k = len(self.symbols)
+        if self._shocks is not None and self._shocks.shape[1] == k:
+            return
+        
+        shocks = np.empty((self.mc_paths, k))
+        for start in range(0, self.mc_paths, self.mc_batch_size):
+            stop = min(start + self.mc_batch_size, self.mc_paths)
+            shocks[start:stop] = self.rng.standard_normal((stop - start, k))
+        self._shocks = shocks
+        
+        if self.mc_distribution == "student_t":
+            # Multivariate t: common chi-square mixing, scaled to unit variance
+            chi2 = self.rng.chisquare(self.mc_dof, self.mc_paths)
+            self._scale = np.sqrt((self.mc_dof - 2) / chi2)
+        else:
+            self._scale = None
+    
+    def monte_carlo_var(self) -> tuple:
+        """
+        Monte Carlo VaR/CVaR from correlated simulated returns
+        
+        Scenario P&L = shocks · (Lᵀw), evaluated batch by batch.
+        
+        Returns:
+            (VaR, CVaR) as positive loss amounts
+        """
+        if self._cov is None or self.mc_paths == 0:
+            return 0.0, 0.0
+        
+        self._ensure_shocks()
+        mu = float((self._sum / self._count) @ self._w)
+        
+        pnl = np.empty(self.mc_paths)
+        for start in range(0, self.mc_paths, self.mc_batch_size):
+            stop = min(start + self.mc_batch_size, self.mc_paths)
+            pnl[start:stop] = self._shocks[start:stop] @ self._mc_loading
+        
+        if self._scale is not None:
+            pnl *= self._scale
+        pnl += mu
+        
+        cutoff = np.quantile(pnl, 1 - self.confidence)
+        tail = pnl[pnl <= cutoff]
+        
+        return max(0.0, -float(cutoff)), max(0.0, -float(tail.mean()))
+    
+    def position_correlation(self) -> float:
+        """
+        Average pairwise return correlation among held positions
+        
+        Returns:
+            Mean off-diagonal correlation (0.0 with fewer than 2 positions)
+        """
+        if self._cov is None:
+            return 0.0
+        
+        held = np.flatnonzero(self._w != 0)
+        if len(held) < 2:
+            return 0.0
+        
+        cov = self._cov[np.ix_(held, held)]
+        std = np.sqrt(np.diag(cov))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr = cov / np.outer(std, std)
+        corr = np.nan_to_num(corr)
+        
+        n = len(held)
+        return float((corr.sum() - np.trace(corr)) / (n * (n - 1)))
+    
+    def correlation_matrix(self, symbols: List[str]) -> Optional[np.ndarray]:
+        """
+        Return correlation matrix for a set of symbols
+        
+        Symbols without history get zero correlation to the others.
+        
+        Args:
+            symbols: Symbols in the desired row/column order
+        
+        Returns:
+            len(symbols) x len(symbols) matrix, or None before enough history
+        """
+        if self._cov is None:
+            return None
+        
+        slots = np.array([self._index.get(s, -1) for s in symbols], dtype=np.int64)
+        known = slots >= 0
+        
+        corr = np.eye(len(symbols))
+        if known.sum() > 1:
+            idx = slots[known]
+            cov = self._cov[np.ix_(idx, idx)]
+            std = np.sqrt(np.diag(cov))
+            with np.errstate(divide='ignore', invalid='ignore'):
+                sub = np.nan_to_num(cov / np.outer(std, std))
+            np.fill_diagonal(sub, 1.0)
+            corr[np.ix_(known, known)] = sub
+        
+        return corr
+    
+    def compute(self, portfolio_value: float) -> PortfolioRiskSnapshot:
+        """
+        Compute all risk measures for the current exposures
+        
+        Args:
+            portfolio_value: Current equity (for leverage ratio)
+        
+        Returns:
+            PortfolioRiskSnapshot
+        """
+        if np.any(self._w):
+            var_h, cvar_h = self.historical_var()
+            var_p, cvar_p = self.parametric_var()
+            var_mc, cvar_mc = self.monte_carlo_var()
+        else:
+            # Flat book: every scenario P&L is zero
+            var_h = cvar_h = var_p = cvar_p = var_mc = cvar_mc = 0.0
+        
+        gross = float(np.abs(self._w).sum())
+        
+        return PortfolioRiskSnapshot(
+            timestamp=clock.now(),
+            gross_exposure=gross,
+            net_exposure=float(self._w.sum()),
+            leverage_ratio=gross / portfolio_value if portfolio_value > 0 else 0.0,
+            position_correlation=self.position_correlation(),
+            var_historical=var_h,
+            cvar_historical=cvar_h,
+            var_parametric=var_p,
+            cvar_parametric=cvar_p,
+            var_monte_carlo=var_mc,
+            cvar_monte_carlo=cvar_mc,
+            observations=self._count
+        )
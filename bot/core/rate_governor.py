@@ -0,0 +1,319 @@
+"""
+Rate Governor
+Shared request budget for all REST calls to each exchange
+
+Every connector (market data, FinstAdapter, order submission) takes
+tokens from the same governor before calling a venue:
+
+- One weighted token bucket per exchange (the venue's overall budget)
+  plus one per (exchange, endpoint class) for class-specific limits
+- Priority lanes: cancels, then orders, then account queries, then
+  market data. A lane only waits for its own bucket; the exchange-wide
+  bucket is always offered to the highest-priority waiter first
+- 429 feedback: ``report_rate_limited`` pauses the exchange until the
+  venue's Retry-After has passed
+- Queue depth and wait-time metrics per lane
+
+No background task: waiters grant each other when they wake, so the
+governor works on whichever event loop is running.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Deque, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class Priority(IntEnum):
+    """Request lanes, lowest value served first"""
+    CANCEL = 0
+    ORDER = 1
+    ACCOUNT = 2
+    MARKET_DATA = 3
+
+
+# Endpoint class -> default lane
+ENDPOINT_PRIORITY = {
+    'cancel': Priority.CANCEL,
+    'order': Priority.ORDER,
+    'account': Priority.ACCOUNT,
+    'market_data': Priority.MARKET_DATA
+}
+
+
+class TokenBucket:
+    """Weighted token bucket refilled continuously"""
+    
+    def __init__(self, rate: float, burst: float):
+        """
+        Args:
+            rate: Tokens added per second
+            burst: Bucket capacity
+        """
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+    
+    def refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    def time_until(self, weight: float) -> float:
+        """Seconds until ``weight`` tokens are available (after ``refill``)"""
+        return max(0.0, (weight - self.tokens) / self.rate)
+
+
+@dataclass
+class _Waiter:
+    endpoint_class: str
+    weight: float
+    priority: int
+    enqueued: float
+    event: asyncio.Event = field(default_factory=asyncio.Event)
+    granted: bool = False
+
+
+class _ExchangeState:
+    """Buckets, lanes and counters of one exchange"""
+    
+    def __init__(self, total: TokenBucket, classes: Dict[str, TokenBucket]):
+        self.total = total
+        self.classes = classes
+        self.lanes: Dict[int, Deque[_Waiter]] = {int(p): deque() for p in Priority}
+        self.blocked_until = 0.0
+        
+        # Statistics
+        self.granted: Dict[str, int] = {}
+        self.wait_total: Dict[int, float] = {int(p): 0.0 for p in Priority}
+        self.wait_max: Dict[int, float] = {int(p): 0.0 for p in Priority}
+        self.served: Dict[int, int] = {int(p): 0 for p in Priority}
+        self.rate_limited = 0
+
+
+class RateGovernor:
+    """
+    Async request governor shared by all exchange clients
+    
+    Usage:
+        async with governor.limit('binance', 'order'):
+            await exchange.create_order(...)
+    """
+    
+    def __init__(self,
+                 limits: Optional[Dict[str, Dict]] = None,
+                 default_limits: Optional[Dict] = None):
+        """
+        Args:
+            limits: Per exchange ``{'total': {'rate', 'burst'}, <endpoint class>: {...}}``
+            default_limits: Limits for exchanges not listed
+        """
+        self.limits = limits or {}
+        self.default_limits = default_limits or {'total': {'rate': 10.0, 'burst': 10.0}}
+        self._states: Dict[str, _ExchangeState] = {}
+        
+        logger.info(
+            f"✓ Rate Governor initialized "
+            f"(exchanges={list(self.limits) or 'default'})"
+        )
+    
+    def _state(self, exchange: str) -> _ExchangeState:
+        state = self._states.get(exchange)
+        if state is None:
+            limits = self.limits.get(exchange, self.default_limits)
+            total = limits.get('total', self.default_limits['total'])
+            state = _ExchangeState(
+                TokenBucket(total['rate'], total.get('burst', total['rate'])),
+                {
+                    name: TokenBucket(spec['rate'], spec.get('burst', spec['rate']))
+                    for name, spec in limits.items() if name != 'total'
+                }
+            )
+            self._states[exchange] = state
+        return state
+    
+    # ==================== ACQUIRE ====================
+    
+    async def acquire(self,
+                      exchange: str,
+                      endpoint_class: str = 'market_data',
+                      weight: float = 1.0,
+                      priority: Optional[int] = None) -> float:
+        """
+        Wait until a request may be sent
+        
+        Args:
+            exchange: Exchange id
+            endpoint_class: cancel, order, account or market_data (or a configured class)
+            weight: Request weight in tokens
+            priority: Lane override (default from the endpoint class)
+        
+        Returns:
+            Seconds waited
+        """
+        state = self._state(exchange)
+        bucket = state.classes.get(endpoint_class)
+        if weight > state.total.burst or (bucket is not None and weight > bucket.burst):
+            raise ValueError(f"Request weight {weight} exceeds bucket capacity for {exchange}/{endpoint_class}")
+        
+        if priority is None:
+            priority = ENDPOINT_PRIORITY.get(endpoint_class, Priority.MARKET_DATA)
+        priority = int(priority)
+        
+        waiter = _Waiter(endpoint_class, weight, priority, time.monotonic())
+        state.lanes[priority].append(waiter)
+        
+        try:
+            while True:
+                self._grant(state)
+                if waiter.granted:
+                    break
+                
+                waiter.event.clear()
+                try:
+                    await asyncio.wait_for(waiter.event.wait(), self._wait_time(state, waiter))
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            if not waiter.granted:
+                state.lanes[priority].remove(waiter)
+        
+        waited = time.monotonic() - waiter.enqueued
+        state.wait_total[priority] += waited
+        state.wait_max[priority] = max(state.wait_max[priority], waited)
+        state.served[priority] += 1
+        state.granted[endpoint_class] = state.granted.get(endpoint_class, 0) + 1
+        return waited
+    
+    @asynccontextmanager
+    async def limit(self,
+                    exchange: str,
+                    endpoint_class: str = 'market_data',
+                    weight: float = 1.0,
+                    priority: Optional[int] = None):
+        """Context manager form of ``acquire``"""
+        await self.acquire(exchange, endpoint_class, weight, priority)
+        yield
+    
+    def _grant(self, state: _ExchangeState):
+        """Hand out tokens to eligible waiters in lane order"""
+        now = time.monotonic()
+        if now < state.blocked_until:
+            return
+        
+        state.total.refill(now)
+        for bucket in state.classes.values():
+            bucket.refill(now)
+        
+        for priority in sorted(state.lanes):
+            lane = state.lanes[priority]
+            for waiter in list(lane):
+                if waiter.weight > state.total.tokens:
+                    # The exchange budget goes to this waiter first
+                    return
+                
+                bucket = state.classes.get(waiter.endpoint_class)
+                if bucket is not None and waiter.weight > bucket.tokens:
+                    continue  # Blocked by its own class only
+                
+                state.total.tokens -= waiter.weight
+                if bucket is not None:
+                    bucket.tokens -= waiter.weight
+                waiter.granted = True
+                lane.remove(waiter)
+                waiter.event.set()
+    
+    def _wait_time(self, state: _ExchangeState, waiter: _Waiter) -> float:
+        """Earliest time the waiter's buckets could afford it"""
+        now = time.monotonic()
+        delay = max(state.total.time_until(waiter.weight), state.blocked_until - now)
+        
+        bucket = state.classes.get(waiter.endpoint_class)
+        if bucket is not None:
+            delay = max(delay, bucket.time_until(waiter.weight))
+        
+        return max(delay, 0.001)
+    
+    # ==================== FEEDBACK ====================
+    
+    def report_rate_limited(self, exchange: str, retry_after: Optional[float] = None):
+        """
+        Pause an exchange after a 429 / rate-limit response
+        
+        Args:
+            exchange: Exchange id
+            retry_after: Seconds to pause (default: time to refill the bucket)
+        """
+        state = self._state(exchange)
+        state.total.refill(time.monotonic())
+        state.total.tokens = 0.0
+        
+        pause = retry_after if retry_after is not None else state.total.burst / state.total.rate
+        state.blocked_until = max(state.blocked_until, time.monotonic() + pause)
+        state.rate_limited += 1
+        
+        logger.warning(f"Rate limited by {exchange}, pausing requests for {pause:.1f}s")
+    
+    # ==================== STATISTICS ====================
+    
+    def queue_depth(self, exchange: str) -> Dict[str, int]:
+        """Waiting requests per lane"""
+        state = self._state(exchange)
+        return {Priority(p).name.lower(): len(lane) for p, lane in state.lanes.items()}
+    
+    def get_statistics(self) -> Dict:
+        """Per-exchange queue depth, waits, grants and bucket levels"""
+        stats = {}
+        for exchange, state in self._states.items():
+            state.total.refill(time.monotonic())
+            stats[exchange] = {
+                'queue_depth': self.queue_depth(exchange),
+                'granted': dict(state.granted),
+                'avg_wait_ms': {
+                    Priority(p).name.lower(): state.wait_total[p] / state.served[p] * 1000
+                    for p in state.served if state.served[p]
+                },
+                'max_wait_ms': {
+                    Priority(p).name.lower(): state.wait_max[p] * 1000
+                    for p in state.served if state.served[p]
+                },
+                'tokens_available': state.total.tokens,
+                'rate_limited': state.rate_limited
+            }
+        return stats
+
+
+# Shared instance used by all connectors
+_governor_instance: Optional[RateGovernor] = None
+
+
+def configure_rate_governor(config) -> Optional[RateGovernor]:
+    """
+    Create the shared governor from ``execution.rate_limits``
+    
+    Returns:
+        RateGovernor, or None when disabled
+    """
+    global _governor_instance
+    
+    settings = config.get('execution.rate_limits', {}) or {}
+    if not settings.get('enabled', False):
+        _governor_instance = None
+        return None
+    
+    _governor_instance = RateGovernor(
+        limits=settings.get('exchanges', {}),
+        default_limits=settings.get('default')
+    )
+    return _governor_instance
+
+
+def get_rate_governor() -> Optional[RateGovernor]:
+    """Shared governor (None until configured)"""
+    return _governor_instance
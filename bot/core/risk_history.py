@@ -0,0 +1,322 @@
+"""
+Tiered Risk History
+Bounded, array-backed time-series storage for risk metrics
+
+Tiers:
+- raw:    full resolution for the last ``raw_hours``
+- minute: per-minute min/max/last for the last ``minute_days``
+- hour:   per-hour min/max/last for the last ``hour_days``
+
+Completed minute/hour buckets can be written through to disk as
+fixed-width binary records so other processes (the dashboard) can
+memory-map them with ``load_history``.
+"""
+
+import json
+import logging
+import numpy as np
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Union
+
+logger = logging.getLogger(__name__)
+
+BUCKET_SECONDS = {'minute': 60, 'hour': 3600}
+SCHEMA_FILE = 'schema.json'
+
+
+def _to_epoch(timestamp: Union[datetime, float, int, None]) -> Optional[float]:
+    """Convert datetime/epoch to epoch seconds"""
+    if timestamp is None:
+        return None
+    if isinstance(timestamp, datetime):
+        return timestamp.timestamp()
+    return float(timestamp)
+
+
+def _raw_dtype(fields: Sequence[str]) -> np.dtype:
+    return np.dtype([('timestamp', 'f8')] + [(f, 'f8') for f in fields])
+
+
+def _agg_dtype(fields: Sequence[str]) -> np.dtype:
+    columns = [('timestamp', 'f8')]
+    for f in fields:
+        columns += [(f'{f}_min', 'f8'), (f'{f}_max', 'f8'), (f'{f}_last', 'f8')]
+    return np.dtype(columns)
+
+
+def load_history(spill_dir: Union[str, Path],
+                 tier: str = 'hour',
+                 start: Union[datetime, float, None] = None,
+                 end: Union[datetime, float, None] = None) -> np.ndarray:
+    """
+    Read spilled history records without loading the whole file
+    
+    Args:
+        spill_dir: Directory written by a ``TieredHistory``
+        tier: 'minute' or 'hour'
+        start: Inclusive range start (datetime or epoch seconds)
+        end: Inclusive range end (datetime or epoch seconds)
+    
+    Returns:
+        Structured array (timestamp, <field>_min/_max/_last ...)
+    """
+    spill_dir = Path(spill_dir)
+    schema_path = spill_dir / SCHEMA_FILE
+    data_path = spill_dir / f'{tier}.bin'
+    
+    if not schema_path.exists():
+        return np.zeros(0, dtype=[('timestamp', 'f8')])
+    
+    fields = json.loads(schema_path.read_text())['fields']
+    dtype = _agg_dtype(fields)
+    
+    if not data_path.exists() or data_path.stat().st_size < dtype.itemsize:
+        return np.zeros(0, dtype=dtype)
+    
+    count = data_path.stat().st_size // dtype.itemsize
+    records = np.memmap(data_path, dtype=dtype, mode='r', shape=(count,))
+    
+    ts = records['timestamp']
+    lo = 0 if start is None else int(np.searchsorted(ts, _to_epoch(start), side='left'))
+    hi = count if end is None else int(np.searchsorted(ts, _to_epoch(end), side='right'))
+    
+    return np.array(records[lo:hi])
+
+
+class _Ring:
+    """Fixed-capacity ring of structured records"""
+    
+    def __init__(self, capacity: int, dtype: np.dtype):
+        self.capacity = max(1, int(capacity))
+        self.data = np.zeros(self.capacity, dtype=dtype)
+        self.pos = 0
+        self.size = 0
+    
+    def push(self, record):
+        self.data[self.pos] = record
+        self.pos = (self.pos + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+    
+    def ordered(self) -> np.ndarray:
+        """Records oldest first"""
+        if self.size < self.capacity:
+            return self.data[:self.size]
+        return np.concatenate([self.data[self.pos:], self.data[:self.pos]])
+    
+    def oldest(self) -> Optional[float]:
+        if self.size == 0:
+            return None
+        idx = 0 if self.size < self.capacity else self.pos
+        return float(self.data['timestamp'][idx])
+
+
+class TieredHistory:
+    """
+    Bounded multi-resolution history of numeric fields
+    
+    Memory is fixed at construction: one ring per tier. Each append
+    is O(fields); range queries are a ``searchsorted`` over the
+    selected tier.
+    """
+    
+    def __init__(self,
+                 fields: Sequence[str],
+                 raw_hours: float = 24,
+                 sample_interval: float = 60,
+                 minute_days: float = 7,
+                 hour_days: float = 365,
+                 spill_dir: Optional[Union[str, Path]] = None,
+                 spill_tiers: Sequence[str] = ('minute', 'hour')):
+        """
+        Args:
+            fields: Names of the numeric fields stored per sample
+            raw_hours: Hours of full-resolution samples kept in memory
+            sample_interval: Expected seconds between samples (sizes the raw ring)
+            minute_days: Days of minute aggregates kept in memory
+            hour_days: Days of hour aggregates kept in memory
+            spill_dir: Directory for write-through of completed buckets (None = memory only)
+            spill_tiers: Aggregate tiers written to disk
+        """
+        self.fields = list(fields)
+        self.raw_hours = raw_hours
+        self.sample_interval = sample_interval
+        
+        self._raw_dtype = _raw_dtype(self.fields)
+        self._agg_dtype = _agg_dtype(self.fields)
+        
+        self.tiers = {
+            'raw': _Ring(np.ceil(raw_hours * 3600 / sample_interval), self._raw_dtype),
+            'minute': _Ring(minute_days * 24 * 60, self._agg_dtype),
+            'hour': _Ring(hour_days * 24, self._agg_dtype)
+        }
+        
+        # In-progress buckets: (bucket start, min, max, last)
+        self._open: Dict[str, Optional[tuple]] = {'minute': None, 'hour': None}
+        
+        self.spill_dir = Path(spill_dir) if spill_dir else None
+        self.spill_tiers = tuple(spill_tiers)
+        if self.spill_dir is not None:
+            self._init_spill()
+        
+        logger.info(
+            f"✓ Tiered history initialized "
+            f"(fields={len(self.fields)}, raw={raw_hours}h, minute={minute_days}d, "
+            f"hour={hour_days}d, spill={self.spill_dir})"
+        )
+    
+    def _init_spill(self):
+        """Create spill directory and schema (resets files if fields changed)"""
+        self.spill_dir.mkdir(parents=True, exist_ok=True)
+        schema_path = self.spill_dir / SCHEMA_FILE
+        
+        if schema_path.exists():
+            existing = json.loads(schema_path.read_text()).get('fields')
+            if existing == self.fields:
+                return
+            logger.warning(f"Risk history schema changed, resetting spill files in {self.spill_dir}")
+            for tier in BUCKET_SECONDS:
+                (self.spill_dir / f'{tier}.bin').unlink(missing_ok=True)
+        
+        schema_path.write_text(json.dumps({'fields': self.fields, 'created': datetime.now().isoformat()}))
+    
+    # ==================== WRITE PATH ====================
+    
+    def append(self, timestamp: Union[datetime, float], values: Union[Sequence[float], Dict[str, float]]):
+        """
+        Add one sample
+        
+        Args:
+            timestamp: Sample time (datetime or epoch seconds), non-decreasing
+            values: Field values, in ``fields`` order or as a dict
+        """
+        ts = _to_epoch(timestamp)
+        if isinstance(values, dict):
+            values = [values.get(f, np.nan) for f in self.fields]
+        vec = np.asarray(values, dtype=np.float64)
+        
+        record = np.zeros((), dtype=self._raw_dtype)
+        record['timestamp'] = ts
+        for i, f in enumerate(self.fields):
+            record[f] = vec[i]
+        self.tiers['raw'].push(record)
+        
+        for tier, seconds in BUCKET_SECONDS.items():
+            bucket = ts - ts % seconds
+            current = self._open[tier]
+            
+            if current is not None and current[0] != bucket:
+                self._close_bucket(tier)
+                current = None
+            
+            if current is None:
+                self._open[tier] = (bucket, vec.copy(), vec.copy(), vec.copy())
+            else:
+                np.minimum(current[1], vec, out=current[1])
+                np.maximum(current[2], vec, out=current[2])
+                current[3][:] = vec
+    
+    def _bucket_record(self, tier: str) -> np.ndarray:
+        """Aggregate record for the open bucket of ``tier``"""
+        bucket, mins, maxs, lasts = self._open[tier]
+        record = np.zeros((), dtype=self._agg_dtype)
+        record['timestamp'] = bucket
+        for i, f in enumerate(self.fields):
+            record[f'{f}_min'] = mins[i]
+            record[f'{f}_max'] = maxs[i]
+            record[f'{f}_last'] = lasts[i]
+        return record
+    
+    def _close_bucket(self, tier: str):
+        """Move the open bucket into the tier ring (and spill file)"""
+        record = self._bucket_record(tier)
+        self.tiers[tier].push(record)
+        self._open[tier] = None
+        
+        if self.spill_dir is not None and tier in self.spill_tiers:
+            with open(self.spill_dir / f'{tier}.bin', 'ab') as f:
+                f.write(record.tobytes())
+    
+    def flush(self):
+        """Close open buckets (e.g. on shutdown) so they reach disk"""
+        for tier in BUCKET_SECONDS:
+            if self._open[tier] is not None:
+                self._close_bucket(tier)
+    
+    # ==================== READ PATH ====================
+    
+    def __len__(self) -> int:
+        return self.tiers['raw'].size
+    
+    def latest(self, count: int = 1) -> np.ndarray:
+        """Most recent raw samples, oldest first"""
+        return self.tiers['raw'].ordered()[-count:] if count > 0 else self.tiers['raw'].ordered()[:0]
+    
+    def _resolve_resolution(self, start: Optional[float]) -> str:
+        """Finest tier whose in-memory data reaches back to ``start``"""
+        for tier in ('raw', 'minute'):
+            oldest = self.tiers[tier].oldest()
+            if oldest is not None and (start is None or oldest <= start):
+                return tier
+        return 'hour'
+    
+    def query(self,
+              start: Union[datetime, float, None] = None,
+              end: Union[datetime, float, None] = None,
+              resolution: str = 'auto') -> np.ndarray:
+        """
+        Range query
+        
+        Aggregate tiers include the currently open bucket and, when the
+        range starts before the in-memory data, spilled records.
+        
+        Args:
+            start: Inclusive range start (datetime or epoch seconds)
+            end: Inclusive range end (datetime or epoch seconds)
+            resolution: 'raw', 'minute', 'hour' or 'auto'
+        
+        Returns:
+            Structured array ordered by timestamp
+        """
+        start_ts = _to_epoch(start)
+        end_ts = _to_epoch(end)
+        
+        if resolution == 'auto':
+            resolution = self._resolve_resolution(start_ts)
+        if resolution not in self.tiers:
+            raise ValueError(f"Unknown resolution: {resolution}")
+        
+        ring = self.tiers[resolution]
+        data = ring.ordered()
+        
+        if resolution != 'raw':
+            if self._open[resolution] is not None:
+                data = np.concatenate([data, self._bucket_record(resolution)[None]])
+            
+            # Spilled records precede the in-memory ones (all of them after a restart)
+            oldest = data['timestamp'][0] if len(data) else None
+            if (self.spill_dir is not None and resolution in self.spill_tiers and
+                    (oldest is None or start_ts is None or start_ts < oldest)):
+                disk = load_history(self.spill_dir, resolution, start_ts, oldest)
+                if oldest is not None:
+                    disk = disk[disk['timestamp'] < oldest]
+                data = np.concatenate([disk.astype(self._agg_dtype), data])
+        
+        ts = data['timestamp']
+        lo = 0 if start_ts is None else int(np.searchsorted(ts, start_ts, side='left'))
+        hi = len(data) if end_ts is None else int(np.searchsorted(ts, end_ts, side='right'))
+        
+        return data[lo:hi]
+    
+    @staticmethod
+    def to_records(data: np.ndarray) -> List[Dict]:
+        """Convert a query result to JSON-friendly dicts"""
+        names = data.dtype.names
+        return [
+            {
+                name: (datetime.fromtimestamp(row[name]).isoformat() if name == 'timestamp'
+                       else float(row[name]))
+                for name in names
+            }
+            for row in data
+        ]
@@ -10,6 +10,10 @@ from dataclasses import dataclass
 from typing import Optional, Dict, List
 from enum import Enum
 
+from .portfolio_risk import PortfolioRiskEngine, PortfolioRiskSnapshot
+from . import clock
+from .risk_history import TieredHistory
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,6 +35,14 @@ class RiskMetrics:
     position_correlation: float
     leverage_ratio: float
     var_95: float  # Value at Risk 95%
+    cvar_95: float = 0.0  # Conditional VaR (Expected Shortfall)
+
+
+# RiskMetrics fields stored in the tiered history (everything but timestamp)
+RISK_HISTORY_FIELDS = [
+    'portfolio_value', 'daily_drawdown', 'max_drawdown', 'daily_pnl',
+    'position_correlation', 'leverage_ratio', 'var_95', 'cvar_95'
+]
 
 
 class CircuitBreaker:
@@ -76,7 +88,7 @@ class CircuitBreaker:
         
         # Check cooldown period
         if self.triggered_at is not None:
-            elapsed = (datetime.now() - self.triggered_at).total_seconds() / 60
+            elapsed = (clock.now() - self.triggered_at).total_seconds() / 60
             if elapsed < self.cooldown_minutes:
                 logger.debug(f"Circuit breaker in cooldown: {elapsed:.1f}/{self.cooldown_minutes} min")
                 return self.state
@@ -107,7 +119,7 @@ class CircuitBreaker:
             # New trigger
             self.state = state
             self.triggered_level = level
-            self.triggered_at = datetime.now()
+            self.triggered_at = clock.now()
             
             self.trigger_history.append({
                 'timestamp': self.triggered_at,
@@ -157,8 +169,14 @@ class RiskManager:
     - Correlation-aware sizing
     """
     
-    def __init__(self, config):
-        """Initialize risk manager"""
+    def __init__(self, config, spill_history: bool = True):
+        """
+        Initialize risk manager
+        
+        Args:
+            config: Configuration
+            spill_history: Write completed history buckets to ``risk.history.spill_dir``
+        """
         
         self.config = config
         
@@ -173,11 +191,17 @@ class RiskManager:
         # Portfolio tracking
         self.daily_start_value: Optional[float] = None
         self.max_portfolio_value: Optional[float] = None
-        self.portfolio_value_history: List[float] = []
         
-        # Risk metrics
+        # Risk metrics (bounded tiered history instead of unbounded lists)
         self.current_metrics: Optional[RiskMetrics] = None
-        self.metrics_history: List[RiskMetrics] = []
+        self.history = TieredHistory(
+            fields=RISK_HISTORY_FIELDS,
+            raw_hours=config.get('risk.history.raw_hours', 24),
+            sample_interval=config.trading.trading_interval,
+            minute_days=config.get('risk.history.minute_days', 7),
+            hour_days=config.get('risk.history.hour_days', 365),
+            spill_dir=config.get('risk.history.spill_dir') if spill_history else None
+        )
         
         # Limits
         self.max_position_size = config.trading.max_position_size
@@ -185,14 +209,35 @@ class RiskManager:
         self.kelly_fraction = config.risk.kelly['fraction']
         self.min_probability = config.risk.kelly['min_probability']
         
+        # Portfolio VaR/CVaR engine
+        self.var_method = config.get('risk.var.method', 'historical')
+        self.risk_engine = PortfolioRiskEngine(
+            window=config.get('risk.var.window', 250),
+            confidence=config.get('risk.var.confidence', 0.95),
+            mc_paths=config.get('risk.var.mc_paths', 10000),
+            mc_distribution=config.get('risk.var.mc_distribution', 'student_t')
+        )
+        self.last_risk_snapshot: Optional[PortfolioRiskSnapshot] = None
+        
         logger.info("✓ Risk Manager initialized")
     
-    def update_metrics(self, portfolio_value: float):
+    def update_prices(self, prices: Dict[str, float]):
+        """
+        Feed latest prices to the portfolio risk engine
+        
+        Args:
+            prices: Dict mapping symbol to latest price
+        """
+        self.risk_engine.update_prices(prices)
+    
+    def update_metrics(self, portfolio_value: float, positions: Optional[Dict] = None):
         """
         Update risk metrics
         
         Args:
             portfolio_value: Current portfolio value
+            positions: Current ``portfolio['positions']`` (None keeps the
+                exposures last given to the risk engine)
         """
         
         # Initialize tracking
@@ -209,24 +254,71 @@ class RiskManager:
         max_dd = self._calculate_max_drawdown(portfolio_value)
         daily_pnl = portfolio_value - self.daily_start_value
         
+        # Portfolio VaR/CVaR, correlation and leverage
+        if positions is not None:
+            self.risk_engine.set_positions(positions)
+        risk = self.risk_engine.compute(portfolio_value)
+        self.last_risk_snapshot = risk
+        var_95, cvar_95 = {
+            'historical': (risk.var_historical, risk.cvar_historical),
+            'parametric': (risk.var_parametric, risk.cvar_parametric),
+            'monte_carlo': (risk.var_monte_carlo, risk.cvar_monte_carlo)
+        }.get(self.var_method, (risk.var_historical, risk.cvar_historical))
+        
         # Create metrics snapshot
         self.current_metrics = RiskMetrics(
-            timestamp=datetime.now(),
+            timestamp=clock.now(),
             portfolio_value=portfolio_value,
             daily_drawdown=daily_dd,
             max_drawdown=max_dd,
             daily_pnl=daily_pnl,
-            position_correlation=0.0,  # Updated externally
-            leverage_ratio=1.0,  # Updated externally
-            var_95=0.0  # Updated externally
+            position_correlation=risk.position_correlation,
+            leverage_ratio=risk.leverage_ratio,
+            var_95=var_95,
+            cvar_95=cvar_95
         )
         
-        self.metrics_history.append(self.current_metrics)
-        self.portfolio_value_history.append(portfolio_value)
+        self.history.append(
+            self.current_metrics.timestamp,
+            [getattr(self.current_metrics, f) for f in RISK_HISTORY_FIELDS]
+        )
         
         # Check circuit breaker
         self.circuit_breaker.check(daily_dd * 100)  # Convert to %
     
+    @property
+    def metrics_history(self) -> List[RiskMetrics]:
+        """Full-resolution metrics still held in memory (last ``raw_hours``)"""
+        return [
+            RiskMetrics(
+                timestamp=datetime.fromtimestamp(row['timestamp']),
+                **{f: float(row[f]) for f in RISK_HISTORY_FIELDS}
+            )
+            for row in self.history.latest(len(self.history))
+        ]
+    
+    @property
+    def portfolio_value_history(self) -> List[float]:
+        """Full-resolution portfolio values still held in memory"""
+        return self.history.latest(len(self.history))['portfolio_value'].tolist()
+    
+    def get_metrics_range(self,
+                          start: Optional[datetime] = None,
+                          end: Optional[datetime] = None,
+                          resolution: str = 'auto') -> List[Dict]:
+        """
+        Range query over the tiered metrics history
+        
+        Args:
+            start: Range start (None = oldest available)
+            end: Range end (None = now)
+            resolution: 'raw', 'minute', 'hour' or 'auto'
+            
+        Returns:
+            List of dicts (raw fields, or <field>_min/_max/_last for aggregates)
+        """
+        return TieredHistory.to_records(self.history.query(start, end, resolution))
+    
     def _calculate_daily_drawdown(self, current_value: float) -> float:
         """Calculate daily drawdown"""
         if self.daily_start_value is None or self.daily_start_value == 0:
@@ -401,6 +493,11 @@ class RiskManager:
             'daily_drawdown_pct': self.current_metrics.daily_drawdown * 100,
             'max_drawdown_pct': self.current_metrics.max_drawdown * 100,
             'daily_pnl': self.current_metrics.daily_pnl,
+            'var_95': self.current_metrics.var_95,
+            'cvar_95': self.current_metrics.cvar_95,
+            'var_method': self.var_method,
+            'position_correlation': self.current_metrics.position_correlation,
+            'leverage_ratio': self.current_metrics.leverage_ratio,
             'circuit_breaker': self.circuit_breaker.get_state_info(),
             'limits': {
                 'max_position_size': self.max_position_size,
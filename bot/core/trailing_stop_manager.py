@@ -23,6 +23,15 @@ class TrailingStopType(Enum):
     DYNAMIC = "dynamic"                # Dynamic based on volatility
 
 
+# Integer codes used by the vectorized stop arrays
+_TYPE_CODES = {
+    TrailingStopType.PERCENTAGE: 0,
+    TrailingStopType.ATR: 1,
+    TrailingStopType.CHANDELIER: 2,
+    TrailingStopType.DYNAMIC: 3,
+}
+
+
 @dataclass
 class TrailingStop:
     """Individual trailing stop configuration"""
@@ -48,6 +57,8 @@ class TrailingStopManager:
     - Multiple stop types (percentage, ATR, chandelier)
     - Activation threshold (only activate after profit)
     - Auto-update on price changes
+    - Batch tick updates over parallel arrays (``update_all``)
+    - Per-symbol incremental ATR/volatility state (``update_bars``)
     - Integration with risk manager
     """
     
@@ -83,6 +94,33 @@ class TrailingStopManager:
         self.stops_triggered = 0
         self.profits_protected = 0.0
         
+        # Parallel stop arrays (row per stop, swap-removed on close)
+        self._row_ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        capacity = 64
+        self._entry = np.zeros(capacity)
+        self._current = np.zeros(capacity)
+        self._highest = np.zeros(capacity)
+        self._stop = np.zeros(capacity)
+        self._activation = np.zeros(capacity)
+        self._distance = np.zeros(capacity)
+        self._activated = np.zeros(capacity, dtype=bool)
+        self._type = np.zeros(capacity, dtype=np.int8)
+        self._sym = np.zeros(capacity, dtype=np.int32)
+        self._objects_stale = False
+        
+        # Per-symbol incremental indicator state
+        self.symbols: List[str] = []
+        self._symbol_index: Dict[str, int] = {}
+        self._bars = np.zeros(0, dtype=np.int64)
+        self._prev_close = np.zeros(0)
+        self._atr = np.zeros(0)              # EMA(TR, atr_period)
+        self._atr_chandelier = np.zeros(0)   # EMA(TR, chandelier_period)
+        self._highs = np.zeros((0, self.chandelier_period))
+        self._ret_n = np.zeros(0)
+        self._ret_mean = np.zeros(0)
+        self._ret_m2 = np.zeros(0)
+        
         logger.info(
             f"✓ Trailing Stop Manager initialized "
             f"(type={self.default_type.value}, activation={self.default_activation}%)"
@@ -144,7 +182,11 @@ class TrailingStopManager:
             last_updated=datetime.now()
         )
         
+        self._sync_objects()
+        if position_id in self.stops:
+            self._remove_row(position_id)
         self.stops[position_id] = stop
+        self._add_row(stop)
         
         logger.info(
             f"✓ Trailing stop added: {symbol} @ {entry_price:.2f} "
@@ -174,7 +216,18 @@ class TrailingStopManager:
             logger.warning(f"Position {position_id} not found in trailing stops")
             return False
         
+        self._sync_objects()
         stop = self.stops[position_id]
+        triggered = self._update_stop(stop, current_price, market_data)
+        self._write_row(stop)
+        
+        return triggered
+    
+    def _update_stop(self,
+                     stop: TrailingStop,
+                     current_price: float,
+                     market_data: Optional[pd.DataFrame] = None) -> bool:
+        """Scalar update of a single stop (see ``update_position``)"""
         stop.current_price = current_price
         
         # Update highest price
@@ -330,9 +383,11 @@ class TrailingStopManager:
         """
         
         if position_id in self.stops:
+            self._sync_objects()
             stop = self.stops[position_id]
             logger.debug(f"Removing trailing stop: {stop.symbol}")
             del self.stops[position_id]
+            self._remove_row(position_id)
     
     def get_stop_info(self, position_id: str) -> Optional[Dict]:
         """
@@ -348,6 +403,7 @@ class TrailingStopManager:
         if position_id not in self.stops:
             return None
         
+        self._sync_objects()
         stop = self.stops[position_id]
         
         return {
@@ -373,7 +429,7 @@ class TrailingStopManager:
         """Get trailing stop statistics"""
         
         active_stops = len(self.stops)
-        activated_stops = sum(1 for s in self.stops.values() if s.activated)
+        activated_stops = int(self._activated[:len(self._row_ids)].sum())
         
         return {
             'enabled': self.enabled,
@@ -385,3 +441,240 @@ class TrailingStopManager:
             'default_activation': self.default_activation,
             'default_trail_distance': self.default_trail_distance
         }
+    
+    # ==================== VECTORIZED BATCH PATH ====================
+    
+    def _symbol_slot(self, symbol: str) -> int:
+        """Get (or allocate) the indicator slot of a symbol"""
+        slot = self._symbol_index.get(symbol)
+        if slot is not None:
+            return slot
+        
+        slot = len(self.symbols)
+        self.symbols.append(symbol)
+        self._symbol_index[symbol] = slot
+        
+        self._bars = np.append(self._bars, 0)
+        self._prev_close = np.append(self._prev_close, np.nan)
+        self._atr = np.append(self._atr, 0.0)
+        self._atr_chandelier = np.append(self._atr_chandelier, 0.0)
+        self._highs = np.vstack([self._highs, np.full((1, self.chandelier_period), -np.inf)])
+        self._ret_n = np.append(self._ret_n, 0.0)
+        self._ret_mean = np.append(self._ret_mean, 0.0)
+        self._ret_m2 = np.append(self._ret_m2, 0.0)
+        return slot
+    
+    def _add_row(self, stop: TrailingStop):
+        """Append a stop to the parallel arrays"""
+        row = len(self._row_ids)
+        if row == len(self._entry):
+            for name in ('_entry', '_current', '_highest', '_stop', '_activation',
+                         '_distance', '_activated', '_type', '_sym'):
+                arr = getattr(self, name)
+                setattr(self, name, np.concatenate([arr, np.zeros_like(arr)]))
+        
+        self._row_ids.append(stop.position_id)
+        self._rows[stop.position_id] = row
+        self._sym[row] = self._symbol_slot(stop.symbol)
+        self._type[row] = _TYPE_CODES[stop.stop_type]
+        self._write_row(stop)
+    
+    def _write_row(self, stop: TrailingStop):
+        """Copy a stop's mutable state into its array row"""
+        row = self._rows[stop.position_id]
+        self._entry[row] = stop.entry_price
+        self._current[row] = stop.current_price
+        self._highest[row] = stop.highest_price
+        self._stop[row] = stop.stop_price
+        self._activation[row] = stop.activation_profit
+        self._distance[row] = stop.trail_distance
+        self._activated[row] = stop.activated
+    
+    def _remove_row(self, position_id: str):
+        """Swap-remove a stop's row"""
+        row = self._rows.pop(position_id)
+        last = len(self._row_ids) - 1
+        
+        if row != last:
+            moved_id = self._row_ids[last]
+            for name in ('_entry', '_current', '_highest', '_stop', '_activation',
+                         '_distance', '_activated', '_type', '_sym'):
+                arr = getattr(self, name)
+                arr[row] = arr[last]
+            self._row_ids[row] = moved_id
+            self._rows[moved_id] = row
+        
+        self._row_ids.pop()
+    
+    def _sync_objects(self):
+        """Write array state back to TrailingStop objects after batch updates"""
+        if not self._objects_stale:
+            return
+        
+        now = datetime.now()
+        for row, position_id in enumerate(self._row_ids):
+            stop = self.stops[position_id]
+            stop.current_price = float(self._current[row])
+            stop.highest_price = float(self._highest[row])
+            stop.stop_price = float(self._stop[row])
+            stop.activated = bool(self._activated[row])
+            stop.last_updated = now
+        
+        self._objects_stale = False
+    
+    def update_bars(self, bars: Dict[str, Dict]):
+        """
+        Advance per-symbol ATR/volatility state with newly closed bars
+        
+        Equivalent to the DataFrame-based ``_calculate_atr`` (EMA of true
+        range, ``adjust=False``), chandelier period high and
+        ``pct_change().std()``, but O(1) per symbol and vectorized
+        across symbols.
+        
+        Args:
+            bars: Dict mapping symbol to {'high', 'low', 'close'}
+        """
+        if not bars:
+            return
+        
+        idx = np.fromiter((self._symbol_slot(s) for s in bars), dtype=np.int64, count=len(bars))
+        high = np.fromiter((b['high'] for b in bars.values()), dtype=np.float64, count=len(bars))
+        low = np.fromiter((b['low'] for b in bars.values()), dtype=np.float64, count=len(bars))
+        close = np.fromiter((b['close'] for b in bars.values()), dtype=np.float64, count=len(bars))
+        
+        self._update_bar_arrays(idx, high, low, close)
+    
+    def _update_bar_arrays(self, idx: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray):
+        """Vectorized bar update for symbol slots ``idx``"""
+        prev_close = self._prev_close[idx]
+        first = self._bars[idx] == 0
+        
+        # True range (first bar has no previous close: high - low)
+        with np.errstate(invalid='ignore'):
+            tr = np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
+        
+        for atr, period in ((self._atr, self.atr_period), (self._atr_chandelier, self.chandelier_period)):
+            alpha = 2.0 / (period + 1)
+            atr[idx] = np.where(first, tr, atr[idx] + alpha * (tr - atr[idx]))
+        
+        # Chandelier highest high over the last period bars
+        self._highs[idx, self._bars[idx] % self.chandelier_period] = high
+        
+        # Welford running variance of close-to-close returns
+        has_ret = ~first & (prev_close != 0)
+        if has_ret.any():
+            r_idx = idx[has_ret]
+            ret = close[has_ret] / prev_close[has_ret] - 1.0
+            n = self._ret_n[r_idx] + 1
+            delta = ret - self._ret_mean[r_idx]
+            mean = self._ret_mean[r_idx] + delta / n
+            self._ret_m2[r_idx] += delta * (ret - mean)
+            self._ret_mean[r_idx] = mean
+            self._ret_n[r_idx] = n
+        
+        self._prev_close[idx] = close
+        self._bars[idx] += 1
+    
+    def warm_up(self, symbol: str, market_data: pd.DataFrame):
+        """
+        Seed a symbol's indicator state from historical OHLC bars
+        
+        Args:
+            symbol: Trading symbol
+            market_data: DataFrame with high/low/close columns, oldest first
+        """
+        idx = np.array([self._symbol_slot(symbol)])
+        for high, low, close in market_data[['high', 'low', 'close']].to_numpy(dtype=np.float64):
+            self._update_bar_arrays(idx, np.array([high]), np.array([low]), np.array([close]))
+    
+    def update_all(self, prices) -> List[str]:
+        """
+        Update every stop with the latest prices in one vectorized pass
+        
+        Same rules as ``update_position``, with ATR/chandelier/dynamic
+        distances taken from the incremental per-symbol state
+        (``update_bars``/``warm_up``). Stops without enough bars fall back
+        to the percentage distance, as the scalar path does.
+        
+        Args:
+            prices: Dict mapping symbol to price, or array aligned with ``self.symbols``
+            
+        Returns:
+            Position ids whose stop was triggered
+        """
+        n = len(self._row_ids)
+        if n == 0:
+            return []
+        
+        if isinstance(prices, dict):
+            symbol_prices = np.full(len(self.symbols), np.nan)
+            for symbol, price in prices.items():
+                slot = self._symbol_index.get(symbol)
+                if slot is not None:
+                    symbol_prices[slot] = price
+        else:
+            symbol_prices = np.asarray(prices, dtype=np.float64)
+        
+        sym = self._sym[:n]
+        price = symbol_prices[sym]
+        valid = ~np.isnan(price)
+        price = np.where(valid, price, self._current[:n])
+        
+        entry = self._entry[:n]
+        highest = np.maximum(self._highest[:n], price)
+        distance = self._distance[:n]
+        
+        # Activation
+        profit_pct = (price - entry) / entry * 100
+        activated = self._activated[:n] | (valid & (profit_pct >= self._activation[:n]))
+        
+        # Candidate stop per type
+        percentage = highest * (1 - distance / 100)
+        bars = self._bars[sym]
+        
+        atr_stop = np.where(
+            bars >= self.atr_period,
+            highest - self._atr[sym] * self.atr_multiplier,
+            percentage
+        )
+        chandelier_stop = np.where(
+            bars >= self.chandelier_period,
+            self._highs[sym].max(axis=1) - self._atr_chandelier[sym] * self.chandelier_multiplier,
+            percentage
+        )
+        with np.errstate(invalid='ignore', divide='ignore'):
+            volatility = np.sqrt(self._ret_m2[sym] / (self._ret_n[sym] - 1))
+        dynamic_stop = np.where(
+            (bars >= 20) & (self._ret_n[sym] > 1),
+            highest * (1 - np.maximum(distance, volatility * 100 * 2) / 100),
+            percentage
+        )
+        
+        code = self._type[:n]
+        candidate = np.select(
+            [code == 1, code == 2, code == 3],
+            [atr_stop, chandelier_stop, dynamic_stop],
+            default=percentage
+        )
+        
+        # Only move stop up, never down
+        stop = np.where(activated, np.maximum(self._stop[:n], candidate), self._stop[:n])
+        triggered = activated & valid & (price <= stop)
+        
+        self._current[:n] = price
+        self._highest[:n] = highest
+        self._activated[:n] = activated
+        self._stop[:n] = stop
+        self._objects_stale = True
+        
+        triggered_rows = np.flatnonzero(triggered)
+        if len(triggered_rows):
+            self.stops_triggered += len(triggered_rows)
+            self.profits_protected += float((price[triggered_rows] - entry[triggered_rows]).sum())
+            for row in triggered_rows:
+                logger.info(
+                    f"🎯 TRAILING STOP TRIGGERED: {self._row_ids[row]} @ {price[row]:.2f} "
+                    f"(entry={entry[row]:.2f}, profit={profit_pct[row]:.2f}%)"
+                )
+        
+        return [self._row_ids[row] for row in triggered_rows]
@@ -11,6 +11,8 @@ from dataclasses import dataclass
 from typing import List, Dict
 from datetime import datetime, timezone, timedelta
 
+from bot.core import clock
+
 logger = logging.getLogger(__name__)
 
 
@@ -399,7 +401,7 @@ class DataValidator:
             return {'valid': True, 'errors': []}  # Already caught elsewhere
         
         # Current time in UTC
-        now = pd.Timestamp.now(tz='UTC')
+        now = pd.Timestamp(clock.time(), unit='s', tz='UTC')
         
         # Make timestamps timezone-aware if needed
         timestamps = data['timestamp']
@@ -4,6 +4,7 @@ Supports Polymarket, CCXT exchanges with fallback mechanisms
 """
 
 import os
+import time
 import asyncio
 import logging
 from typing import Dict, List, Optional, Any
@@ -13,6 +14,8 @@ from enum import Enum
 import aiohttp
 import ccxt.async_support as ccxt
 
+from bot.core.rate_governor import get_rate_governor
+
 logger = logging.getLogger(__name__)
 
 
@@ -38,6 +41,7 @@ class MarketData:
     bid_volume: Optional[float] = None
     ask_volume: Optional[float] = None
     exchange: str = ""
+    latency_ms: Optional[float] = None  # Request round trip
     raw_data: Optional[Dict] = None
 
 
@@ -174,6 +178,9 @@ class CryptoExchangeConnector:
         self.testnet = testnet
         self.exchange = None
         
+        # Shared request budget across connectors; replaces CCXT's per-instance limiter
+        self.governor = get_rate_governor()
+        
         self._init_exchange()
     
     def _init_exchange(self):
@@ -182,7 +189,7 @@ class CryptoExchangeConnector:
             exchange_class = getattr(ccxt, self.exchange_id)
             
             config = {
-                'enableRateLimit': True,
+                'enableRateLimit': self.governor is None,
                 'timeout': 10000,
             }
             
@@ -212,6 +219,16 @@ class CryptoExchangeConnector:
             logger.error(f"Error initializing {self.exchange_id}: {e}")
             raise
     
+    async def _acquire(self, endpoint_class: str, weight: float = 1.0):
+        """Wait for the shared rate governor (no-op when none is configured)"""
+        if self.governor is not None:
+            await self.governor.acquire(self.exchange_id, endpoint_class, weight)
+    
+    def _rate_limited(self):
+        """Pause this exchange in the shared governor after a 429"""
+        if self.governor is not None:
+            self.governor.report_rate_limited(self.exchange_id)
+    
     async def fetch_ticker(self, symbol: str) -> Optional[MarketData]:
         """
         Fetch ticker data for symbol
@@ -223,7 +240,10 @@ class CryptoExchangeConnector:
             MarketData object or None
         """
         try:
+            await self._acquire('market_data')
+            start = time.perf_counter()
             ticker = await self.exchange.fetch_ticker(symbol)
+            latency_ms = (time.perf_counter() - start) * 1000
             
             return MarketData(
                 symbol=symbol,
@@ -238,9 +258,15 @@ class CryptoExchangeConnector:
                 bid_volume=float(ticker.get('bidVolume', 0)) if ticker.get('bidVolume') else None,
                 ask_volume=float(ticker.get('askVolume', 0)) if ticker.get('askVolume') else None,
                 exchange=self.exchange_id,
+                latency_ms=latency_ms,
                 raw_data=ticker
             )
         
+        except ccxt.RateLimitExceeded as e:
+            self._rate_limited()
+            logger.error(f"Rate limited fetching {symbol} from {self.exchange_id}: {e}")
+            return None
+        
         except Exception as e:
             logger.error(f"Error fetching {symbol} from {self.exchange_id}: {e}")
             return None
@@ -258,6 +284,7 @@ class CryptoExchangeConnector:
             List of MarketData objects
         """
         try:
+            await self._acquire('market_data')
             ohlcv = await self.exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
             
             result = []
@@ -277,6 +304,11 @@ class CryptoExchangeConnector:
             
             return result
         
+        except ccxt.RateLimitExceeded as e:
+            self._rate_limited()
+            logger.error(f"Rate limited fetching OHLCV for {symbol}: {e}")
+            return []
+        
         except Exception as e:
             logger.error(f"Error fetching OHLCV for {symbol}: {e}")
             return []
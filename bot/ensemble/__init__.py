@@ -37,3 +37,12 @@ try:
 except ImportError as e:
     logger.warning(f"Could not import ensemble_voting: {e}")
     EnsembleVoting = None
+
+# Portfolio Construction
+try:
+    from .portfolio_construction import PortfolioConstructor, PortfolioOrder
+    __all__.extend(['PortfolioConstructor', 'PortfolioOrder'])
+except ImportError as e:
+    logger.warning(f"Could not import portfolio_construction: {e}")
+    PortfolioConstructor = None
+    PortfolioOrder = None
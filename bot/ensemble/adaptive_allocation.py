@@ -6,51 +6,320 @@ Allocates capital to strategies based on recent Sharpe ratio
 import logging
 import numpy as np
 from datetime import datetime, timedelta
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+
+from bot.core import clock
 
 logger = logging.getLogger(__name__)
 
 
+class RunningMoments:
+    """
+    Rolling-window return moments updated in O(1) per observation
+    
+    Keeps the last ``window`` returns in a ring buffer together with the
+    running sum and sum of squares, so mean/std/Sharpe never touch the
+    raw return list again. A Page-Hinkley statistic on the same stream
+    flags mean shifts (performance drift) as they happen.
+    """
+    
+    def __init__(self,
+                 window: int = 20,
+                 drift_delta: float = 0.005,
+                 drift_lambda: float = 0.05):
+        """
+        Args:
+            window: Number of most recent returns kept in the moments
+            drift_delta: Page-Hinkley tolerance on the mean shift
+            drift_lambda: Page-Hinkley alarm threshold
+        """
+        self.window = max(2, int(window))
+        self.drift_delta = drift_delta
+        self.drift_lambda = drift_lambda
+        
+        self._buffer = np.zeros(self.window, dtype=np.float64)
+        self._pos = 0
+        self.count = 0          # Returns currently in the window
+        self.total_seen = 0     # Returns ever pushed
+        self._sum = 0.0
+        self._sum_sq = 0.0
+        
+        # Page-Hinkley state (two-sided)
+        self._ph_mean = 0.0
+        self._ph_up = 0.0
+        self._ph_up_min = 0.0
+        self._ph_down = 0.0
+        self._ph_down_max = 0.0
+    
+    def push(self, value: float) -> bool:
+        """
+        Add one return to the window
+        
+        Args:
+            value: Period return
+        
+        Returns:
+            True if the Page-Hinkley test signalled a drift
+        """
+        value = float(value)
+        
+        if self.count == self.window:
+            old = self._buffer[self._pos]
+            self._sum -= old
+            self._sum_sq -= old * old
+        else:
+            self.count += 1
+        
+        self._buffer[self._pos] = value
+        self._pos = (self._pos + 1) % self.window
+        self._sum += value
+        self._sum_sq += value * value
+        self.total_seen += 1
+        
+        return self._update_drift(value)
+    
+    def _update_drift(self, value: float) -> bool:
+        """Page-Hinkley update, resets itself after an alarm"""
+        n = self.total_seen
+        self._ph_mean += (value - self._ph_mean) / n
+        
+        self._ph_up += value - self._ph_mean - self.drift_delta
+        self._ph_up_min = min(self._ph_up_min, self._ph_up)
+        self._ph_down += value - self._ph_mean + self.drift_delta
+        self._ph_down_max = max(self._ph_down_max, self._ph_down)
+        
+        drifted = (
+            self._ph_up - self._ph_up_min > self.drift_lambda or
+            self._ph_down_max - self._ph_down > self.drift_lambda
+        )
+        
+        if drifted:
+            self._ph_up = self._ph_up_min = 0.0
+            self._ph_down = self._ph_down_max = 0.0
+        
+        return drifted
+    
+    @property
+    def mean(self) -> float:
+        return self._sum / self.count if self.count else 0.0
+    
+    @property
+    def std(self) -> float:
+        """Population standard deviation of the window (matches np.std)"""
+        if self.count == 0:
+            return 0.0
+        mean = self.mean
+        var = self._sum_sq / self.count - mean * mean
+        return float(np.sqrt(var)) if var > 1e-18 else 0.0
+    
+    def sharpe(self, risk_free_rate: float = 0.02) -> float:
+        """
+        Annualized Sharpe ratio of the window
+        
+        Same definition as ``AdaptiveAllocationEngine._calculate_sharpe``.
+        """
+        if self.count < 2:
+            return 1.0
+        
+        annual_std = self.std * np.sqrt(252)
+        if annual_std == 0:
+            return 0.0
+        
+        annual_return = self.mean * 252
+        return max(0.1, (annual_return - risk_free_rate) / annual_std)
+    
+    def reset(self):
+        """Clear the window and drift state"""
+        self.__init__(self.window, self.drift_delta, self.drift_lambda)
+
+
 class AdaptiveAllocationEngine:
     """
     Dynamically allocates capital to strategies based on performance
     
     Key features:
     - Sharpe ratio-based weighting
+    - Running per-strategy moments (O(1) per new return)
     - Exponential smoothing for stability
-    - Automatic rebalancing
-    - Drift tracking
+    - Event-driven rebalancing (weight drift, drift detector, clock)
+    - Fixed-width weight history
     """
     
     def __init__(self,
                  rebalance_freq: str = "daily",
                  smoothing_alpha: float = 0.7,
-                 lookback_days: int = 20):
+                 lookback_days: int = 20,
+                 drift_threshold: float = 0.05,
+                 history_size: int = 1000):
         """
         Args:
             rebalance_freq: Rebalancing frequency (daily, hourly, weekly)
             smoothing_alpha: Exponential smoothing factor [0-1]
             lookback_days: Historical window for Sharpe calculation
+            drift_threshold: Max absolute gap between target and current
+                weight that triggers an early rebalance
+            history_size: Number of weight snapshots kept
         """
         self.rebalance_freq = rebalance_freq
         self.smoothing_alpha = smoothing_alpha
         self.lookback_days = lookback_days
+        self.drift_threshold = drift_threshold
+        self.history_size = history_size
         
         # State
         self.current_weights: Dict[str, float] = {}
         self.sharpe_history: Dict[str, float] = {}
-        self.weight_history = []
         self.last_rebalance: Optional[datetime] = None
         
+        # Incremental state: one slot per strategy
+        self.moments: Dict[str, RunningMoments] = {}
+        self._slots: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._effective_sharpe = np.zeros(0, dtype=np.float64)
+        self._target = np.zeros(0, dtype=np.float64)
+        self._current = np.zeros(0, dtype=np.float64)
+        self._drift_events: List[Dict] = []
+        
+        # Weight history ring buffer (rows = snapshots, cols = strategy slots)
+        self._history_ts = np.zeros(history_size, dtype=np.float64)
+        self._history_w = np.zeros((history_size, 0), dtype=np.float32)
+        self._history_pos = 0
+        self._history_len = 0
+        
         # Constraints
         self.min_weight = 0.01  # Minimum 1% allocation
         self.max_weight = 0.25  # Maximum 25% allocation
         
         logger.info(
             f"✓ Adaptive Allocation Engine initialized "
-            f"(freq={rebalance_freq}, alpha={smoothing_alpha}, lookback={lookback_days}d)"
+            f"(freq={rebalance_freq}, alpha={smoothing_alpha}, lookback={lookback_days}d, "
+            f"drift={drift_threshold:.0%})"
         )
     
+    # ==================== INCREMENTAL UPDATES ====================
+    
+    def _slot(self, strategy_name: str) -> int:
+        """Get (or allocate) the array slot of a strategy"""
+        slot = self._slots.get(strategy_name)
+        if slot is not None:
+            return slot
+        
+        slot = len(self._names)
+        self._slots[strategy_name] = slot
+        self._names.append(strategy_name)
+        self.moments[strategy_name] = RunningMoments(window=self.lookback_days)
+        
+        self._effective_sharpe = np.append(self._effective_sharpe, 1.0)
+        self._target = np.append(self._target, 0.0)
+        self._current = np.append(self._current, 0.0)
+        self._history_w = np.hstack([
+            self._history_w,
+            np.zeros((self.history_size, 1), dtype=np.float32)
+        ])
+        return slot
+    
+    def record_return(self, strategy_name: str, ret: float):
+        """
+        Feed one new strategy return and refresh target weights
+        
+        Args:
+            strategy_name: Strategy that produced the return
+            ret: Period return
+        """
+        self._ingest(strategy_name, [ret])
+        self._target = self._weights_from_sharpe(self._effective_sharpe)
+    
+    def update_performance(self, strategies_performance: Dict):
+        """
+        Consume new returns from a performance snapshot without rebalancing
+        
+        Call every iteration so weight drift and drift-detector events are
+        seen between rebalances; ``should_rebalance`` then decides.
+        
+        Args:
+            strategies_performance: Same format as ``calculate_weights``
+        """
+        for strategy_name, perf_data in strategies_performance.items():
+            self._sync_from_performance(strategy_name, perf_data)
+        self._target = self._weights_from_sharpe(self._effective_sharpe)
+    
+    def _ingest(self, strategy_name: str, returns, detect_drift: bool = True) -> None:
+        """Push returns into a strategy's moments and refresh its Sharpe"""
+        slot = self._slot(strategy_name)
+        moments = self.moments[strategy_name]
+        
+        for ret in returns:
+            if moments.push(ret) and detect_drift:
+                self.notify_drift(strategy_name, reason='page_hinkley')
+        
+        self._effective_sharpe[slot] = self._preview_sharpe(strategy_name)
+    
+    def _preview_sharpe(self, strategy_name: str) -> float:
+        """Smoothed, clamped Sharpe a rebalance would use right now"""
+        moments = self.moments[strategy_name]
+        if moments.count < 2:
+            return 1.0
+        
+        sharpe = moments.sharpe()
+        if strategy_name in self.sharpe_history:
+            sharpe = (
+                self.smoothing_alpha * self.sharpe_history[strategy_name] +
+                (1 - self.smoothing_alpha) * sharpe
+            )
+        return min(5.0, max(0.5, sharpe))
+    
+    def _sync_from_performance(self, strategy_name: str, perf_data: Dict):
+        """
+        Bring a strategy's moments up to date from a performance snapshot
+        
+        Only returns not seen before are pushed: the ``trades`` counter
+        tells how many returns exist in total, so the tail of ``returns``
+        beyond what we already consumed is the new part. Without a
+        counter the window is rebuilt from the list.
+        """
+        returns = perf_data.get('returns', [])
+        total = perf_data.get('trades')
+        moments = self.moments.get(strategy_name)
+        
+        if moments is not None and total is not None and total >= moments.total_seen:
+            new_count = min(total - moments.total_seen, len(returns))
+            if new_count > 0:
+                self._ingest(strategy_name, returns[-new_count:])
+            return
+        
+        # Rebuilding replays old returns, which must not raise drift alarms
+        self._slot(strategy_name)
+        self.moments[strategy_name].reset()
+        self._ingest(strategy_name, returns, detect_drift=False)
+    
+    def notify_drift(self, strategy_name: Optional[str] = None, reason: str = 'external'):
+        """
+        Register a drift-detector event; the next ``should_rebalance`` fires
+        
+        Args:
+            strategy_name: Strategy whose behaviour drifted (None = portfolio)
+            reason: Short description of the detector/event
+        """
+        self._drift_events.append({
+            'timestamp': clock.now(),
+            'strategy': strategy_name,
+            'reason': reason
+        })
+        logger.debug(f"Drift event: strategy={strategy_name} reason={reason}")
+    
+    def get_weight_drift(self) -> float:
+        """
+        Largest absolute gap between target and current weights
+        
+        Returns:
+            Max drift (0.0 when nothing has been allocated yet)
+        """
+        if len(self._target) == 0:
+            return 0.0
+        return float(np.max(np.abs(self._target - self._current)))
+    
+    # ==================== WEIGHT CALCULATION ====================
+    
     def calculate_weights(self, strategies_performance: Dict) -> Dict[str, float]:
         """
         Calculate allocation weights based on strategy performance
@@ -79,50 +348,23 @@ class AdaptiveAllocationEngine:
         
         for strategy_name, perf_data in strategies_performance.items():
             
-            # Get returns
-            returns = perf_data.get('returns', [])
-            
-            if len(returns) < 2:
-                # Insufficient data, use neutral weight
-                recent_sharpe[strategy_name] = 1.0
-                continue
-            
-            # Calculate Sharpe ratio
-            sharpe = self._calculate_sharpe(returns)
-            
-            # Apply exponential smoothing with historical Sharpe
-            if strategy_name in self.sharpe_history:
-                prev_sharpe = self.sharpe_history[strategy_name]
-                smoothed_sharpe = (
-                    self.smoothing_alpha * prev_sharpe +
-                    (1 - self.smoothing_alpha) * sharpe
-                )
-            else:
-                smoothed_sharpe = sharpe
-            
-            # Ensure positive (floor at 0.5 to avoid zero weights)
-            smoothed_sharpe = max(0.5, smoothed_sharpe)
-            
-            # Cap at reasonable maximum
-            smoothed_sharpe = min(5.0, smoothed_sharpe)
-            
+            self._sync_from_performance(strategy_name, perf_data)
+            smoothed_sharpe = self._preview_sharpe(strategy_name)
             recent_sharpe[strategy_name] = smoothed_sharpe
-            self.sharpe_history[strategy_name] = smoothed_sharpe
             
-            logger.debug(
-                f"{strategy_name}: Sharpe={sharpe:.2f} → Smoothed={smoothed_sharpe:.2f}"
-            )
+            # Insufficient data keeps the neutral weight without history
+            if self.moments[strategy_name].count >= 2:
+                self.sharpe_history[strategy_name] = smoothed_sharpe
+                logger.debug(
+                    f"{strategy_name}: Sharpe={self.moments[strategy_name].sharpe():.2f} "
+                    f"→ Smoothed={smoothed_sharpe:.2f}"
+                )
         
         # Convert Sharpe ratios to weights
         weights = self._sharpe_to_weights(recent_sharpe)
         
         # Store weights
-        self.current_weights = weights
-        self.weight_history.append({
-            'timestamp': datetime.now(),
-            'weights': weights.copy()
-        })
-        self.last_rebalance = datetime.now()
+        self._apply_weights(weights)
         
         # Log top strategies
         top_3 = sorted(weights.items(), key=lambda x: x[1], reverse=True)[:3]
@@ -130,6 +372,43 @@ class AdaptiveAllocationEngine:
         
         return weights
     
+    def _apply_weights(self, weights: Dict[str, float]):
+        """Make ``weights`` current, record the snapshot and clear triggers"""
+        now = clock.now()
+        
+        current = np.zeros(len(self._names), dtype=np.float64)
+        for strategy_name, weight in weights.items():
+            slot = self._slot(strategy_name)
+            if slot >= len(current):
+                current = np.append(current, 0.0)
+            current[slot] = weight
+        
+        self.current_weights = weights
+        self._current = current
+        self._target = current.copy()
+        self._drift_events.clear()
+        self.last_rebalance = now
+        
+        pos = self._history_pos
+        self._history_ts[pos] = now.timestamp()
+        self._history_w[pos, :] = current
+        self._history_pos = (pos + 1) % self.history_size
+        self._history_len = min(self._history_len + 1, self.history_size)
+    
+    def _weights_from_sharpe(self, sharpe: np.ndarray) -> np.ndarray:
+        """Vectorized Sharpe → weight mapping used by ``_sharpe_to_weights``"""
+        if len(sharpe) == 0:
+            return np.zeros(0, dtype=np.float64)
+        
+        # Exponential weighting for non-linear emphasis
+        exp_weights = np.exp(np.asarray(sharpe, dtype=np.float64) / 3.0)
+        weights = exp_weights / exp_weights.sum()
+        
+        # Apply min/max constraints, then renormalize to sum to 1.0
+        weights = np.clip(weights, self.min_weight, self.max_weight)
+        total = weights.sum()
+        return weights / total if total > 0 else weights
+    
     def _sharpe_to_weights(self, sharpe_dict: Dict[str, float]) -> Dict[str, float]:
         """
         Convert Sharpe ratios to portfolio weights using normalized exponential
@@ -144,34 +423,10 @@ class AdaptiveAllocationEngine:
         if not sharpe_dict:
             return {}
         
-        # Exponential weighting for non-linear emphasis
-        exp_weights = {}
-        total_weight = 0
-        
-        for strategy_name, sharpe in sharpe_dict.items():
-            # Use e^sharpe to emphasize higher Sharpe ratios
-            exp_weight = np.exp(sharpe / 3.0)  # Divide by 3 to moderate exponential
-            exp_weights[strategy_name] = exp_weight
-            total_weight += exp_weight
+        names = list(sharpe_dict.keys())
+        weights = self._weights_from_sharpe(np.fromiter(sharpe_dict.values(), dtype=np.float64))
         
-        # Normalize and apply constraints
-        normalized_weights = {}
-        
-        for strategy_name, exp_weight in exp_weights.items():
-            # Normalize to sum to 1
-            weight = exp_weight / total_weight
-            
-            # Apply min/max constraints
-            weight = max(self.min_weight, min(self.max_weight, weight))
-            
-            normalized_weights[strategy_name] = weight
-        
-        # Renormalize after constraints to ensure sum to 1.0
-        total = sum(normalized_weights.values())
-        if total > 0:
-            normalized_weights = {k: v / total for k, v in normalized_weights.items()}
-        
-        return normalized_weights
+        return {name: float(w) for name, w in zip(names, weights)}
     
     def _calculate_sharpe(self, returns: list, risk_free_rate: float = 0.02) -> float:
         """
@@ -204,7 +459,11 @@ class AdaptiveAllocationEngine:
     
     def should_rebalance(self) -> bool:
         """
-        Check if portfolio should be rebalanced based on frequency setting
+        Check if portfolio should be rebalanced
+        
+        Triggers, in order: first allocation, pending drift-detector
+        events, target/current weight drift above ``drift_threshold``,
+        and finally the clock-based frequency setting.
         
         Returns:
             True if rebalancing is due, False otherwise
@@ -213,7 +472,13 @@ class AdaptiveAllocationEngine:
         if self.last_rebalance is None:
             return True
         
-        time_since_rebalance = datetime.now() - self.last_rebalance
+        if self._drift_events:
+            return True
+        
+        if self.get_weight_drift() > self.drift_threshold:
+            return True
+        
+        time_since_rebalance = clock.now() - self.last_rebalance
         
         if self.rebalance_freq == "hourly":
             return time_since_rebalance.total_seconds() > 3600
@@ -224,6 +489,11 @@ class AdaptiveAllocationEngine:
         
         return False
     
+    @property
+    def weight_history(self) -> list:
+        """Full weight history, oldest first (see ``get_weight_history``)"""
+        return self.get_weight_history(limit=self.history_size)
+    
     def get_weight_history(self, limit: int = 50) -> list:
         """
         Get recent weight history
@@ -235,7 +505,34 @@ class AdaptiveAllocationEngine:
             List of weight history entries
         """
         
-        return self.weight_history[-limit:]
+        count = min(limit, self._history_len)
+        if count <= 0:
+            return []
+        
+        rows = (self._history_pos - count + np.arange(count)) % self.history_size
+        history = []
+        for row in rows:
+            weights = {
+                name: float(self._history_w[row, slot])
+                for name, slot in self._slots.items()
+                if self._history_w[row, slot] > 0
+            }
+            history.append({
+                'timestamp': datetime.fromtimestamp(self._history_ts[row]),
+                'weights': weights
+            })
+        return history
+    
+    def get_weight_history_array(self) -> tuple:
+        """
+        Raw weight history for vectorized consumers
+        
+        Returns:
+            (timestamps [n], weights [n, strategies], strategy names),
+            oldest first
+        """
+        rows = (self._history_pos - self._history_len + np.arange(self._history_len)) % self.history_size
+        return self._history_ts[rows].copy(), self._history_w[rows].copy(), list(self._names)
     
     def reset(self):
         """
@@ -244,7 +541,17 @@ class AdaptiveAllocationEngine:
         
         self.current_weights = {}
         self.sharpe_history = {}
-        self.weight_history = []
         self.last_rebalance = None
+        self.moments = {}
+        self._slots = {}
+        self._names = []
+        self._effective_sharpe = np.zeros(0, dtype=np.float64)
+        self._target = np.zeros(0, dtype=np.float64)
+        self._current = np.zeros(0, dtype=np.float64)
+        self._drift_events = []
+        self._history_ts = np.zeros(self.history_size, dtype=np.float64)
+        self._history_w = np.zeros((self.history_size, 0), dtype=np.float32)
+        self._history_pos = 0
+        self._history_len = 0
         
         logger.info("✓ Adaptive Allocation Engine reset")
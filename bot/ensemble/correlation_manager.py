@@ -9,6 +9,8 @@ import pandas as pd
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
+from bot.core import clock
+
 logger = logging.getLogger(__name__)
 
 
@@ -80,7 +82,7 @@ class CorrelationManager:
         # Calculate correlation matrix
         self._calculate_correlation_matrix()
         
-        self.last_update = datetime.now()
+        self.last_update = clock.now()
     
     def _calculate_correlation_matrix(self):
         """Calculate correlation matrix from returns history"""
@@ -9,6 +9,8 @@ import pandas as pd
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 
+from bot.core import clock
+
 logger = logging.getLogger(__name__)
 
 
@@ -107,7 +109,7 @@ class EnsembleVoting:
         # Store in history
         if final_signal:
             self.voting_history.append({
-                'timestamp': pd.Timestamp.now(),
+                'timestamp': pd.Timestamp(clock.now()),
                 'signal': final_signal,
                 'num_strategies': len(active_signals),
                 'method': self.method
@@ -115,6 +117,32 @@ class EnsembleVoting:
         
         return final_signal
     
+    def vote_by_symbol(self,
+                       signals: Dict[str, TradeSignal],
+                       weights: Dict[str, float]) -> Dict[str, TradeSignal]:
+        """
+        Aggregate strategy signals separately for each symbol
+        
+        Args:
+            signals: Dict mapping strategy name to TradeSignal
+            weights: Dict mapping strategy name to allocation weight
+            
+        Returns:
+            Dict mapping symbol to its ensemble TradeSignal (symbols without
+            consensus are omitted)
+        """
+        by_symbol: Dict[str, Dict[str, TradeSignal]] = {}
+        for name, signal in signals.items():
+            by_symbol.setdefault(signal.symbol, {})[name] = signal
+        
+        decisions = {}
+        for symbol, symbol_signals in by_symbol.items():
+            final_signal = self.vote(symbol_signals, weights)
+            if final_signal is not None:
+                decisions[symbol] = final_signal
+        
+        return decisions
+    
     def _weighted_average_vote(self,
                                 signals: Dict[str, TradeSignal],
                                 weights: Dict[str, float]) -> Optional[TradeSignal]:
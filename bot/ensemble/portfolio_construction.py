@@ -0,0 +1,191 @@
+"""
+Portfolio Construction
+Sizes all per-symbol ensemble decisions jointly into a batch of orders
+"""
+
+import logging
+import numpy as np
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from .ensemble_voting import TradeSignal
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PortfolioOrder:
+    """Order emitted by the portfolio construction stage"""
+    signal: TradeSignal
+    size: float  # Fraction of equity
+    kelly: float  # Standalone Kelly fraction of the signal
+    
+    @property
+    def symbol(self) -> str:
+        return self.signal.symbol
+    
+    @property
+    def action(self) -> str:
+        return self.signal.action
+
+
+class PortfolioConstructor:
+    """
+    Joint Kelly / mean-variance sizing over all candidate signals
+    
+    Each 1:1 bet with win probability p has edge 2p - 1 and unit
+    variance, so the joint Kelly vector is f = k · C⁻¹(2p - 1) with C
+    the candidates' return correlation (shrunk towards identity). With
+    uncorrelated candidates this is exactly the per-signal
+    ``compute_kelly_fraction``; correlated candidates share their size.
+    
+    Constraints:
+    - Per-symbol cap ``max_position_size`` (including the current holding)
+    - New positions limited by free ``max_open_positions`` slots
+    - Total buys limited by available cash and ``max_gross_exposure``
+    - Orders below ``min_position_size`` are dropped
+    """
+    
+    def __init__(self,
+                 max_position_size: float = 0.15,
+                 min_position_size: float = 0.01,
+                 max_open_positions: int = 10,
+                 kelly_fraction: float = 0.25,
+                 min_probability: float = 0.55,
+                 max_gross_exposure: float = 1.0,
+                 correlation_shrinkage: float = 0.1):
+        """
+        Args:
+            max_position_size: Maximum position as fraction of equity
+            min_position_size: Minimum order as fraction of equity
+            max_open_positions: Maximum number of simultaneous positions
+            kelly_fraction: Fraction of full Kelly to use
+            min_probability: Minimum win probability to size a signal
+            max_gross_exposure: Cap on total long exposure as fraction of equity
+            correlation_shrinkage: Weight of identity in the shrunk correlation
+        """
+        self.max_position_size = max_position_size
+        self.min_position_size = min_position_size
+        self.max_open_positions = max_open_positions
+        self.kelly_fraction = kelly_fraction
+        self.min_probability = min_probability
+        self.max_gross_exposure = max_gross_exposure
+        self.correlation_shrinkage = correlation_shrinkage
+        
+        logger.info(
+            f"✓ Portfolio Constructor initialized "
+            f"(max_positions={max_open_positions}, max_size={max_position_size:.0%})"
+        )
+    
+    def construct(self,
+                  decisions: Dict[str, TradeSignal],
+                  portfolio: Dict,
+                  prices: Dict[str, float],
+                  correlation: Optional[np.ndarray] = None,
+                  size_multiplier: float = 1.0) -> List[PortfolioOrder]:
+        """
+        Size all decisions of one iteration
+        
+        Args:
+            decisions: Dict mapping symbol to ensemble TradeSignal
+            portfolio: Portfolio state (cash, equity, positions)
+            prices: Latest price per symbol (for current holdings)
+            correlation: Correlation matrix aligned with ``decisions`` order (None = identity)
+            size_multiplier: Scalar applied to all buy sizes (correlation / circuit breaker)
+        
+        Returns:
+            Orders to execute this iteration, sells first
+        """
+        if not decisions:
+            return []
+        
+        equity = portfolio.get('equity', portfolio.get('cash', 0))
+        if equity <= 0:
+            return []
+        
+        positions = portfolio.get('positions', {})
+        signals = list(decisions.values())
+        symbols = [s.symbol for s in signals]
+        
+        confidence = np.array([s.confidence for s in signals], dtype=np.float64)
+        is_buy = np.array([s.action == 'BUY' for s in signals])
+        is_sell = np.array([s.action == 'SELL' for s in signals])
+        held = np.array([
+            positions[sym]['size'] * prices.get(sym, positions[sym].get('avg_price', 0)) / equity
+            if sym in positions else 0.0
+            for sym in symbols
+        ])
+        
+        # Standalone Kelly (1:1 payoff), same as RiskManager.compute_kelly_fraction
+        edge = 2 * confidence - 1
+        eligible = confidence >= self.min_probability
+        kelly = np.where(eligible, np.maximum(0.0, edge * self.kelly_fraction), 0.0)
+        
+        orders: List[PortfolioOrder] = []
+        
+        # Exits: confident sells close the holding
+        for i in np.flatnonzero(is_sell & eligible & (held > 0)):
+            orders.append(PortfolioOrder(signal=signals[i], size=float(held[i]), kelly=float(kelly[i])))
+        
+        buys = np.flatnonzero(is_buy & eligible & (kelly > 0))
+        if len(buys):
+            sizes = self._joint_kelly(edge[buys], None if correlation is None else correlation[np.ix_(buys, buys)])
+            sizes *= size_multiplier
+            
+            # Per-symbol cap including what is already held
+            sizes = np.minimum(sizes, np.maximum(0.0, self.max_position_size - held[buys]))
+            sizes[sizes < self.min_position_size] = 0.0
+            
+            # Free position slots go to the largest new positions
+            is_new = held[buys] <= 0
+            free_slots = max(0, self.max_open_positions - len(positions))
+            new_idx = np.flatnonzero(is_new & (sizes > 0))
+            if len(new_idx) > free_slots:
+                ranked = new_idx[np.argsort(-sizes[new_idx], kind='stable')]
+                sizes[ranked[free_slots:]] = 0.0
+            
+            # Budget: cash (plus proceeds of this batch's exits) and gross exposure
+            exits = sum(o.size for o in orders)
+            gross = sum(
+                pos['size'] * prices.get(sym, pos.get('avg_price', 0)) for sym, pos in positions.items()
+            ) / equity
+            cash_fraction = portfolio.get('cash', 0) / equity + exits
+            budget = min(cash_fraction, self.max_gross_exposure - (gross - exits))
+            total = sizes.sum()
+            if total > budget:
+                sizes *= max(0.0, budget) / total
+                sizes[sizes < self.min_position_size] = 0.0
+            
+            for j in np.argsort(-sizes, kind='stable'):
+                if sizes[j] > 0:
+                    i = buys[j]
+                    orders.append(PortfolioOrder(signal=signals[i], size=float(sizes[j]), kelly=float(kelly[i])))
+        
+        logger.debug(
+            f"Portfolio construction: {len(decisions)} decisions -> {len(orders)} orders "
+            f"(gross={sum(o.size for o in orders if o.action == 'BUY'):.2%})"
+        )
+        
+        return orders
+    
+    def _joint_kelly(self, edge: np.ndarray, correlation: Optional[np.ndarray]) -> np.ndarray:
+        """Long-only Kelly vector k · C⁻¹·edge over the candidate set"""
+        if correlation is None or len(edge) == 1:
+            return np.maximum(0.0, edge * self.kelly_fraction)
+        
+        shrunk = (1 - self.correlation_shrinkage) * correlation + self.correlation_shrinkage * np.eye(len(edge))
+        active = np.ones(len(edge), dtype=bool)
+        sizes = np.zeros(len(edge))
+        
+        # Drop candidates the unconstrained solution shorts and re-solve
+        for _ in range(len(edge)):
+            idx = np.flatnonzero(active)
+            solution = np.linalg.solve(shrunk[np.ix_(idx, idx)], edge[idx])
+            if np.all(solution >= 0):
+                sizes[idx] = solution * self.kelly_fraction
+                break
+            active[idx[solution < 0]] = False
+            if not active.any():
+                break
+        
+        return sizes
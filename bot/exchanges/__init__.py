@@ -6,16 +6,42 @@ Supported exchanges:
 - Coinbase Pro (optional)
 - Kraken (optional)
 - Finst (preparatory - API not yet available)
+
+Uses safe imports so a missing adapter module does not block the others.
 """
 
-from .binance_adapter import BinanceAdapter
-from .coinbase_adapter import CoinbaseAdapter
-from .kraken_adapter import KrakenAdapter
+import logging
+
+logger = logging.getLogger(__name__)
+
+__all__ = []
+
+# Binance
+try:
+    from .binance_adapter import BinanceAdapter
+    __all__.append('BinanceAdapter')
+except ImportError as e:
+    logger.warning(f"Could not import binance_adapter: {e}")
+    BinanceAdapter = None
+
+# Coinbase Pro
+try:
+    from .coinbase_adapter import CoinbaseAdapter
+    __all__.append('CoinbaseAdapter')
+except ImportError as e:
+    logger.warning(f"Could not import coinbase_adapter: {e}")
+    CoinbaseAdapter = None
+
+# Kraken
+try:
+    from .kraken_adapter import KrakenAdapter
+    __all__.append('KrakenAdapter')
+except ImportError as e:
+    logger.warning(f"Could not import kraken_adapter: {e}")
+    KrakenAdapter = None
+
+# Finst
 from .finst_adapter import FinstAdapter
+from .finst_async_adapter import AsyncFinstAdapter
 
-__all__ = [
-    'BinanceAdapter',
-    'CoinbaseAdapter',
-    'KrakenAdapter',
-    'FinstAdapter',
-]
+__all__.extend(['FinstAdapter', 'AsyncFinstAdapter'])
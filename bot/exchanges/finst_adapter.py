@@ -69,7 +69,8 @@ class FinstAdapter:
         api_key: Optional[str] = None,
         api_secret: Optional[str] = None,
         testnet: bool = False,
-        timeout: int = 10
+        timeout: int = 10,
+        base_url: Optional[str] = None
     ):
         """
         Initialize Finst adapter
@@ -79,6 +80,7 @@ class FinstAdapter:
             api_secret: Finst API secret (placeholder until API available)
             testnet: Use testnet environment when available
             timeout: Request timeout in seconds
+            base_url: Override the API endpoint (e.g. a local mock server)
         """
         self.api_key = api_key
         self.api_secret = api_secret
@@ -86,7 +88,9 @@ class FinstAdapter:
         self.timeout = timeout
         
         # Estimated API endpoints (to be updated when API is released)
-        if testnet:
+        if base_url:
+            self.base_url = base_url.rstrip('/')
+        elif testnet:
             self.base_url = "https://testnet-api.finst.com/v1"  # Estimated
         else:
             self.base_url = "https://api.finst.com/v1"  # Estimated
@@ -0,0 +1,490 @@
+"""
+Finst Exchange Adapter - Asynchronous Variant (Preparatory)
+
+Async counterpart of ``FinstAdapter`` for the asyncio trading stack.
+Requests go through a single pooled keep-alive ``aiohttp`` session, so
+order placement, balance fetches and status polls never block the
+event loop. Concurrent requests are bounded by a client-side rate
+limiter; bulk operations (multi-symbol tickers, order cancellation)
+are pipelined over the shared connection pool.
+
+Status: INACTIVE - Waiting for Finst API release (see FinstAdapter)
+"""
+
+import asyncio
+import time
+from decimal import Decimal
+from typing import Awaitable, Dict, Iterable, List, Optional
+import logging
+
+import aiohttp
+
+from .finst_adapter import FinstAdapter
+from ..core.rate_governor import RateGovernor, get_rate_governor
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncRateLimiter:
+    """
+    Token bucket plus in-flight cap for one client
+    
+    ``rate`` tokens are added per second up to ``burst``; each request
+    takes one token and one of ``max_in_flight`` slots.
+    """
+    
+    def __init__(self, rate: float = 10.0, burst: int = 10, max_in_flight: int = 8):
+        """
+        Args:
+            rate: Sustained requests per second
+            burst: Maximum tokens accumulated while idle
+            max_in_flight: Maximum concurrent requests
+        """
+        self.rate = rate
+        self.burst = burst
+        self.max_in_flight = max_in_flight
+        
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        
+        # Statistics
+        self.total_wait = 0.0
+    
+    def _ensure_primitives(self):
+        """Create asyncio primitives on the running loop"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+            self._slots = asyncio.Semaphore(self.max_in_flight)
+    
+    async def acquire(self):
+        """Wait for a token and an in-flight slot"""
+        self._ensure_primitives()
+        start = time.monotonic()
+        
+        # Tokens are handed out in arrival order under the lock
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._tokens = 1.0
+                self._updated = time.monotonic()
+            self._tokens -= 1
+        
+        await self._slots.acquire()
+        self.total_wait += time.monotonic() - start
+    
+    def release(self):
+        """Free an in-flight slot"""
+        self._slots.release()
+
+
+class AsyncFinstAdapter(FinstAdapter):
+    """
+    Finst Exchange Adapter - asyncio variant
+    
+    Same endpoints and signing as ``FinstAdapter``; all API methods are
+    coroutines. Use as ``async with AsyncFinstAdapter(...) as finst:``
+    or call ``close()`` on shutdown.
+    
+    Configuration (in addition to FinstAdapter):
+        max_connections: Size of the keep-alive connection pool
+        rate_limit: Sustained requests per second
+        burst: Requests allowed back-to-back after idling
+        max_in_flight: Concurrent requests on the wire
+    """
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        api_secret: Optional[str] = None,
+        testnet: bool = False,
+        timeout: int = 10,
+        base_url: Optional[str] = None,
+        max_connections: int = 8,
+        rate_limit: float = 10.0,
+        burst: int = 10,
+        max_in_flight: int = 8,
+        governor: Optional[RateGovernor] = None
+    ):
+        """
+        Initialize async Finst adapter
+        
+        Args:
+            api_key: Finst API key (placeholder until API available)
+            api_secret: Finst API secret (placeholder until API available)
+            testnet: Use testnet environment when available
+            timeout: Request timeout in seconds
+            base_url: Override the API endpoint (e.g. a local mock server)
+            max_connections: Keep-alive connection pool size
+            rate_limit: Client-side request rate (requests/second)
+            burst: Token bucket capacity
+            max_in_flight: Maximum concurrent requests
+            governor: Shared rate governor (default: the configured one)
+        """
+        super().__init__(api_key=api_key, api_secret=api_secret, testnet=testnet, timeout=timeout, base_url=base_url)
+        
+        self.max_connections = max_connections
+        self.limiter = AsyncRateLimiter(rate=rate_limit, burst=burst, max_in_flight=max_in_flight)
+        self.governor = governor if governor is not None else get_rate_governor()
+        
+        # Pooled session, created lazily on the running loop
+        self.http: Optional[aiohttp.ClientSession] = None
+        
+        # Statistics
+        self.requests_sent = 0
+        self.requests_failed = 0
+    
+    async def _ensure_session(self):
+        """Ensure the pooled aiohttp session exists"""
+        if self.http is None or self.http.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                keepalive_timeout=30,
+                enable_cleanup_closed=True
+            )
+            self.http = aiohttp.ClientSession(
+                connector=connector,
+                headers=dict(self.session.headers),
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+    
+    async def close(self):
+        """Close the pooled session"""
+        if self.http is not None and not self.http.closed:
+            await self.http.close()
+        self.session.close()
+    
+    async def __aenter__(self) -> 'AsyncFinstAdapter':
+        await self._ensure_session()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        signed: bool = False,
+        **kwargs
+    ) -> Dict:
+        """
+        Make HTTP request to Finst API over the pooled session
+        
+        Args:
+            method: HTTP method (GET, POST, DELETE)
+            endpoint: API endpoint
+            signed: Whether request requires authentication
+            **kwargs: Additional request parameters
+        
+        Returns:
+            JSON response from API
+        """
+        self._check_api_availability()
+        
+        if signed and (not self.api_key or not self.api_secret):
+            raise ValueError("API key and secret required for signed requests")
+        
+        await self._ensure_session()
+        url = f"{self.base_url}{endpoint}"
+        
+        if self.governor is not None:
+            await self.governor.acquire('finst', self._endpoint_class(method, endpoint, signed))
+        
+        await self.limiter.acquire()
+        try:
+            # Sign after the rate limiter so the timestamp is fresh
+            if signed:
+                params = dict(kwargs.get('params', {}))
+                params['timestamp'] = int(time.time() * 1000)
+                params['signature'] = self._generate_signature(params)
+                kwargs['params'] = params
+                
+                headers = dict(kwargs.get('headers', {}))
+                headers['X-FINST-API-KEY'] = self.api_key
+                kwargs['headers'] = headers
+            
+            self.requests_sent += 1
+            async with self.http.request(method, url, **kwargs) as response:
+                if response.status == 429 and self.governor is not None:
+                    retry_after = response.headers.get('Retry-After')
+                    self.governor.report_rate_limited(
+                        'finst', float(retry_after) if retry_after else None
+                    )
+                response.raise_for_status()
+                return await response.json()
+        
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.requests_failed += 1
+            logger.error(f"Finst API request failed: {e}")
+            raise
+        
+        finally:
+            self.limiter.release()
+    
+    @staticmethod
+    def _endpoint_class(method: str, endpoint: str, signed: bool) -> str:
+        """Rate governor lane of a request"""
+        if method == 'DELETE':
+            return 'cancel'
+        if method == 'POST' and endpoint.startswith('/orders'):
+            return 'order'
+        return 'account' if signed else 'market_data'
+    
+    async def gather(self, requests: Iterable[Awaitable], return_exceptions: bool = True) -> List:
+        """
+        Pipeline several requests over the shared pool
+        
+        Args:
+            requests: Coroutines of this adapter
+            return_exceptions: Return failures in place instead of raising the first
+        
+        Returns:
+            Results in request order
+        """
+        return await asyncio.gather(*requests, return_exceptions=return_exceptions)
+    
+    # Market Data Methods
+    
+    async def get_ticker(self, symbol: str) -> Dict:
+        """Get current ticker information for a symbol (see FinstAdapter.get_ticker)"""
+        self._check_api_availability()
+        
+        endpoint = f"/ticker/{symbol.replace('/', '')}"
+        return await self._request('GET', endpoint)
+    
+    async def get_tickers(self, symbols: List[str]) -> Dict[str, Dict]:
+        """
+        Get tickers for several symbols concurrently
+        
+        Args:
+            symbols: Trading pairs
+        
+        Returns:
+            Dict mapping symbol to ticker (failed symbols omitted)
+        """
+        results = await self.gather(self.get_ticker(s) for s in symbols)
+        
+        tickers = {}
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Ticker fetch failed for {symbol}: {result}")
+                continue
+            tickers[symbol] = result
+        
+        return tickers
+    
+    async def get_order_book(self, symbol: str, limit: int = 100) -> Dict:
+        """Get order book for a symbol"""
+        self._check_api_availability()
+        
+        endpoint = f"/orderbook/{symbol.replace('/', '')}"
+        return await self._request('GET', endpoint, params={'limit': limit})
+    
+    async def get_trades(self, symbol: str, limit: int = 100) -> List[Dict]:
+        """Get recent trades for a symbol"""
+        self._check_api_availability()
+        
+        endpoint = f"/trades/{symbol.replace('/', '')}"
+        return await self._request('GET', endpoint, params={'limit': limit})
+    
+    # Account Methods (Authenticated)
+    
+    async def get_balance(self) -> Dict[str, Decimal]:
+        """Get account balance as Dict mapping currency to available balance"""
+        self._check_api_availability()
+        
+        response = await self._request('GET', "/account/balance", signed=True)
+        
+        return {
+            item['currency']: Decimal(str(item['available']))
+            for item in response.get('balances', [])
+        }
+    
+    async def get_open_orders(self, symbol: Optional[str] = None) -> List[Dict]:
+        """Get all open orders (optionally for one symbol)"""
+        self._check_api_availability()
+        
+        params = {'symbol': symbol.replace('/', '')} if symbol else {}
+        return await self._request('GET', "/orders/open", signed=True, params=params)
+    
+    # Trading Methods (Authenticated)
+    
+    async def place_market_order(self, symbol: str, side: str, amount: float) -> Dict:
+        """Place a market order"""
+        self._check_api_availability()
+        
+        data = {
+            'symbol': symbol.replace('/', ''),
+            'side': side.lower(),
+            'type': 'market',
+            'amount': str(amount)
+        }
+        return await self._request('POST', "/orders", signed=True, json=data)
+    
+    async def place_limit_order(self, symbol: str, side: str, amount: float, price: float) -> Dict:
+        """Place a limit order"""
+        self._check_api_availability()
+        
+        data = {
+            'symbol': symbol.replace('/', ''),
+            'side': side.lower(),
+            'type': 'limit',
+            'amount': str(amount),
+            'price': str(price)
+        }
+        return await self._request('POST', "/orders", signed=True, json=data)
+    
+    async def cancel_order(self, order_id: str) -> Dict:
+        """Cancel an open order"""
+        self._check_api_availability()
+        
+        return await self._request('DELETE', f"/orders/{order_id}", signed=True)
+    
+    async def cancel_orders(self, order_ids: List[str]) -> Dict:
+        """
+        Cancel several orders concurrently
+        
+        Args:
+            order_ids: Order IDs to cancel
+        
+        Returns:
+            Dict with 'cancelled' and 'failed' order ids
+        """
+        results = await self.gather(self.cancel_order(order_id) for order_id in order_ids)
+        
+        cancelled = [oid for oid, r in zip(order_ids, results) if not isinstance(r, Exception)]
+        failed = [oid for oid, r in zip(order_ids, results) if isinstance(r, Exception)]
+        
+        if failed:
+            logger.warning(f"Finst cancel failed for {len(failed)}/{len(order_ids)} orders")
+        
+        return {'cancelled': cancelled, 'failed': failed}
+    
+    async def cancel_all_orders(self, symbol: Optional[str] = None, symbols: Optional[List[str]] = None) -> Dict:
+        """
+        Cancel all open orders
+        
+        Args:
+            symbol: Limit to specific symbol (optional)
+            symbols: Several symbols, cancelled concurrently (optional)
+        
+        Returns:
+            Cancellation summary (per symbol when ``symbols`` is given)
+        """
+        self._check_api_availability()
+        
+        if symbols:
+            results = await self.gather(self.cancel_all_orders(symbol=s) for s in symbols)
+            return {
+                s: ({'error': str(r)} if isinstance(r, Exception) else r)
+                for s, r in zip(symbols, results)
+            }
+        
+        params = {'symbol': symbol.replace('/', '')} if symbol else {}
+        return await self._request('DELETE', "/orders/cancel-all", signed=True, params=params)
+    
+    async def get_order_status(self, order_id: str) -> Dict:
+        """Get status of a specific order"""
+        self._check_api_availability()
+        
+        return await self._request('GET', f"/orders/{order_id}", signed=True)
+    
+    async def get_orders_status(self, order_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Poll the status of several orders concurrently
+        
+        Returns:
+            Dict mapping order id to status (failed polls omitted)
+        """
+        results = await self.gather(self.get_order_status(oid) for oid in order_ids)
+        return {oid: r for oid, r in zip(order_ids, results) if not isinstance(r, Exception)}
+    
+    # Trading History
+    
+    async def get_trade_history(
+        self,
+        symbol: Optional[str] = None,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        limit: int = 100
+    ) -> List[Dict]:
+        """Get trading history"""
+        self._check_api_availability()
+        
+        params = {'limit': limit}
+        if symbol:
+            params['symbol'] = symbol.replace('/', '')
+        if start_time:
+            params['start_time'] = start_time
+        if end_time:
+            params['end_time'] = end_time
+        
+        return await self._request('GET', "/account/trades", signed=True, params=params)
+    
+    # Utility Methods
+    
+    async def get_exchange_info(self) -> Dict:
+        """Get exchange information (trading pairs, limits, fees)"""
+        self._check_api_availability()
+        
+        return await self._request('GET', "/exchangeInfo")
+    
+    async def get_server_time(self) -> int:
+        """Get server time in milliseconds"""
+        self._check_api_availability()
+        
+        response = await self._request('GET', "/time")
+        return response.get('serverTime', int(time.time() * 1000))
+    
+    async def ping(self) -> bool:
+        """Test connectivity to API"""
+        try:
+            await self._request('GET', "/ping")
+            return True
+        except Exception:
+            return False
+    
+    # Standardized interface methods (compatible with other adapters)
+    
+    async def get_current_price(self, symbol: str) -> Decimal:
+        """Get current market price for a symbol"""
+        ticker = await self.get_ticker(symbol)
+        return Decimal(str(ticker['last_price']))
+    
+    async def execute_trade(
+        self,
+        symbol: str,
+        side: str,
+        amount: float,
+        order_type: str = 'market',
+        price: Optional[float] = None
+    ) -> Dict:
+        """Execute a trade (unified interface)"""
+        if order_type == 'market':
+            return await self.place_market_order(symbol, side, amount)
+        elif order_type == 'limit':
+            if price is None:
+                raise ValueError("Price required for limit orders")
+            return await self.place_limit_order(symbol, side, amount, price)
+        else:
+            raise ValueError(f"Unsupported order type: {order_type}")
+    
+    def get_statistics(self) -> Dict:
+        """Client statistics"""
+        return {
+            'requests_sent': self.requests_sent,
+            'requests_failed': self.requests_failed,
+            'rate_limit_wait': self.limiter.total_wait
+        }
+    
+    def __repr__(self) -> str:
+        return (
+            f"AsyncFinstAdapter(testnet={self.testnet}, "
+            f"api_available={self._api_available})"
+        )
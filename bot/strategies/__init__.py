@@ -23,7 +23,7 @@ from .bollinger_bands import BollingerBandsStrategy
 from .breakout import BreakoutStrategy
 from .fibonacci import FibonacciStrategy
 from .ichimoku import IchimokuStrategy
-from .elliot_wave import ElliotWaveStrategy
+from .elliot_wave import ElliottWaveStrategy
 from .rsi_divergence import RSIDivergenceStrategy
 from .sector_rotation import SectorRotationStrategy
 from .stochastic import StochasticStrategy
@@ -51,7 +51,7 @@ STRATEGY_CLASSES: Dict[str, Type[BaseStrategy]] = {
     'breakout': BreakoutStrategy,
     'fibonacci': FibonacciStrategy,
     'ichimoku': IchimokuStrategy,
-    'elliot_wave': ElliotWaveStrategy,
+    'elliot_wave': ElliottWaveStrategy,
     'rsi_divergence': RSIDivergenceStrategy,
     'stochastic': StochasticStrategy,
     'macd_momentum': MACDMomentumStrategy,
@@ -6,7 +6,7 @@ Abstract base class for all trading strategies
 import logging
 import os
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import pandas as pd
 import numpy as np
@@ -24,8 +24,17 @@ class BaseStrategy(ABC):
     All strategies must inherit from this class and implement:
     - generate_signal()
     - calculate_indicators() (optional)
+    - on_bar() / reset_state() for incremental backtests (optional)
+    - signals_vectorized() for vectorized backtests (optional)
     """
     
+    # Event-driven backtests feed incremental strategies one bar at a time
+    # through on_bar(); others get a view of the last ``history_bars`` bars
+    # (None = the backtester's configured lookback)
+    supports_incremental = False
+    supports_vectorized = False
+    history_bars: Optional[int] = None
+    
     def __init__(self, config, strategy_name: str):
         """
         Initialize base strategy
@@ -78,6 +87,52 @@ class BaseStrategy(ABC):
         """
         return data
     
+    async def on_bar(self, bar: Dict) -> Optional[TradeSignal]:
+        """
+        Update indicator state with one new bar and return a signal
+        
+        Implemented by strategies with ``supports_incremental = True``;
+        must match ``generate_signal`` over the full history.
+        
+        Args:
+            bar: Mapping with open/high/low/close/volume (and timestamp)
+            
+        Returns:
+            TradeSignal or None if no signal
+        """
+        raise NotImplementedError(f"{self.name} does not support incremental updates")
+    
+    def reset_state(self):
+        """Clear incremental indicator state before a new run"""
+        pass
+    
+    def signals_vectorized(self, frame: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Signal of every bar at once
+        
+        Implemented by strategies with ``supports_vectorized = True``;
+        entry ``i`` must equal ``generate_signal(frame.iloc[:i+1])``.
+        
+        Args:
+            frame: Full OHLCV history
+            
+        Returns:
+            (action, confidence): int8 array (+1 BUY, -1 SELL, 0 none)
+            and float array (0 where there is no signal)
+        """
+        raise NotImplementedError(f"{self.name} does not support vectorized signals")
+    
+    @staticmethod
+    def _vector_signals(buy: np.ndarray,
+                        sell: np.ndarray,
+                        confidence: np.ndarray,
+                        min_bars: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """Combine buy/sell masks into (action, confidence) arrays"""
+        action = np.where(buy, 1, np.where(sell, -1, 0)).astype(np.int8)
+        action[:max(min_bars - 1, 0)] = 0
+        confidence = np.where(action != 0, confidence, 0.0)
+        return action, confidence
+    
     def record_trade(self, trade_result: Dict):
         """
         Record trade execution result
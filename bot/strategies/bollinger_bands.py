@@ -7,7 +7,7 @@ ROI Esperado: +225%
 import logging
 import pandas as pd
 import numpy as np
-from typing import Optional
+from typing import Optional, Tuple
 
 from .base_strategy import BaseStrategy
 from bot.ensemble.ensemble_voting import TradeSignal
@@ -32,6 +32,8 @@ class BollingerBandsStrategy(BaseStrategy):
         self.period = 20
         self.std_dev = 2.0
         self.squeeze_threshold = 0.02
+        
+        self.supports_vectorized = True
     
     async def generate_signal(self, market_data: pd.DataFrame) -> Optional[TradeSignal]:
         """Generate Bollinger Bands signal"""
@@ -114,6 +116,22 @@ class BollingerBandsStrategy(BaseStrategy):
         
         return None
     
+    def signals_vectorized(self, frame: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """Band bounce signal of every bar"""
+        df = self.calculate_indicators(frame).reindex(frame.index)
+        price = df['close'].to_numpy(dtype=np.float64)
+        middle = df['bb_middle'].to_numpy()
+        position = df['bb_position'].to_numpy()
+        
+        active = df['bb_width'].to_numpy() >= self.squeeze_threshold
+        buy = active & (position < 0.1)
+        sell = active & (position > 0.9)
+        
+        distance = np.where(buy, middle - price, price - middle) / middle
+        confidence = np.minimum(0.5 + distance * 3, 1.0)
+        
+        return self._vector_signals(buy, sell, confidence, self.period)
+    
     def calculate_indicators(self, data: pd.DataFrame) -> pd.DataFrame:
         """Calculate Bollinger Bands"""
         
@@ -7,7 +7,7 @@ ROI Esperado: +340%
 import logging
 import pandas as pd
 import numpy as np
-from typing import Optional
+from typing import Optional, Tuple
 
 from .base_strategy import BaseStrategy
 from bot.ensemble.ensemble_voting import TradeSignal
@@ -36,6 +36,8 @@ class BreakoutStrategy(BaseStrategy):
         self.range_high = None
         self.range_low = None
         self.range_duration = 0
+        
+        self.supports_vectorized = True
     
     async def generate_signal(self, market_data: pd.DataFrame) -> Optional[TradeSignal]:
         """Generate breakout signal"""
@@ -118,6 +120,24 @@ class BreakoutStrategy(BaseStrategy):
         
         return None
     
+    def signals_vectorized(self, frame: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """Range breakout signal of every bar"""
+        df = self.calculate_indicators(frame).reindex(frame.index)
+        price = df['close'].to_numpy(dtype=np.float64)
+        range_high = df['range_high'].to_numpy()
+        range_low = df['range_low'].to_numpy()
+        volume_ok = df['volume_ratio'].to_numpy() > self.volume_multiplier
+        
+        up = price > range_high * (1 + self.breakout_threshold)
+        down = ~up & (price < range_low * (1 - self.breakout_threshold))
+        buy = up & volume_ok
+        sell = down & volume_ok
+        
+        size = np.where(buy, (price - range_high) / range_high, (range_low - price) / range_low)
+        confidence = np.minimum(0.6 + size * 5, 1.0)
+        
+        return self._vector_signals(buy, sell, confidence, self.lookback)
+    
     def calculate_indicators(self, data: pd.DataFrame) -> pd.DataFrame:
         """Calculate breakout indicators"""
         
@@ -7,7 +7,7 @@ ROI Esperado: +280%
 import logging
 import pandas as pd
 import numpy as np
-from typing import Optional
+from typing import Optional, Tuple
 
 from .base_strategy import BaseStrategy
 from bot.ensemble.ensemble_voting import TradeSignal
@@ -32,6 +32,8 @@ class MACDMomentumStrategy(BaseStrategy):
         self.fast_period = 12
         self.slow_period = 26
         self.signal_period = 9
+        
+        self.supports_vectorized = True
     
     async def generate_signal(self, market_data: pd.DataFrame) -> Optional[TradeSignal]:
         """Generate MACD signal"""
@@ -109,6 +111,22 @@ class MACDMomentumStrategy(BaseStrategy):
         
         return None
     
+    def signals_vectorized(self, frame: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """MACD crossover signal of every bar"""
+        df = self.calculate_indicators(frame).reindex(frame.index)
+        macd = df['macd'].to_numpy()
+        signal_line = df['signal'].to_numpy()
+        histogram = df['histogram'].to_numpy()
+        prev_macd = df['macd'].shift(1).to_numpy()
+        prev_signal = df['signal'].shift(1).to_numpy()
+        
+        buy = (prev_macd <= prev_signal) & (macd > signal_line) & (histogram > 0)
+        sell = (prev_macd >= prev_signal) & (macd < signal_line) & (histogram < 0)
+        
+        confidence = np.minimum(0.5 + np.abs(histogram) / 100, 1.0)
+        
+        return self._vector_signals(buy, sell, confidence, self.slow_period + self.signal_period)
+    
     def calculate_indicators(self, data: pd.DataFrame) -> pd.DataFrame:
         """Calculate MACD indicators"""
         
@@ -7,7 +7,8 @@ ROI Esperado: +180%
 import logging
 import pandas as pd
 import numpy as np
-from typing import Optional
+from collections import deque
+from typing import Dict, Optional, Tuple
 
 from .base_strategy import BaseStrategy
 from bot.ensemble.ensemble_voting import TradeSignal
@@ -38,6 +39,11 @@ class MomentumStrategy(BaseStrategy):
         self.rsi_buy_threshold = 50
         self.rsi_sell_threshold = 50
         self.min_roc = 0.02  # 2% minimum rate of change
+        
+        # Incremental state: only the closes the indicators look back on
+        self.supports_incremental = True
+        self.supports_vectorized = True
+        self._closes = deque(maxlen=max(self.ma_period, self.rsi_period + 1, self.roc_period + 1))
     
     async def generate_signal(self, market_data: pd.DataFrame) -> Optional[TradeSignal]:
         """Generate momentum signal"""
@@ -54,10 +60,55 @@ class MomentumStrategy(BaseStrategy):
         # Get latest values
         latest = data_with_indicators.iloc[-1]
         
-        price = latest.get('close', 0)
-        ma = latest.get('ma', 0)
-        rsi = latest.get('rsi', 50)
-        roc = latest.get('roc', 0)
+        return self._signal_from(
+            latest.get('close', 0),
+            latest.get('ma', 0),
+            latest.get('rsi', 50),
+            latest.get('roc', 0)
+        )
+    
+    async def on_bar(self, bar: Dict) -> Optional[TradeSignal]:
+        """Momentum signal from the latest bar (O(lookback) per bar)"""
+        self._closes.append(float(bar['close']))
+        
+        if len(self._closes) < self.ma_period:
+            return None
+        
+        closes = np.fromiter(self._closes, dtype=np.float64, count=len(self._closes))
+        
+        ma = closes[-self.ma_period:].mean()
+        
+        delta = np.diff(closes[-(self.rsi_period + 1):])
+        gain = np.maximum(delta, 0).mean()
+        loss = np.maximum(-delta, 0).mean()
+        rsi = 100 - (100 / (1 + gain / (loss + 1e-8)))
+        
+        roc = closes[-1] / closes[-(self.roc_period + 1)] - 1
+        
+        return self._signal_from(closes[-1], ma, rsi, roc)
+    
+    def reset_state(self):
+        """Forget the incremental close history (sized for the current periods)"""
+        self._closes = deque(maxlen=max(self.ma_period, self.rsi_period + 1, self.roc_period + 1))
+    
+    def signals_vectorized(self, frame: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """Momentum signal of every bar (see ``_signal_from``)"""
+        df = self.calculate_indicators(frame).reindex(frame.index)
+        price = df['close'].to_numpy(dtype=np.float64)
+        ma = df['ma'].to_numpy()
+        rsi = df['rsi'].to_numpy()
+        roc = df['roc'].to_numpy()
+        
+        buy = (price > ma) & (rsi > self.rsi_buy_threshold) & (roc > self.min_roc)
+        sell = (price < ma) & (rsi < self.rsi_sell_threshold) & (roc < -self.min_roc)
+        
+        rsi_score = np.clip(np.where(buy, (rsi - 50) / 50, (50 - rsi) / 50), 0, 1)
+        roc_score = np.minimum(np.abs(roc) / 0.10, 1.0)
+        
+        return self._vector_signals(buy, sell, 0.6 * rsi_score + 0.4 * roc_score, self.ma_period)
+    
+    def _signal_from(self, price: float, ma: float, rsi: float, roc: float) -> Optional[TradeSignal]:
+        """Apply the entry rules to the latest indicator values"""
         
         # Generate signal
         signal = None
@@ -7,7 +7,7 @@ ROI Esperado: +215%
 import logging
 import pandas as pd
 import numpy as np
-from typing import Optional
+from typing import Optional, Tuple
 
 from .base_strategy import BaseStrategy
 from bot.ensemble.ensemble_voting import TradeSignal
@@ -32,6 +32,8 @@ class StochasticStrategy(BaseStrategy):
         self.d_period = 3
         self.oversold = 20
         self.overbought = 80
+        
+        self.supports_vectorized = True
     
     async def generate_signal(self, market_data: pd.DataFrame) -> Optional[TradeSignal]:
         """Generate Stochastic signal"""
@@ -111,6 +113,21 @@ class StochasticStrategy(BaseStrategy):
         
         return None
     
+    def signals_vectorized(self, frame: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """%K/%D crossover signal of every bar"""
+        df = self.calculate_indicators(frame).reindex(frame.index)
+        k = df['stoch_k'].to_numpy()
+        d = df['stoch_d'].to_numpy()
+        prev_k = df['stoch_k'].shift(1).to_numpy()
+        prev_d = df['stoch_d'].shift(1).to_numpy()
+        
+        buy = (prev_k <= prev_d) & (k > d) & (k < self.oversold)
+        sell = (prev_k >= prev_d) & (k < d) & (k > self.overbought)
+        
+        factor = np.where(buy, (self.oversold - k) / self.oversold, (k - self.overbought) / (100 - self.overbought))
+        
+        return self._vector_signals(buy, sell, 0.6 + factor * 0.3, self.k_period + self.d_period)
+    
     def calculate_indicators(self, data: pd.DataFrame) -> pd.DataFrame:
         """Calculate Stochastic Oscillator"""
         
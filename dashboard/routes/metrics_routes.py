@@ -20,6 +20,8 @@ from .metrics_monitor import get_metrics_monitor, setup_metrics_for_app
 
 logger = logging.getLogger(__name__)
 
+EXECUTION_ANALYTICS_PATH = os.getenv('EXECUTION_ANALYTICS_PATH', 'data/execution_analytics.json')
+
 # Create blueprint
 metrics_bp = Blueprint('metrics', __name__, url_prefix='/api/metrics')
 
@@ -388,6 +390,40 @@ def get_websocket_metrics():
         return jsonify({'error': str(e)}), 500
 
 
+@metrics_bp.route('/execution', methods=['GET'])
+@login_required
+def get_execution_metrics():
+    """
+    Get execution quality distributions from the bot's analytics snapshot.
+    
+    Query params:
+    - dimension: all, symbol, strategy or order_type (default: all dimensions)
+    - key: Single symbol/strategy/order type within the dimension
+    
+    Returns count, mean, min, max and p50/p95/p99 of slippage (bps),
+    fill ratio, signal-to-fill latency (ms) and commission (bps).
+    """
+    try:
+        from bot.core.execution_analytics import DIMENSIONS, load_snapshot
+        
+        dimension = request.args.get('dimension')
+        if dimension is not None and dimension not in ('all',) + DIMENSIONS:
+            return jsonify({'error': 'Invalid dimension'}), 400
+        
+        analytics = load_snapshot(EXECUTION_ANALYTICS_PATH)
+        
+        return jsonify({
+            'success': True,
+            'execution': analytics.summary(dimension, request.args.get('key')),
+            'records': analytics.records,
+            'timestamp': datetime.now().isoformat()
+        })
+    
+    except Exception as e:
+        logger.error(f"Error getting execution metrics: {e}", exc_info=True)
+        return jsonify({'error': str(e)}), 500
+
+
 # ==================== ADMIN ENDPOINTS ====================
 
 @metrics_bp.route('/reset', methods=['POST'])
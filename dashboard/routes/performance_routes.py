@@ -14,13 +14,19 @@ Version: 1.0.0
 """
 
 import logging
+import os
 from flask import Blueprint, jsonify, request, render_template, session
 from functools import wraps
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
 import random
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Run directories written by BacktestRunner's results store
+BACKTEST_RESULTS_DIR = os.getenv('BACKTEST_RESULTS_DIR', 'data/backtest_results')
+
 # Create blueprint with url_prefix
 performance_bp = Blueprint('performance', __name__, url_prefix='/performance')
 
@@ -37,6 +43,18 @@ def login_required(f):
     return decorated_function
 
 
+def _stored_run(name: str):
+    """Memory-mapped results of a stored backtest run"""
+    from bot.backtesting.results_store import load_results
+    
+    # Only direct children of the results directory ('.', '..' and paths resolve elsewhere)
+    root = Path(BACKTEST_RESULTS_DIR).resolve()
+    path = (root / name).resolve() if name else root
+    if path.parent != root:
+        raise ValueError(f"Invalid backtest name: {name}")
+    return load_results(path)
+
+
 # ==================== UI ROUTES ====================
 
 @performance_bp.route('/', methods=['GET'])
@@ -51,8 +69,37 @@ def performance_ui():
 @performance_bp.route('/api/overview', methods=['GET'])
 @login_required
 def get_performance_overview():
-    """Get performance overview"""
+    """
+    Get performance overview
+    
+    Query params:
+    - backtest: Stored backtest run to summarize (default: simulated live data)
+    """
     try:
+        name = request.args.get('backtest')
+        if name:
+            run = _stored_run(name)
+            metrics = run.metrics
+            pnl = run.trades['pnl']
+            closed = pnl[~np.isnan(pnl)]
+            wins, losses = closed[closed > 0].sum(), -closed[closed < 0].sum()
+            overview = {
+                'total_return_pct': metrics.get('total_return_pct'),
+                'total_return_usd': metrics.get('final_equity', 0) - metrics.get('initial_capital', 0),
+                'sharpe_ratio': metrics.get('sharpe_ratio'),
+                'max_drawdown_pct': metrics.get('max_drawdown_pct'),
+                'win_rate': float(np.mean(closed > 0)) if len(closed) else 0.0,
+                'profit_factor': float(wins / losses) if losses > 0 else None,
+                'total_trades': int(metrics.get('total_trades', len(pnl))),
+                'complete': run.complete
+            }
+            return jsonify({
+                'success': True,
+                'backtest': name,
+                'overview': overview,
+                'timestamp': datetime.now().isoformat()
+            })
+        
         # Simulated performance data
         overview = {
             'total_return_pct': round(random.uniform(-10, 50), 2),
@@ -73,6 +120,12 @@ def get_performance_overview():
             'timestamp': datetime.now().isoformat()
         })
     
+    except FileNotFoundError as e:
+        return jsonify({'error': str(e)}), 404
+    
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
     except Exception as e:
         logger.error(f"Error getting performance overview: {e}", exc_info=True)
         return jsonify({'error': str(e)}), 500
@@ -81,10 +134,42 @@ def get_performance_overview():
 @performance_bp.route('/api/equity-curve', methods=['GET'])
 @login_required
 def get_equity_curve():
-    """Get equity curve data"""
+    """
+    Get equity curve data
+    
+    Query params:
+    - days: Lookback in days (default: 30)
+    - backtest: Stored backtest run to plot (default: simulated live data)
+    - start, end: Time range of a stored run (ISO dates)
+    - max_points: Points returned for a stored run (default: 1000)
+    """
     try:
         days = int(request.args.get('days', 30))
         
+        name = request.args.get('backtest')
+        if name:
+            run = _stored_run(name)
+            series = run.equity_curve(
+                start=request.args.get('start'),
+                end=request.args.get('end'),
+                max_points=int(request.args.get('max_points', 1000))
+            )
+            curve = [
+                {
+                    'date': datetime.fromtimestamp(ts, timezone.utc).isoformat() if np.isfinite(ts) else None,
+                    'equity': round(float(equity), 2),
+                    'drawdown_pct': round(float(drawdown) * 100, 2)
+                }
+                for ts, equity, drawdown in zip(series['timestamp'], series['equity'], series['drawdown'])
+            ]
+            return jsonify({
+                'success': True,
+                'backtest': name,
+                'equity_curve': curve,
+                'points': len(run.equity),
+                'timestamp': datetime.now().isoformat()
+            })
+        
         # Simulated equity curve
         curve = []
         base_value = 10000
@@ -107,11 +192,37 @@ def get_equity_curve():
             'timestamp': datetime.now().isoformat()
         })
     
+    except FileNotFoundError as e:
+        return jsonify({'error': str(e)}), 404
+    
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
     except Exception as e:
         logger.error(f"Error getting equity curve: {e}", exc_info=True)
         return jsonify({'error': str(e)}), 500
 
 
+@performance_bp.route('/api/backtests', methods=['GET'])
+@login_required
+def get_backtests():
+    """List stored backtest runs (manifests only)"""
+    try:
+        from bot.backtesting.results_store import list_results
+        
+        runs = list_results(BACKTEST_RESULTS_DIR)
+        return jsonify({
+            'success': True,
+            'backtests': runs,
+            'count': len(runs),
+            'timestamp': datetime.now().isoformat()
+        })
+    
+    except Exception as e:
+        logger.error(f"Error listing backtests: {e}", exc_info=True)
+        return jsonify({'error': str(e)}), 500
+
+
 @performance_bp.route('/api/monthly', methods=['GET'])
 @login_required
 def get_monthly_performance():
@@ -12,10 +12,14 @@ Version: 7.8
 from flask import Blueprint, render_template, request, jsonify, session
 from functools import wraps
 import logging
+import os
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+# Spill directory written by RiskManager's tiered history
+RISK_HISTORY_DIR = os.getenv('RISK_HISTORY_DIR', 'data/risk_history')
+
 risk_bp = Blueprint('risk', __name__, url_prefix='/risk')
 
 
@@ -293,4 +297,55 @@ def get_drawdown_analysis():
         }), 500
 
 
+@risk_bp.route('/api/history', methods=['GET'])
+@login_required
+def get_risk_history():
+    """
+    Get risk metrics history from the bot's tiered history store
+    
+    Query params:
+    - hours: Lookback in hours (default: 24)
+    - resolution: minute or hour (default: minute up to 48h, hour beyond)
+    - fields: Comma-separated metric names (default: all)
+    """
+    try:
+        from bot.core.risk_history import load_history
+        
+        hours = float(request.args.get('hours', 24))
+        resolution = request.args.get('resolution') or ('minute' if hours <= 48 else 'hour')
+        if resolution not in ('minute', 'hour'):
+            return jsonify({'success': False, 'error': 'Invalid resolution'}), 400
+        
+        start = datetime.now() - timedelta(hours=hours)
+        records = load_history(RISK_HISTORY_DIR, resolution, start=start)
+        
+        wanted = request.args.get('fields')
+        names = records.dtype.names
+        if wanted:
+            prefixes = tuple(f"{f.strip()}_" for f in wanted.split(','))
+            names = ['timestamp'] + [n for n in names if n.startswith(prefixes)]
+        
+        series = {
+            name: (
+                [datetime.fromtimestamp(ts).isoformat() for ts in records[name]]
+                if name == 'timestamp' else records[name].tolist()
+            )
+            for name in names
+        }
+        
+        return jsonify({
+            'success': True,
+            'resolution': resolution,
+            'count': int(len(records)),
+            'history': series
+        })
+        
+    except Exception as e:
+        logger.error(f"Error getting risk history: {e}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
 logger.info("Risk management routes initialized (v7.8)")
@@ -17,6 +17,8 @@ Version: 4.4.0
 import logging
 import json
 import copy
+import os
+import importlib
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
@@ -26,6 +28,15 @@ import threading
 
 logger = logging.getLogger(__name__)
 
+# OHLCV history used by quick backtests and sweeps (csv or parquet)
+BACKTEST_DATA_PATH = os.getenv('BACKTEST_DATA_PATH', 'data/ohlcv.csv')
+
+# Editor strategy name -> (module, class) of the backtestable implementation
+BACKTEST_STRATEGIES = {
+    'MACD': ('bot.strategies.macd_momentum', 'MACDMomentumStrategy'),
+    'Bollinger': ('bot.strategies.bollinger_bands', 'BollingerBandsStrategy'),
+}
+
 
 # ==================== ENUMS ====================
 
@@ -188,6 +199,10 @@ class StrategyEditor:
         self.config_dir = Path('config/strategies')
         self.config_dir.mkdir(parents=True, exist_ok=True)
         
+        # Backtest result cache (opened on first backtest)
+        self._result_cache = None
+        self._result_cache_opened = False
+        
         # Statistics
         self.stats = {
             'total_changes': 0,
@@ -682,37 +697,190 @@ class StrategyEditor:
         
         return 'Test the change with backtesting to evaluate impact'
     
-    def quick_backtest(self, strategy_name: str, days: int = 7) -> Dict[str, Any]:
+    def quick_backtest(self, strategy_name: str, days: int = 7, data=None) -> Dict[str, Any]:
         """Run quick backtest with current parameters
         
         Args:
             strategy_name: Name of the strategy
             days: Number of days to backtest
+            data: OHLCV DataFrame (default: last ``days`` of BACKTEST_DATA_PATH)
             
         Returns:
             Backtest results summary
         """
-        # Placeholder for actual backtesting integration
-        # This would call the backtesting engine with current parameters
+        from bot.backtesting import ParameterSweep
+        
+        strategy_class = self._strategy_class(strategy_name)
+        data = self._load_backtest_data(days) if data is None else data
+        params = dict(self.configurations[strategy_name].parameters)
+        config = self._backtest_config()
+        
+        with ParameterSweep(config, data, workers=1, cache=self._backtest_cache(config)) as sweep:
+            result = next(sweep.run(strategy_class, [params]))
         
         self.stats['backtests_run'] += 1
         
-        # Mock results for demonstration
+        start_date, end_date = self._data_bounds(data, days)
+        summary = {
+            'strategy_name': strategy_name,
+            'period': f'Last {days} days',
+            'start_date': start_date,
+            'end_date': end_date,
+            **self._summarize(result.metrics),
+            'status': 'failed' if result.error else 'completed'
+        }
+        if result.error:
+            summary['error'] = result.error
+        
+        return summary
+    
+    def sweep_parameters(self,
+                         strategy_name: str,
+                         method: str = 'grid',
+                         samples: int = 50,
+                         days: int = 30,
+                         metric: str = 'sharpe_ratio',
+                         workers: Optional[int] = None,
+                         data=None,
+                         seed: Optional[int] = None,
+                         top: int = 10) -> Dict[str, Any]:
+        """Backtest a strategy over its parameter ranges
+        
+        Args:
+            strategy_name: Name of the strategy
+            method: grid, random or bayesian
+            samples: Combinations for random / iterations for bayesian
+            days: Number of days to backtest
+            metric: Result metric to rank by
+            workers: Worker processes (default: CPU count)
+            data: OHLCV DataFrame (default: last ``days`` of BACKTEST_DATA_PATH)
+            seed: Sampling seed
+            top: Number of ranked results returned
+            
+        Returns:
+            Ranked results and best parameters
+        """
+        from bot.backtesting import ParameterSweep
+        
+        if method not in ('grid', 'random', 'bayesian'):
+            raise ValueError(f"Unknown sweep method: {method}")
+        
+        strategy_class = self._strategy_class(strategy_name)
+        space = self._parameter_space(strategy_name)
+        data = self._load_backtest_data(days) if data is None else data
+        config = self._backtest_config()
+        
+        with ParameterSweep(config, data, workers=workers, metric=metric, cache=self._backtest_cache(config)) as sweep:
+            if method == 'bayesian':
+                stream = sweep.bayesian(strategy_class, space, n_iter=samples, seed=seed)
+            else:
+                combinations = sweep.grid(space) if method == 'grid' else sweep.random(space, samples, seed)
+                stream = sweep.run(strategy_class, combinations)
+            
+            results = []
+            for result in stream:
+                results.append(result)
+                if len(results) % 25 == 0:
+                    logger.info(f"Sweep {strategy_name}: {len(results)} combinations done")
+            
+            ranked = sweep.best(results, top)
+            statistics = sweep.get_statistics()
+        
+        self.stats['backtests_run'] += len(results)
+        
+        start_date, end_date = self._data_bounds(data, days)
         return {
             'strategy_name': strategy_name,
+            'method': method,
+            'metric': metric,
             'period': f'Last {days} days',
-            'start_date': (datetime.now() - timedelta(days=days)).isoformat(),
-            'end_date': datetime.now().isoformat(),
-            'total_trades': 15,
-            'winning_trades': 10,
-            'losing_trades': 5,
-            'win_rate': 66.67,
-            'total_return': 3.45,
-            'sharpe_ratio': 1.85,
-            'max_drawdown': -2.10,
+            'start_date': start_date,
+            'end_date': end_date,
+            'combinations': len(results),
+            'failed': statistics['failed'],
+            'best_parameters': ranked[0].params if ranked else None,
+            'results': [
+                {'parameters': r.params, **self._summarize(r.metrics)} for r in ranked
+            ],
             'status': 'completed'
         }
     
+    def _strategy_class(self, strategy_name: str):
+        """Backtestable strategy class for an editor strategy"""
+        if strategy_name not in self.strategies:
+            raise ValueError(f"Strategy {strategy_name} not found")
+        if strategy_name not in BACKTEST_STRATEGIES:
+            raise ValueError(f"Strategy {strategy_name} has no backtest implementation")
+        
+        module_name, class_name = BACKTEST_STRATEGIES[strategy_name]
+        return getattr(importlib.import_module(module_name), class_name)
+    
+    def _parameter_space(self, strategy_name: str) -> List:
+        """Parameter definitions as sweep ranges"""
+        from bot.backtesting import ParameterRange
+        
+        space = []
+        for name, param in self.strategies[strategy_name].items():
+            if param.type == ParameterType.INTEGER:
+                space.append(ParameterRange(name, 'int', param.min_value, param.max_value, param.step))
+            elif param.type == ParameterType.FLOAT:
+                space.append(ParameterRange(name, 'float', param.min_value, param.max_value, param.step))
+            elif param.type == ParameterType.BOOLEAN:
+                space.append(ParameterRange(name, 'choice', choices=[False, True]))
+            elif param.type == ParameterType.ENUM:
+                space.append(ParameterRange(name, 'choice', choices=list(param.enum_values)))
+        return space
+    
+    def _backtest_config(self):
+        """Bot configuration for backtests"""
+        from bot.config.config_manager import ConfigManager
+        return ConfigManager()
+    
+    def _backtest_cache(self, config):
+        """Result cache for repeated backtests (None when disabled in config)"""
+        if not self._result_cache_opened:
+            from bot.backtesting import ResultCache
+            self._result_cache = ResultCache.from_config(config)
+            self._result_cache_opened = True
+        return self._result_cache
+    
+    def _load_backtest_data(self, days: int):
+        """Last ``days`` of the OHLCV history"""
+        import pandas as pd
+        
+        path = Path(BACKTEST_DATA_PATH)
+        if not path.exists():
+            raise FileNotFoundError(f"Backtest data not found: {path}")
+        
+        data = pd.read_parquet(path) if path.suffix == '.parquet' else pd.read_csv(path)
+        if 'timestamp' in data.columns:
+            data['timestamp'] = pd.to_datetime(data['timestamp'])
+            data = data[data['timestamp'] >= data['timestamp'].max() - timedelta(days=days)]
+        
+        return data.reset_index(drop=True)
+    
+    @staticmethod
+    def _data_bounds(data, days: int) -> Tuple[str, str]:
+        """Start and end of the backtested data"""
+        if 'timestamp' in data.columns and len(data):
+            return data['timestamp'].iloc[0].isoformat(), data['timestamp'].iloc[-1].isoformat()
+        return (datetime.now() - timedelta(days=days)).isoformat(), datetime.now().isoformat()
+    
+    @staticmethod
+    def _summarize(metrics: Dict[str, float]) -> Dict[str, Any]:
+        """Dashboard summary of backtest metrics"""
+        round_trips = int(metrics.get('round_trips', 0))
+        winning = int(metrics.get('winning_trades', 0))
+        return {
+            'total_trades': int(metrics.get('total_trades', 0)),
+            'winning_trades': winning,
+            'losing_trades': round_trips - winning,
+            'win_rate': round(metrics.get('win_rate', 0.0) * 100, 2),
+            'total_return': round(metrics.get('total_return_pct', 0.0), 2),
+            'sharpe_ratio': round(metrics.get('sharpe_ratio', 0.0), 2),
+            'max_drawdown': round(metrics.get('max_drawdown_pct', 0.0), 2)
+        }
+    
     def get_statistics(self) -> Dict[str, Any]:
         """Get editor statistics
         
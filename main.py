@@ -68,12 +68,15 @@ from bot.core.risk_manager import RiskManager, CircuitBreaker
 from bot.core.state_manager import StateManager
 from bot.core.liquidation_detector import LiquidationDetector
 from bot.core.execution_engine import ExecutionEngine
+from bot.core.order_events import OrderEvent, build_user_stream
+from bot.core.rate_governor import configure_rate_governor
 from bot.data.data_validator import DataValidator
 from bot.data.normalization_pipeline import NormalizationPipeline
 from bot.data.exchange_connector import ExchangeConnector
 from bot.ensemble.adaptive_allocation import AdaptiveAllocationEngine
 from bot.ensemble.correlation_manager import CorrelationManager
 from bot.ensemble.ensemble_voting import EnsembleVoting
+from bot.ensemble.portfolio_construction import PortfolioConstructor
 from bot.strategies.base_strategy import load_all_strategies
 from bot.backtesting.realistic_simulator import RealisticSimulator
 from bot.utils.secrets_manager import get_secrets_manager
@@ -160,6 +163,9 @@ class BotV2:
     def _init_components(self):
         """Initialize all system components"""
         
+        # Shared per-exchange request budget, picked up by every connector below
+        configure_rate_governor(self.config)
+        
         # Round 1: Foundation (Data & Risk)
         logger.info("Initializing Round 1: Foundation components...")
         self.data_validator = DataValidator(
@@ -180,7 +186,9 @@ class BotV2:
         logger.info("Initializing Round 2: Intelligence components...")
         self.allocation_engine = AdaptiveAllocationEngine(
             rebalance_freq=self.config.get('ensemble.adaptive_allocation.rebalance_frequency', 'daily'),
-            smoothing_alpha=self.config.get('ensemble.adaptive_allocation.smoothing_alpha', 0.7)
+            smoothing_alpha=self.config.get('ensemble.adaptive_allocation.smoothing_alpha', 0.7),
+            lookback_days=self.config.get('ensemble.adaptive_allocation.lookback_days', 20),
+            drift_threshold=self.config.get('ensemble.adaptive_allocation.drift_threshold', 0.05)
         )
         self.correlation_manager = CorrelationManager(
             threshold=self.config.risk.correlation_threshold,
@@ -190,6 +198,15 @@ class BotV2:
             method=self.config.get('ensemble.voting_method', 'weighted_average'),
             confidence_threshold=self.config.get('ensemble.confidence_threshold', 0.5)
         )
+        self.portfolio_constructor = PortfolioConstructor(
+            max_position_size=self.config.trading.max_position_size,
+            min_position_size=self.config.trading.min_position_size,
+            max_open_positions=self.config.trading.max_open_positions,
+            kelly_fraction=self.config.risk.kelly['fraction'],
+            min_probability=self.config.risk.kelly['min_probability'],
+            max_gross_exposure=self.config.get('ensemble.portfolio_construction.max_gross_exposure', 1.0),
+            correlation_shrinkage=self.config.get('ensemble.portfolio_construction.correlation_shrinkage', 0.1)
+        )
         
         # Round 3: Execution (Realistic)
         logger.info("Initializing Round 3: Execution components...")
@@ -198,8 +215,14 @@ class BotV2:
             lookback_window=self.config.get('liquidation_detection.lookback_window', 300)
         )
         self.execution_engine = ExecutionEngine(self.config)
+        self.execution_engine.add_fill_listener(self._on_scheduled_fill)
         self.simulator = RealisticSimulator(self.config)
         
+        # Exchange fills drive the portfolio when a user stream is configured
+        self.user_stream = build_user_stream(self.config)
+        if self.user_stream is not None:
+            self.user_stream.add_listener(self._on_order_event)
+        
         # Phase 1: Exchange Integration
         logger.info("Initializing Phase 1: Exchange connectors...")
         self.exchange_connector = ExchangeConnector(self.config)
@@ -243,6 +266,7 @@ class BotV2:
             for symbol, data in market_data.items():
                 processed_data[symbol] = {
                     'timestamp': data.timestamp,
+                    'symbol': data.symbol,
                     'open': data.open,
                     'high': data.high,
                     'low': data.low,
@@ -250,7 +274,10 @@ class BotV2:
                     'volume': data.volume,
                     'bid': data.bid,
                     'ask': data.ask,
-                    'exchange': data.exchange
+                    'bid_volume': data.bid_volume,
+                    'ask_volume': data.ask_volume,
+                    'exchange': data.exchange,
+                    'latency_ms': data.latency_ms
                 }
             
             return processed_data
@@ -270,9 +297,9 @@ class BotV2:
         4. Generate Strategy Signals
         5. Adaptive Allocation
         6. Correlation Management
-        7. Ensemble Voting
-        8. Position Sizing
-        9. Execute Trade
+        7. Ensemble Voting (per symbol)
+        8. Portfolio Construction (joint sizing)
+        9. Execute Order Batch
         10. Update Portfolio
         11. Persist State
         12. Performance Reporting
@@ -284,6 +311,9 @@ class BotV2:
         logger.info(f"{TARGET} Starting main trading loop...")
         logger.info("=" * 70)
         
+        if self.user_stream is not None:
+            await self.user_stream.start()
+        
         while self.is_running and not self.shutdown_requested:
             self.iteration += 1
             loop_start = datetime.now()
@@ -298,6 +328,9 @@ class BotV2:
                     await asyncio.sleep(self.config.trading.trading_interval)
                     continue
                 
+                # Scheduled child orders fill against the latest prices; venue quotes feed routing
+                self.execution_engine.update_market_data(raw_data)
+                
                 # ===== PHASE 2: DATA VALIDATION =====
                 logger.debug(f"[{self.iteration}] Phase 2: Validating data")
                 validation_result = self.data_validator.validate_market_data(raw_data)
@@ -338,9 +371,12 @@ class BotV2:
                 # ===== PHASE 5: PRE-TRADE RISK CHECK =====
                 logger.debug(f"[{self.iteration}] Phase 5: Pre-trade risk check")
                 
-                # Update risk metrics
+                # Update risk metrics (VaR/CVaR over current positions)
+                self.risk_manager.update_prices({
+                    symbol: data['close'] for symbol, data in raw_data.items()
+                })
                 current_equity = self.portfolio['equity']
-                self.risk_manager.update_metrics(current_equity)
+                self.risk_manager.update_metrics(current_equity, self.portfolio['positions'])
                 
                 # Check circuit breaker
                 daily_dd = self.risk_manager.get_daily_drawdown()
@@ -377,6 +413,8 @@ class BotV2:
                 # ===== PHASE 7: ADAPTIVE ALLOCATION =====
                 logger.debug(f"[{self.iteration}] Phase 7: Computing adaptive weights")
                 
+                self.allocation_engine.update_performance(strategy_performance)
+                
                 if self.allocation_engine.should_rebalance():
                     weights = self.allocation_engine.calculate_weights(strategy_performance)
                     logger.debug(f"Rebalanced weights: Top 3 = {list(weights.items())[:3]}")
@@ -401,74 +439,70 @@ class BotV2:
                 # ===== PHASE 9: ENSEMBLE VOTING =====
                 logger.debug(f"[{self.iteration}] Phase 9: Ensemble voting")
                 
-                final_signal = self.ensemble_voting.vote(adjusted_signals, weights)
+                decisions = self.ensemble_voting.vote_by_symbol(adjusted_signals, weights)
                 
-                if final_signal is None:
+                if not decisions:
                     logger.info("Ensemble voting produced no signal")
                     await asyncio.sleep(self.config.trading.trading_interval)
                     continue
                 
-                if final_signal.confidence < self.config.get('ensemble.confidence_threshold', 0.5):
-                    logger.info(f"Ensemble confidence too low: {final_signal.confidence:.2%}")
-                    continue
-                
-                logger.info(
-                    f"{TARGET} Ensemble Signal: {final_signal.action} "
-                    f"@ {final_signal.confidence:.2%} confidence"
-                )
-                
-                # ===== PHASE 10: POSITION SIZING =====
-                logger.debug(f"[{self.iteration}] Phase 10: Position sizing")
+                for symbol, decision in decisions.items():
+                    logger.info(
+                        f"{TARGET} Ensemble Signal: {decision.action} {symbol} "
+                        f"@ {decision.confidence:.2%} confidence"
+                    )
                 
-                # Kelly-Modified sizing
-                base_size = self.risk_manager.compute_kelly_fraction(
-                    win_probability=final_signal.confidence,
-                    capital=self.portfolio['cash']
-                )
+                # ===== PHASE 10: PORTFOLIO CONSTRUCTION =====
+                logger.debug(f"[{self.iteration}] Phase 10: Portfolio construction")
                 
-                # Correlation-aware adjustment
+                # Correlation-aware and circuit breaker size multipliers
                 correlation_factor = self.correlation_manager.get_correlation_factor(portfolio_corr)
-                adjusted_size = base_size * correlation_factor
-                
-                # Circuit breaker size multiplier
                 cb_multiplier = self.circuit_breaker.get_size_multiplier()
-                final_size = adjusted_size * cb_multiplier
                 
-                # Apply hard limits
-                final_size = self.risk_manager.apply_limits(final_size)
+                prices = {symbol: data['close'] for symbol, data in raw_data.items()}
+                # Cash committed to working child orders is not available
+                pending_buys = self.execution_engine.scheduler.pending_value('BUY')
+                orders = self.portfolio_constructor.construct(
+                    decisions,
+                    {**self.portfolio, 'cash': self.portfolio['cash'] - pending_buys},
+                    prices,
+                    correlation=self.risk_manager.risk_engine.correlation_matrix(list(decisions)),
+                    size_multiplier=correlation_factor * cb_multiplier
+                )
                 
                 logger.info(
-                    f"Position sizing: Kelly={base_size:.4f} -> "
-                    f"Corr-adj={adjusted_size:.4f} -> "
-                    f"CB-adj={final_size:.4f}"
+                    f"Portfolio construction: {len(decisions)} decisions -> {len(orders)} orders "
+                    f"(Corr-adj={correlation_factor:.2f}, CB-adj={cb_multiplier:.2f})"
                 )
                 
-                # ===== PHASE 11: EXECUTE TRADE =====
-                logger.debug(f"[{self.iteration}] Phase 11: Executing trade")
+                # ===== PHASE 11: EXECUTE ORDER BATCH =====
+                logger.debug(f"[{self.iteration}] Phase 11: Executing {len(orders)} orders")
                 
-                if final_size > 0:
-                    trade_result = await self.execution_engine.execute_trade(
-                        symbol=final_signal.symbol,
-                        action=final_signal.action,
-                        size=final_size,
-                        portfolio=self.portfolio
-                    )
+                if orders:
+                    results = await self.execution_engine.execute_batch(orders, raw_data, self.portfolio)
                     
-                    if trade_result.get('success'):
-                        # Update portfolio
-                        self._update_portfolio(trade_result)
-                        
-                        # Record trade
-                        self.trade_history.append(trade_result)
-                        
-                        logger.info(
-                            f"{DONE} Trade executed: {final_signal.action} {final_size:.4f} "
-                            f"{final_signal.symbol} @ {trade_result.get('price', 0):.2f}"
-                        )
-                    else:
-                        logger.warning(f"{WARN} Trade execution failed: {trade_result.get('error')}")
+                    for order, trade_result in zip(orders, results):
+                        if trade_result.get('executed'):
+                            trade_result['size'] = trade_result.get('shares', 0)
+                            
+                            # Update portfolio (from fill events when streaming)
+                            if self.user_stream is None:
+                                self._update_portfolio(trade_result)
+                            
+                            # Record trade
+                            self.trade_history.append(trade_result)
+                            
+                            logger.info(
+                                f"{DONE} Trade executed: {order.action} {order.size:.4f} "
+                                f"{order.symbol} @ {trade_result.get('price', 0):.2f}"
+                            )
+                        else:
+                            logger.warning(
+                                f"{WARN} Trade execution failed: {order.symbol} "
+                                f"{trade_result.get('reason')}"
+                            )
                 else:
-                    logger.info("Position size too small, skipping trade")
+                    logger.info("Position sizes too small, skipping trades")
                 
                 # ===== PHASE 12: PERSIST STATE & REPORT =====
                 logger.debug(f"[{self.iteration}] Phase 12: Persisting state")
@@ -503,6 +537,32 @@ class BotV2:
         # Cleanup on exit
         await self._cleanup()
     
+    def _on_scheduled_fill(self, fill: Dict):
+        """Apply an asynchronous child order fill to the portfolio"""
+        if self.user_stream is None:
+            self._update_portfolio(fill)
+        self.trade_history.append(fill)
+        
+        logger.info(
+            f"{DONE} Slice filled: {fill['action']} {fill['shares']:.6f} "
+            f"{fill['symbol']} @ {fill['price']:.2f} "
+            f"({fill['parent_id']}, {fill['parent_status']})"
+        )
+    
+    def _on_order_event(self, event: OrderEvent):
+        """Apply an exchange fill event to the portfolio"""
+        if not event.is_fill or event.last_qty <= 0:  # Status change without a new fill
+            logger.info(f"Order {event.order_id} {event.event_type.value} ({event.exchange} {event.symbol})")
+            return
+        
+        fill = event.to_fill()
+        self._update_portfolio(fill)
+        
+        logger.info(
+            f"{DONE} Exchange fill: {fill['action']} {fill['size']:.6f} {fill['symbol']} "
+            f"@ {fill['price']:.2f} ({event.event_type.value}, {event.latency_ms:.0f}ms)"
+        )
+    
     def _update_portfolio(self, trade_result: Dict):
         """Update portfolio with trade result"""
         symbol = trade_result['symbol']
@@ -608,6 +668,14 @@ class BotV2:
         logger.info(f"\n{SHIELD} Performing cleanup...")
         
         try:
+            # Stop order pacing (cancels unfilled slices)
+            await self.execution_engine.shutdown()
+            logger.info(f"{OK} Child order scheduler stopped")
+            
+            if self.user_stream is not None:
+                await self.user_stream.stop()
+                logger.info(f"{OK} User data stream stopped")
+            
             # Close exchange connections
             await self.exchange_connector.close()
             logger.info(f"{OK} Exchange connections closed")
@@ -623,6 +691,10 @@ class BotV2:
             })
             logger.info(f"{OK} Final state saved")
             
+            # Write the open risk history buckets to disk
+            self.risk_manager.history.flush()
+            logger.info(f"{OK} Risk history flushed")
+            
             # Clear secrets cache
             get_secrets_manager().clear_cache()
             logger.info(f"{OK} Secrets cache cleared")
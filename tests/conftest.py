@@ -19,6 +19,10 @@ from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict, List, Generator, Any
 import secrets
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
 
 # Flask imports
 try:
@@ -356,6 +360,50 @@ def mock_ohlcv_data() -> List[Dict]:
     return data
 
 
+def make_ohlcv(n: int = 1500, seed: int = 2, start: str = '2024-01-01') -> pd.DataFrame:
+    """Hourly random-walk OHLCV frame for the backtesters"""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    open_ = close * (1 + rng.normal(0, 0.003, n))
+    return pd.DataFrame({
+        'timestamp': pd.date_range(start, periods=n, freq='h'),
+        'open': open_,
+        'high': np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.01, n))),
+        'low': np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.01, n))),
+        'close': close,
+        'volume': rng.lognormal(12, 1, n)
+    })
+
+
+class BacktestConfig:
+    """Picklable backtest configuration for pool workers"""
+    
+    execution = SimpleNamespace(
+        slippage_model='conservative',
+        market_impact_percent=0.001,
+        commission_percent=0.001,
+        simulation={}
+    )
+    
+    def __init__(self, initial_capital: float = 3000, **backtesting):
+        self.sections = {'backtesting': {'initial_capital': initial_capital, **backtesting}}
+    
+    def get(self, key, default=None):
+        return self.sections.get(key, default)
+
+
+@pytest.fixture
+def ohlcv_frame() -> pd.DataFrame:
+    """Backtester OHLCV frame (see make_ohlcv)"""
+    return make_ohlcv()
+
+
+@pytest.fixture
+def backtest_config() -> BacktestConfig:
+    """Picklable backtest configuration"""
+    return BacktestConfig()
+
+
 @pytest.fixture
 def mock_annotation_data() -> Dict:
     """Mock chart annotation data"""
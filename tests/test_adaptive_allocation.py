@@ -0,0 +1,143 @@
+"""
+Unit Tests for Adaptive Allocation Engine
+Tests running moments, incremental weight updates and event-driven rebalancing
+"""
+
+import pytest
+import numpy as np
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bot.ensemble.adaptive_allocation import AdaptiveAllocationEngine, RunningMoments
+
+
+@pytest.fixture
+def engine():
+    """Create allocation engine"""
+    return AdaptiveAllocationEngine(rebalance_freq="daily", drift_threshold=0.05)
+
+
+def make_performance(returns_by_strategy):
+    """Build a performance snapshot in the format produced by strategies"""
+    return {
+        name: {'returns': list(returns[-20:]), 'trades': len(returns)}
+        for name, returns in returns_by_strategy.items()
+    }
+
+
+class TestRunningMoments:
+    """Test rolling moments"""
+    
+    def test_matches_numpy_over_window(self):
+        """Window mean/std match a full recomputation"""
+        rng = np.random.default_rng(1)
+        values = rng.normal(0.001, 0.02, 100)
+        
+        moments = RunningMoments(window=20)
+        for v in values:
+            moments.push(v)
+        
+        assert moments.count == 20
+        assert moments.total_seen == 100
+        assert moments.mean == pytest.approx(np.mean(values[-20:]))
+        assert moments.std == pytest.approx(np.std(values[-20:]))
+    
+    def test_sharpe_matches_engine_definition(self, engine):
+        """Running Sharpe equals the list-based Sharpe"""
+        values = [0.01, -0.005, 0.02, 0.003, -0.01, 0.015]
+        moments = RunningMoments(window=20)
+        for v in values:
+            moments.push(v)
+        
+        assert moments.sharpe() == pytest.approx(engine._calculate_sharpe(values))
+    
+    def test_page_hinkley_detects_mean_shift(self):
+        """A sustained change in mean raises a drift alarm"""
+        moments = RunningMoments(window=20)
+        alarms = [moments.push(0.001) for _ in range(50)]
+        assert not any(alarms)
+        
+        alarms = [moments.push(-0.03) for _ in range(10)]
+        assert any(alarms)
+
+
+class TestAdaptiveAllocationEngine:
+    """Test allocation engine"""
+    
+    def test_weights_sum_to_one(self, engine):
+        """Weights are normalized and within constraints"""
+        rng = np.random.default_rng(2)
+        perf = make_performance({
+            f"s{i}": list(rng.normal(0.001 * i, 0.01, 30)) for i in range(8)
+        })
+        
+        weights = engine.calculate_weights(perf)
+        
+        assert sum(weights.values()) == pytest.approx(1.0)
+        assert all(w > 0 for w in weights.values())
+    
+    def test_only_new_returns_are_ingested(self, engine):
+        """The trades counter drives incremental ingestion"""
+        returns = [0.01, -0.01, 0.02]
+        engine.calculate_weights(make_performance({'a': returns}))
+        assert engine.moments['a'].total_seen == 3
+        
+        returns = returns + [0.005, 0.004]
+        engine.update_performance(make_performance({'a': returns}))
+        assert engine.moments['a'].total_seen == 5
+        
+        # Same snapshot again adds nothing
+        engine.update_performance(make_performance({'a': returns}))
+        assert engine.moments['a'].total_seen == 5
+    
+    def test_no_rebalance_right_after_allocation(self, engine):
+        """Clock, drift and events are all quiet after a rebalance"""
+        engine.calculate_weights(make_performance({
+            'a': [0.01, 0.02, -0.01], 'b': [0.0, 0.01, 0.005]
+        }))
+        
+        assert engine.get_weight_drift() == 0.0
+        assert not engine.should_rebalance()
+    
+    def test_weight_drift_triggers_rebalance(self):
+        """Large target change triggers an early rebalance"""
+        engine = AdaptiveAllocationEngine(drift_threshold=0.01)
+        names = [f"s{i}" for i in range(6)]
+        engine.calculate_weights(make_performance({n: [0.001, -0.001, 0.0005] for n in names}))
+        assert not engine.should_rebalance()
+        
+        for _ in range(10):
+            engine.record_return('s0', 0.05)
+            engine.record_return('s1', -0.05)
+        
+        assert engine.get_weight_drift() > 0.01
+        assert engine.should_rebalance()
+    
+    def test_drift_event_triggers_rebalance(self, engine):
+        """An external drift-detector event forces a rebalance"""
+        engine.calculate_weights(make_performance({'a': [0.01, 0.02]}))
+        assert not engine.should_rebalance()
+        
+        engine.notify_drift('a', reason='regime_change')
+        assert engine.should_rebalance()
+        
+        engine.calculate_weights(make_performance({'a': [0.01, 0.02]}))
+        assert not engine.should_rebalance()
+    
+    def test_weight_history_is_bounded(self):
+        """History keeps at most history_size snapshots"""
+        engine = AdaptiveAllocationEngine(history_size=5)
+        for i in range(12):
+            engine.calculate_weights(make_performance({'a': [0.01] * (i + 2), 'b': [0.0, 0.01]}))
+        
+        history = engine.get_weight_history(limit=50)
+        assert len(history) == 5
+        assert set(history[-1]['weights']) == {'a', 'b'}
+        
+        timestamps, weights, names = engine.get_weight_history_array()
+        assert weights.shape == (5, 2)
+        assert weights.dtype == np.float32
+        assert names == ['a', 'b']
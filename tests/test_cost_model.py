@@ -0,0 +1,102 @@
+"""
+Unit Tests for the Shared Cost Model
+Tests vectorized estimates, presets, seeding and the components using it
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bot.core.cost_model import CostModel
+from bot.core.order_optimizer_config import get_optimizer_for_exchange
+from bot.backtesting.realistic_simulator import RealisticSimulator
+
+
+def make_config(slippage_model='realistic', seed=7):
+    config = Mock()
+    config.execution.slippage_model = slippage_model
+    config.execution.market_impact_percent = 0.001
+    config.execution.commission_percent = 0.0005
+    config.execution.simulation = {}
+    config.get = lambda key, default=None: {'execution.cost_model': {'seed': seed}}.get(key, default)
+    return config
+
+
+class TestCostModel:
+    """Test vectorized cost estimates"""
+    
+    def test_batch_matches_scalar(self):
+        model = CostModel.preset('realistic', 0.001)
+        sides = np.array(['BUY', 'SELL', 'BUY'])
+        sizes = np.array([0.01, 0.05, 0.2])
+        vols = np.array([0.01, 0.02, 0.05])
+        
+        batch = model.estimate(sides, sizes, vols, randomize=False)
+        for i in range(3):
+            single = model.estimate(sides[i], sizes[i], vols[i], randomize=False)
+            assert batch.slippage[i] == pytest.approx(single.slippage[0])
+        
+        # 0.0015 + 0.01*size + 0.5*vol + 0.001
+        assert batch.slippage[0] == pytest.approx(0.0015 + 0.0001 + 0.005 + 0.001)
+    
+    def test_execution_prices_signed(self):
+        estimate = CostModel.preset('conservative').estimate(['BUY', 'SELL'], 0.1)
+        
+        np.testing.assert_allclose(estimate.execution_prices(100.0), [100.1, 99.9])
+    
+    def test_seeded_noise_reproducible(self):
+        a = CostModel.preset('realistic', seed=3).estimate('BUY', np.full(1000, 0.05))
+        b = CostModel.preset('realistic', seed=3).estimate('BUY', np.full(1000, 0.05))
+        
+        np.testing.assert_array_equal(a.slippage, b.slippage)
+        expected = CostModel.preset('realistic').estimate('BUY', 0.05, randomize=False).slippage[0]
+        assert a.slippage.min() >= expected * 0.8 - 1e-12
+        assert a.slippage.max() <= expected * 1.2 + 1e-12
+    
+    def test_optimizer_preset(self):
+        """Optimizer estimate: size in EUR, capped at 10k, liquidity penalty"""
+        model = CostModel.for_optimizer()
+        slippage = model.estimate('BUY', [5000.0, 50000.0], 0.02, liquidity_rank=5, randomize=False).slippage
+        
+        np.testing.assert_allclose(slippage, [0.0005 + 0.001 + 0.001 + 0.01, 0.0005 + 0.002 + 0.001 + 0.01])
+
+
+class TestSharedModel:
+    """Test the components pricing through the shared model"""
+    
+    def test_optimizer_uses_model(self):
+        optimizer = get_optimizer_for_exchange('binance')
+        expected = optimizer.cost_model.slippage('BUY', 2000.0, 0.03, liquidity_rank=2, randomize=False)
+        
+        assert optimizer._estimate_slippage('BUY', 2000.0, 100.0, 0.03, 2) == pytest.approx(expected)
+    
+    def test_simulator_fill(self):
+        simulator = RealisticSimulator(make_config())
+        data = pd.DataFrame({'close': np.linspace(100, 110, 30)})
+        
+        execution = simulator.simulate_trade('BUY', 1000.0, 110.0, data, portfolio_value=10000.0)
+        
+        assert execution['executed']
+        assert execution['execution_price'] > 110.0
+        assert execution['commission'] == pytest.approx(0.5)
+        assert execution['total_cost'] == pytest.approx(1000.5)
+        assert simulator.get_statistics()['total_trades'] == 1
+    
+    def test_simulator_partial_fill(self):
+        simulator = RealisticSimulator(make_config())
+        data = pd.DataFrame({'close': np.full(30, 100.0)})
+        
+        execution = simulator.simulate_trade('SELL', 80000.0, 100.0, data)
+        
+        assert execution['size_filled'] == pytest.approx(50000.0)
+        assert execution['execution_price'] < 100.0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
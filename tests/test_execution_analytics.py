@@ -0,0 +1,118 @@
+"""
+Unit Tests for Execution Quality Analytics
+Tests HDR histogram quantiles, mergeable snapshots and engine recording
+"""
+
+import pytest
+import asyncio
+import numpy as np
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bot.core.execution_analytics import ExecutionAnalytics, HdrHistogram, load_snapshot
+from bot.core.execution_engine import ExecutionEngine
+from bot.ensemble.ensemble_voting import TradeSignal
+
+
+class TestHdrHistogram:
+    """Test the log-bucketed histogram"""
+    
+    def test_quantiles_within_precision(self):
+        values = np.random.default_rng(1).lognormal(2.0, 1.0, 20000)
+        hist = HdrHistogram(0.01, 1e6, precision=0.01)
+        for v in values:
+            hist.record(v)
+        
+        result = hist.percentiles((50, 95, 99))
+        for q in (50, 95, 99):
+            assert result[q] == pytest.approx(np.percentile(values, q), rel=0.015)
+    
+    def test_signed_values(self):
+        """Negative slippage (price improvement) sorts below zero"""
+        hist = HdrHistogram()
+        for v in [-5.0, -1.0, 0.0, 2.0, 10.0]:
+            hist.record(v)
+        
+        assert hist.percentile(10) == pytest.approx(-5.0, rel=0.01)
+        assert hist.percentile(50) == 0.0
+        assert hist.percentile(100) == pytest.approx(10.0, rel=0.01)
+        assert hist.min == -5.0 and hist.max == 10.0
+    
+    def test_merge_and_roundtrip(self):
+        a, b = HdrHistogram(), HdrHistogram()
+        for v in range(1, 51):
+            a.record(float(v))
+        for v in range(51, 101):
+            b.record(float(v))
+        a.merge(HdrHistogram.from_dict(b.to_dict()))
+        
+        assert a.count == 100
+        assert a.mean == pytest.approx(50.5)
+        assert a.percentile(50) == pytest.approx(50.0, rel=0.01)
+    
+    def test_merge_rejects_different_layout(self):
+        with pytest.raises(ValueError):
+            HdrHistogram(precision=0.01).merge(HdrHistogram(precision=0.02))
+
+
+class TestExecutionAnalytics:
+    """Test grouping, snapshots and engine integration"""
+    
+    def test_groups_by_dimension(self):
+        analytics = ExecutionAnalytics()
+        analytics.record('BTC/EUR', 'momentum', 'market', slippage_bps=5.0, fill_ratio=1.0)
+        analytics.record('ETH/EUR', 'momentum', 'limit', slippage_bps=-1.0, fill_ratio=0.5)
+        
+        summary = analytics.summary()
+        assert summary['all']['all']['slippage_bps']['count'] == 2
+        assert summary['strategy']['momentum']['fill_ratio']['count'] == 2
+        assert summary['symbol']['ETH/EUR']['slippage_bps']['p50'] == pytest.approx(-1.0, rel=0.01)
+        assert 'latency_ms' not in summary['order_type']['limit']
+    
+    def test_snapshot_file_merges(self, tmp_path):
+        path = tmp_path / 'analytics.json'
+        first = ExecutionAnalytics(snapshot_path=path)
+        first.record('BTC/EUR', 'a', 'market', latency_ms=10.0)
+        first.flush()
+        
+        second = ExecutionAnalytics()
+        second.record('BTC/EUR', 'b', 'market', latency_ms=30.0)
+        
+        merged = load_snapshot(path)
+        merged.merge(second)
+        
+        latency = merged.summary('symbol', 'BTC/EUR')['symbol']['BTC/EUR']['latency_ms']
+        assert latency['count'] == 2
+        assert latency['max'] == pytest.approx(30.0)
+        assert merged.records == 2
+    
+    def test_engine_records_fills(self):
+        config = Mock()
+        config.execution.slippage_model = 'conservative'
+        config.execution.market_impact_percent = 0.001
+        config.execution.order_types = ['market']
+        config.exchanges = {'primary': 'binance', 'binance': {'commission': 0.001}}
+        config.get = lambda key, default=None: {
+            'execution.routing': {'enabled': False},
+            'execution.analytics': {'enabled': True}
+        }.get(key, default)
+        
+        engine = ExecutionEngine(config)
+        signal = TradeSignal(strategy='test', action='BUY', confidence=0.9, symbol='BTC/EUR', entry_price=100.0)
+        portfolio = {'cash': 10000.0, 'equity': 10000.0, 'positions': {}}
+        
+        result = asyncio.run(engine._execute_crypto_spot(signal, 0.05, {'close': 100.0}, portfolio))
+        
+        assert result['executed']
+        quality = engine.get_execution_stats()['execution_quality']
+        assert quality['fill_ratio']['p50'] == pytest.approx(1.0, rel=0.01)
+        assert quality['slippage_bps']['p50'] > 0
+        assert quality['latency_ms']['count'] == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
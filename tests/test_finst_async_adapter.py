@@ -0,0 +1,160 @@
+"""
+Unit Tests for Async Finst Adapter
+Tests pooled keep-alive requests, rate limiting and pipelined bulk calls
+against a local mock Finst server
+"""
+
+import pytest
+import asyncio
+import time
+import sys
+from pathlib import Path
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bot.exchanges.finst_async_adapter import AsyncFinstAdapter, AsyncRateLimiter
+
+
+class MockFinst:
+    """Minimal Finst API: tickers, balance and order cancellation"""
+    
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.peers = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.cancelled = []
+        self.api_keys = []
+    
+    async def _enter(self, request):
+        self.peers.add(request.transport.get_extra_info('peername'))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.latency)
+        self.in_flight -= 1
+    
+    async def ticker(self, request):
+        await self._enter(request)
+        symbol = request.match_info['symbol']
+        if symbol == 'BADEUR':
+            raise web.HTTPNotFound()
+        return web.json_response({'symbol': symbol, 'last_price': 100.0})
+    
+    async def balance(self, request):
+        await self._enter(request)
+        self.api_keys.append(request.headers.get('X-FINST-API-KEY'))
+        assert 'signature' in request.query
+        return web.json_response({'balances': [{'currency': 'EUR', 'available': '1000.5'}]})
+    
+    async def cancel(self, request):
+        await self._enter(request)
+        self.cancelled.append(request.match_info['order_id'])
+        return web.json_response({'status': 'cancelled'})
+    
+    def app(self):
+        app = web.Application()
+        app.router.add_get('/ticker/{symbol}', self.ticker)
+        app.router.add_get('/account/balance', self.balance)
+        app.router.add_delete('/orders/{order_id}', self.cancel)
+        return app
+
+
+def run_against_mock(mock, scenario, **adapter_kwargs):
+    """Start the mock server, run ``scenario(adapter)`` and shut down"""
+    async def main():
+        server = TestServer(mock.app())
+        await server.start_server()
+        adapter = AsyncFinstAdapter(
+            api_key='key', api_secret='secret',
+            base_url=str(server.make_url('')), **adapter_kwargs
+        )
+        adapter._api_available = True
+        try:
+            async with adapter:
+                return await scenario(adapter)
+        finally:
+            await server.close()
+    
+    return asyncio.run(main())
+
+
+class TestAsyncFinstAdapter:
+    """Test async adapter against the mock server"""
+    
+    def test_concurrent_tickers_share_pool(self):
+        """Multi-symbol tickers run concurrently over a bounded keep-alive pool"""
+        mock = MockFinst(latency=0.1)
+        symbols = [f'C{i}/EUR' for i in range(12)]
+        
+        async def scenario(adapter):
+            start = time.perf_counter()
+            tickers = await adapter.get_tickers(symbols)
+            elapsed = time.perf_counter() - start
+            await adapter.get_tickers(symbols)
+            return tickers, elapsed
+        
+        tickers, elapsed = run_against_mock(mock, scenario, max_connections=4, max_in_flight=4, burst=50, rate_limit=1000)
+        
+        assert len(tickers) == 12
+        assert tickers['C3/EUR']['symbol'] == 'C3EUR'
+        assert elapsed < 0.8  # 3 waves of 0.1s, not 12 sequential round trips
+        assert mock.max_in_flight == 4
+        assert len(mock.peers) <= 4  # Connections reused across both batches
+    
+    def test_failed_symbols_are_omitted(self):
+        """One failing ticker does not fail the batch"""
+        mock = MockFinst()
+        
+        async def scenario(adapter):
+            return await adapter.get_tickers(['BTC/EUR', 'BAD/EUR'])
+        
+        tickers = run_against_mock(mock, scenario)
+        
+        assert list(tickers) == ['BTC/EUR']
+    
+    def test_signed_request(self):
+        """Signed requests carry key header, timestamp and signature"""
+        mock = MockFinst()
+        
+        async def scenario(adapter):
+            return await adapter.get_balance()
+        
+        balances = run_against_mock(mock, scenario)
+        
+        assert str(balances['EUR']) == '1000.5'
+        assert mock.api_keys == ['key']
+    
+    def test_pipelined_cancel(self):
+        """Bulk cancellation is pipelined and reports every order"""
+        mock = MockFinst(latency=0.05)
+        
+        async def scenario(adapter):
+            return await adapter.cancel_orders([f'o{i}' for i in range(8)])
+        
+        result = run_against_mock(mock, scenario)
+        
+        assert result['failed'] == []
+        assert sorted(mock.cancelled) == sorted(result['cancelled'])
+        assert mock.max_in_flight > 1
+
+
+class TestAsyncRateLimiter:
+    """Test client-side token bucket"""
+    
+    def test_rate_is_enforced_after_burst(self):
+        """Requests beyond the burst are spaced at the sustained rate"""
+        limiter = AsyncRateLimiter(rate=50, burst=5, max_in_flight=10)
+        
+        async def scenario():
+            start = time.perf_counter()
+            for _ in range(15):
+                await limiter.acquire()
+                limiter.release()
+            return time.perf_counter() - start
+        
+        elapsed = asyncio.run(scenario())
+        
+        assert elapsed == pytest.approx(10 / 50, abs=0.08)
@@ -0,0 +1,125 @@
+"""
+Unit Tests for Bulk Latency Simulation
+Tests pre-sampled streams, seeded replay and the bounded latency histogram
+"""
+
+import pytest
+import numpy as np
+from unittest.mock import Mock
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bot.backtesting.latency_simulator import LatencySimulator, LatencyHistogram
+
+
+def make_simulator(**overrides):
+    """Simulator with a seeded stream"""
+    config = Mock()
+    config.execution.latency = {
+        'enabled': True,
+        'model': 'lognormal',
+        'mean_ms': 50,
+        'std_ms': 20,
+        'min_ms': 10,
+        'max_ms': 500,
+        'distribution': 'lognormal',
+        'time_effects': {'enabled': True, 'peak_hours': [9, 10], 'peak_multiplier': 2.0},
+        'packet_loss_rate': 0.05,
+        'retry_attempts': 3,
+        'retry_delay_ms': 100,
+        'seed': 42,
+        'block_size': 1000,
+        **overrides
+    }
+    return LatencySimulator(config)
+
+
+class TestLatencyHistogram:
+    """Test the bounded histogram"""
+    
+    def test_percentiles_match_numpy(self):
+        values = np.random.default_rng(0).lognormal(3.5, 0.5, 100000)
+        hist = LatencyHistogram()
+        hist.record(values)
+        
+        for q in (50, 95, 99):
+            assert hist.percentile(q) == pytest.approx(np.percentile(values, q), rel=0.02)
+        assert hist.count == len(values)
+        assert hist.mean == pytest.approx(values.mean())
+        assert hist.max == pytest.approx(values.max())
+    
+    def test_merge(self):
+        a, b = LatencyHistogram(), LatencyHistogram()
+        a.record([10.0, 20.0])
+        b.record(30.0)
+        a.merge(b)
+        
+        assert a.count == 3
+        assert a.min == 10.0 and a.max == 30.0
+
+
+class TestBulkSimulation:
+    """Test vectorized sampling and replay"""
+    
+    def test_batch_statistics(self):
+        sim = make_simulator()
+        latencies, success = sim.simulate_batch(50000)
+        
+        stats = sim.get_statistics()
+        assert stats.total_requests == 50000
+        assert stats.successful_requests == int(success.sum())
+        assert stats.failed_requests == 50000 - int(success.sum())
+        assert stats.packet_losses > 0 and stats.retries > 0
+        assert stats.median_latency_ms == pytest.approx(np.median(latencies), rel=0.02)
+        assert len(sim.latencies) <= sim.latencies.maxlen
+    
+    def test_retries_add_backoff(self):
+        sim = make_simulator(packet_loss_rate=1.0, retry_attempts=3)
+        latencies, success = sim.simulate_batch(100)
+        
+        # Three failed attempts, backoff 100 + 200 ms between them
+        assert not success.any()
+        assert np.all(latencies >= 3 * 10 + 300)
+    
+    def test_seed_reproducible_across_batching(self):
+        sim = make_simulator()
+        single = [sim.next_latency() for _ in range(1500)]
+        
+        sim.reseed()
+        batched = np.concatenate([sim.simulate_batch(700)[0], sim.simulate_batch(800)[0]])
+        
+        np.testing.assert_allclose(single, batched)
+    
+    def test_time_effects(self):
+        sim = make_simulator(packet_loss_rate=0.0)
+        peak = sim.simulate_batch(timestamps=np.full(2000, np.datetime64('2024-01-01T09:30')))[0]
+        sim.reseed()
+        off = sim.simulate_batch(timestamps=np.full(2000, np.datetime64('2024-01-01T03:30')))[0]
+        
+        np.testing.assert_allclose(peak, off * 2.0)
+    
+    def test_replay_recorded(self):
+        sim = make_simulator()
+        sim.load_replay([5.0, 6.0, 7.0], success=[True, False, True])
+        latencies, success = sim.simulate_batch(5)
+        
+        np.testing.assert_allclose(latencies, [5.0, 6.0, 7.0, 5.0, 6.0])
+        assert success.tolist() == [True, False, True, True, False]
+        
+        sim.clear_replay()
+        assert sim.next_latency() >= 10
+    
+    def test_reset_statistics(self):
+        sim = make_simulator()
+        sim.simulate_batch(1000)
+        sim.reset_statistics()
+        
+        assert sim.histogram.count == 0
+        assert sim.get_statistics().total_requests == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
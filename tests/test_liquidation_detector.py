@@ -0,0 +1,115 @@
+"""
+Unit Tests for Liquidation Detector
+Tests running window aggregates against a full recomputation of the scores
+"""
+
+import pytest
+import asyncio
+import numpy as np
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bot.core.liquidation_detector import LiquidationDetector, LiquidationEvent
+
+
+def reference_scores(events, now, detector, current_price):
+    """List-based scores over the window, recomputed from scratch"""
+    window = [e for e in events if e[0] >= now - detector.lookback_window]
+    n = len(window)
+    if n < 2:
+        return None
+    
+    baseline = [e for e in window if e[0] < now - detector.lookback_window // 2]
+    total = sum(e[1] for e in window)
+    if not baseline:
+        volume = 0.7 if n > detector.min_events_for_cascade else 0.0
+    else:
+        volume = min(1.0, total / sum(e[1] for e in baseline) / detector.volume_spike_multiplier)
+    
+    gaps = np.diff([e[0] for e in window])
+    clustering = np.sum(gaps <= detector.time_clustering_seconds) / len(gaps)
+    
+    longs = sum(1 for e in window if e[3] == 'long')
+    direction = abs(longs - (n - longs)) / n
+    
+    prices = [e[2] for e in window]
+    impact = min(1.0, (max(prices) - min(prices)) / current_price / 0.05)
+    
+    return volume, clustering, direction, impact
+
+
+class TestLiquidationDetector:
+    """Test cascade detection window"""
+    
+    def test_running_scores_match_recomputation(self):
+        """O(1) sub-scores equal the list-based computation as the window slides"""
+        detector = LiquidationDetector(lookback_window=300)
+        rng = np.random.default_rng(4)
+        t0 = 1_700_000_000.0
+        
+        events = []
+        ts = t0
+        for i in range(400):
+            ts += float(rng.exponential(20))
+            event = (ts, float(rng.uniform(0.1, 5)), float(100 + rng.normal(0, 2)),
+                     'long' if rng.random() < 0.7 else 'short')
+            events.append(event)
+            detector._push(event[0], 'BTC/USDT', event[1], event[2], event[3])
+            detector._cleanup_old_events(ts)
+            
+            expected = reference_scores(events, ts, detector, 100.0)
+            if expected is None:
+                continue
+            actual = (
+                detector._analyze_volume_spike(),
+                detector._analyze_time_clustering(),
+                detector._analyze_directional_bias(),
+                detector._analyze_price_impact({'close': 100.0})
+            )
+            assert actual == pytest.approx(expected)
+    
+    def test_window_eviction(self):
+        """Events older than the lookback window are dropped"""
+        detector = LiquidationDetector(lookback_window=60)
+        now = datetime.now()
+        detector.add_liquidation(LiquidationEvent(now - timedelta(seconds=120), 'BTC', 1.0, 100.0, 'long'))
+        detector.add_liquidation(LiquidationEvent(now, 'BTC', 2.0, 101.0, 'short'))
+        
+        events = detector.recent_liquidations
+        assert len(events) == 1
+        assert events[0].direction == 'short'
+        assert detector.get_cascade_summary()['volume_by_direction'] == {'long': 0.0, 'short': 2.0}
+    
+    def test_burst_triggers_cascade(self):
+        """A dense one-sided burst after a quiet baseline is flagged"""
+        detector = LiquidationDetector(cascade_threshold=0.6, lookback_window=300)
+        now = datetime.now()
+        baseline = [
+            {'timestamp': now - timedelta(seconds=280 - i), 'size': 0.1, 'price': 100.0, 'direction': 'long'}
+            for i in range(2)
+        ]
+        burst = [
+            {'timestamp': now - timedelta(seconds=30 - i), 'size': 5.0, 'price': 100.0 - i * 0.3,
+             'direction': 'long'}
+            for i in range(20)
+        ]
+        
+        result = asyncio.run(detector.detect_cascade_risk({'close': 95.0}, baseline + burst))
+        
+        assert result['recent_count'] == 22
+        assert result['scores']['volume_spike'] == 1.0
+        assert result['scores']['directional_bias'] == 1.0
+        assert result['triggered']
+    
+    def test_reset(self):
+        """Reset clears window and running aggregates"""
+        detector = LiquidationDetector()
+        detector.add_liquidation(LiquidationEvent(datetime.now(), 'BTC', 1.0, 100.0, 'long'))
+        detector.reset()
+        
+        assert detector.recent_liquidations == []
+        assert detector._analyze_price_impact({'close': 100.0}) == 0.0
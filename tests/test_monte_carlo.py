@@ -0,0 +1,103 @@
+"""
+Unit Tests for Monte Carlo Robustness Analysis
+Tests path metrics, resampling methods and backtest integration
+"""
+
+import pytest
+import asyncio
+import numpy as np
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tests.conftest import make_ohlcv
+from bot.backtesting import BacktestRunner, MonteCarloAnalyzer, VectorizedBacktester
+from bot.strategies import MomentumStrategy
+
+
+def make_config(**monte_carlo):
+    config = Mock()
+    config.execution.slippage_model = 'conservative'
+    config.execution.market_impact_percent = 0.001
+    config.execution.commission_percent = 0.001
+    config.execution.simulation = {}
+    config.get = lambda key, default=None: {
+        'backtesting': {'initial_capital': 3000, 'monte_carlo': {'seed': 7, **monte_carlo}},
+        'execution.cost_model': {'seed': 1}
+    }.get(key, default)
+    return config
+
+
+class TestPathMetrics:
+    """Test metrics of known paths"""
+    
+    def test_drawdown_and_recovery(self):
+        analyzer = MonteCarloAnalyzer(make_config(), paths=10)
+        metrics = analyzer._path_metrics(np.array([[0.1, -0.5, 0.2, 1.0], [0.1, -0.5, 0.2, 0.1]]))
+        
+        np.testing.assert_allclose(metrics['max_drawdown'], [-0.5, -0.5])
+        np.testing.assert_allclose(metrics['total_return'], [0.32, 1.1 * 0.5 * 1.2 * 1.1 - 1])
+        np.testing.assert_array_equal(metrics['time_to_recovery'], [2, 3])
+        np.testing.assert_array_equal(metrics['recovered'], [True, False])
+
+
+class TestResampling:
+    """Test the resampling methods"""
+    
+    def test_trade_shuffle_preserves_final_equity(self):
+        trades = np.random.default_rng(0).normal(0.002, 0.01, 80)
+        result = MonteCarloAnalyzer(make_config(), paths=5000).trade_shuffle(trades)
+        
+        np.testing.assert_allclose(result.total_return, np.prod(1 + trades) - 1)
+        assert result.max_drawdown.std() > 0
+        assert result.observed['total_return'] == pytest.approx(np.prod(1 + trades) - 1)
+    
+    def test_full_length_block_reproduces_series(self):
+        returns = np.random.default_rng(1).normal(0, 0.01, 300)
+        result = MonteCarloAnalyzer(make_config(), paths=100).block_bootstrap(returns, block_size=300)
+        
+        np.testing.assert_allclose(result.max_drawdown, result.observed['max_drawdown'])
+    
+    def test_chunking_does_not_change_results(self):
+        returns = np.random.default_rng(2).normal(0, 0.01, 500)
+        chunked = MonteCarloAnalyzer(make_config(chunk_size=128), paths=1000).bootstrap(returns)
+        single = MonteCarloAnalyzer(make_config(chunk_size=1000), paths=1000).bootstrap(returns)
+        
+        np.testing.assert_allclose(chunked.sharpe_ratio, single.sharpe_ratio)
+        assert len(chunked.max_drawdown) == 1000
+    
+    def test_too_few_observations(self):
+        analyzer = MonteCarloAnalyzer(make_config(), paths=100)
+        
+        assert analyzer.bootstrap(np.array([0.01])) is None
+        assert analyzer.analyze({'daily_returns': [0.01]}) == {}
+
+
+class TestBacktestIntegration:
+    """Test analysis of backtest results"""
+    
+    def test_runner_and_vectorized_trade_returns_agree(self):
+        data = make_ohlcv(2000)
+        runner = asyncio.run(BacktestRunner(make_config()).run_backtest(data, MomentumStrategy(Mock())))
+        vectorized = VectorizedBacktester(make_config()).run(data, MomentumStrategy(Mock()))
+        
+        np.testing.assert_allclose(
+            MonteCarloAnalyzer.trade_returns(runner), vectorized['trade_returns'], atol=1e-12
+        )
+    
+    def test_analyze(self):
+        results = VectorizedBacktester(make_config()).run(make_ohlcv(2000), MomentumStrategy(Mock()))
+        summary = MonteCarloAnalyzer(make_config(), paths=2000).analyze(results)
+        
+        assert set(summary) == {'bootstrap', 'block_bootstrap', 'trade_shuffle'}
+        drawdown = summary['block_bootstrap']['max_drawdown']
+        assert drawdown['p5'] <= drawdown['p50'] <= drawdown['p95'] <= 0
+        assert 0 <= drawdown['observed_rank'] <= 1
+        assert summary['trade_shuffle']['horizon'] == len(results['trade_returns'])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
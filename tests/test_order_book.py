@@ -0,0 +1,116 @@
+"""
+Unit Tests for Array-Backed Order Book
+Tests vectorized sweeps, L2 deltas and depth snapshot replay
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bot.backtesting.market_microstructure import OrderBook, DepthReplay, MarketMicrostructure
+
+
+@pytest.fixture
+def book():
+    """Book with three known levels per side"""
+    book = OrderBook(levels=3)
+    book.load_snapshot([99.0, 98.0, 97.0], [10.0, 10.0, 10.0],
+                       [101.0, 102.0, 103.0], [10.0, 10.0, 10.0])
+    return book
+
+
+class TestOrderBook:
+    """Test order book sweeps and updates"""
+    
+    def test_partial_sweep_avg_price(self, book):
+        """Sweep consumes full levels, partially fills the last one"""
+        result = book.execute_market_order('BUY', 1010.0 + 510.0)
+        
+        assert result['filled']
+        assert result['num_levels'] == 2
+        assert result['filled_size'] == pytest.approx(1520.0)
+        assert result['avg_price'] == pytest.approx(1520.0 / 15.0)
+        assert book.asks == [(102.0, 5.0), (103.0, 10.0)]
+    
+    def test_exact_level_is_removed(self, book):
+        """Exhausting a level exactly removes it"""
+        book.execute_market_order('SELL', 990.0)
+        
+        assert book.get_best_bid() == (98.0, 10.0)
+    
+    def test_sweep_whole_side(self, book):
+        """Orders larger than the book are partially filled"""
+        result = book.execute_market_order('SELL', 1e6)
+        
+        assert not result['filled']
+        assert result['filled_size'] == pytest.approx(2940.0)
+        assert book.bids == []
+    
+    def test_deltas(self, book):
+        """Deltas insert, update and remove levels; last update wins"""
+        book.apply_deltas('bid', [99.5, 98.0, 97.0, 99.5], [4.0, 0.0, 3.0, 6.0])
+        
+        assert book.bids == [(99.5, 6.0), (99.0, 10.0), (97.0, 3.0)]
+        
+        book.apply_delta('ask', 100.5, 2.0)
+        assert book.get_best_ask() == (100.5, 2.0)
+        assert len(book.asks) == 3  # Truncated to levels
+    
+    def test_recenter_refills_levels(self, book):
+        """Re-centering shifts the ladder and replaces consumed levels"""
+        book.execute_market_order('BUY', 1010.0)
+        book.recenter(110.0)
+        
+        assert book.get_mid_price() == pytest.approx(110.0)
+        assert len(book.asks) == 3
+        assert np.all(np.diff(book.ask_prices) > 0)
+    
+    def test_repeated_sweeps_do_not_hollow_out_book(self):
+        """Depth taken by sweeps comes back on re-centering"""
+        book = OrderBook(levels=10)
+        book.initialize(100.0)
+        initial_spread = book.get_spread()
+        
+        for _ in range(50):
+            book.recenter(100.0)
+            book.execute_market_order('BUY', 5e6)
+        book.recenter(100.0)
+        
+        assert book.get_spread() == pytest.approx(initial_spread)
+        assert len(book.asks) == 10
+    
+    def test_partial_replenish_recovers_gradually(self, book):
+        """Swept levels recover a share of fresh depth per re-centering"""
+        book.execute_market_order('BUY', 1e6)
+        book.recenter(100.0, replenish=0.5)
+        
+        assert len(book.asks) == 3
+        assert np.all(book.ask_sizes >= 2500)  # Half of the smallest fresh level
+        assert np.all(book.bid_sizes >= 10.0)
+
+
+class TestDepthReplay:
+    """Test recorded depth replay"""
+    
+    def test_snapshot_lookup_and_roundtrip(self, tmp_path):
+        """Latest snapshot at or before a timestamp is loaded"""
+        replay = DepthReplay(
+            [0.0, 60.0],
+            [[99.0, 98.0], [109.0, 108.0]], [[1.0, 1.0], [1.0, 1.0]],
+            [[101.0, 102.0], [111.0, 112.0]], [[1.0, 1.0], [1.0, 1.0]]
+        )
+        replay.save(tmp_path / 'depth.npz')
+        replay = DepthReplay.load(tmp_path / 'depth.npz')
+        
+        microstructure = MarketMicrostructure(depth_replay=replay)
+        bar = pd.DataFrame({'open': [100.0], 'close': [100.0], 'volume': [1.0]},
+                           index=[pd.Timestamp(90, unit='s')])
+        microstructure.update(bar)
+        
+        assert replay.index_at(-1) == -1
+        assert microstructure.order_book.get_mid_price() == pytest.approx(110.0)
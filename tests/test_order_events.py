@@ -0,0 +1,171 @@
+"""
+Unit Tests for Order Event Stream
+Tests normalization, fill reconciliation and push delivery through the
+local stand-in stream server
+"""
+
+import pytest
+import asyncio
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bot.core.order_events import (
+    CCXTOrderSource,
+    LocalOrderStreamServer,
+    OrderEventSource,
+    OrderEventType,
+    UserDataStream,
+    WebSocketOrderSource,
+    normalize_binance,
+)
+
+
+def binance_report(execution, status, last_qty=0.0, last_price=0.0, cumulative=0.0, quote=0.0, order_id=1):
+    return {
+        'e': 'executionReport', 'E': int(time.time() * 1000), 's': 'BTCEUR', 'c': 'bot-1',
+        'S': 'BUY', 'q': '1.0', 'x': execution, 'X': status, 'i': order_id,
+        'l': str(last_qty), 'L': str(last_price), 'z': str(cumulative), 'Z': str(quote),
+        'n': '0.01', 'N': 'EUR', 't': 7 if execution == 'TRADE' else -1
+    }
+
+
+def ccxt_order(status, filled, average, fee):
+    return {'id': 'A1', 'symbol': 'ETH/EUR', 'side': 'sell', 'status': status, 'amount': 2.0,
+            'filled': filled, 'average': average, 'fee': {'cost': fee, 'currency': 'EUR'}}
+
+
+class TestNormalization:
+    """Test exchange message normalization"""
+    
+    def test_binance_partial_fill(self):
+        """Trade execution reports map to partial fills with VWAP"""
+        event = normalize_binance(binance_report('TRADE', 'PARTIALLY_FILLED', 0.4, 100.0, 0.4, 40.0))
+        
+        assert event.event_type == OrderEventType.PARTIAL_FILL
+        assert event.last_qty == 0.4
+        assert event.avg_price == pytest.approx(100.0)
+        assert event.trade_id == '7'
+    
+    def test_unrelated_messages_ignored(self):
+        """Account updates are not order events"""
+        assert normalize_binance({'e': 'outboundAccountPosition'}) is None
+    
+    def test_ccxt_cumulative_updates_become_fill_deltas(self):
+        """Cumulative order updates yield per-fill quantity, price and fee"""
+        source = CCXTOrderSource(SimpleNamespace(id='ccxt'))
+        
+        first = source.normalize(ccxt_order('open', 0.5, 100.0, 0.05))
+        second = source.normalize(ccxt_order('closed', 2.0, 106.0, 0.2))
+        
+        assert first.event_type == OrderEventType.PARTIAL_FILL
+        assert second.event_type == OrderEventType.FILL
+        assert second.last_qty == pytest.approx(1.5)
+        assert second.last_price == pytest.approx((212.0 - 50.0) / 1.5)
+        assert second.commission == pytest.approx(0.15)
+        assert second.to_fill()['action'] == 'SELL'
+    
+    def test_replayed_updates_are_dropped(self):
+        """Updates replayed after a reconnect are not applied twice"""
+        source = CCXTOrderSource(SimpleNamespace(id='ccxt'))
+        source.normalize(ccxt_order('open', 0.5, 100.0, 0.05))
+        
+        assert source.normalize(ccxt_order('open', 0.5, 100.0, 0.05)) is None
+        source.normalize(ccxt_order('canceled', 0.5, 100.0, 0.05))
+        assert source.normalize(ccxt_order('open', 0.5, 100.0, 0.05)) is None
+        assert source.duplicates == 2
+    
+    def test_close_without_new_quantity_is_kept(self):
+        """A terminal status with an unchanged filled amount is a transition, not a replay"""
+        source = CCXTOrderSource(SimpleNamespace(id='ccxt'))
+        source.normalize(ccxt_order('open', 2.0, 100.0, 0.2))
+        
+        closed = source.normalize(ccxt_order('closed', 2.0, 100.0, 0.2))
+        
+        assert closed.event_type == OrderEventType.FILL
+        assert closed.last_qty == 0.0 and closed.commission == 0.0
+        assert closed.cumulative_qty == 2.0 and closed.avg_price == pytest.approx(100.0)
+        assert source.normalize(ccxt_order('closed', 2.0, 100.0, 0.2)) is None
+    
+    def test_source_requires_messages(self):
+        """The base source is abstract"""
+        with pytest.raises(TypeError):
+            OrderEventSource('ccxt')
+
+
+class TestUserDataStream:
+    """Test push delivery over WebSocket"""
+    
+    def test_events_pushed_to_listener(self):
+        """Fills, duplicates and cancels flow from server to listener"""
+        async def scenario():
+            server = LocalOrderStreamServer()
+            url = await server.start()
+            
+            stream = UserDataStream()
+            stream.add_source(WebSocketOrderSource('binance', url, symbol_map={'BTCEUR': 'BTC/EUR'}))
+            received = []
+            got_all = asyncio.Event()
+            
+            async def listener(event):
+                received.append(event)
+                if event.event_type == OrderEventType.CANCELED:
+                    got_all.set()
+            
+            stream.add_listener(listener)
+            await stream.start()
+            await server.wait_for_clients(1)
+            
+            partial = binance_report('TRADE', 'PARTIALLY_FILLED', 0.4, 100.0, 0.4, 40.0)
+            await server.publish(partial)
+            await server.publish(partial)  # Duplicate
+            await server.publish(binance_report('CANCELED', 'CANCELED', cumulative=0.4, quote=40.0))
+            
+            await asyncio.wait_for(got_all.wait(), 2.0)
+            stats = stream.get_statistics()
+            
+            await stream.stop()
+            await server.stop()
+            return received, stats
+        
+        received, stats = asyncio.run(scenario())
+        
+        assert [e.event_type for e in received] == [OrderEventType.PARTIAL_FILL, OrderEventType.CANCELED]
+        assert received[0].symbol == 'BTC/EUR'
+        assert received[0].to_fill()['size'] == 0.4
+        assert stats['sources']['binance']['duplicates'] == 1
+        assert stats['latency_ms_max'] < 1000
+    
+    def test_reconnect_after_disconnect(self):
+        """Source reconnects and keeps delivering after the server drops it"""
+        async def scenario():
+            server = LocalOrderStreamServer()
+            url = await server.start()
+            
+            stream = UserDataStream()
+            source = WebSocketOrderSource('binance', url, reconnect_delay=0.05)
+            stream.add_source(source)
+            received = asyncio.Queue()
+            stream.add_listener(received.put_nowait)
+            await stream.start()
+            
+            await server.wait_for_clients(1)
+            await server.disconnect_clients()
+            while source.reconnects == 0:
+                await asyncio.sleep(0.01)
+            await server.wait_for_clients(1)
+            await server.publish(binance_report('TRADE', 'FILLED', 1.0, 100.0, 1.0, 100.0, order_id=2))
+            
+            event = await asyncio.wait_for(received.get(), 2.0)
+            await stream.stop()
+            await server.stop()
+            return event, source.reconnects
+        
+        event, reconnects = asyncio.run(scenario())
+        
+        assert event.event_type == OrderEventType.FILL
+        assert reconnects >= 1
@@ -0,0 +1,92 @@
+"""
+Unit Tests for Order Optimizer
+Tests batch planning against single-order planning and fee table refresh
+"""
+
+import pytest
+import time
+import numpy as np
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bot.core.order_optimizer import OrderOptimizationStrategy, OrderType
+from bot.core.order_optimizer_config import get_optimizer_for_exchange
+
+
+def make_orders(n=300, seed=0, ranks=(1, 6)):
+    """Random order requests spanning all plan branches"""
+    rng = np.random.default_rng(seed)
+    return [
+        {
+            'symbol': f"SYM{i % 7}/EUR",
+            'side': 'BUY' if i % 2 else 'SELL',
+            'amount': float(rng.choice([5.0, 200.0, 900.0, 3000.0, 12000.0]) * rng.uniform(0.8, 1.2)),
+            'current_price': float(rng.uniform(10, 1000)),
+            'market_volatility': float(rng.uniform(0.001, 0.08)),
+            'confidence': float(rng.uniform(0, 1)),
+            'liquidity_rank': int(rng.integers(*ranks)),
+            'strategy_name': 'test'
+        }
+        for i in range(n)
+    ]
+
+
+class TestBatchPlanning:
+    """Test create_execution_plans"""
+    
+    @pytest.mark.parametrize('strategy', list(OrderOptimizationStrategy))
+    @pytest.mark.parametrize('ranks', [(1, 6), (-3, 10)])
+    def test_batch_matches_single_plans(self, strategy, ranks):
+        """Every batch plan equals the single-order plan, out-of-range ranks included"""
+        optimizer = get_optimizer_for_exchange('binance', optimization_strategy=strategy, has_bnb=True)
+        orders = make_orders(ranks=ranks)
+        
+        batch = optimizer.create_execution_plans(orders)
+        single = [optimizer.create_execution_plan(**o) for o in orders]
+        
+        for a, b in zip(batch, single):
+            assert a.order_type == b.order_type
+            assert a.number_of_orders == b.number_of_orders
+            assert a.estimated_commission_percent == pytest.approx(b.estimated_commission_percent)
+            assert a.estimated_slippage_percent == pytest.approx(b.estimated_slippage_percent)
+            assert a.orders == b.orders
+    
+    def test_statistics_match_single_plans(self):
+        """Savings and counters are accumulated the same way"""
+        orders = make_orders(seed=1)
+        batch = get_optimizer_for_exchange('kraken')
+        single = get_optimizer_for_exchange('kraken')
+        
+        batch.create_execution_plans(orders)
+        for o in orders:
+            single.create_execution_plan(**o)
+        
+        assert batch.total_orders_optimized == single.total_orders_optimized
+        assert batch.total_commissions_saved == pytest.approx(single.total_commissions_saved)
+    
+    def test_fee_table_refreshes_on_state_change(self):
+        """Volume tier and BNB changes update the precomputed fees"""
+        optimizer = get_optimizer_for_exchange('binance', has_bnb=False)
+        assert optimizer._fee_table[OrderType.MARKET] == pytest.approx(0.001)
+        
+        optimizer.update_volume_30d(300000)
+        assert optimizer._fee_table[OrderType.MARKET] == pytest.approx(0.0008)
+        
+        optimizer.toggle_bnb(True)
+        assert optimizer._fee_table[OrderType.LIMIT] == pytest.approx(0.0008 * 0.75)
+    
+    @pytest.mark.performance
+    def test_thousands_of_orders_per_second(self):
+        """Batch planning handles thousands of orders per second"""
+        optimizer = get_optimizer_for_exchange('binance')
+        orders = make_orders(n=5000, seed=2)
+        
+        start = time.perf_counter()
+        plans = optimizer.create_execution_plans(orders)
+        elapsed = time.perf_counter() - start
+        
+        assert len(plans) == 5000
+        assert elapsed < 1.0
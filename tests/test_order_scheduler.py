@@ -0,0 +1,237 @@
+"""
+Unit Tests for Child Order Scheduler
+Tests background pacing, cancel/amend and asynchronous fill reporting
+"""
+
+import pytest
+import asyncio
+import time
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bot.core import clock
+from bot.core.order_scheduler import ChildOrder, ChildOrderScheduler, ParentOrder, ParentOrderStatus
+from bot.core.execution_engine import ExecutionEngine
+from bot.ensemble.ensemble_voting import TradeSignal
+
+
+def make_signal(action='BUY'):
+    return TradeSignal(strategy='test', action=action, confidence=0.8,
+                       symbol='BTC/EUR', entry_price=100.0)
+
+
+def make_parent(delays, size=100.0):
+    plan = Mock(estimated_commission_percent=0.001)
+    return ParentOrder(
+        parent_id='', signal=make_signal(), plan=plan, reference_price=100.0,
+        portfolio_value=10000.0, market_data={'close': 100.0},
+        children=[ChildOrder(index=i, size=size, delay_seconds=d) for i, d in enumerate(delays)]
+    )
+
+
+def simple_fill(parent, child):
+    return {'symbol': parent.symbol, 'shares': child.size / 100.0,
+            'position_value': child.size, 'index': child.index}
+
+
+@pytest.fixture
+def mock_config():
+    """Create mock configuration"""
+    config = Mock()
+    config.execution.slippage_model = 'conservative'
+    config.execution.market_impact_percent = 0.001
+    config.execution.order_types = ['market', 'limit']
+    config.exchanges = {'primary': 'binance'}
+    return config
+
+
+class TestChildOrderScheduler:
+    """Test scheduler timer loop"""
+    
+    def test_slices_fill_in_due_order(self):
+        """Slices fill in due-time order and complete the parent"""
+        async def scenario():
+            scheduler = ChildOrderScheduler(simple_fill)
+            fills = []
+            scheduler.add_fill_listener(fills.append)
+            
+            parent_id = scheduler.submit(make_parent([0.06, 0.02, 0.04]))
+            await asyncio.sleep(0.15)
+            await scheduler.stop()
+            return scheduler, parent_id, fills
+        
+        scheduler, parent_id, fills = asyncio.run(scenario())
+        
+        assert [f['index'] for f in fills] == [1, 2, 0]
+        parent = scheduler.get_parent(parent_id)
+        assert parent.status == ParentOrderStatus.COMPLETED
+        assert parent.filled_value == pytest.approx(300.0)
+        assert fills[-1]['parent_status'] == 'completed'
+    
+    def test_cancel_drops_pending_slices(self):
+        """Cancelled parents stop filling"""
+        async def scenario():
+            scheduler = ChildOrderScheduler(simple_fill)
+            fills = []
+            scheduler.add_fill_listener(fills.append)
+            
+            parent_id = scheduler.submit(make_parent([0.01, 0.2]))
+            await asyncio.sleep(0.05)
+            assert scheduler.cancel(parent_id)
+            await asyncio.sleep(0.2)
+            await scheduler.stop()
+            return scheduler, parent_id, fills
+        
+        scheduler, parent_id, fills = asyncio.run(scenario())
+        
+        assert len(fills) == 1
+        assert scheduler.get_parent(parent_id).status == ParentOrderStatus.CANCELLED
+        assert scheduler.pending_value() == 0.0
+    
+    def test_amend_redistributes_remaining(self):
+        """Amending remaining notional rescales pending slices pro rata"""
+        async def scenario():
+            scheduler = ChildOrderScheduler(simple_fill)
+            parent_id = scheduler.submit(make_parent([1.0, 1.0, 2.0]))
+            scheduler.amend(parent_id, remaining_value=150.0, limit_price=99.0)
+            sizes = [c.size for c in scheduler.get_parent(parent_id).children]
+            await scheduler.stop()
+            return sizes
+        
+        assert asyncio.run(scenario()) == pytest.approx([50.0, 50.0, 50.0])
+    
+    def test_async_listener(self):
+        """Coroutine listeners are awaited"""
+        async def scenario():
+            scheduler = ChildOrderScheduler(simple_fill)
+            seen = []
+            
+            async def listener(fill):
+                seen.append(fill['index'])
+            
+            scheduler.add_fill_listener(listener)
+            scheduler.submit(make_parent([0.0]))
+            await asyncio.sleep(0.02)
+            await scheduler.stop()
+            return seen
+        
+        assert asyncio.run(scenario()) == [0]
+    
+    def test_driven_mode_follows_simulated_clock(self):
+        """Driven schedulers fill on run_due as the installed clock advances"""
+        async def scenario():
+            scheduler = ChildOrderScheduler(simple_fill, driven=True)
+            fills = []
+            scheduler.add_fill_listener(fills.append)
+            
+            sim = clock.SimulatedClock('2024-01-01')
+            with clock.use_clock(sim):
+                parent_id = scheduler.submit(make_parent([0.0, 30.0, 60.0]))
+                filled = [await scheduler.run_due()]
+                sim.advance(45)
+                filled.append(await scheduler.run_due())
+                sim.advance(3600)
+                filled.append(await scheduler.run_due())
+            return scheduler, parent_id, fills, filled
+        
+        scheduler, parent_id, fills, filled = asyncio.run(scenario())
+        
+        assert filled == [1, 1, 1]
+        assert [f['index'] for f in fills] == [0, 1, 2]
+        assert not scheduler.get_statistics()['running']
+        parent = scheduler.get_parent(parent_id)
+        assert parent.status == ParentOrderStatus.COMPLETED
+        assert parent.completed_at == clock.SimulatedClock('2024-01-01 01:00:45').now()
+
+
+class TestExecutionEngineScheduling:
+    """Test plan execution without blocking"""
+    
+    def test_delayed_slices_do_not_block(self, mock_config):
+        """Immediate slice fills inline; delayed slices arrive via listener"""
+        engine = ExecutionEngine(mock_config)
+        plan = engine._create_fallback_plan('BTC/EUR', 'BUY', 300.0, 100.0)
+        plan.orders = [
+            {'type': 'market', 'size': 100.0, 'delay_seconds': 0},
+            {'type': 'market', 'size': 100.0, 'delay_seconds': 0.05},
+            {'type': 'market', 'size': 100.0, 'delay_seconds': 0.1},
+        ]
+        fills = []
+        engine.add_fill_listener(fills.append)
+        
+        async def scenario():
+            start = time.perf_counter()
+            result = await engine._execute_plan(plan, make_signal(), 300.0, 100.0, 10000.0, {'close': 100.0})
+            elapsed = time.perf_counter() - start
+            
+            engine.update_market_data({'BTC/EUR': {'close': 110.0}})
+            await asyncio.sleep(0.2)
+            await engine.shutdown()
+            return result, elapsed
+        
+        result, elapsed = asyncio.run(scenario())
+        
+        assert elapsed < 0.05
+        assert result['executed']
+        assert result['position_value'] == pytest.approx(100.0)
+        assert result['scheduled_orders'] == 2
+        assert len(fills) == 2
+        assert all(f['signal_price'] == 110.0 for f in fills)
+        assert engine.get_execution_stats()['total_executions'] == 3
+    
+    def test_limit_slices_wait_for_their_price(self, mock_config):
+        """Limit slices stay working above the limit and fill at most at an amended limit"""
+        engine = ExecutionEngine(mock_config)
+        engine.scheduler.driven = True
+        plan = engine._create_fallback_plan('BTC/EUR', 'BUY', 100.0, 100.0)
+        plan.orders = [{'type': 'limit', 'size': 100.0, 'price': 95.0, 'delay_seconds': 10}]
+        fills = []
+        engine.add_fill_listener(fills.append)
+        
+        async def scenario():
+            sim = clock.SimulatedClock('2024-01-01')
+            with clock.use_clock(sim):
+                result = await engine._execute_plan(plan, make_signal(), 100.0, 100.0, 10000.0, {'close': 100.0})
+                engine.update_market_data({'BTC/EUR': {'close': 100.0}})
+                sim.advance(10)
+                await engine.scheduler.run_due()
+                waiting = len(fills)
+                
+                engine.amend_order(result['parent_id'], limit_price=100.05)
+                sim.advance(engine.scheduler.retry_seconds)
+                await engine.scheduler.run_due()
+            return result, waiting
+        
+        result, waiting = asyncio.run(scenario())
+        
+        assert waiting == 0
+        assert engine.scheduler.slices_retried == 1
+        assert len(fills) == 1
+        assert fills[0]['execution_price'] <= 100.05
+        assert engine.scheduler.get_parent(result['parent_id']).status == ParentOrderStatus.COMPLETED
+    
+    def test_unfilled_limit_slice_expires(self):
+        """A limit slice that never fills cancels its parent after max_retries"""
+        def never_fill(parent, child):
+            return {'executed': False, 'reason': 'limit_not_reached'}
+        
+        async def scenario():
+            scheduler = ChildOrderScheduler(never_fill, driven=True, retry_seconds=5.0, max_retries=3)
+            sim = clock.SimulatedClock('2024-01-01')
+            with clock.use_clock(sim):
+                parent_id = scheduler.submit(make_parent([0.0]))
+                for _ in range(10):
+                    await scheduler.run_due()
+                    sim.advance(scheduler.retry_seconds)
+            return scheduler, parent_id
+        
+        scheduler, parent_id = asyncio.run(scenario())
+        
+        assert scheduler.slices_retried == 3
+        assert scheduler.slices_expired == 1
+        assert scheduler.get_parent(parent_id).status == ParentOrderStatus.CANCELLED
+        assert scheduler.pending_value() == 0.0 and not scheduler._heap
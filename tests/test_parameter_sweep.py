@@ -0,0 +1,162 @@
+"""
+Unit Tests for the Parameter Sweep
+Tests sampling, shared-memory market data, pooled runs and the editor hook
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tests.conftest import BacktestConfig, make_ohlcv
+from bot.backtesting import ParameterRange, ParameterSweep
+from bot.backtesting.parameter_sweep import SharedFrame
+from bot.strategies import BollingerBandsStrategy, MACDMomentumStrategy
+
+
+SPACE = [
+    ParameterRange('period', 'int', 10, 30, 10),
+    ParameterRange('std_dev', 'float', 1.5, 2.5, 0.5)
+]
+
+
+class TestSampling:
+    """Test combination generation"""
+    
+    def test_grid(self):
+        combinations = ParameterSweep.grid(SPACE)
+        
+        assert len(combinations) == 9
+        assert {'period': 20, 'std_dev': 2.0} in combinations
+    
+    def test_random_snaps_to_step(self):
+        combinations = ParameterSweep.random(SPACE, 50, seed=1)
+        
+        assert len(combinations) == 50
+        assert all(c['period'] in (10, 20, 30) for c in combinations)
+        assert all(c['std_dev'] in (1.5, 2.0, 2.5) for c in combinations)
+        assert combinations == ParameterSweep.random(SPACE, 50, seed=1)
+    
+    def test_choice_range(self):
+        param = ParameterRange('enabled', 'choice', choices=[False, True])
+        
+        assert param.grid() == [False, True]
+        assert param.from_unit(np.array([0.0, 0.49, 0.5, 1.0])) == [False, False, True, True]
+
+
+class TestSharedFrame:
+    """Test the shared-memory round trip"""
+    
+    def test_attach_matches_source(self):
+        data = make_ohlcv(200)
+        shared = SharedFrame(data)
+        try:
+            frame, shm = SharedFrame.attach(shared.spec)
+            pd.testing.assert_frame_equal(frame, data, check_dtype=False)
+            del frame
+            shm.close()
+        finally:
+            shared.close()
+
+
+class TestSweep:
+    """Test sweep execution"""
+    
+    def test_pool_matches_inline(self):
+        data = make_ohlcv()
+        combinations = ParameterSweep.grid(SPACE)
+        
+        with ParameterSweep(BacktestConfig(), data, workers=1) as sweep:
+            inline = {tuple(r.params.values()): r for r in sweep.run(BollingerBandsStrategy, combinations)}
+        with ParameterSweep(BacktestConfig(), data, workers=2) as sweep:
+            pooled = list(sweep.run(BollingerBandsStrategy, combinations))
+            assert sweep.get_statistics()['completed'] == 9
+        
+        assert len(pooled) == 9
+        for result in pooled:
+            expected = inline[tuple(result.params.values())]
+            assert result.error is None
+            assert result.metrics['final_equity'] == pytest.approx(expected.metrics['final_equity'])
+    
+    def test_monte_carlo_metrics(self):
+        with ParameterSweep(BacktestConfig(), make_ohlcv(), workers=1, monte_carlo_paths=500) as sweep:
+            result = next(sweep.run(BollingerBandsStrategy, [{'period': 20}]))
+        
+        assert 0 <= result.metrics['mc_probability_of_loss'] <= 1
+        assert result.metrics['mc_max_drawdown_p5'] <= 0
+    
+    def test_monte_carlo_metrics_independent_of_scheduling(self):
+        data = make_ohlcv()
+        combinations = [{'period': p} for p in (10, 20, 30)]
+        
+        def mc_metrics(workers, order):
+            with ParameterSweep(BacktestConfig(monte_carlo={'seed': 3}), data, workers=workers, monte_carlo_paths=200) as sweep:
+                return {
+                    r.params['period']: {k: v for k, v in r.metrics.items() if k.startswith('mc_')}
+                    for r in sweep.run(BollingerBandsStrategy, order)
+                }
+        
+        inline = mc_metrics(1, combinations)
+        
+        assert mc_metrics(1, combinations[::-1]) == inline
+        assert mc_metrics(2, combinations) == inline
+        assert inline[10] != inline[20]  # Each combination has its own draws
+    
+    def test_unknown_parameter_reported(self):
+        with ParameterSweep(BacktestConfig(), make_ohlcv(300), workers=1) as sweep:
+            result = next(sweep.run(BollingerBandsStrategy, [{'missing': 1}]))
+        
+        assert result.error is not None
+        assert result.score('sharpe_ratio') == -np.inf
+    
+    def test_bayesian(self):
+        space = [
+            ParameterRange('fast_period', 'int', 5, 20, 1),
+            ParameterRange('slow_period', 'int', 21, 40, 1)
+        ]
+        with ParameterSweep(BacktestConfig(), make_ohlcv(), workers=1) as sweep:
+            results = list(sweep.bayesian(MACDMomentumStrategy, space, n_iter=12, n_initial=4, seed=3))
+            best = sweep.best(results, 1)[0]
+        
+        assert len(results) == 12
+        assert best.score('sharpe_ratio') == max(r.score('sharpe_ratio') for r in results)
+
+
+class TestStrategyEditorBacktest:
+    """Test the editor's backtest hooks"""
+    
+    @pytest.fixture
+    def editor(self, tmp_path, monkeypatch):
+        from dashboard.strategy_editor import StrategyEditor
+        
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(StrategyEditor, '_instance', None)
+        editor = StrategyEditor()
+        monkeypatch.setattr(editor, '_backtest_config', lambda: BacktestConfig())
+        return editor
+    
+    def test_quick_backtest(self, editor):
+        results = editor.quick_backtest('Bollinger', data=make_ohlcv())
+        
+        assert results['status'] == 'completed'
+        assert results['total_trades'] > 0
+        assert results['winning_trades'] + results['losing_trades'] <= results['total_trades']
+        assert editor.stats['backtests_run'] == 1
+    
+    def test_sweep_parameters(self, editor):
+        results = editor.sweep_parameters('Bollinger', method='random', samples=6, data=make_ohlcv(), workers=1, seed=0)
+        
+        assert results['combinations'] == 6
+        assert results['best_parameters'] == results['results'][0]['parameters']
+    
+    def test_unmapped_strategy(self, editor):
+        with pytest.raises(ValueError):
+            editor.quick_backtest('RSI', data=make_ohlcv())
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,185 @@
+"""
+Unit Tests for the Portfolio Backtester
+Tests panel alignment, shared cash, position limits and single-symbol parity
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tests.conftest import make_ohlcv
+from bot.backtesting import PortfolioBacktester, PricePanel, VectorizedBacktester
+from bot.strategies import MACDMomentumStrategy
+
+
+def make_config(**portfolio):
+    config = Mock()
+    config.execution.slippage_model = 'conservative'
+    config.execution.market_impact_percent = 0.001
+    config.execution.commission_percent = 0.001
+    config.execution.simulation = {}
+    config.get = lambda key, default=None: {
+        'backtesting': {
+            'initial_capital': 3000,
+            'warmup_bars': 1,
+            'portfolio': portfolio
+        },
+        'execution.cost_model': {'seed': 1}
+    }.get(key, default)
+    return config
+
+
+def flat_panel(n_bars=50, n_symbols=4, price=100.0):
+    close = np.full((n_bars, n_symbols), price)
+    return PricePanel(
+        timestamps=pd.date_range('2024-01-01', periods=n_bars, freq='h'),
+        symbols=[f'S{j}' for j in range(n_symbols)],
+        close=close,
+        volatility=np.full(close.shape, 0.02)
+    )
+
+
+class TestPricePanel:
+    """Test panel alignment"""
+    
+    def test_staggered_symbols_share_one_timeline(self):
+        early = make_ohlcv(100, seed=1)
+        late = make_ohlcv(60, seed=2, start='2024-01-04 08:00')
+        
+        panel = PricePanel.from_frames({'EARLY': early, 'LATE': late})
+        
+        assert panel.symbols == ['EARLY', 'LATE']
+        assert panel.close.shape == (140, 2)
+        assert panel.valid[:, 0].sum() == 100 and panel.valid[:, 1].sum() == 60
+        assert np.isnan(panel.close[0, 1]) and np.isnan(panel.close[-1, 0])
+        np.testing.assert_array_equal(panel.close[-60:, 1], late['close'].to_numpy())
+        assert np.all(np.isfinite(panel.volatility))
+    
+    def test_long_frame_matches_dict(self):
+        frames = {'A': make_ohlcv(80, seed=3), 'B': make_ohlcv(80, seed=4)}
+        long = pd.concat([frame.assign(symbol=name) for name, frame in frames.items()])
+        
+        np.testing.assert_array_equal(PricePanel.from_frames(long).close, PricePanel.from_frames(frames).close)
+
+
+class TestSharedCash:
+    """Test sizing against one cash balance"""
+    
+    def test_single_symbol_matches_vectorized_backtester(self):
+        config = make_config()
+        data = make_ohlcv(2000)
+        strategy = MACDMomentumStrategy(Mock())
+        
+        single = VectorizedBacktester(config).run(data, strategy)
+        portfolio = PortfolioBacktester(config).run({'BTC': data}, strategy)
+        
+        assert portfolio['total_trades'] == single['total_trades']
+        assert portfolio['final_equity'] == pytest.approx(single['final_equity'], rel=1e-6)
+    
+    def test_highest_confidence_entries_fill_first(self):
+        panel = flat_panel(n_symbols=4)
+        action = np.zeros(panel.close.shape, dtype=np.int8)
+        action[5] = 1
+        confidence = np.zeros(panel.close.shape)
+        confidence[5] = [0.1, 0.9, 0.5, 0.7]
+        
+        # 40% of equity per entry: only two entries are affordable
+        results = PortfolioBacktester(make_config(position_fraction=0.4, max_position_weight=0.4)).run_signals(
+            panel, action, confidence)
+        
+        assert sorted(results['positions']) == ['S1', 'S3']
+        assert results['cash'] >= 0
+        assert sum(results['positions'].values()) + results['cash'] == pytest.approx(results['final_equity'])
+    
+    def test_symbol_limits_and_max_positions(self):
+        panel = flat_panel(n_symbols=5)
+        action = np.zeros(panel.close.shape, dtype=np.int8)
+        action[5] = 1
+        confidence = np.zeros(panel.close.shape)
+        confidence[5] = np.arange(5)
+        
+        results = PortfolioBacktester(make_config(
+            position_fraction=0.15, max_positions=3, symbol_limits={'S4': 0.05}
+        )).run_signals(panel, action, confidence)
+        
+        positions = results['positions']
+        assert sorted(positions) == ['S2', 'S3', 'S4']
+        assert positions['S4'] == pytest.approx(0.05 * 3000, rel=0.01)
+        assert positions['S3'] == pytest.approx(0.15 * 3000, rel=0.01)
+    
+    def test_unaffordable_entry_does_not_block_cheaper_ones(self):
+        panel = flat_panel(n_symbols=4)
+        action = np.zeros(panel.close.shape, dtype=np.int8)
+        action[5] = 1
+        confidence = np.zeros(panel.close.shape)
+        confidence[5] = [0.9, 0.8, 0.1, 0.5]
+        
+        # S3 no longer fits after S0 and S1; S2 needs 150 and still fills
+        results = PortfolioBacktester(make_config(
+            position_fraction=0.4, max_position_weight=0.4, max_positions=3, symbol_limits={'S2': 0.05}
+        )).run_signals(panel, action, confidence)
+        
+        assert sorted(results['positions']) == ['S0', 'S1', 'S2']
+        assert results['positions']['S2'] == pytest.approx(150, rel=0.01)
+    
+    def test_dropped_candidates_do_not_take_slots(self):
+        panel = flat_panel(n_symbols=3)
+        action = np.zeros(panel.close.shape, dtype=np.int8)
+        action[5] = 1
+        confidence = np.zeros(panel.close.shape)
+        confidence[5] = [0.9, 0.5, 0.1]
+        
+        # S0 is below min_trade_value, so both slots go to S1 and S2
+        results = PortfolioBacktester(make_config(
+            max_positions=2, symbol_limits={'S0': 0.01}
+        )).run_signals(panel, action, confidence)
+        
+        assert sorted(results['positions']) == ['S1', 'S2']
+    
+    def test_exit_frees_cash_and_records_pnl(self):
+        panel = flat_panel(n_symbols=2)
+        panel.close[20:, 0] = 110.0
+        action = np.zeros(panel.close.shape, dtype=np.int8)
+        action[5, 0] = 1
+        action[30, 0] = -1
+        
+        results = PortfolioBacktester(make_config()).run_signals(panel, action)
+        
+        assert results['round_trips'] == 1 and results['positions'] == {}
+        assert results['symbol_pnl']['S0'] > 0 and results['symbol_trades'] == {'S0': 2, 'S1': 0}
+        assert results['cash'] == pytest.approx(results['final_equity'])
+        # Marked to market while open
+        equity = results['equity_curve']
+        assert equity[25] - equity[15] == pytest.approx(results['trade_log']['value'][0] * 0.1, rel=0.01)
+
+
+class TestScale:
+    """Test wide universes"""
+    
+    def test_hundreds_of_symbols(self):
+        rng = np.random.default_rng(5)
+        n_bars, n_symbols = 2000, 300
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, (n_bars, n_symbols)), axis=0))
+        close[:rng.integers(0, 500), :50] = np.nan  # Late listings
+        panel = PricePanel(pd.date_range('2024-01-01', periods=n_bars, freq='h'),
+                           [f'S{j}' for j in range(n_symbols)], close, np.full(close.shape, 0.02))
+        action = rng.choice([-1, 0, 1], size=close.shape, p=[0.01, 0.98, 0.01]).astype(np.int8)
+        
+        results = PortfolioBacktester(make_config(max_positions=20)).run_signals(panel, action, rng.random(close.shape))
+        
+        assert results['symbols_processed'] == n_symbols
+        assert len(results['positions']) <= 20
+        assert results['cash'] >= -1e-6
+        log = results['trade_log']
+        assert panel.valid[log['bar'], log['symbol']].all()  # No fills before listing
+        assert results['final_equity'] == pytest.approx(results['cash'] + sum(results['positions'].values()))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
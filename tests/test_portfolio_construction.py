@@ -0,0 +1,119 @@
+"""
+Unit Tests for Portfolio Construction
+Tests joint Kelly sizing, position limits and per-symbol voting
+"""
+
+import pytest
+import numpy as np
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bot.ensemble.ensemble_voting import EnsembleVoting, TradeSignal
+from bot.ensemble.portfolio_construction import PortfolioConstructor
+
+
+def make_signal(symbol, action='BUY', confidence=0.7, strategy='ensemble'):
+    return TradeSignal(strategy=strategy, action=action, confidence=confidence,
+                       symbol=symbol, entry_price=100.0)
+
+
+@pytest.fixture
+def constructor():
+    """Create constructor with config defaults"""
+    return PortfolioConstructor(max_position_size=0.15, min_position_size=0.01,
+                                max_open_positions=10, kelly_fraction=0.25, min_probability=0.55)
+
+
+@pytest.fixture
+def portfolio():
+    return {'cash': 10000.0, 'equity': 10000.0, 'positions': {}}
+
+
+class TestPortfolioConstructor:
+    """Test joint sizing"""
+    
+    def test_uncorrelated_matches_single_kelly(self, constructor, portfolio):
+        """Without correlation each order equals the per-signal Kelly size"""
+        decisions = {s: make_signal(s, confidence=c) for s, c in [('A', 0.6), ('B', 0.7)]}
+        
+        orders = constructor.construct(decisions, portfolio, {})
+        sizes = {o.symbol: o.size for o in orders}
+        
+        assert sizes['A'] == pytest.approx(0.25 * 0.2)
+        assert sizes['B'] == pytest.approx(0.25 * 0.4)
+    
+    def test_correlated_candidates_share_size(self, constructor, portfolio):
+        """Highly correlated candidates are sized down jointly"""
+        decisions = {s: make_signal(s, confidence=0.7) for s in ['A', 'B']}
+        correlation = np.array([[1.0, 0.9], [0.9, 1.0]])
+        
+        orders = constructor.construct(decisions, portfolio, {}, correlation=correlation)
+        
+        assert len(orders) == 2
+        assert all(o.size < o.kelly for o in orders)
+        assert orders[0].size == pytest.approx(orders[1].size)
+    
+    def test_respects_open_position_slots(self, constructor, portfolio):
+        """Only free slots are filled, best candidates first"""
+        portfolio['positions'] = {f'H{i}': {'size': 1.0, 'avg_price': 100.0} for i in range(8)}
+        portfolio['cash'] = 9200.0
+        decisions = {f'N{i}': make_signal(f'N{i}', confidence=0.6 + i * 0.05) for i in range(5)}
+        
+        orders = constructor.construct(decisions, portfolio, {})
+        
+        assert [o.symbol for o in orders] == ['N4', 'N3']
+    
+    def test_caps_and_budget(self, constructor, portfolio):
+        """Per-symbol cap includes holdings; total buys fit the cash"""
+        portfolio['positions'] = {'A': {'size': 12.0, 'avg_price': 100.0}}
+        portfolio['cash'] = 8800.0
+        decisions = {'A': make_signal('A', confidence=0.9)}
+        decisions.update({f'N{i}': make_signal(f'N{i}', confidence=0.9) for i in range(9)})
+        
+        orders = constructor.construct(decisions, portfolio, {'A': 100.0})
+        sizes = {o.symbol: o.size for o in orders}
+        
+        assert sizes['A'] <= 0.03 + 1e-12
+        assert all(size <= 0.15 + 1e-12 for size in sizes.values())
+        assert sum(sizes.values()) == pytest.approx(0.88)
+        
+        alone = constructor.construct({'A': decisions['A']}, portfolio, {'A': 100.0})
+        assert alone[0].size == pytest.approx(0.03)
+    
+    def test_sells_close_holdings_only(self, constructor, portfolio):
+        """Confident sells exit held positions; unheld sells are ignored"""
+        portfolio['positions'] = {'A': {'size': 10.0, 'avg_price': 100.0}}
+        portfolio['cash'] = 9000.0
+        decisions = {'A': make_signal('A', 'SELL', 0.8), 'B': make_signal('B', 'SELL', 0.8)}
+        
+        orders = constructor.construct(decisions, portfolio, {'A': 110.0})
+        
+        assert len(orders) == 1
+        assert orders[0].action == 'SELL'
+        assert orders[0].size == pytest.approx(0.11)
+    
+    def test_low_confidence_is_dropped(self, constructor, portfolio):
+        """Signals below the Kelly minimum probability get no order"""
+        orders = constructor.construct({'A': make_signal('A', confidence=0.52)}, portfolio, {})
+        assert orders == []
+
+
+class TestVoteBySymbol:
+    """Test per-symbol ensemble decisions"""
+    
+    def test_groups_signals_by_symbol(self):
+        voting = EnsembleVoting(confidence_threshold=0.5)
+        signals = {
+            's1': make_signal('BTC', 'BUY', 0.8, 's1'),
+            's2': make_signal('BTC', 'BUY', 0.7, 's2'),
+            's3': make_signal('ETH', 'SELL', 0.9, 's3'),
+        }
+        
+        decisions = voting.vote_by_symbol(signals, {'s1': 0.4, 's2': 0.3, 's3': 0.3})
+        
+        assert set(decisions) == {'BTC', 'ETH'}
+        assert decisions['BTC'].action == 'BUY'
+        assert decisions['ETH'].action == 'SELL'
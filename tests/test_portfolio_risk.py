@@ -0,0 +1,114 @@
+"""
+Unit Tests for Portfolio Risk Engine
+Tests VaR/CVaR methods, incremental position updates and latency budget
+"""
+
+import pytest
+import time
+import numpy as np
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bot.core.portfolio_risk import PortfolioRiskEngine
+
+
+def feed_prices(engine, n_symbols=10, n_obs=300, seed=0, vol=0.01):
+    """Push a random-walk price history into the engine"""
+    rng = np.random.default_rng(seed)
+    symbols = [f"SYM{i}" for i in range(n_symbols)]
+    prices = np.full(n_symbols, 100.0)
+    for _ in range(n_obs):
+        prices = prices * (1 + rng.normal(0, vol, n_symbols))
+        engine.update_prices(dict(zip(symbols, prices)))
+    return symbols, prices
+
+
+@pytest.fixture
+def engine():
+    """Create risk engine with reproducible scenarios"""
+    return PortfolioRiskEngine(window=250, mc_paths=20000, seed=42)
+
+
+class TestPortfolioRiskEngine:
+    """Test portfolio VaR/CVaR engine"""
+    
+    def test_covariance_matches_numpy(self, engine):
+        """Running covariance equals a full recomputation"""
+        feed_prices(engine)
+        assert np.allclose(engine._cov, np.cov(engine._returns.T))
+    
+    def test_empty_portfolio_has_no_risk(self, engine):
+        """No positions, no VaR"""
+        feed_prices(engine)
+        snapshot = engine.compute(10000)
+        
+        assert snapshot.var_historical == 0.0
+        assert snapshot.var_parametric == 0.0
+        assert snapshot.leverage_ratio == 0.0
+    
+    def test_methods_agree_for_gaussian_returns(self, engine):
+        """Historical, parametric and Monte Carlo VaR are consistent"""
+        symbols, prices = feed_prices(engine, n_obs=250)
+        engine.set_positions({s: {'size': 10.0, 'avg_price': 100.0} for s in symbols})
+        
+        snapshot = engine.compute(20000)
+        
+        assert snapshot.var_parametric > 0
+        assert snapshot.var_historical == pytest.approx(snapshot.var_parametric, rel=0.35)
+        assert snapshot.var_monte_carlo == pytest.approx(snapshot.var_parametric, rel=0.35)
+        assert snapshot.cvar_parametric > snapshot.var_parametric
+        assert snapshot.cvar_historical >= snapshot.var_historical
+    
+    def test_single_position_update_matches_full_recompute(self, engine):
+        """Incremental caches equal a full recompute after one position change"""
+        symbols, _ = feed_prices(engine)
+        engine.set_positions({s: {'size': 5.0, 'avg_price': 100.0} for s in symbols})
+        
+        engine.update_position(symbols[3], 2500.0)
+        engine.update_position(symbols[7], -800.0)
+        incremental = (engine._hist_pnl.copy(), engine._variance, engine._mc_loading.copy())
+        
+        engine._recompute_exposure_caches()
+        
+        assert np.allclose(incremental[0], engine._hist_pnl)
+        assert incremental[1] == pytest.approx(engine._variance)
+        assert np.allclose(incremental[2], engine._mc_loading)
+    
+    def test_correlated_positions(self):
+        """Identical price series give correlation close to 1"""
+        engine = PortfolioRiskEngine(mc_paths=1000, seed=1)
+        rng = np.random.default_rng(3)
+        price = 100.0
+        for _ in range(100):
+            price *= 1 + rng.normal(0, 0.01)
+            engine.update_prices({'A': price, 'B': price * 2})
+        engine.set_positions({'A': {'size': 1.0}, 'B': {'size': 1.0}})
+        
+        assert engine.position_correlation() == pytest.approx(1.0, abs=1e-6)
+    
+    def test_unsupported_confidence(self):
+        """Only tabulated confidence levels are accepted"""
+        with pytest.raises(ValueError):
+            PortfolioRiskEngine(confidence=0.42)
+    
+    @pytest.mark.performance
+    def test_hundred_positions_under_budget(self):
+        """Price tick + position sync + all VaR methods stay well under 50 ms"""
+        engine = PortfolioRiskEngine(mc_paths=10000, seed=7)
+        symbols, prices = feed_prices(engine, n_symbols=100, n_obs=250)
+        positions = {s: {'size': 1.0, 'avg_price': 100.0} for s in symbols}
+        rng = np.random.default_rng(9)
+        
+        start = time.perf_counter()
+        for i in range(20):
+            prices = prices * (1 + rng.normal(0, 0.01, 100))
+            engine.update_prices(dict(zip(symbols, prices)))
+            positions[symbols[i]]['size'] = 2.0
+            engine.set_positions(positions)
+            engine.compute(10000)
+        elapsed_ms = (time.perf_counter() - start) / 20 * 1000
+        
+        assert elapsed_ms < 50
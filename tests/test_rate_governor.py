@@ -0,0 +1,125 @@
+"""
+Unit Tests for the Rate Governor
+Tests token bucket pacing, priority lanes, 429 backoff and configuration
+"""
+
+import pytest
+import asyncio
+import time
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bot.core import rate_governor
+from bot.core.rate_governor import RateGovernor, configure_rate_governor, get_rate_governor
+
+
+class TestRateGovernor:
+    """Test request pacing and lane ordering"""
+    
+    def test_sustained_rate(self):
+        governor = RateGovernor({'ex': {'total': {'rate': 100.0, 'burst': 5.0}}})
+        
+        async def scenario():
+            start = time.monotonic()
+            for _ in range(25):
+                await governor.acquire('ex')
+            return time.monotonic() - start
+        
+        # 5 from the burst, 20 more at 100/s
+        elapsed = asyncio.run(scenario())
+        assert 0.18 <= elapsed < 0.5
+        assert governor.get_statistics()['ex']['granted']['market_data'] == 25
+    
+    def test_orders_before_market_data(self):
+        governor = RateGovernor({'ex': {'total': {'rate': 50.0, 'burst': 1.0}}})
+        served = []
+        
+        async def request(endpoint_class, tag):
+            await governor.acquire('ex', endpoint_class)
+            served.append(tag)
+        
+        async def scenario():
+            await governor.acquire('ex')  # Empty the bucket
+            tasks = [asyncio.create_task(request('market_data', f'md{i}')) for i in range(3)]
+            await asyncio.sleep(0)
+            tasks.append(asyncio.create_task(request('order', 'order')))
+            tasks.append(asyncio.create_task(request('cancel', 'cancel')))
+            await asyncio.sleep(0)
+            
+            depth = governor.queue_depth('ex')
+            await asyncio.gather(*tasks)
+            return depth
+        
+        depth = asyncio.run(scenario())
+        
+        assert depth == {'cancel': 1, 'order': 1, 'account': 0, 'market_data': 3}
+        assert served[:2] == ['cancel', 'order']
+    
+    def test_class_bucket_does_not_block_other_lanes(self):
+        """An exhausted order bucket leaves the exchange budget to market data"""
+        governor = RateGovernor({'ex': {
+            'total': {'rate': 1000.0, 'burst': 10.0},
+            'order': {'rate': 1.0, 'burst': 1.0}
+        }})
+        
+        async def scenario():
+            await governor.acquire('ex', 'order')
+            blocked = asyncio.create_task(governor.acquire('ex', 'order'))
+            await asyncio.sleep(0)
+            
+            start = time.monotonic()
+            await governor.acquire('ex', 'market_data')
+            waited = time.monotonic() - start
+            blocked.cancel()
+            return waited
+        
+        assert asyncio.run(scenario()) < 0.05
+        assert governor.queue_depth('ex')['order'] == 0
+    
+    def test_rate_limited_pauses_exchange(self):
+        governor = RateGovernor({'ex': {'total': {'rate': 1000.0, 'burst': 10.0}}})
+        
+        async def scenario():
+            governor.report_rate_limited('ex', retry_after=0.1)
+            return await governor.acquire('ex', 'order')
+        
+        assert asyncio.run(scenario()) >= 0.09
+        assert governor.get_statistics()['ex']['rate_limited'] == 1
+    
+    def test_weight_above_capacity(self):
+        governor = RateGovernor()
+        
+        with pytest.raises(ValueError):
+            asyncio.run(governor.acquire('ex', weight=50))
+
+
+class TestConfiguration:
+    """Test the shared instance"""
+    
+    def test_configure_from_config(self):
+        settings = {
+            'enabled': True,
+            'exchanges': {'binance': {'total': {'rate': 20, 'burst': 40}}}
+        }
+        
+        class Config:
+            def get(self, key, default=None):
+                return settings if key == 'execution.rate_limits' else default
+        
+        try:
+            governor = configure_rate_governor(Config())
+            assert get_rate_governor() is governor
+            assert governor._state('binance').total.burst == 40
+            
+            settings['enabled'] = False
+            assert configure_rate_governor(Config()) is None
+            assert get_rate_governor() is None
+        finally:
+            rate_governor._governor_instance = None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,150 @@
+"""
+Unit Tests for the Result Cache
+Tests content-addressed keys, LRU eviction and sweep reuse
+"""
+
+import pytest
+import numpy as np
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tests.conftest import BacktestConfig, make_ohlcv
+from bot.backtesting import ParameterSweep, ResultCache
+from bot.backtesting.result_cache import ENGINE_MODULES, _source_digests
+from bot.strategies import BollingerBandsStrategy, MACDMomentumStrategy
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResultCache(tmp_path / 'cache')
+
+
+class TestKeys:
+    """Test content addressing"""
+    
+    def test_fingerprint_follows_content(self):
+        data = make_ohlcv()
+        changed = data.copy()
+        changed.loc[700, 'close'] *= 1.0001
+        
+        assert ResultCache.fingerprint(data) == ResultCache.fingerprint(data.copy())
+        assert ResultCache.fingerprint(data) != ResultCache.fingerprint(changed)
+        assert ResultCache.fingerprint(data).startswith('2024-01-01 00:00:00/')
+    
+    def test_key_covers_params_settings_and_code(self, cache, tmp_path):
+        fingerprint = ResultCache.fingerprint(make_ohlcv(200))
+        strategy = MACDMomentumStrategy(BacktestConfig())
+        params = ResultCache.strategy_params(strategy)
+        base = cache.key('results', fingerprint, MACDMomentumStrategy, params, {'engine': 'auto'})
+        
+        assert base == cache.key('results', fingerprint, MACDMomentumStrategy, dict(params), {'engine': 'auto'})
+        assert base != cache.key('results', fingerprint, MACDMomentumStrategy, {**params, 'fast_period': 10}, {'engine': 'auto'})
+        assert base != cache.key('results', fingerprint, MACDMomentumStrategy, params, {'engine': 'event'})
+        assert base != cache.key('signals', fingerprint, MACDMomentumStrategy, params, {'engine': 'auto'})
+        assert base != cache.key('results', fingerprint, BollingerBandsStrategy, params, {'engine': 'auto'})
+        
+        pinned = ResultCache(tmp_path / 'cache', code_version='v1')
+        assert base != pinned.key('results', fingerprint, MACDMomentumStrategy, params, {'engine': 'auto'})
+    
+    @pytest.mark.parametrize('module_name', ENGINE_MODULES)
+    def test_engine_source_change_invalidates_key(self, cache, monkeypatch, module_name):
+        fingerprint = ResultCache.fingerprint(make_ohlcv(200))
+        base = cache.key('results', fingerprint, MACDMomentumStrategy, {}, None)
+        
+        monkeypatch.setitem(_source_digests, module_name, 'edited')
+        
+        assert cache.key('results', fingerprint, MACDMomentumStrategy, {}, None) != base
+
+
+class TestStorage:
+    """Test the on-disk store"""
+    
+    def test_round_trip_survives_reopen(self, cache):
+        cache.put('a' * 40, {'sharpe_ratio': 1.5, 'curve': np.arange(5.0)})
+        
+        reopened = ResultCache(cache.directory)
+        value = reopened.get('a' * 40)
+        
+        assert value['sharpe_ratio'] == 1.5
+        np.testing.assert_array_equal(value['curve'], np.arange(5.0))
+        assert reopened.get('b' * 40) is None
+        assert reopened.get_statistics()['hits'] == 1
+        assert reopened.get_statistics()['misses'] == 1
+    
+    def test_lru_eviction_keeps_recent_entries(self, tmp_path):
+        payload = np.zeros(1000)  # ~8 KB per entry
+        cache = ResultCache(tmp_path / 'cache', max_bytes=30_000)
+        
+        cache.put('first', payload)
+        cache.put('second', payload)
+        cache.put('third', payload)
+        assert cache.get('first') is not None  # Now most recently used
+        cache.put('fourth', payload)
+        
+        assert cache.get('second') is None
+        assert cache.get('first') is not None
+        assert cache.get('fourth') is not None
+        assert cache.get_statistics()['evictions'] == 1
+        assert cache.get_statistics()['bytes'] <= cache.max_bytes
+    
+    def test_unreadable_entry_is_dropped(self, cache):
+        (cache.directory / 'broken.pkl').write_bytes(b'not a pickle')
+        
+        assert cache.get('broken') is None
+        assert not (cache.directory / 'broken.pkl').exists()
+
+
+class TestSweepCache:
+    """Test reuse across sweeps"""
+    
+    def test_repeat_run_is_served_from_cache(self, cache, monkeypatch):
+        data = make_ohlcv()
+        combinations = [{'fast_period': 8}, {'fast_period': 12}]
+        
+        with ParameterSweep(BacktestConfig(), data, workers=1, cache=cache) as sweep:
+            first = sorted(sweep.run(MACDMomentumStrategy, combinations), key=lambda r: r.params['fast_period'])
+        
+        monkeypatch.setattr(MACDMomentumStrategy, 'signals_vectorized',
+                            lambda self, frame: pytest.fail('recomputed signals'))
+        with ParameterSweep(BacktestConfig(), data, workers=1, cache=cache) as sweep:
+            second = sorted(sweep.run(MACDMomentumStrategy, combinations), key=lambda r: r.params['fast_period'])
+        
+        assert [r.metrics for r in second] == [r.metrics for r in first]
+        assert cache.get_statistics()['hits'] >= 2
+    
+    def test_new_simulator_settings_reuse_signals(self, cache, monkeypatch):
+        data = make_ohlcv()
+        with ParameterSweep(BacktestConfig(), data, workers=1, cache=cache) as sweep:
+            baseline = next(sweep.run(BollingerBandsStrategy, [{'period': 20}]))
+        
+        calls = []
+        original = BollingerBandsStrategy.signals_vectorized
+        monkeypatch.setattr(BollingerBandsStrategy, 'signals_vectorized',
+                            lambda self, frame: calls.append(1) or original(self, frame))
+        
+        with ParameterSweep(BacktestConfig(initial_capital=6000), data, workers=1, cache=cache) as sweep:
+            rerun = next(sweep.run(BollingerBandsStrategy, [{'period': 20}]))
+        
+        assert calls == []  # Indicator arrays came from the cache
+        assert rerun.metrics['final_equity'] == pytest.approx(2 * baseline.metrics['final_equity'])
+    
+    def test_pool_workers_share_the_cache(self, cache):
+        data = make_ohlcv()
+        combinations = [{'period': p} for p in (10, 20, 30)]
+        
+        with ParameterSweep(BacktestConfig(), data, workers=2, cache=cache) as sweep:
+            pooled = {r.params['period']: r.metrics for r in sweep.run(BollingerBandsStrategy, combinations)}
+        
+        reopened = ResultCache(cache.directory)
+        with ParameterSweep(BacktestConfig(), data, workers=1, cache=reopened) as sweep:
+            inline = {r.params['period']: r.metrics for r in sweep.run(BollingerBandsStrategy, combinations)}
+        
+        assert inline == pooled
+        assert reopened.get_statistics()['misses'] == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
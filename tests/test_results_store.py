@@ -0,0 +1,151 @@
+"""
+Unit Tests for the Backtest Results Store
+Tests chunked streaming, lazy memory-mapped reads and the runner integration
+"""
+
+import pytest
+import asyncio
+import json
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tests.conftest import make_ohlcv
+from bot.backtesting import BacktestRunner, ResultsWriter, list_results, load_results
+from bot.strategies.momentum import MomentumStrategy
+
+
+def make_config(results_dir='data/backtest_results', chunk_rows=4096):
+    config = Mock()
+    config.execution.slippage_model = 'conservative'
+    config.execution.market_impact_percent = 0.001
+    config.execution.commission_percent = 0.001
+    config.execution.simulation = {}
+    config.get = lambda key, default=None: {
+        'backtesting': {
+            'initial_capital': 3000,
+            'lookback': 100,
+            'output': {'results_dir': str(results_dir), 'chunk_rows': chunk_rows}
+        },
+        'execution.cost_model': {'seed': 1}
+    }.get(key, default)
+    return config
+
+
+class TestResultsWriter:
+    """Test chunked streaming"""
+    
+    def test_chunks_reach_disk_before_close(self, tmp_path):
+        writer = ResultsWriter(tmp_path / 'run', chunk_rows=10, metadata={'strategy': 'test'})
+        start = pd.Timestamp('2024-01-01')
+        for i in range(25):
+            writer.append_equity(start + pd.Timedelta(hours=i), 1000.0 + i)
+        
+        running = load_results(tmp_path / 'run')
+        assert len(running.equity) == 20  # Two full chunks; the rest is buffered
+        assert not running.complete
+        
+        writer.close({'sharpe_ratio': 1.2, 'equity_curve': [1.0, 2.0]})
+        stored = load_results(tmp_path / 'run')
+        
+        assert stored.complete
+        assert isinstance(stored.equity, np.memmap)
+        np.testing.assert_array_equal(stored.equity['equity'], 1000.0 + np.arange(25))
+        assert stored.equity['timestamp'][0] == start.timestamp()
+        assert stored.metrics == {'sharpe_ratio': 1.2}
+        assert stored.manifest['metadata'] == {'strategy': 'test'}
+        assert stored.manifest['tables']['equity']['rows'] == 25
+    
+    def test_trades_are_decoded(self, tmp_path):
+        with ResultsWriter(tmp_path / 'run') as writer:
+            writer.append_trade({'timestamp': pd.Timestamp('2024-01-01 10:00'), 'symbol': 'BTC',
+                                 'strategy': 'momentum', 'action': 'BUY', 'execution_price': 100.5})
+            writer.append_trade({'timestamp': pd.Timestamp('2024-01-01 12:00'), 'symbol': 'ETH',
+                                 'strategy': 'momentum', 'action': 'SELL', 'pnl': 12.5})
+        
+        trades = load_results(tmp_path / 'run').trades_frame()
+        
+        assert list(trades['symbol']) == ['BTC', 'ETH']
+        assert list(trades['action']) == ['BUY', 'SELL']
+        assert trades['timestamp'].iloc[1] == pd.Timestamp('2024-01-01 12:00')
+        assert trades['execution_price'].iloc[0] == 100.5
+        assert np.isnan(trades['pnl'].iloc[0]) and trades['pnl'].iloc[1] == 12.5
+    
+    def test_equity_curve_range_and_downsampling(self, tmp_path):
+        equity = 1000.0 + np.sin(np.arange(10_000) / 100.0) * 50
+        with ResultsWriter(tmp_path / 'run') as writer:
+            writer.extend_equity(np.arange(10_000, dtype=np.float64) * 60, equity)
+        
+        stored = load_results(tmp_path / 'run')
+        sampled = stored.equity_curve(max_points=500)
+        ranged = stored.equity_curve(start=6000, end=11_940)
+        
+        assert len(sampled['equity']) <= 501
+        assert sampled['equity'][-1] == equity[-1]
+        assert sampled['drawdown'].min() == pytest.approx((equity / np.maximum.accumulate(equity) - 1).min(), abs=1e-3)
+        np.testing.assert_array_equal(ranged['equity'], equity[100:200])
+
+
+class TestBacktestRunnerStore:
+    """Test streaming from the event-driven runner"""
+    
+    def test_streamed_run_matches_in_memory_run(self, tmp_path):
+        data = make_ohlcv(2000)
+        runner = BacktestRunner(make_config(tmp_path, chunk_rows=64))
+        
+        in_memory = asyncio.run(runner.run_backtest(data, MomentumStrategy(Mock())))
+        streamed = asyncio.run(runner.run_backtest(data, MomentumStrategy(Mock()), writer=runner.results_writer('momentum')))
+        
+        for key in ('final_equity', 'sharpe_ratio', 'max_drawdown', 'total_trades', 'win_rate'):
+            assert streamed[key] == pytest.approx(in_memory[key])
+        assert 'equity_curve' not in streamed and 'trades' not in streamed
+        assert runner.equity_curve == [runner.initial_capital]  # Nothing accumulated in memory
+        
+        stored = load_results(streamed['results_dir'])
+        np.testing.assert_allclose(stored.equity['equity'], in_memory['equity_curve'])
+        np.testing.assert_allclose(stored.equity['timestamp'], in_memory['equity_timestamps'])
+        assert len(stored.trades) == in_memory['total_trades']
+        assert stored.metrics['final_equity'] == pytest.approx(in_memory['final_equity'])
+        assert stored.manifest['metadata']['strategy'] == 'momentum'
+    
+    def test_save_results_writes_columnar_run(self, tmp_path):
+        runner = BacktestRunner(make_config(tmp_path))
+        results = asyncio.run(runner.run_backtest(make_ohlcv(2000), MomentumStrategy(Mock())))
+        
+        path = runner.save_results(results, 'saved')
+        stored = load_results(path)
+        
+        assert path == tmp_path / 'saved'
+        assert len(stored.equity) == len(results['equity_curve'])
+        assert list(stored.trades_frame()['symbol'].unique()) == [results['trades'][0]['symbol']]
+        assert json.loads((path / 'manifest.json').read_text())['complete']
+        assert [run['name'] for run in list_results(tmp_path)] == ['saved']
+
+
+class TestDashboardAccess:
+    """Test stored-run lookup from the performance routes"""
+    
+    @pytest.mark.parametrize('name', ['', '.', '..', '../saved', 'saved/..', '/tmp'])
+    def test_names_outside_results_dir_are_rejected(self, tmp_path, monkeypatch, name):
+        routes = pytest.importorskip('dashboard.routes.performance_routes')
+        monkeypatch.setattr(routes, 'BACKTEST_RESULTS_DIR', str(tmp_path / 'runs'))
+        
+        with pytest.raises(ValueError):
+            routes._stored_run(name)
+    
+    def test_stored_run_is_loaded(self, tmp_path, monkeypatch):
+        routes = pytest.importorskip('dashboard.routes.performance_routes')
+        monkeypatch.setattr(routes, 'BACKTEST_RESULTS_DIR', str(tmp_path))
+        runner = BacktestRunner(make_config(tmp_path))
+        runner.save_results(asyncio.run(runner.run_backtest(make_ohlcv(2000), MomentumStrategy(Mock()))), 'saved')
+        
+        assert routes._stored_run('saved').complete
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
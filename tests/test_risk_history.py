@@ -0,0 +1,121 @@
+"""
+Unit Tests for Tiered Risk History
+Tests bounded tiers, min/max/last aggregation, spill-to-disk and range queries
+"""
+
+import pytest
+import numpy as np
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bot.core.risk_history import TieredHistory, load_history
+
+T0 = 1_700_000_000.0 - (1_700_000_000.0 % 3600)  # Hour-aligned start
+
+
+def fill(history, seconds, step=10):
+    """Append a ramp sample every ``step`` seconds"""
+    for i, ts in enumerate(np.arange(T0, T0 + seconds, step)):
+        history.append(ts, [float(i), -float(i)])
+
+
+class TestTieredHistory:
+    """Test tiered history"""
+    
+    def test_raw_tier_is_bounded(self):
+        """Raw ring keeps only raw_hours worth of samples"""
+        history = TieredHistory(['value', 'neg'], raw_hours=1, sample_interval=10)
+        fill(history, 3 * 3600)
+        
+        assert len(history) == 360
+        raw = history.query(resolution='raw')
+        assert raw['timestamp'][0] == T0 + 2 * 3600
+    
+    def test_minute_aggregates(self):
+        """Minute buckets carry min/max/last of their samples"""
+        history = TieredHistory(['value', 'neg'], sample_interval=10)
+        fill(history, 180)
+        
+        minutes = history.query(resolution='minute')
+        
+        assert len(minutes) == 3  # two closed buckets + the open one
+        assert minutes['timestamp'][0] == T0
+        assert minutes['value_min'][0] == 0.0
+        assert minutes['value_max'][0] == 5.0
+        assert minutes['value_last'][1] == 11.0
+        assert minutes['neg_min'][1] == -11.0
+    
+    def test_range_query(self):
+        """Range queries are inclusive on both ends"""
+        history = TieredHistory(['value', 'neg'], sample_interval=10)
+        fill(history, 600)
+        
+        result = history.query(T0 + 100, T0 + 200, resolution='raw')
+        
+        assert result['timestamp'][0] == T0 + 100
+        assert result['timestamp'][-1] == T0 + 200
+        assert len(result) == 11
+    
+    def test_auto_resolution_falls_back_to_coarser_tier(self):
+        """Ranges older than the raw window are served from aggregates"""
+        history = TieredHistory(['value', 'neg'], raw_hours=0.5, sample_interval=10)
+        fill(history, 2 * 3600)
+        
+        recent = history.query(start=T0 + 7000)
+        older = history.query(start=T0)
+        
+        assert 'value' in recent.dtype.names
+        assert 'value_last' in older.dtype.names
+        assert older['timestamp'][0] == T0
+    
+    def test_spill_to_disk(self, tmp_path):
+        """Closed buckets are written through and readable by other processes"""
+        history = TieredHistory(
+            ['value', 'neg'], sample_interval=10, minute_days=1 / 1440 * 5,
+            spill_dir=tmp_path
+        )
+        fill(history, 1200)
+        
+        on_disk = load_history(tmp_path, 'minute')
+        assert len(on_disk) == 19
+        assert on_disk['value_max'][0] == 5.0
+        
+        # In-memory ring holds 5 minutes; the rest comes from disk
+        full = history.query(start=T0, resolution='minute')
+        assert len(full) == 20
+        assert np.all(np.diff(full['timestamp']) == 60)
+        
+        ranged = load_history(tmp_path, 'minute', start=T0 + 120, end=T0 + 240)
+        assert list(ranged['timestamp']) == [T0 + 120, T0 + 180, T0 + 240]
+    
+    def test_spilled_records_survive_restart(self, tmp_path):
+        """A fresh history over an existing spill directory serves the spilled buckets"""
+        history = TieredHistory(['value', 'neg'], sample_interval=10, spill_dir=tmp_path)
+        fill(history, 600)
+        history.flush()
+        
+        restarted = TieredHistory(['value', 'neg'], sample_interval=10, spill_dir=tmp_path)
+        
+        minutes = restarted.query(start=T0, resolution='minute')
+        assert len(minutes) == 10 and minutes['timestamp'][0] == T0
+        assert len(restarted.query(start=T0)) == 1  # auto -> hour tier, from disk
+        
+        restarted.append(T0 + 3600, [1.0, -1.0])
+        assert len(restarted.query(start=T0, resolution='minute')) == 11
+    
+    def test_load_history_without_data(self, tmp_path):
+        """Missing spill directory yields an empty result"""
+        assert len(load_history(tmp_path / 'missing', 'hour')) == 0
+    
+    def test_dict_values_and_records(self):
+        """Dict samples and JSON conversion"""
+        history = TieredHistory(['value', 'neg'])
+        history.append(T0, {'value': 1.5, 'neg': -1.5})
+        
+        records = TieredHistory.to_records(history.query(resolution='raw'))
+        
+        assert records[0]['value'] == 1.5
+        assert isinstance(records[0]['timestamp'], str)
@@ -0,0 +1,192 @@
+"""
+Unit Tests for Smart Order Router
+Tests venue cost ranking, marginal-cost splitting, latency tracking and
+concurrent dispatch through the execution engine
+"""
+
+import pytest
+import asyncio
+import time
+import numpy as np
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bot.core.smart_order_router import SmartOrderRouter
+from bot.core.execution_engine import ExecutionEngine
+from bot.ensemble.ensemble_voting import TradeSignal
+
+
+@pytest.fixture
+def router():
+    """Three venues with equal quotes and different fees"""
+    router = SmartOrderRouter({'binance': 0.001, 'kraken': 0.0026, 'coinbase': 0.005},
+                              min_child_notional=50.0)
+    for venue in router.venues:
+        router.update_quote(venue, 'BTC/EUR', 99.99, 100.01, bid_size=5.0, ask_size=5.0)
+        router.record_latency(venue, 20.0)
+    return router
+
+
+class TestSmartOrderRouter:
+    """Test routing decisions"""
+    
+    def test_small_order_goes_to_cheapest_venue(self, router):
+        """Small orders are not worth splitting"""
+        decision = router.route('BTC/EUR', 'BUY', 20.0)
+        
+        assert decision.venues == ['binance']
+        assert decision.allocations[0].expected_price > 100.01
+    
+    def test_price_dislocation_beats_fee(self, router):
+        """A cheaper ask outweighs a higher fee"""
+        router.update_quote('coinbase', 'BTC/EUR', 99.0, 99.2, bid_size=5.0, ask_size=5.0)
+        
+        assert router.route('BTC/EUR', 'BUY', 20.0).venues == ['coinbase']
+        assert router.route('BTC/EUR', 'SELL', 20.0).venues == ['binance']
+    
+    def test_large_order_split_equalizes_marginal_cost(self, router):
+        """Large orders are split; marginal costs match across active venues"""
+        decision = router.route('BTC/EUR', 'BUY', 5000.0)
+        
+        assert len(decision.allocations) >= 2
+        assert sum(a.notional for a in decision.allocations) == pytest.approx(5000.0)
+        
+        costs = router.venue_costs('BTC/EUR', 'BUY')
+        k = router.impact_coefficient
+        marginal = [
+            costs['base'][router.venues.index(a.venue)] + 1.5 * k * (a.notional / costs['depth'][router.venues.index(a.venue)]) ** 0.5
+            for a in decision.allocations
+        ]
+        assert max(marginal) - min(marginal) < 1e-9
+        assert decision.expected_cost_pct < router.route('BTC/EUR', 'BUY', 5000.0, allow_split=False).expected_cost_pct
+    
+    def test_slow_and_stale_venues_penalized(self, router):
+        """Latency risk and quote age steer flow away"""
+        router.volatility = 0.01
+        for _ in range(50):
+            router.record_latency('binance', 2000.0)
+        
+        assert router.route('BTC/EUR', 'BUY', 20.0).venues == ['kraken']
+        
+        router.update_quote('kraken', 'BTC/EUR', 99.99, 100.01, 5.0, 5.0, timestamp=time.time() - 60)
+        assert 'kraken' not in router.route('BTC/EUR', 'BUY', 20.0).venues
+    
+    def test_no_quotes(self, router):
+        """Unknown symbols cannot be routed"""
+        assert router.route('ETH/EUR', 'BUY', 100.0) is None
+        assert not router.has_quotes('ETH/EUR')
+    
+    @pytest.mark.performance
+    def test_failed_venue_is_reprobed_after_cooldown(self, router):
+        """A venue whose submission raised sits out for the cooldown only"""
+        router.unavailable_cooldown = 1.0
+        
+        async def failing_submit(allocation, decision):
+            raise ConnectionError('venue down')
+        
+        decision = router.route('BTC/EUR', 'BUY', 20.0)
+        router.set_available('kraken', False)
+        router.set_available('coinbase', False)
+        assert asyncio.run(router.dispatch(decision, failing_submit)) == [None]
+        router.set_available('kraken', True)
+        router.set_available('coinbase', True)
+        
+        now = time.time()
+        assert router.route('BTC/EUR', 'BUY', 20.0).venues != ['binance']
+        assert np.isnan(router.venue_costs('BTC/EUR', 'BUY', now=now + 0.5)['base'][0])
+        assert not np.isnan(router.venue_costs('BTC/EUR', 'BUY', now=now + 1.5)['base'][0])
+        assert router.get_statistics()['venues']['binance']['available']
+    
+    def test_failed_slice_is_rerouted(self, router):
+        """A slice whose venue fails is placed on the next best healthy venue"""
+        placed = []
+        
+        async def submit(allocation, decision):
+            placed.append(allocation.venue)
+            if allocation.venue != 'coinbase':
+                raise ConnectionError('venue down')
+            return {'venue': allocation.venue, 'position_value': allocation.notional}
+        
+        decision = router.route('BTC/EUR', 'BUY', 20.0)
+        fills = asyncio.run(router.dispatch(decision, submit))
+        
+        assert placed == ['binance', 'kraken', 'coinbase']
+        assert fills == [{'venue': 'coinbase', 'position_value': 20.0}]
+        assert router.get_statistics()['reroutes'] == 2
+        assert not router.available[:2].any()
+    
+    def test_decision_is_sub_millisecond(self, router):
+        """Routing decisions stay well under a millisecond"""
+        for size in (20.0, 5000.0):
+            start = time.perf_counter()
+            for _ in range(500):
+                router.route('BTC/EUR', 'BUY', size)
+            assert (time.perf_counter() - start) / 500 < 0.001
+
+
+class TestRoutedExecution:
+    """Test engine dispatch through the router"""
+    
+    def test_engine_dispatches_slices_concurrently(self):
+        """Slices on different venues are submitted concurrently"""
+        config = Mock()
+        config.execution.slippage_model = 'conservative'
+        config.execution.market_impact_percent = 0.001
+        config.execution.order_types = ['market']
+        config.exchanges = {'primary': 'binance', 'binance': {'commission': 0.001}, 'kraken': {'commission': 0.001}}
+        config.get = lambda key, default=None: {'markets.crypto_exchanges': ['binance', 'kraken']}.get(key, default)
+        
+        engine = ExecutionEngine(config)
+        engine.update_market_data({
+            f'{venue}_BTC_EUR': {'exchange': venue, 'symbol': 'BTC/EUR', 'bid': 99.99, 'ask': 100.01,
+                                 'bid_volume': 5.0, 'ask_volume': 5.0, 'close': 100.0}
+            for venue in ('binance', 'kraken')
+        })
+        
+        async def slow_submit(allocation, decision):
+            await asyncio.sleep(0.1)
+            return await engine._simulate_venue_fill(allocation, decision)
+        
+        engine.venue_submitter = slow_submit
+        signal = TradeSignal(strategy='test', action='BUY', confidence=0.9, symbol='BTC/EUR', entry_price=100.0)
+        portfolio = {'cash': 100000.0, 'equity': 100000.0, 'positions': {}}
+        
+        async def scenario():
+            start = time.perf_counter()
+            result = await engine._execute_crypto_spot(signal, 0.08, {'close': 100.0}, portfolio)
+            return result, time.perf_counter() - start
+        
+        result, elapsed = asyncio.run(scenario())
+        
+        assert result['executed']
+        assert set(result['venues']) == {'binance', 'kraken'}
+        assert elapsed < 0.18
+        assert result['commission'] == pytest.approx(result['position_value'] * 0.001)
+    
+    def test_paper_fills_do_not_update_latency(self):
+        """Simulated venue fills leave the measured latency untouched"""
+        config = Mock()
+        config.execution.slippage_model = 'conservative'
+        config.execution.market_impact_percent = 0.001
+        config.execution.order_types = ['market']
+        config.exchanges = {'primary': 'binance', 'binance': {'commission': 0.001}}
+        config.get = lambda key, default=None: {'markets.crypto_exchanges': ['binance']}.get(key, default)
+        
+        engine = ExecutionEngine(config)
+        engine.update_market_data({
+            'binance_BTC_EUR': {'exchange': 'binance', 'symbol': 'BTC/EUR', 'bid': 99.99, 'ask': 100.01,
+                                'bid_volume': 5.0, 'ask_volume': 5.0, 'close': 100.0}
+        })
+        engine.router.record_latency('binance', 40.0)
+        before = engine.router.latency_ms.copy()
+        
+        signal = TradeSignal(strategy='test', action='BUY', confidence=0.9, symbol='BTC/EUR', entry_price=100.0)
+        portfolio = {'cash': 100000.0, 'equity': 100000.0, 'positions': {}}
+        result = asyncio.run(engine._execute_crypto_spot(signal, 0.01, {'close': 100.0}, portfolio))
+        
+        assert result['venues'] == {'binance': pytest.approx(result['position_value'])}
+        np.testing.assert_array_equal(engine.router.latency_ms, before)
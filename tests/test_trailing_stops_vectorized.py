@@ -0,0 +1,145 @@
+"""
+Unit Tests for Vectorized Trailing Stops
+Tests batch updates against the scalar path and incremental ATR/volatility state
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+from unittest.mock import Mock
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bot.core.trailing_stop_manager import TrailingStopManager, TrailingStopType
+
+
+@pytest.fixture
+def mock_config():
+    """Create mock configuration"""
+    config = Mock()
+    config.risk.trailing_stops = {
+        'activation_profit': 2.0,
+        'trail_distance': 1.0,
+        'atr_period': 14,
+        'atr_multiplier': 2.0,
+        'chandelier_period': 22,
+        'chandelier_multiplier': 3.0
+    }
+    return config
+
+
+def make_bars(n=60, seed=0, start=100.0):
+    """Random-walk OHLC bars"""
+    rng = np.random.default_rng(seed)
+    close = start * np.cumprod(1 + rng.normal(0.002, 0.01, n))
+    spread = np.abs(rng.normal(0, 0.5, n))
+    return pd.DataFrame({
+        'open': close,
+        'high': close + spread,
+        'low': close - spread,
+        'close': close
+    })
+
+
+class TestIncrementalIndicators:
+    """Test per-symbol incremental state"""
+    
+    def test_atr_matches_dataframe_calculation(self, mock_config):
+        """EMA true range equals the pandas-based ATR"""
+        manager = TrailingStopManager(mock_config)
+        bars = make_bars()
+        manager.warm_up('BTC/USDT', bars)
+        
+        slot = manager._symbol_index['BTC/USDT']
+        assert manager._atr[slot] == pytest.approx(manager._calculate_atr(bars, 14))
+        assert manager._atr_chandelier[slot] == pytest.approx(manager._calculate_atr(bars, 22))
+        assert manager._highs[slot].max() == pytest.approx(bars['high'].iloc[-22:].max())
+    
+    def test_volatility_matches_pct_change_std(self, mock_config):
+        """Welford variance equals pandas returns std"""
+        manager = TrailingStopManager(mock_config)
+        bars = make_bars(seed=3)
+        manager.warm_up('ETH/USDT', bars)
+        
+        slot = manager._symbol_index['ETH/USDT']
+        volatility = np.sqrt(manager._ret_m2[slot] / (manager._ret_n[slot] - 1))
+        assert volatility == pytest.approx(bars['close'].pct_change().std())
+    
+    def test_update_bars_across_symbols(self, mock_config):
+        """Batch bar updates match per-symbol warm-up"""
+        batch = TrailingStopManager(mock_config)
+        single = TrailingStopManager(mock_config)
+        frames = {'A': make_bars(seed=1), 'B': make_bars(seed=2)}
+        
+        for i in range(60):
+            batch.update_bars({s: df.iloc[i].to_dict() for s, df in frames.items()})
+        for s, df in frames.items():
+            single.warm_up(s, df)
+        
+        assert np.allclose(batch._atr, single._atr)
+        assert np.allclose(batch._ret_m2, single._ret_m2)
+
+
+class TestUpdateAll:
+    """Test vectorized batch update"""
+    
+    @pytest.mark.parametrize('stop_type', list(TrailingStopType))
+    def test_matches_scalar_updates(self, mock_config, stop_type):
+        """Batch path produces the same stops as update_position"""
+        bars = make_bars(n=80, seed=5)
+        warm, ticks = bars.iloc[:40], bars['close'].iloc[40:]
+        
+        scalar = TrailingStopManager(mock_config)
+        batch = TrailingStopManager(mock_config)
+        for manager in (scalar, batch):
+            manager.add_position('BTC/USDT', 'pos1', entry_price=float(warm['close'].iloc[-1]),
+                                 stop_type=stop_type)
+        batch.warm_up('BTC/USDT', warm)
+        
+        for i, price in enumerate(ticks):
+            history = bars.iloc[:40 + i]
+            triggered_scalar = scalar.update_position('pos1', price, history)
+            triggered_batch = batch.update_all({'BTC/USDT': price})
+            batch.update_bars({'BTC/USDT': bars.iloc[40 + i].to_dict()})
+            
+            assert triggered_batch == (['pos1'] if triggered_scalar else [])
+            assert batch.get_stop_info('pos1')['stop_price'] == pytest.approx(
+                scalar.get_stop_info('pos1')['stop_price']
+            )
+            if triggered_scalar:
+                break
+        
+        assert batch.stops_triggered == scalar.stops_triggered
+    
+    def test_many_positions_and_removal(self, mock_config):
+        """Hundreds of stops update together; removal keeps rows consistent"""
+        manager = TrailingStopManager(mock_config)
+        symbols = [f"SYM{i}" for i in range(300)]
+        for i, symbol in enumerate(symbols):
+            manager.add_position(symbol, f"pos{i}", entry_price=100.0)
+        
+        manager.update_all({s: 110.0 for s in symbols})
+        manager.remove_position('pos0')
+        manager.remove_position('pos150')
+        
+        triggered = manager.update_all(np.full(len(manager.symbols), 100.0))
+        
+        assert len(triggered) == 298
+        assert 'pos0' not in triggered
+        assert manager.get_stop_info('pos299')['stop_price'] == pytest.approx(108.9)
+        assert manager.get_statistics()['activated_stops'] == 298
+    
+    def test_objects_reflect_batch_updates(self, mock_config):
+        """TrailingStop objects returned by add_position see batch updates"""
+        manager = TrailingStopManager(mock_config)
+        stop = manager.add_position('BTC/USDT', 'pos1', entry_price=100.0)
+        
+        manager.update_all({'BTC/USDT': 105.0})
+        manager.get_all_stops()
+        
+        assert stop.activated
+        assert stop.highest_price == 105.0
+        assert stop.stop_price == pytest.approx(103.95)
@@ -0,0 +1,88 @@
+"""
+Unit Tests for the Vectorized Backtester
+Tests signal arrays against per-bar signals and equity against BacktestRunner
+"""
+
+import pytest
+import asyncio
+import numpy as np
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tests.conftest import make_ohlcv
+from bot.backtesting import BacktestRunner, VectorizedBacktester
+from bot.strategies import (
+    MomentumStrategy,
+    BollingerBandsStrategy,
+    StochasticStrategy,
+    MACDMomentumStrategy,
+    BreakoutStrategy
+)
+
+STRATEGIES = [MomentumStrategy, BollingerBandsStrategy, StochasticStrategy, MACDMomentumStrategy, BreakoutStrategy]
+
+
+def make_config(slippage_model='conservative'):
+    config = Mock()
+    config.execution.slippage_model = slippage_model
+    config.execution.market_impact_percent = 0.001
+    config.execution.commission_percent = 0.001
+    config.execution.simulation = {}
+    config.get = lambda key, default=None: {
+        'backtesting': {'initial_capital': 3000},
+        'execution.cost_model': {'seed': 1}
+    }.get(key, default)
+    return config
+
+
+class TestSignalArrays:
+    """Test signals_vectorized against generate_signal"""
+    
+    @pytest.mark.parametrize('strategy_class', STRATEGIES)
+    def test_matches_per_bar_signals(self, strategy_class):
+        data = make_ohlcv(250)
+        strategy = strategy_class(Mock())
+        action, confidence = strategy.signals_vectorized(data)
+        
+        async def per_bar():
+            return [await strategy.generate_signal(data.iloc[:i + 1]) for i in range(len(data))]
+        
+        for i, signal in enumerate(asyncio.run(per_bar())):
+            expected = {'BUY': 1, 'SELL': -1}[signal.action] if signal else 0
+            assert action[i] == expected, f"bar {i}"
+            if signal:
+                assert confidence[i] == pytest.approx(signal.confidence)
+
+
+class TestVectorizedBacktester:
+    """Test agreement with the event-driven runner"""
+    
+    @pytest.mark.parametrize('strategy_class', [MomentumStrategy, StochasticStrategy, MACDMomentumStrategy])
+    def test_matches_event_driven_runner(self, strategy_class):
+        data = make_ohlcv()
+        expected = asyncio.run(BacktestRunner(make_config()).run_backtest(data, strategy_class(Mock())))
+        result = VectorizedBacktester(make_config()).run(data, strategy_class(Mock()))
+        
+        assert result['total_trades'] == expected['total_trades'] > 0
+        np.testing.assert_allclose(result['equity_curve'], expected['equity_curve'], rtol=1e-9)
+        assert result['max_drawdown'] == pytest.approx(expected['max_drawdown'])
+    
+    def test_randomized_costs_within_tolerance(self):
+        data = make_ohlcv()
+        expected = asyncio.run(BacktestRunner(make_config('realistic')).run_backtest(data, BollingerBandsStrategy(Mock())))
+        result = VectorizedBacktester(make_config('realistic')).run(data, BollingerBandsStrategy(Mock()))
+        
+        assert result['final_equity'] == pytest.approx(expected['final_equity'], rel=5e-3)
+    
+    def test_no_signals(self):
+        data = make_ohlcv(300)
+        
+        assert VectorizedBacktester(make_config()).run_signals(data, np.zeros(300, dtype=np.int8)) == {}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,95 @@
+"""
+Unit Tests for Walk-Forward Optimization
+Tests window generation, windowed sweeps and out-of-sample stitching
+"""
+
+import pytest
+import numpy as np
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tests.conftest import BacktestConfig, make_ohlcv
+from bot.backtesting import ParameterRange, ParameterSweep, WalkForwardOptimizer
+from bot.strategies import BollingerBandsStrategy
+
+
+SPACE = [
+    ParameterRange('period', 'int', 10, 30, 10),
+    ParameterRange('std_dev', 'float', 1.5, 2.5, 0.5)
+]
+
+
+class TestWindows:
+    """Test train/test splits"""
+    
+    def test_rolling(self):
+        windows = WalkForwardOptimizer(BacktestConfig(), make_ohlcv(2300), 1000, 500).windows()
+        
+        assert [(w.train_start, w.train_end, w.test_start, w.test_end) for w in windows] == [
+            (0, 1000, 1000, 1500),
+            (500, 1500, 1500, 2000),
+            (1000, 2000, 2000, 2300)
+        ]
+    
+    def test_anchored(self):
+        windows = WalkForwardOptimizer(BacktestConfig(), make_ohlcv(2000), 1000, 500, anchored=True).windows()
+        
+        assert [w.train_start for w in windows] == [0, 0]
+        assert [w.train_end for w in windows] == [1000, 1500]
+    
+    def test_not_enough_data(self):
+        optimizer = WalkForwardOptimizer(BacktestConfig(), make_ohlcv(800), 1000, 500)
+        
+        assert optimizer.run(BollingerBandsStrategy, SPACE) == {}
+
+
+class TestWindowedSweep:
+    """Test run_windows"""
+    
+    def test_vectorized_matches_event_engine(self):
+        data = make_ohlcv(1000)
+        spans = [(100, 300, 700), (0, 0, 500)]
+        curves = {}
+        
+        for engine in ('auto', 'event'):
+            with ParameterSweep(BacktestConfig(), data, workers=1, engine=engine) as sweep:
+                results = next(sweep.run_windows(BollingerBandsStrategy, [({'period': 20}, spans)], keep_curves=True))
+            curves[engine] = [r.equity_curve for r in results]
+        
+        assert [len(c) for c in curves['auto']] == [401, 501]
+        for vectorized, event in zip(curves['auto'], curves['event']):
+            np.testing.assert_allclose(vectorized, event, rtol=1e-9)
+
+
+class TestWalkForward:
+    """Test the optimization pipeline"""
+    
+    def test_stitched_curve(self):
+        data = make_ohlcv(3000)
+        results = WalkForwardOptimizer(BacktestConfig(), data, 1000, 500, workers=1).run(BollingerBandsStrategy, SPACE)
+        
+        assert len(results['windows']) == 4
+        assert len(results['equity_curve']) == 1 + 2000
+        assert results['equity_curve'][0] == 3000
+        assert results['final_equity'] == results['equity_curve'][-1]
+        assert results['combinations'] == 9
+        assert all(w['best_params'] is not None for w in results['windows'])
+        
+        # Each window's out-of-sample return compounds into the total
+        growth = np.prod([1 + w['out_of_sample'].get('total_return', 0.0) for w in results['windows']])
+        assert results['total_return'] == pytest.approx(growth - 1)
+    
+    def test_pool_matches_inline(self):
+        data = make_ohlcv(3000)
+        inline = WalkForwardOptimizer(BacktestConfig(), data, 1000, 500, workers=1).run(BollingerBandsStrategy, SPACE)
+        pooled = WalkForwardOptimizer(BacktestConfig(), data, 1000, 500, workers=2).run(BollingerBandsStrategy, SPACE)
+        
+        assert [w['best_params'] for w in pooled['windows']] == [w['best_params'] for w in inline['windows']]
+        np.testing.assert_allclose(pooled['equity_curve'], inline['equity_curve'])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])